@@ -165,6 +165,9 @@ class GameConfig:
     max_particles: int = 500
     enable_particles: bool = True
     
+    # Debug settings
+    debug_world_checks: bool = False  # Check every set_block against the world invariants
+    
     def validate(self) -> List[str]:
         """Validate configuration values and return list of errors"""
         errors = []
@@ -703,6 +706,9 @@ parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
+# Swept AABB collision shared by the player, animals and mobs - required, nothing can move without it
+from system.collision import move_box, find_solid_tile
+
 # Now import our modules with error handling
 try:
     from managers.character_manager import CharacterManager
@@ -716,6 +722,62 @@ except ImportError as e:
     print(f"⚠️ Warning: Could not import multiplayer UI: {e}")
     MultiplayerUI = None
 
+try:
+    from multiplayer.interpolation import AdaptiveSendRate
+except ImportError as e:
+    print(f"⚠️ Warning: Could not import multiplayer interpolation: {e}")
+    AdaptiveSendRate = None
+
+try:
+    from multiplayer.net_stats import format_rate
+except ImportError as e:
+    print(f"⚠️ Warning: Could not import network stats: {e}")
+    format_rate = None
+
+try:
+    from world_generation.chunk_pregen import (ChunkPregenerator, column_rng, plan_chunk, plan_terrain_column,
+                                               surface_height, tree_allowed)
+except ImportError as e:
+    print(f"⚠️ Warning: Could not import chunk pre-generation: {e}")
+    ChunkPregenerator = column_rng = plan_chunk = plan_terrain_column = surface_height = tree_allowed = None
+
+try:
+    from world_generation.biome_map import BiomeMap
+except ImportError as e:
+    print(f"⚠️ Warning: Could not import biome map: {e}")
+    BiomeMap = None
+
+try:
+    from world_generation.world_checks import block_problem, chunk_checksums, mismatched_chunks, repair_chunks
+except ImportError as e:
+    print(f"⚠️ Warning: Could not import world checks: {e}")
+    block_problem = chunk_checksums = mismatched_chunks = repair_chunks = None
+
+try:
+    from system.structure_registry import StructureRegistry
+except ImportError as e:
+    print(f"⚠️ Warning: Could not import structure registry: {e}")
+    StructureRegistry = None
+
+try:
+    from system.texture_cache import ProceduralTextures
+except ImportError as e:
+    print(f"⚠️ Warning: Could not import texture cache: {e}")
+    ProceduralTextures = None
+
+try:
+    from system.sprite_sheets import SpriteSheetCache, find_animation_gifs
+except ImportError as e:
+    print(f"⚠️ Warning: Could not import sprite sheets: {e}")
+    SpriteSheetCache = find_animation_gifs = None
+
+try:
+    from system.asset_loader import (PRIORITY_GAME, PRIORITY_LATE, PRIORITY_TITLE, AssetLoader, AssetManifest,
+                                     decode_animation)
+except ImportError as e:
+    print(f"⚠️ Warning: Could not import asset loader: {e}")
+    AssetLoader = AssetManifest = decode_animation = None
+
 # Don't import old network modules - we use the new multiplayer folder now
 if CharacterManager is None:
     MultiplayerServer = None
@@ -914,7 +976,10 @@ FORTRESS_TYPES = {
     }
 }
 
-# Discovery system - tracks which fortresses player has found
+# Every placed structure's bounding box, bucketed by chunk (placement overlap, discovery, minimap, saves)
+structure_registry = StructureRegistry(config.world_chunk_size) if StructureRegistry else None
+
+# Discovery system - tracks which fortress types the player has found
 discovered_fortresses = set()
 current_fortress_discovery = None
 discovery_timer = 0
@@ -1138,11 +1203,10 @@ def make_seeds_texture(size):
     seed_size = max(2, size // 8)
     
     # Scatter seeds around
-    import random
-    random.seed(42)  # Consistent pattern
+    rng = random.Random(42)  # Consistent pattern (drawn lazily now, so leave the global RNG alone)
     for _ in range(6):
-        x = random.randint(seed_size, size - seed_size)
-        y = random.randint(seed_size, size - seed_size)
+        x = rng.randint(seed_size, size - seed_size)
+        y = rng.randint(seed_size, size - seed_size)
         pygame.draw.circle(surf, seed_color, (x, y), seed_size)
     
     return surf
@@ -1467,70 +1531,14 @@ def make_boots_texture(size):
     return surf
 
 # --- EXTREME ENGINEERING: Additional Armor Texture Generators ---
-
-def generate_leather_helmet_texture():
-    """Generate leather helmet texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (139, 69, 19), "helmet")
-
-def generate_leather_chestplate_texture():
-    """Generate leather chestplate texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (139, 69, 19), "chestplate")
-
-def generate_leather_leggings_texture():
-    """Generate leather leggings texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (139, 69, 19), "leggings")
-
-def generate_leather_boots_texture():
-    """Generate leather boots texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (139, 69, 19), "boots")
-
-def generate_chainmail_helmet_texture():
-    """Generate chainmail helmet texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (169, 169, 169), "helmet")
-
-def generate_chainmail_chestplate_texture():
-    """Generate chainmail chestplate texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (169, 169, 169), "chestplate")
-
-def generate_chainmail_leggings_texture():
-    """Generate chainmail leggings texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (169, 169, 169), "leggings")
-
-def generate_chainmail_boots_texture():
-    """Generate chainmail boots texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (169, 169, 169), "boots")
-
-def generate_gold_helmet_texture():
-    """Generate gold helmet texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (255, 215, 0), "helmet")
-
-def generate_gold_chestplate_texture():
-    """Generate gold chestplate texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (255, 215, 0), "chestplate")
-
-def generate_gold_leggings_texture():
-    """Generate gold leggings texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (255, 215, 0), "leggings")
-
-def generate_gold_boots_texture():
-    """Generate gold boots texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (255, 215, 0), "boots")
-
-def generate_diamond_helmet_texture():
-    """Generate diamond helmet texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (0, 191, 255), "helmet")
-
-def generate_diamond_chestplate_texture():
-    """Generate diamond chestplate texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (0, 191, 255), "chestplate")
-
-def generate_diamond_leggings_texture():
-    """Generate diamond leggings texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (0, 191, 255), "leggings")
-
-def generate_diamond_boots_texture():
-    """Generate diamond boots texture"""
-    return make_armor_texture_with_color(TILE_SIZE, (0, 191, 255), "boots")
+ARMOR_MATERIAL_COLORS = {
+    "leather": (139, 69, 19),
+    "chainmail": (169, 169, 169),
+    "gold": (255, 215, 0),
+    "diamond": (0, 191, 255),
+    "iron": (192, 192, 192),
+}
+ARMOR_SLOTS = ("helmet", "chestplate", "leggings", "boots")
 
 def make_armor_texture_with_color(size, base_color, armor_type):
     """EXTREME ENGINEERING: Universal armor texture generator with material colors"""
@@ -1576,22 +1584,6 @@ def make_armor_texture_with_color(size, base_color, armor_type):
     pygame.draw.rect(surf, outline, (0, 0, size, size), 1)
     return surf
 
-def generate_iron_helmet_texture():
-    """Generate iron helmet texture (enhanced version)"""
-    return make_armor_texture_with_color(TILE_SIZE, (192, 192, 192), "helmet")
-
-def generate_iron_chestplate_texture():
-    """Generate iron chestplate texture (enhanced version)"""
-    return make_armor_texture_with_color(TILE_SIZE, (192, 192, 192), "chestplate")
-
-def generate_iron_leggings_texture():
-    """Generate iron leggings texture (enhanced version)"""
-    return make_armor_texture_with_color(TILE_SIZE, (192, 192, 192), "leggings")
-
-def generate_iron_boots_texture():
-    """Generate iron boots texture (enhanced version)"""
-    return make_armor_texture_with_color(TILE_SIZE, (192, 192, 192), "boots")
-
 # --- Door Texture Generator ---
 def make_door_texture(size):
     """Procedurally draw a simple wooden door with handle."""
@@ -1931,181 +1923,57 @@ def generate_carbine_field(center_x: int, ground_y: int, world_rng):
 
 def generate_terrain_column(x):
     """Generate realistic terrain for a specific column if it hasn't been generated yet"""
-    global generated_terrain_columns
-    
     # Skip if already generated - CRITICAL: This prevents terrain overlap!
     if x in generated_terrain_columns:
         print(f"⏭️ Skipping terrain generation for column {x} - already generated")
         return
     
     print(f"🌍 Generating terrain for NEW column {x}")
+    if plan_terrain_column is None or biome_map is None:
+        return
     
-    # NATURAL HILL GENERATION: Create terrain that follows natural contours
-    # Use multiple noise functions for more natural terrain
-    base_height = 115  # Base surface level
-    
-    # Primary terrain variation
-    primary_wave = 8 * math.sin(x * 0.05)  # Large hills/valleys
-    secondary_wave = 3 * math.sin(x * 0.15)  # Medium variations  
-    tertiary_wave = 2 * math.sin(x * 0.3)   # Small details
-    
-    # Combine waves for natural terrain
-    height_variation = int(primary_wave + secondary_wave + tertiary_wave)
-    surface_y = base_height + height_variation
-    
-    # Ensure surface is in reasonable range
-    surface_y = max(100, min(125, surface_y))
-    
-    # NATURAL TERRAIN GENERATION: Build hills from base up, not cutting through
-    # Generate terrain layers from bottom to top to create natural hill contours
-    
-    # 1. BEDROCK at bottom - CHECK FOR EXISTING BLOCKS
-    bedrock_y = 327  # 200 blocks below surface (surface_y + 200)
-    if get_block(x, bedrock_y) is None:
-        set_block(x, bedrock_y, "bedrock")
-    
-    # 2. STONE LAYER: Fill from bedrock up to surface (200 blocks deep!)
-    for y in range(surface_y + 3, bedrock_y):  # Stone fills 200 blocks underground
-        if get_block(x, y) is None:
-            set_block(x, y, "stone")
-    
-    # 3. DIRT LAYER: 2 blocks below surface - NEVER underground
-    for y in range(surface_y + 1, surface_y + 3):
-        if get_block(x, y) is None:
-            set_block(x, y, "dirt")
-    
-    # 4. GRASS: ONLY at exact surface level - NEVER underground
-    if get_block(x, surface_y) is None:
-        set_block(x, surface_y, "grass")  # Surface ONLY - NEVER underground!
-    
-    # BIOME-BASED TERRAIN GENERATION: Handle different biomes
-    biome_type = get_biome_type(x)
+    # BIOME-BASED TERRAIN GENERATION: layers, biome surface, trees, ores and carrots (see chunk_pregen)
+    biome = biome_map.info(x)
     
     # Debug: Print biome type for first few columns
     if x < 10:
-        print(f"🌍 Column {x}: Biome = {biome_type}")
-    
-    # CAVE SYSTEM REMOVED - No longer generating caves
-    
-    # DESERT BIOME TERRAIN: Replace grass with sand in desert biomes
-    if biome_type == "desert":
-        # Replace surface grass with sand
-        if get_block(x, surface_y) == "grass":
-            set_block(x, surface_y, "sand")
-        # Replace underground dirt with sand too (desert sand goes deeper)
-        for depth in range(1, min(8, surface_y + 1)):
-            if get_block(x, surface_y - depth) == "dirt":
-                set_block(x, surface_y - depth, "sand")
-        
-        # Deserts have very few trees (cacti would be better, but we don't have that texture)
-        # So we'll just have sparse trees
-        if random.random() < 0.02 and should_generate_tree(x, surface_y, biome_type):  # Very rare trees in desert
-            # Same tree generation as other biomes
-            if get_block(x, surface_y - 1) is None and (surface_y - 1) < surface_y:
-                set_block(x, surface_y - 1, "log")
-                if get_block(x, surface_y - 2) is None and (surface_y - 2) < surface_y:
-                    set_block(x, surface_y - 2, "log")
-                
-                # Leaves
-                if get_block(x - 1, surface_y - 3) is None and (surface_y - 3) < surface_y:
-                    set_block(x - 1, surface_y - 3, "leaves")
-                if get_block(x, surface_y - 3) is None and (surface_y - 3) < surface_y:
-                    set_block(x, surface_y - 3, "leaves")
-                if get_block(x + 1, surface_y - 3) is None and (surface_y - 3) < surface_y:
-                    set_block(x + 1, surface_y - 3, "leaves")
-                
-                if get_block(x - 1, surface_y - 2) is None and (surface_y - 2) < surface_y:
-                    set_block(x - 1, surface_y - 2, "leaves")
-                if get_block(x + 1, surface_y - 2) is None and (surface_y - 2) < surface_y:
-                    set_block(x + 1, surface_y - 2, "leaves")
-    
-    # NORMAL BIOME TREE GENERATION: Forests have lots of trees, fields have few
-    elif biome_type in ["forest", "field", "mixed"] and should_generate_tree(x, surface_y, biome_type):
-        # ABSOLUTE RULE: Trees can ONLY spawn ABOVE surface (y < surface_y) - NEVER underground!
-        # Tree trunk: 2 stacked logs - CHECK FOR EXISTING BLOCKS
-        # CRITICAL: Trees can NEVER EVER spawn underground or at ground level
-        if get_block(x, surface_y - 1) is None and (surface_y - 1) < surface_y:
-            set_block(x, surface_y - 1, "log")  # Bottom log (ABOVE surface only)
-            if get_block(x, surface_y - 2) is None and (surface_y - 2) < surface_y:
-                set_block(x, surface_y - 2, "log")  # Top log (ABOVE surface only)
-            
-            # Perfect 6-leaf formation in a block pattern - CHECK FOR EXISTING BLOCKS
-            # Top row (3 leaves) - ONLY ABOVE SURFACE - NEVER underground!
-            if get_block(x - 1, surface_y - 3) is None and (surface_y - 3) < surface_y:
-                set_block(x - 1, surface_y - 3, "leaves")  # Left
-            if get_block(x, surface_y - 3) is None and (surface_y - 3) < surface_y:
-                set_block(x, surface_y - 3, "leaves")      # Center
-            if get_block(x + 1, surface_y - 3) is None and (surface_y - 3) < surface_y:
-                set_block(x + 1, surface_y - 3, "leaves")  # Right
-            
-            # Bottom row (3 leaves) - ONLY ABOVE SURFACE - NEVER underground!
-            if get_block(x - 1, surface_y - 2) is None and (surface_y - 2) < surface_y:
-                set_block(x - 1, surface_y - 2, "leaves")  # Left (at log level)
-            if get_block(x + 1, surface_y - 2) is None and (surface_y - 2) < surface_y:
-                set_block(x + 1, surface_y - 2, "leaves")  # Right (at log level)
-            if get_block(x, surface_y - 4) is None and (surface_y - 4) < surface_y:
-                set_block(x, surface_y - 4, "leaves")      # Top center (above the 3-leaf row)
-    
-    # Add underground ores with proper rarity distribution - CHECK FOR EXISTING BLOCKS
-    ore_chance = random.random()
-    
-    # Ensure valid range for ore placement in the deep stone layer
-    min_ore_y = surface_y + 5
-    max_ore_y = bedrock_y - 1  # Ore can go almost to bedrock
-    
-    # Multiple ore chances per column for more ores underground
-    for _ in range(3):  # Try to place up to 3 ores per column
-        if ore_chance < 0.8:  # 80% chance for at least one ore per column
-            if min_ore_y <= max_ore_y:  # Only place ore if range is valid
-                ore_y = random.randint(min_ore_y, max_ore_y)
-
-                # Depth-based ore rarity system
-                depth_from_surface = ore_y - surface_y
-                depth_percentage = depth_from_surface / (bedrock_y - surface_y)
-
-                # Ore rarity based on depth and random chance
-                ore_roll = random.random()
-
-                # Coal: Common (60% chance), spawns at any depth
-                if ore_roll < 0.6:
-                    ore_type = "coal"
-                # Iron: Uncommon (25% chance), spawns at any depth
-                elif ore_roll < 0.85:
-                    ore_type = "iron"
-                # Gold: Slightly rare (12% chance), spawns deeper (50%+ depth)
-                elif ore_roll < 0.97 and depth_percentage > 0.5:
-                    ore_type = "gold"
-                # Diamond: Rare (3% chance), spawns very deep (80%+ depth)
-                elif depth_percentage > 0.8:
-                    ore_type = "diamond"
-                else:
-                    ore_type = "coal"  # Fallback to coal if conditions not met
-                
-                # Only place ore if the location is empty
-                if get_block(x, ore_y) is None:
-                    set_block(x, ore_y, ore_type)
+        print(f"🌍 Column {x}: Biome = {biome.biome}")
+    
+    # The column's own seeded RNG - the same column as the background pre-generator would plan
+    install_terrain_column(x, plan_terrain_column(x, biome, column_rng(biome_map.seed, x), get_block))
+
+def install_terrain_column(x, column_blocks):
+    """Place a planned column's blocks (only into empty spots) and mark the column generated"""
+    global generated_terrain_columns
     
-        # Reduce chance for additional ores
-        ore_chance = random.random() * 0.4  # 40% chance for second ore, 16% for third
+    # A column is only ever generated once - the player may have changed it since it was planned
+    if x in generated_terrain_columns:
+        return
     
-    # Add surface items (carrots and chests) - CHECK FOR EXISTING BLOCKS
-    if can_place_surface_item(x, surface_y):
-        # Carrots - 15% chance
-        if random.random() < 0.15:
-            # Only place carrot if the location is empty
-            if get_block(x, surface_y - 1) is None:
-                set_block(x, surface_y - 1, "carrot")
-        
-        # Chests removed from natural spawning - only spawn in fortresses and structures now
-        # (Chest generation in fortresses is handled separately)
+    for block_x, block_y, block_type in column_blocks:
+        if get_block(block_x, block_y) is None:
+            set_block(block_x, block_y, block_type)
     
     # Safety check: Ensure at least the surface block was placed
+    surface_y = surface_height(x)
     if get_block(x, surface_y) is None:
         print(f"⚠️ WARNING: Surface block missing at ({x}, {surface_y}), forcing placement...")
         set_block(x, surface_y, "grass")
     
     # Mark as generated
     generated_terrain_columns.add(x)
+
+def chunk_terrain_complete(chunk_id):
+    """True once every column of the chunk has terrain"""
+    base_x = chunk_id * config.world_chunk_size
+    return all(x in generated_terrain_columns for x in range(base_x, base_x + config.world_chunk_size))
+
+def roll_chunk_fortress(chunk_id):
+    """Give a chunk its one deterministic fortress roll (after its terrain is in)"""
+    if chunk_id in fortress_checked_chunks:
+        return
+    fortress_checked_chunks.add(chunk_id)
+    maybe_generate_fortress_for_chunk(chunk_id, chunk_id * config.world_chunk_size)
     
 # Cave generation functions removed
 
@@ -2968,53 +2836,79 @@ def fix_player_spawn_position():
     return True
 
 
-# Load textures
-textures = {
-    "grass": load_texture(os.path.join(TILE_DIR, "grass.png")),
-    "dirt": load_texture(os.path.join(TILE_DIR, "dirt.png")),
-    "stone": load_texture(os.path.join(TILE_DIR, "stone.png")),
-    "bedrock": load_texture(os.path.join(TILE_DIR, "bedrock.png")),
-    "carrot": load_texture(os.path.join(TILE_DIR, "carrot.gif")),
-    "chest": load_texture(os.path.join(TILE_DIR, "chest.png")),
-    "coal": load_texture(os.path.join(TILE_DIR, "coal.png")),
-    "iron": load_texture(os.path.join(TILE_DIR, "iron.png")),
-    "gold": load_texture(os.path.join(TILE_DIR, "gold.png")),
-    "diamond": load_texture(os.path.join(TILE_DIR, "diamond.png")),
-    "log": load_texture(os.path.join(TILE_DIR, "log.png")),
-    "leaves": load_texture(os.path.join(TILE_DIR, "leaves.png")),
-    "red_brick": load_texture(os.path.join(TILE_DIR, "red_brick.png")),
-    "oak_planks": load_texture(os.path.join(TILE_DIR, "oak_planks.png")),
-    "sword": load_texture(os.path.join(ITEM_DIR, "sword.png")),
-    "stone_sword": load_texture(os.path.join(ITEM_DIR, "stone_sword.png")),  # Using actual stone sword texture
-    "pickaxe": load_texture(os.path.join(ITEM_DIR, "pickaxe.png")),
-    "water": make_beautiful_water_texture(TILE_SIZE),
-    "lava": load_texture(os.path.join(TILE_DIR, "lava.png")),
-    "sand": load_texture(os.path.join(TILE_DIR, "sand.png")),
-    "snow": make_snow_texture(TILE_SIZE),  # Generated snow texture
-    "torch": make_torch_texture(TILE_SIZE),  # Generated torch texture
-    "bed": load_texture(os.path.join(TILE_DIR, "bed.png")),
-    "ladder": make_ladder_texture(TILE_SIZE),
-    "door": load_texture(os.path.join(TILE_DIR, "door.png")), 
-    "bread": load_texture(os.path.join(ITEM_DIR, "bread.png")),
-    "cooked_fish": load_texture(os.path.join(ITEM_DIR, "cooked_fish.png")),
-    "steak": load_texture(os.path.join(ITEM_DIR, "steak.png")),
-    "honey_jar": load_texture(os.path.join(ITEM_DIR, "honey_jar.png")),
-    "saddle": make_saddle_texture(TILE_SIZE),  # Procedural saddle item texture
-    "stick": load_texture(os.path.join(TILE_DIR, "log.png")),  # Using log as stick for now
-    "seeds": make_seeds_texture(TILE_SIZE),  # Procedural green dots
-    "crop_young": make_crop_texture(TILE_SIZE, 0),  # Green growing crop
-    "crop_mature": make_crop_texture(TILE_SIZE, 1),  # Tan mature crop ready for harvest
-    
-    # Potions (flipped upside down)
-    "healing_potion": pygame.transform.flip(load_texture(os.path.join(ITEM_DIR, "potion.png")), False, True) if os.path.exists(os.path.join(ITEM_DIR, "potion.png")) else make_potion_texture(TILE_SIZE),
-    "speed_potion": pygame.transform.flip(load_texture(os.path.join(ITEM_DIR, "potion.png")), False, True) if os.path.exists(os.path.join(ITEM_DIR, "potion.png")) else make_potion_texture(TILE_SIZE),
-    "strength_potion": pygame.transform.flip(load_texture(os.path.join(ITEM_DIR, "potion.png")), False, True) if os.path.exists(os.path.join(ITEM_DIR, "potion.png")) else make_potion_texture(TILE_SIZE),
-    
-    "shopkeeper": load_texture(os.path.join(TILE_DIR, "shopkeeper.png")),
-    "boss": load_texture(os.path.join(MOB_DIR, "boss.png")),
+# Texture files (name -> path), decoded in the background by the asset loader (see ASSET MANIFEST)
+TEXTURE_FILES = {
+    "grass": os.path.join(TILE_DIR, "grass.png"),
+    "dirt": os.path.join(TILE_DIR, "dirt.png"),
+    "stone": os.path.join(TILE_DIR, "stone.png"),
+    "bedrock": os.path.join(TILE_DIR, "bedrock.png"),
+    "carrot": os.path.join(TILE_DIR, "carrot.gif"),
+    "chest": os.path.join(TILE_DIR, "chest.png"),
+    "coal": os.path.join(TILE_DIR, "coal.png"),
+    "iron": os.path.join(TILE_DIR, "iron.png"),
+    "gold": os.path.join(TILE_DIR, "gold.png"),
+    "diamond": os.path.join(TILE_DIR, "diamond.png"),
+    "log": os.path.join(TILE_DIR, "log.png"),
+    "leaves": os.path.join(TILE_DIR, "leaves.png"),
+    "red_brick": os.path.join(TILE_DIR, "red_brick.png"),
+    "oak_planks": os.path.join(TILE_DIR, "oak_planks.png"),
+    "sword": os.path.join(ITEM_DIR, "sword.png"),
+    "stone_sword": os.path.join(ITEM_DIR, "stone_sword.png"),  # Using actual stone sword texture
+    "pickaxe": os.path.join(ITEM_DIR, "pickaxe.png"),
+    "lava": os.path.join(TILE_DIR, "lava.png"),
+    "sand": os.path.join(TILE_DIR, "sand.png"),
+    "bed": os.path.join(TILE_DIR, "bed.png"),
+    "door": os.path.join(TILE_DIR, "door.png"), 
+    "bread": os.path.join(ITEM_DIR, "bread.png"),
+    "cooked_fish": os.path.join(ITEM_DIR, "cooked_fish.png"),
+    "steak": os.path.join(ITEM_DIR, "steak.png"),
+    "honey_jar": os.path.join(ITEM_DIR, "honey_jar.png"),
+    "stick": os.path.join(TILE_DIR, "log.png"),  # Using log as stick for now
+    
+    "shopkeeper": os.path.join(TILE_DIR, "shopkeeper.png"),
+    "boss": os.path.join(MOB_DIR, "boss.png"),
+    
+    "zombie": os.path.join(MOB_DIR, "zombie.png"),
+    # monster.png if there is one, otherwise monster.gif
+    "monster": os.path.join(MOB_DIR, "monster.png") if os.path.exists(os.path.join(MOB_DIR, "monster.png")) else os.path.join(MOB_DIR, "monster.gif"),
+    "beef": os.path.join(ITEM_DIR, "beef.png"),
+    "wheat": os.path.join(ITEM_DIR, "wheat.png"),
+    "horse": os.path.join(MOB_DIR, "horse.png"),
+    "horse_saddle": os.path.join(MOB_DIR, "horse_saddle.png"),
+    "cow": os.path.join(MOB_DIR, "cow.png"),
+    "ladder": os.path.join(TILE_DIR, "ladder.png"),  # Replaces the procedural ladder once loaded
     
         # Portal texture removed - using ability system instead
 }
+POTION_FILE = os.path.join(ITEM_DIR, "potion.png")
+POTION_TEXTURES = ("healing_potion", "speed_potion", "strength_potion")
+
+textures = {}
+
+# Procedural textures are drawn on first use and cached on disk (keyed by generator code), not drawn here
+if ProceduralTextures is not None:
+    textures = ProceduralTextures(os.path.join(SAVE_DIR, "texture_cache"), textures)
+
+def register_texture(name, generator, *args):
+    """Procedural TILE_SIZE texture, drawn lazily when the texture cache is available"""
+    if ProceduralTextures is not None:
+        textures.register(name, generator, TILE_SIZE, *args)
+    else:
+        textures[name] = generator(TILE_SIZE, *args)
+
+register_texture("water", make_beautiful_water_texture)
+register_texture("snow", make_snow_texture)  # Generated snow texture
+register_texture("torch", make_torch_texture)  # Generated torch texture
+register_texture("ladder", make_ladder_texture)
+register_texture("saddle", make_saddle_texture)  # Procedural saddle item texture
+register_texture("seeds", make_seeds_texture)  # Procedural green dots
+register_texture("crop_young", make_crop_texture, 0)  # Green growing crop
+register_texture("crop_mature", make_crop_texture, 1)  # Tan mature crop ready for harvest
+
+# Potions (flipped upside down) - drawn only when there's no potion.png for the loader
+if not os.path.exists(POTION_FILE):
+    for potion_name in POTION_TEXTURES:
+        register_texture(potion_name, make_potion_texture)
 
 # Create map texture programmatically
 map_texture = pygame.Surface((TILE_SIZE, TILE_SIZE))
@@ -3028,207 +2922,116 @@ textures["map"] = map_texture
 
 # Villager texture removed
 
-# --- Zombie texture (tries file, falls back to procedural) ---
-try:
-    textures["zombie"] = load_texture(os.path.join(MOB_DIR, "zombie.png"))
-except Exception:
-    textures["zombie"] = make_zombie_texture(TILE_SIZE)
-
-# --- Monster texture (tries PNG first, then GIF, falls back to zombie texture) ---
-try:
-    textures["monster"] = load_texture(os.path.join(MOB_DIR, "monster.png"))
-    print("✅ Loaded monster.png texture")
-except Exception:
-    try:
-        textures["monster"] = load_texture(os.path.join(MOB_DIR, "monster.gif"))
-        print("✅ Loaded monster.gif texture")
-    except Exception:
-        # Fallback to zombie texture if neither found
-        textures["monster"] = textures["zombie"]
-        print("⚠️ Using zombie texture as fallback for monster")
+# Zombie, monster, beef, wheat, horse, cow and bed textures come from TEXTURE_FILES
+# (a missing file gets load_texture's colored fallback square, as before)
 
 # --- Slime texture (procedurally generated) ---
-textures["slime"] = make_slime_texture(TILE_SIZE)
-
-# --- Beef texture (tries file, falls back to steak texture) ---
-try:
-    textures["beef"] = load_texture(os.path.join(ITEM_DIR, "beef.png"))
-    print("✅ Loaded beef.png texture")
-except Exception:
-    textures["beef"] = textures["steak"]  # Fallback to steak texture
-    print("⚠️ Using steak texture as fallback for beef")
-
-# --- Wheat texture (tries file, falls back to carrot) ---
-try:
-    textures["wheat"] = load_texture(os.path.join(ITEM_DIR, "wheat.png"))
-    print("✅ Loaded wheat.png texture")
-except Exception:
-    textures["wheat"] = load_texture(os.path.join(TILE_DIR, "carrot.gif"))  # Fallback to carrot
-    print("⚠️ Using carrot texture as fallback for wheat")
+register_texture("slime", make_slime_texture)
 
 # --- Mad Pigeon texture (procedurally generated) ---
-textures["mad_pigeon"] = make_mad_pigeon_texture(TILE_SIZE)
-
-# --- Horse textures (tries file, falls back to procedural) ---
-try:
-    textures["horse"] = load_texture(os.path.join(MOB_DIR, "horse.png"))
-    print("✅ Loaded horse.png texture")
-except Exception:
-    # Fallback to placeholder
-    horse_image = pygame.Surface((TILE_SIZE * 2, TILE_SIZE * 1.5), pygame.SRCALPHA)
-    horse_image.fill((120, 80, 50))
-    textures["horse"] = horse_image
-    print("⚠️ Using placeholder texture for horse")
-
-try:
-    textures["horse_saddle"] = load_texture(os.path.join(MOB_DIR, "horse_saddle.png"))
-    print("✅ Loaded horse_saddle.png texture")
-except Exception:
-    # Fallback to placeholder
-    horse_saddle_image = pygame.Surface((TILE_SIZE * 2, TILE_SIZE * 1.5), pygame.SRCALPHA)
-    horse_saddle_image.fill((150, 100, 60))
-    textures["horse_saddle"] = horse_saddle_image
-    print("⚠️ Using placeholder texture for horse_saddle")
-
-# --- Cow texture ---
-try:
-    textures["cow"] = load_texture(os.path.join(MOB_DIR, "cow.png"))
-except Exception:
-    # Fallback to a simple brown rectangle if cow.png not found
-    cow_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-    pygame.draw.rect(cow_surf, (139, 69, 19), (4, 4, TILE_SIZE-8, TILE_SIZE-8))  # Brown
-    textures["cow"] = cow_surf
+register_texture("mad_pigeon", make_mad_pigeon_texture)
 
 # Shopkeeper texture removed
 
-# --- Bed texture (tries file, falls back to a procedural bed texture) ---
-try:
-    textures["bed"] = load_texture(os.path.join(TILE_DIR, "bed.png"))  # preferred: assets/tiles/bed.png
-except Exception:
-    textures["bed"] = make_bed_texture(TILE_SIZE)
-
-# --- Armor textures (tries files, falls back to procedural textures) ---
-try:
-    textures["iron_helmet"] = load_texture(os.path.join(ITEM_DIR, "iron_helmet.png"))
-except Exception:
-    textures["iron_helmet"] = make_helmet_texture(TILE_SIZE)
-
-try:
-    textures["iron_chestplate"] = load_texture(os.path.join(ITEM_DIR, "iron_chestplate.png"))
-except Exception:
-    textures["iron_chestplate"] = make_chestplate_texture(TILE_SIZE)
-
-try:
-    textures["iron_leggings"] = load_texture(os.path.join(ITEM_DIR, "iron_leggings.png"))
-except Exception:
-    textures["iron_leggings"] = make_leggings_texture(TILE_SIZE)
-
-try:
-    textures["iron_boots"] = load_texture(os.path.join(ITEM_DIR, "iron_boots.png"))
-except Exception:
-    textures["iron_boots"] = make_boots_texture(TILE_SIZE)
-
 # --- EXTREME ENGINEERING: Enhanced armor textures with all materials ---
-# Leather armor
-textures["leather_helmet"] = generate_leather_helmet_texture()
-textures["leather_chestplate"] = generate_leather_chestplate_texture()
-textures["leather_leggings"] = generate_leather_leggings_texture()
-textures["leather_boots"] = generate_leather_boots_texture()
-
-# Chainmail armor
-textures["chainmail_helmet"] = generate_chainmail_helmet_texture()
-textures["chainmail_chestplate"] = generate_chainmail_chestplate_texture()
-textures["chainmail_leggings"] = generate_chainmail_leggings_texture()
-textures["chainmail_boots"] = generate_chainmail_boots_texture()
-
-# Gold armor
-textures["gold_helmet"] = generate_gold_helmet_texture()
-textures["gold_chestplate"] = generate_gold_chestplate_texture()
-textures["gold_leggings"] = generate_gold_leggings_texture()
-textures["gold_boots"] = generate_gold_boots_texture()
-
-# Diamond armor
-textures["diamond_helmet"] = generate_diamond_helmet_texture()
-textures["diamond_chestplate"] = generate_diamond_chestplate_texture()
-textures["diamond_leggings"] = generate_diamond_leggings_texture()
-textures["diamond_boots"] = generate_diamond_boots_texture()
-
-# Enhanced iron armor (replace old versions)
-textures["iron_helmet"] = generate_iron_helmet_texture()
-textures["iron_chestplate"] = generate_iron_chestplate_texture()
-textures["iron_leggings"] = generate_iron_leggings_texture()
-textures["iron_boots"] = generate_iron_boots_texture()
+# These always replaced the iron armor files, so those files aren't loaded at all
+for material, color in ARMOR_MATERIAL_COLORS.items():
+    for slot in ARMOR_SLOTS:
+        register_texture(f"{material}_{slot}", make_armor_texture_with_color, color, slot)
 
 # =============================================================================
 # AUTOMATIC GIF ANIMATION SYSTEM
 # =============================================================================
 
+# GIFs are decoded into sprite sheets once (and again only when a GIF changes), not on every launch
+sprite_sheets = SpriteSheetCache(os.path.join(SAVE_DIR, "sprite_sheets")) if SpriteSheetCache else None
+if sprite_sheets and AssetLoader is None:  # Otherwise the asset loader builds them on its threads
+    sheets_built = sprite_sheets.prepare(find_animation_gifs(assets_root))
+    if sheets_built:
+        print(f"🎞️ Built {sheets_built} sprite sheets")
+
 # Player Animation System
 player_animations = {}
 
 class PlayerAnimator:
     """Player animation system with proper GIF frame cycling"""
     
-    def __init__(self):
+    ANIMATION_FILES = ["standing.gif", "walking.gif", "falling.gif"]
+    
+    def __init__(self, load=True):
         self.animations = {}  # Store animation data for each animation
         self.current_animation = "standing"
         self.frame_timers = {}  # Track frame timing for each animation
-        self.load_animations()
+        if load:  # Otherwise the asset loader hands frames over as they're decoded
+            self.load_animations()
     
-    def load_animations(self):
-        """Load all player animations from the animations folder and extract frames"""
+    @staticmethod
+    def animations_dir():
+        """Folder holding the player animation GIFs"""
         # Use PyInstaller-compatible path resolution
         if getattr(sys, 'frozen', False):
             # Running as executable - use bundled assets
-            animations_dir = os.path.join(get_resource_path("assets"), "player", "animations")
-        else:
-            # Running as script - use relative path
-            animations_dir = os.path.join("../../../../player", "animations")
-        
-        if not os.path.exists(animations_dir):
-            print(f"⚠️ Animations directory not found: {animations_dir}")
+            return os.path.join(get_resource_path("assets"), "player", "animations")
+        # Running as script - use relative path
+        return os.path.join("../../../../player", "animations")
+    
+    def animation_paths(self):
+        """Animation name -> GIF path"""
+        animations_dir = self.animations_dir()
+        return {anim_file.replace(".gif", ""): os.path.join(animations_dir, anim_file)
+                for anim_file in self.ANIMATION_FILES}
+    
+    def load_animations(self):
+        """Load all player animations from the animations folder and extract frames"""
+        if not os.path.exists(self.animations_dir()):
+            print(f"⚠️ Animations directory not found: {self.animations_dir()}")
             return
         
-        animation_files = ["standing.gif", "walking.gif", "falling.gif"]
-        
-        for anim_file in animation_files:
-            anim_path = os.path.join(animations_dir, anim_file)
+        for animation_name, anim_path in self.animation_paths().items():
             if os.path.exists(anim_path):
                 try:
                     # Load the GIF and extract frames
                     frames = self.extract_gif_frames(anim_path)
                     if frames:
-                        animation_name = anim_file.replace(".gif", "")
-                        
-                        # Set different frame rates for each animation
-                        if animation_name == "walking":
-                            frame_duration = 125  # 8 frames per second (1000ms / 8fps = 125ms)
-                        elif animation_name == "standing":
-                            frame_duration = 1000  # 1 frame per second (1000ms / 1fps = 1000ms)
-                        elif animation_name == "falling":
-                            frame_duration = 500   # 2 frames per second (1000ms / 2fps = 500ms)
-                        else:
-                            frame_duration = 100   # Default fallback
-                        
-                        self.animations[animation_name] = {
-                            'frames': frames,
-                            'current_frame': 0,
-                            'frame_duration': frame_duration,
-                            'last_frame_time': 0
-                        }
-                        self.frame_timers[animation_name] = 0
-                        print(f"🎬 Loaded animation: {animation_name} with {len(frames)} frames at {1000//frame_duration}fps")
+                        gif_durations = sprite_sheets.durations(anim_path) if sprite_sheets else []
+                        self.add_animation(animation_name, frames, gif_durations)
                     else:
-                        print(f"⚠️ No frames extracted from {anim_file}")
+                        print(f"⚠️ No frames extracted from {os.path.basename(anim_path)}")
                 except Exception as e:
-                    print(f"❌ Failed to load {anim_file}: {e}")
+                    print(f"❌ Failed to load {os.path.basename(anim_path)}: {e}")
             else:
                 print(f"⚠️ Animation file not found: {anim_path}")
         
         print(f"🎬 Animation system ready with {len(self.animations)} animations")
     
+    def add_animation(self, animation_name, frames, gif_durations=None):
+        """Store an animation's frames at its frame rate"""
+        # Set different frame rates for each animation
+        if animation_name == "walking":
+            frame_duration = 125  # 8 frames per second (1000ms / 8fps = 125ms)
+        elif animation_name == "standing":
+            frame_duration = 1000  # 1 frame per second (1000ms / 1fps = 1000ms)
+        elif animation_name == "falling":
+            frame_duration = 500   # 2 frames per second (1000ms / 2fps = 500ms)
+        else:
+            # Default to the GIF's own timing
+            frame_duration = gif_durations[0] if gif_durations else 100
+        
+        self.animations[animation_name] = {
+            'frames': frames,
+            'current_frame': 0,
+            'frame_duration': frame_duration,
+            'last_frame_time': 0
+        }
+        self.frame_timers[animation_name] = 0
+        print(f"🎬 Loaded animation: {animation_name} with {len(frames)} frames at {1000//frame_duration}fps")
+    
     def extract_gif_frames(self, gif_path):
         """Extract frames from a GIF file"""
+        if sprite_sheets:
+            frames = sprite_sheets.frames(gif_path, (TILE_SIZE, TILE_SIZE))
+            if frames:
+                return frames
         try:
             # Try to use PIL for proper GIF frame extraction
             try:
@@ -3342,55 +3145,107 @@ class PlayerAnimator:
         """Get current animation frame"""
         return self.get_animation(self.current_animation)
 
-# Initialize player animator
-player_animator = PlayerAnimator()
+# Initialize player animator (the asset loader hands it frames when it can use the sprite sheets)
+player_animator = PlayerAnimator(load=AssetLoader is None or sprite_sheets is None)
 
-# --- Ladder texture (tries file, falls back to procedural ladder texture) ---
-try:
-    textures["ladder"] = load_texture(os.path.join(TILE_DIR, "ladder.png"))  # preferred: assets/tiles/ladder.png
-except Exception:
-    # keep the already-generated ladder texture if file missing
-    textures["ladder"] = make_ladder_texture(TILE_SIZE)
 
+# =============================================================================
+# ASSET MANIFEST - files decoded on worker threads, finished on the main thread
+# =============================================================================
 
-player_image = load_texture(os.path.join(PLAYER_DIR, "player.gif"))
-# Try to load monster.png first, fallback to monster.gif
-try:
-    monster_image = load_texture(os.path.join(MOB_DIR, "monster.png"))
-except Exception:
-    monster_image = load_texture(os.path.join(MOB_DIR, "monster.gif"))
-boss_image = load_texture(os.path.join(MOB_DIR, "boss.png"))
-villager_image = load_texture(os.path.join(MOB_DIR, "villager.png"))
-alive_hp = load_texture(os.path.join(HP_DIR, "alive_hp.png"))
-dead_hp = load_texture(os.path.join(HP_DIR, "dead_hp.png"))
+# Images kept in their own globals rather than in textures
+IMAGE_FILES = {
+    "player_image": os.path.join(PLAYER_DIR, "player.gif"),
+    "monster_image": TEXTURE_FILES["monster"],  # monster.png, or monster.gif without one
+    "boss_image": os.path.join(MOB_DIR, "boss.png"),
+    "villager_image": os.path.join(MOB_DIR, "villager.png"),
+    "alive_hp": os.path.join(HP_DIR, "alive_hp.png"),
+    "dead_hp": os.path.join(HP_DIR, "dead_hp.png"),
+}
+SOUND_FILES = {
+    "damage_sound": os.path.join(SOUND_DIR, "damage_sound.wav"),
+    "achievement_sound": os.path.join("achievement_sound", "achievement_unlock.wav"),
+}
+FONT_SIZES = {"font": 24, "small_font": 16, "title_font": 36, "BIG_FONT": 48}  # All Arial
+STUDIO_LOGO_FILE = os.path.join(assets_root, "studio logo", "Banana labs logo copy.png")
+ASSET_SLICE_MS = 4  # Main-thread time per frame for turning decoded files into surfaces
+
+# Filled in as the loader finishes them
+player_image = monster_image = boss_image = villager_image = alive_hp = dead_hp = None
+damage_sound = achievement_sound = None
+font = small_font = title_font = BIG_FONT = None
 
 # Boss texture will be loaded when needed
 
-# Load sound with error handling
-try:
-    damage_sound_path = os.path.join(SOUND_DIR, "damage_sound.wav")
-    if os.path.exists(damage_sound_path):
-        damage_sound = pygame.mixer.Sound(damage_sound_path)
-        print(f"🔊 Loaded damage sound: {damage_sound_path}")
-    else:
-        print(f"⚠️ Sound file not found: {damage_sound_path}")
-        damage_sound = None
-except Exception as e:
-    print(f"❌ Error loading damage sound: {e}")
-    damage_sound = None
+def build_asset_manifest():
+    """Everything loaded at startup - fonts and the studio logo first, so the loading screen can draw"""
+    manifest = AssetManifest()
+    tile = (TILE_SIZE, TILE_SIZE)
+    for name, size in FONT_SIZES.items():
+        manifest.add(name, "font", "Arial", PRIORITY_TITLE, size)
+    manifest.add("studio_logo", "texture", STUDIO_LOGO_FILE, PRIORITY_TITLE, (200, 200))
+    for name, path in list(TEXTURE_FILES.items()) + list(IMAGE_FILES.items()):
+        manifest.add(name, "texture", path, PRIORITY_GAME, tile)
+    if os.path.exists(POTION_FILE):
+        manifest.add("potion", "texture", POTION_FILE, PRIORITY_GAME, tile)
+    for name, path in SOUND_FILES.items():
+        manifest.add(name, "sound", path, PRIORITY_GAME)
+    if sprite_sheets:
+        player_gifs = player_animator.animation_paths()
+        for name, path in player_gifs.items():
+            manifest.add(f"animation:{name}", "animation", path, PRIORITY_GAME, tile)
+        # The other GIFs just get their sheets built; nothing animates them yet
+        player_gif_files = {os.path.realpath(path) for path in player_gifs.values()}
+        for path in find_animation_gifs(assets_root):
+            if os.path.realpath(path) not in player_gif_files:
+                manifest.add(f"sheet:{os.path.relpath(path, assets_root)}", "animation", path, PRIORITY_LATE, tile)
+    return manifest
+
+def on_asset_loaded(asset, value):
+    """Put a loaded asset where the game looks for it (value is None if the file couldn't be loaded)"""
+    name = asset.name
+    if asset.kind == "font":
+        globals()[name] = value or pygame.font.SysFont(asset.source, asset.size)
+    elif asset.kind == "sound":
+        if value is None:
+            print(f"⚠️ Sound file not found: {asset.source}")
+        else:
+            print(f"🔊 Loaded {name.replace('_', ' ')}: {asset.source}")
+        globals()[name] = value
+    elif asset.kind == "animation":
+        if name.startswith("animation:"):
+            frames, gif_durations = value or (player_animator.extract_gif_frames(asset.source), None)
+            if frames:
+                player_animator.add_animation(name.partition(":")[2], frames, gif_durations)
+    elif name != "studio_logo":  # The loading screen reads the logo from asset_loader.assets
+        if value is None:
+            value = load_texture(asset.source)  # Missing file: the same colored fallback as before
+        if name == "potion":
+            for potion_name in POTION_TEXTURES:
+                textures[potion_name] = pygame.transform.flip(value, False, True)
+        elif name in IMAGE_FILES:
+            if globals()[name] is None:  # A chosen character skin may have replaced it already
+                globals()[name] = value
+        else:
+            textures[name] = value
 
-# Load achievement sound
-try:
-    achievement_sound_path = os.path.join("achievement_sound", "achievement_unlock.wav")
-    if os.path.exists(achievement_sound_path):
-        achievement_sound = pygame.mixer.Sound(achievement_sound_path)
-        print(f"🏆 Loaded achievement sound: {achievement_sound_path}")
-    else:
-        print(f"⚠️ Achievement sound file not found: {achievement_sound_path}")
-        achievement_sound = None
-except Exception as e:
-    print(f"❌ Error loading achievement sound: {e}")
-    achievement_sound = None
+if AssetLoader is not None:
+    asset_loader = AssetLoader(build_asset_manifest(), on_asset_loaded,
+                               decoders={"animation": lambda asset: decode_animation(asset, sprite_sheets)}).start()
+    asset_loader.finish(PRIORITY_TITLE)  # Fonts and logo now; the rest loads behind the studio screen
+else:
+    asset_loader = None
+    for texture_name, texture_path in TEXTURE_FILES.items():
+        textures[texture_name] = load_texture(texture_path)
+    if os.path.exists(POTION_FILE):
+        for potion_name in POTION_TEXTURES:
+            textures[potion_name] = pygame.transform.flip(load_texture(POTION_FILE), False, True)
+    for image_name, image_path in IMAGE_FILES.items():
+        globals()[image_name] = load_texture(image_path)
+    for sound_name, sound_path in SOUND_FILES.items():
+        globals()[sound_name] = pygame.mixer.Sound(sound_path) if os.path.exists(sound_path) else None
+    for font_name, font_size in FONT_SIZES.items():
+        globals()[font_name] = pygame.font.SysFont("Arial", font_size)
 
 def play_damage_sound():
     """Safely play damage sound if available"""
@@ -3409,12 +3264,7 @@ def play_achievement_sound():
     except Exception as e:
         print(f"⚠️ Could not play achievement sound: {e}")
 
-
-# Fonts
-font = pygame.font.SysFont("Arial", 24)
-small_font = pygame.font.SysFont("Arial", 16)
-title_font = pygame.font.SysFont("Arial", 36)
-BIG_FONT = pygame.font.SysFont("Arial", 48)
+# Fonts (font, small_font, title_font, BIG_FONT) are loaded with the title-screen assets above
 
 # World management system will be initialized later in the new system
 
@@ -3907,6 +3757,9 @@ def generate_beach(center_x, surface_y):
                 else:  # 20% sand
                     set_block(x, y, "sand")
     
+    if structure_registry:
+        structure_registry.add("beach", center_x - beach_width//2, surface_y - beach_height,
+                               center_x + beach_width//2, surface_y)
     print(f"🏖️ Beach generated at ({center_x}, {surface_y}) with water and sand!")
 
 # =============================================================================
@@ -3950,48 +3803,143 @@ def update_fortress_bosses_removed():
                 
                 if distance <= 3:  # Attack range
                     # Create fireball projectile
-                    entities.append({
-                        "type": "fireball",
-                        "x": boss["x"],
-                        "y": boss["y"],
-                        "dx": 0.1 * dx / distance,
-                        "dy": 0.1 * dy / distance,
-                        "damage": 5,
-                        "lifetime": 120
-                    })
+                    spawn_projectile("fireball", boss["x"], boss["y"],
+                                     0.1 * dx / distance, 0.1 * dy / distance,
+                                     damage=5, lifetime=120, owner=boss)
                     
                     boss["attack_timer"] = 0
                     print("🔥 Fortress Boss shoots fireball!")
 
-def update_fireball_projectiles():
-    """Update fireball projectiles"""
-    global entities
+# =============================================================================
+# PROJECTILE SYSTEM
+# =============================================================================
+
+try:
+    from system.projectile_system import ProjectileSystem, SpatialHash, TEAM_HOSTILE, TEAM_FRIENDLY
+except ImportError:
+    print("⚠️ Warning: Projectile system not available")
+    ProjectileSystem = None
+
+if ProjectileSystem:
+    projectile_system = ProjectileSystem()
+    player_hit_index = SpatialHash(cell_size=2.0)  # Targets for hostile projectiles
+    mob_hit_index = SpatialHash(cell_size=2.0)     # Targets for thrown swords
+else:
+    projectile_system = None
+
+# Entity types that used to carry projectiles in the entities list (old saves)
+LEGACY_PROJECTILE_TYPES = {"projectile", "rock_projectile", "boss_projectile", "fireball", "thrown_sword"}
+
+# Mobs that thrown swords can hit
+SWORD_TARGET_TYPES = {"monster", "zombie", "boss"}
+
+PROJECTILE_HIT_MESSAGES = {
+    "rock": "💥 Rock projectile hit player! Damage: {damage}",
+    "boss": "🔥 Boss projectile hit player! Damage: {damage}",
+    "fireball": "🔥 Fireball hit player for {damage} damage!",
+}
+
+def spawn_projectile(kind, x, y, dx, dy, **options):
+    """Spawn a projectile in the shared pool and return its slot id (or None)"""
+    if not projectile_system:
+        return None
+    return projectile_system.spawn(kind, x, y, dx, dy, **options)
+
+def is_projectile_blocking(x, y):
+    """Tile test used by the projectile raycast"""
+    return is_solid_block(world_data.get(f"{x},{y}"))
+
+def update_projectiles():
+    """Move every projectile and apply the hits it reports"""
+    if not projectile_system or projectile_system.active_count == 0:
+        return
     
-    for projectile in entities[:]:
-        if projectile["type"] == "fireball":
-            # Move fireball
-            projectile["x"] += projectile["dx"]
-            projectile["y"] += projectile["dy"]
-            
-            # Decrease lifetime
-            projectile["lifetime"] -= 1
-            
-            # Check collision with player
-            dx = player["x"] - projectile["x"]
-            dy = player["y"] - projectile["y"]
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            if distance <= 0.5:  # Hit player
-                damage = calculate_armor_damage_reduction(projectile["damage"])
-                player["health"] -= damage
-                play_damage_sound()
-                entities.remove(projectile)
-                print(f"🔥 Fireball hit player for {damage} damage!")
-                continue
-            
-            # Remove if lifetime expired
-            if projectile["lifetime"] <= 0:
-                entities.remove(projectile)
+    # Rebuild the hit indexes once per frame
+    player_hit_index.clear()
+    player_hit_index.insert(player, player["x"], player["y"])
+    mob_hit_index.clear()
+    for entity in entities:
+        if entity["type"] in SWORD_TARGET_TYPES:
+            mob_hit_index.insert(entity, entity["x"], entity["y"])
+    
+    events = projectile_system.update(
+        is_projectile_blocking,
+        {TEAM_HOSTILE: player_hit_index, TEAM_FRIENDLY: mob_hit_index},
+        {"player": (player["x"], player["y"])},
+        target_alive=lambda entity: entity in entities
+    )
+    
+    for event in events:
+        if event["event"] == "hit":
+            if event["team"] == TEAM_HOSTILE:
+                damage_player_from_projectile(event)
+            else:
+                damage_mob_from_projectile(event)
+        elif event["event"] == "returned" and event["kind"] == "sword":
+            return_thrown_sword(event["payload"])
+
+def damage_player_from_projectile(event):
+    """Apply a hostile projectile hit to the player"""
+    damage = calculate_armor_damage_reduction(int(event["damage"]))
+    player["health"] -= damage
+    play_damage_sound()
+    message = PROJECTILE_HIT_MESSAGES.get(event["kind"])
+    if message:
+        print(message.format(damage=damage))
+    if player["health"] <= 0:
+        show_death_screen()
+
+def damage_mob_from_projectile(event):
+    """Apply a thrown sword hit to a mob"""
+    mob = event["target"]
+    if mob not in entities:
+        return
+    
+    mob["hp"] = mob.get("hp", 4) - int(event["damage"])
+    print(f"🗡️ Sword hit {mob['type']}! HP: {mob['hp']}")
+    
+    # Create hit effect particles
+    hit_x = (mob["x"] * TILE_SIZE) - camera_x
+    hit_y = (mob["y"] * TILE_SIZE) - camera_y
+    create_blood_particles(hit_x, hit_y, 8)
+    
+    if mob["hp"] <= 0:
+        # Track monster kill
+        track_monster_kill()
+        
+        # Create dramatic blood spray for death
+        create_monster_death_blood_spray(hit_x, hit_y)
+        
+        # Monster defeated - chance to drop coins
+        if random.random() < 0.15 and coins_manager:
+            coin_amount = random.randint(1, 2)
+            coins_manager.add_coins(coin_amount)
+        
+        entities.remove(mob)
+        print(f"💀 {mob['type']} defeated by thrown sword!")
+
+def draw_projectiles():
+    """Draw every projectile in the pool"""
+    if not projectile_system or projectile_system.active_count == 0:
+        return
+    
+    for slot, kind, x, y, dx, dy, returning in projectile_system.iter_active():
+        ex = int(x * TILE_SIZE) - camera_x
+        ey = int(y * TILE_SIZE) - camera_y
+        
+        # Only draw if on screen
+        if ex < -TILE_SIZE or ex > SCREEN_WIDTH or ey < -TILE_SIZE or ey > SCREEN_HEIGHT:
+            continue
+        
+        if kind == "rock":
+            # Draw rock projectile as a brown circle
+            pygame.draw.circle(screen, (139, 69, 19), (ex + 16, ey + 16), 8)
+        elif kind == "boss":
+            pygame.draw.rect(screen, (255, 100, 0), (ex + 12, ey + 12, 12, 12))  # Larger, orange projectile
+        elif kind == "fireball":
+            pygame.draw.circle(screen, (255, 100, 0), (ex + 16, ey + 16), 8)  # Orange fireball
+        elif kind == "sword":
+            draw_thrown_sword(slot, ex, ey, dx, dy)
 
 # =============================================================================
 # VILLAGE SYSTEM
@@ -4046,6 +3994,9 @@ def generate_village(center_x, surface_y):
         village_data["villagers"].append(villager_data)
     
     villages.append(village_data)
+    if structure_registry:
+        structure_registry.add("village", center_x - village_width//2, surface_y - village_height,
+                               center_x + village_width//2, surface_y + village_height//2)
     print(f"🏘️ Village generated at ({center_x}, {surface_y}) with {num_houses} houses and {num_villagers} villagers!")
 
 def generate_house(house_x, house_y):
@@ -4237,8 +4188,7 @@ def interact_with_villager(villager):
 # =============================================================================
 
 # Lost Ruins variables
-lost_ruins_entrances = []  # List of Lost Ruins entrance positions
-lost_ruins_systems = []    # List of Lost Ruins system data
+lost_ruins_systems = []    # List of Lost Ruins system data (entrances are in the structure registry)
 final_boss_active = False  # Whether the final boss is currently active
 final_boss_position = None  # Position of the final boss
 final_boss_health = 100  # Final boss health
@@ -4247,7 +4197,7 @@ credits_from_boss_defeat = False  # Whether credits screen is shown due to boss
 
 def generate_lost_ruins(center_x, surface_y):
     """Generate the Lost Ruins dungeon with portal to final boss"""
-    global lost_ruins_entrances, lost_ruins_systems
+    global lost_ruins_systems
     
     # Lost Ruins entrance (underground)
     entrance_width = 4
@@ -4260,9 +4210,6 @@ def generate_lost_ruins(center_x, surface_y):
             if get_block(x, y) in ["stone", "dirt", "grass"]:
                 set_block(x, y, "air")
     
-    # Add entrance to list
-    lost_ruins_entrances.append((center_x, entrance_y))
-    
     # Generate Lost Ruins structure
     ruins_data = {
         "entrance": (center_x, entrance_y),
@@ -4329,6 +4276,10 @@ def generate_lost_ruins(center_x, surface_y):
             set_block(tx, ty, "torch")
     
     lost_ruins_systems.append(ruins_data)
+    if structure_registry:
+        # Portal room on the left, boss room on the right, halls up to 13 blocks above the entrance
+        structure_registry.add("lost_ruins", portal_x - portal_width//2, boss_y - boss_height,
+                               boss_x + boss_width//2, entrance_y, entrance=[center_x, entrance_y])
     print(f"🏛️ Lost Ruins generated at ({center_x}, {entrance_y}) with portal and boss room!")
 
 def spawn_final_boss():
@@ -4398,15 +4349,8 @@ def update_final_boss():
         
         # Ranged attack - fire projectiles
         if dist > 0:
-            entities.append({
-                "type": "boss_projectile",
-                "x": boss_x,
-                "y": boss_y,
-                "dx": 0.2 * dx / dist,
-                "dy": 0.2 * dy / dist,
-                "damage": 5,
-                "lifetime": 180
-            })
+            spawn_projectile("boss", boss_x, boss_y, 0.2 * dx / dist, 0.2 * dy / dist,
+                             damage=5, lifetime=180, radius=0.8, owner=boss_entity)
             print("🔥 Boss fired projectile!")
     
     # Contact damage
@@ -4488,15 +4432,40 @@ def get_performance_stats():
         "lag_spikes": performance_monitor["lag_spikes"]
     }
 
+def get_network_overlay_lines():
+    """Network stats for the F3 overlay (nothing when not in multiplayer)"""
+    lines = []
+    if not multiplayer_ui or not format_rate:
+        return lines
+    
+    lan_client = multiplayer_ui.get_lan_client()
+    if lan_client and lan_client.is_connected():
+        net = lan_client.get_network_stats()
+        rtt = f"{net['rtt_ms']:.0f}ms" if net["rtt_ms"] is not None else "--"
+        lines.append(f"Net: RTT {rtt} ({net['transport']})")
+        lines.append(f"In {format_rate(net['bytes_in_per_s'])}  Out {format_rate(net['bytes_out_per_s'])}")
+        lines.append(f"Msgs/s: {net['messages_in_per_s']:.0f} in, {net['messages_out_per_s']:.0f} out")
+        lines.append(f"Malformed: {net['malformed']}  Reconnects: {net['reconnects']}")
+    
+    lan_server = multiplayer_ui.get_lan_server()
+    if lan_server:
+        totals = lan_server.get_network_stats()["totals"]
+        rtt = f"{totals['max_rtt_ms']:.0f}ms" if totals["max_rtt_ms"] is not None else "--"
+        lines.append(f"Server: {totals['players']} players, worst RTT {rtt}")
+        lines.append(f"In {format_rate(totals['bytes_in_per_s'])}  Out {format_rate(totals['bytes_out_per_s'])}")
+        lines.append(f"Send queues: {totals['send_queue_bytes']} B  Dropped: {totals['dropped']}")
+    return lines
+
 def draw_performance_stats():
     """Draw performance statistics on screen with player coordinates"""
     if not performance_monitor["show_stats"]:
         return
     
     stats = get_performance_stats()
+    network_lines = get_network_overlay_lines()
     
     # Draw semi-transparent background (moved down to not cover player info)
-    overlay = pygame.Surface((300, 160), pygame.SRCALPHA)
+    overlay = pygame.Surface((300, 160 + 20 * len(network_lines)), pygame.SRCALPHA)
     overlay.fill((0, 0, 0, 150))
     screen.blit(overlay, (10, 80))  # Moved down from y=10 to y=80
     
@@ -4519,9 +4488,14 @@ def draw_performance_stats():
     lag_text = font.render(f"Lag Spikes: {stats['lag_spikes']}", True, (255, 100, 100) if stats['lag_spikes'] > 0 else (255, 255, 255))
     screen.blit(lag_text, (20, 170))
     
+    # Multiplayer network stats
+    for i, line in enumerate(network_lines):
+        net_text = font.render(line, True, (150, 200, 255))
+        screen.blit(net_text, (20, 190 + i * 20))
+    
     # Draw toggle instruction
     toggle_text = font.render("Press F3 to toggle", True, (200, 200, 200))
-    screen.blit(toggle_text, (20, 190))
+    screen.blit(toggle_text, (20, 190 + len(network_lines) * 20))
 
 # =============================================================================
 # MERCHANT SYSTEM - BRAND NEW SHOPKEEPER
@@ -4715,9 +4689,11 @@ pickaxe_animation_direction = 1  # 1 for up, -1 for down
 
 # EXTREME ENGINEERING: Professional Multiplayer System
 MULTIPLAYER_PORT = 25565  # Standard Minecraft-style port
-MULTIPLAYER_MAX_PLAYERS = 20
+MULTIPLAYER_MAX_PLAYERS = 64  # Updates are range-limited per player (see multiplayer/interest.py)
 MULTIPLAYER_TPS = 20  # 20 TPS (Ticks Per Second)
 MULTIPLAYER_SYNC_RATE = 5   # Sync every 5 ticks
+# Our position goes out at 1-10 Hz depending on speed; receivers interpolate between updates
+multiplayer_send_rate = AdaptiveSendRate() if AdaptiveSendRate else None
 
 # Multiplayer state
 multiplayer_mode = False
@@ -4904,8 +4880,11 @@ def draw_achievement_popups():
     achievement_popups[:] = active
 
 def draw_fortress_minimap():
-    """Draw discovered fortresses on minimap in corner"""
-    if not discovered_fortresses:
+    """Draw discovered fortresses on minimap in corner - nearest first, with direction and distance"""
+    if structure_registry is None:
+        return
+    fortresses = structure_registry.nearest(player["x"], kind="fortress", discovered=True)
+    if not fortresses:
         return
     
     # Minimap settings
@@ -4927,17 +4906,19 @@ def draw_fortress_minimap():
     
     # Draw fortress list
     y_offset = 30
-    for fortress_type in discovered_fortresses:
-        fortress_info = FORTRESS_TYPES.get(fortress_type, {})
-        fortress_name = fortress_info.get("name", "Unknown")
+    for fortress in fortresses:
+        fortress_info = FORTRESS_TYPES.get(fortress.subtype, {})
+        fortress_name = fortress_info.get("name", "Fortress")
         
         # Color based on whether it has monsters
         text_color = (255, 100, 100) if fortress_info.get("has_monsters", False) else (150, 200, 255)
         
         # Truncate long names
-        display_name = fortress_name[:15] + "..." if len(fortress_name) > 15 else fortress_name
+        display_name = fortress_name[:12] + "..." if len(fortress_name) > 12 else fortress_name
+        offset_x = int(fortress.center[0] - player["x"])
+        direction = "<" if offset_x < 0 else ">"
         
-        fortress_text = font.render(f"🏰 {display_name}", True, text_color)
+        fortress_text = font.render(f"🏰 {display_name} {direction}{abs(offset_x)}", True, text_color)
         screen.blit(fortress_text, (minimap_x + 5, minimap_y + y_offset))
         y_offset += 20
         
@@ -5443,6 +5424,10 @@ def reset_game_state_to_title():
     # Clear all entities and items
     entities.clear()
     dropped_items.clear()
+    if dropped_item_tracker:
+        dropped_item_tracker.clear()
+    if mob_spawner:
+        mob_spawner.reset()
     
     # Reset to daytime
     is_day = True
@@ -5455,8 +5440,10 @@ def reset_game_state_to_title():
     map_open = False
     merchant_shop_open = False
     
-    # Clear thrown sword
+    # Clear thrown sword and all other projectiles
     thrown_sword = None
+    if projectile_system:
+        projectile_system.clear()
     
     # Reset boss states
     boss_fight_active = False
@@ -5481,8 +5468,17 @@ def create_world_with_name(name_input):
         world_name = f"World {len(world_system.world_list) + 1}"
         print(f"🌍 Creating world with default name: {world_name}")
     
+    def show_generation_progress(done, total):
+        global world_generation_progress, world_generation_total, world_generation_status
+        world_generation_progress = done
+        world_generation_total = max(total, 1)
+        world_generation_status = "Generating terrain..."
+        pygame.event.pump()
+        draw_world_generation_screen()
+        pygame.display.flip()
+    
     # Create the world
-    if world_system.create_world(world_name):
+    if world_system.create_world(world_name, on_progress=show_generation_progress):
         print(f"✅ Created new world: {world_name}")
         # Refresh world selection state
         world_ui.refresh_world_selection()
@@ -5570,7 +5566,7 @@ inventory_drag_item = None  # Item being dragged in inventory
 inventory_drag_from = None  # ('hotbar', index) or ('backpack', index) or ('armor', slot_name)
 
 # --- Sword Throwing System ---
-thrown_sword = None  # {'x': float, 'y': float, 'target_x': float, 'target_y': float, 'returning': bool, 'sword_type': str, 'original_slot': int}
+thrown_sword = None  # Projectile slot id of the sword currently in flight (see update_projectiles)
 sword_throw_speed = 0.3  # Speed of sword projectile
 sword_return_speed = 0.2  # Speed of sword returning
 sword_throw_range = 8  # Maximum throw range in tiles
@@ -5846,43 +5842,6 @@ def get_block(x, y):
         print(f"❌ Error getting block at ({x}, {y}): {e}")
         return None
 
-def validate_world_integrity():
-    """Validate world data integrity and fix common issues"""
-    global world_data
-    
-    print("🔍 Validating world data integrity...")
-    issues_found = 0
-    fixes_applied = 0
-    
-    # Check for invalid keys
-    invalid_keys = []
-    for key in list(world_data.keys()):
-        try:
-            x, y = map(int, key.split(','))
-            # Check if coordinates are reasonable
-            if abs(x) > 10000 or abs(y) > 1000:
-                invalid_keys.append(key)
-                issues_found += 1
-        except (ValueError, AttributeError):
-            invalid_keys.append(key)
-            issues_found += 1
-    
-    # Remove invalid keys
-    for key in invalid_keys:
-        del world_data[key]
-        fixes_applied += 1
-        print(f"🔧 Fixed: Removed invalid key: {key}")
-    
-    # Check for None values
-    none_values = [key for key, value in world_data.items() if value is None]
-    for key in none_values:
-        world_data[key] = "air"  # Replace None with air
-        fixes_applied += 1
-        print(f"🔧 Fixed: Replaced None with air at {key}")
-    
-    print(f"✅ World validation complete: {issues_found} issues found, {fixes_applied} fixes applied")
-    return issues_found == 0
-
 def set_block(x, y, block_type, sync_multiplayer=False):
     """Set block at coordinates with validation and error handling"""
     try:
@@ -5900,9 +5859,19 @@ def set_block(x, y, block_type, sync_multiplayer=False):
             print(f"⚠️ Invalid block type: {block_type} (type: {type(block_type)})")
             return False
         
+        # Debug runs also check the world invariants (coordinate range, empty block names)
+        if config.debug_world_checks and block_problem:
+            problem = block_problem(x, y, block_type)
+            if problem:
+                print(f"🐞 set_block rejected: {problem}")
+                return False
+        
         # Set the block
         world_data[f"{x},{y}"] = block_type
         
+        # Let systems that cache terrain know it changed
+        notify_block_changed(x, y)
+        
         # MULTIPLAYER: Sync block placement to other players
         if sync_multiplayer:
             sync_block_change(x, y, block_type)
@@ -5913,6 +5882,38 @@ def set_block(x, y, block_type, sync_multiplayer=False):
         print(f"❌ Error setting block at ({x}, {y}): {e}")
         return False
 
+# --- Mob pathfinding ---
+# Blocks hostile flying mobs can move through
+MOB_PASSABLE_BLOCKS = {None, "air", "water", "lava"}
+
+def is_mob_passable(x, y):
+    """Fast passability check used by the mob flow field (no validation)"""
+    return world_data.get(f"{x},{y}") in MOB_PASSABLE_BLOCKS
+
+def is_mob_solid(x, y):
+    """Collision callback for hostile mobs (they move through water and lava)"""
+    return world_data.get(f"{x},{y}") not in MOB_PASSABLE_BLOCKS
+
+try:
+    from system.pathfinding import FlowField
+except ImportError:
+    print("⚠️ Warning: Pathfinding system not available")
+    FlowField = None
+
+if FlowField:
+    mob_flow_field = FlowField(is_mob_passable, radius=20)
+else:
+    mob_flow_field = None
+
+def notify_block_changed(x, y):
+    """Tell systems that cache terrain (pathfinding, sleeping items) that a block changed"""
+    if mob_flow_field:
+        mob_flow_field.notify_block_change(x, y)
+    if dropped_item_tracker:
+        dropped_item_tracker.wake_around(x, y)
+    if mob_spawner:
+        mob_spawner.notify_block_change(x, y)
+
 
 
 # --- Bedrock helper ---
@@ -5937,29 +5938,13 @@ def is_solid_block(block_type):
         return False
     return not is_non_solid_block(block_type)
 
-def check_collision_at_position(x, y, width=1.0, height=1.0):
-    """Check for collision at a specific position with given dimensions"""
-    # Check multiple points around the player's hitbox
-    left = int(x)
-    right = int(x + width - 0.1)  # Slightly inside the right edge
-    top = int(y)
-    bottom = int(y + height - 0.1)  # Slightly inside the bottom edge
-    
-    # Check all four corners and center points
-    collision_points = [
-        (left, top),      # Top-left
-        (right, top),     # Top-right
-        (left, bottom),   # Bottom-left
-        (right, bottom),  # Bottom-right
-        (int(x + width/2), int(y + height/2))  # Center
-    ]
-    
-    for px, py in collision_points:
-        block = get_block(px, py)
-        if is_solid_block(block):
-            return True, block, (px, py)
-    
-    return False, None, None
+# Hitbox size in tiles (slightly narrower than a tile so 1-wide gaps are easy to enter)
+ENTITY_WIDTH = 0.9
+ENTITY_HEIGHT = 1.0
+
+def is_collision_tile(x, y):
+    """Collision callback: is the tile at (x, y) solid for walking entities?"""
+    return is_solid_block(world_data.get(f"{x},{y}"))
 
 def trigger_head_bump():
     """Trigger head bump effect when player hits ceiling"""
@@ -6160,6 +6145,10 @@ def start_world_generation():
     world_generation_status = "Generating terrain..."
     world_generation_start_time = time.time()
     
+    # The world generator already built the spawn columns (showing its own progress) - only wildlife is left
+    if all(x in generated_terrain_columns for x in range(-10, 11)):
+        world_generation_progress = world_generation_total
+    
     # Shop removed - now available in title screen
     
     print("🌍 Starting world generation...")
@@ -6375,6 +6364,10 @@ def generate_boss_arena():
         "y": arena_center_y + 5  # 5 blocks above arena floor
     }
     
+    if structure_registry and not structure_registry.at(arena_center_x, arena_center_y, kind="boss_arena"):
+        structure_registry.add("boss_arena", arena_center_x - half_size, arena_center_y - half_size,
+                               arena_center_x + half_size, arena_center_y + half_size + 10)
+    
     print(f"🏟️ LEGENDARY BOSS ARENA COMPLETE! Boss positioned at ({boss_position['x']}, {boss_position['y']})")
 
 def check_player_armor():
@@ -6652,29 +6645,35 @@ def check_stone_sword_requirement():
             return True
     return False
 
+def register_world_landmarks():
+    """Register the fixed structures every world has (the underground fortress below the boss spawn)"""
+    if structure_registry and not structure_registry.of_kind("underground_fortress"):
+        # 20 columns either side of the boss spawn, deeper than 50 blocks underground
+        structure_registry.add("underground_fortress", BOSS_SPAWN_DISTANCE - 20, -1000000,
+                               BOSS_SPAWN_DISTANCE + 19, -51)
+
 def check_underground_fortress_trigger():
     """Check if player has reached the underground fortress area"""
-    global boss_fight_active
+    if boss_fight_active or structure_registry is None:
+        return False
     
-    # Check if player is in the underground fortress area (around x=200)
-    if (abs(player["x"] - BOSS_SPAWN_DISTANCE) < 20 and 
-        player["y"] < 0 and  # Underground
-        not boss_fight_active):
-        
-        # Check if player has broken through bedrock (deep underground)
-        if player["y"] < -50:  # Very deep underground
+    # One bucket lookup: is the player inside the underground fortress's box?
+    fortress = structure_registry.at(player["x"], player["y"], kind="underground_fortress")
+    if fortress is not None:
+        if not fortress.discovered:
+            fortress.discovered = True
             show_message(" You've discovered the underground fortress! The final boss awaits!", 4000)
             print("🏰 Player discovered underground fortress!")
-            
-            # Auto-start boss fight if player has stone sword
-            if check_stone_sword_requirement():
-                show_message(" You have the Stone Sword! The boss fight begins!", 3000)
-                start_boss_fight()
-            else:
-                show_message(" You need a Stone Sword to challenge the boss!", 3000)
-                print("❌ Player needs stone sword for boss fight")
-            
-            return True
+        
+        # Auto-start boss fight if player has stone sword
+        if check_stone_sword_requirement():
+            show_message(" You have the Stone Sword! The boss fight begins!", 3000)
+            start_boss_fight()
+        else:
+            show_message(" You need a Stone Sword to challenge the boss!", 3000)
+            print("❌ Player needs stone sword for boss fight")
+        
+        return True
     
     return False
 
@@ -6804,15 +6803,8 @@ def add_item_to_inventory(item_id, count):
     drop_item_near_player(item_id, count)
 
 def drop_item_near_player(item_id, count):
-    """Drop an item near the player"""
-    entities.append({
-        "type": "item_drop",
-        "x": player["x"] + random.uniform(-2, 2),
-        "y": player["y"] + random.uniform(-2, 2),
-        "item_type": item_id,
-        "count": count,
-        "pickup_timer": 0
-    })
+    """Drop an item near the player (merges into a nearby identical stack)"""
+    drop_item(item_id, player["x"] + random.uniform(-1, 1), player["y"], count)
 
 def draw_merchant_shop_ui():
     """Draw the merchant shop interface"""
@@ -7450,15 +7442,13 @@ def damage_boss(damage):
             show_message(" FINAL BOSS PHASE DEFEATED! Victory!", 2000)
 
 
-def build_fortress(origin_x, ground_y, fortress_type="safe_outpost"):
-    """Build a red brick fortress of the specified type"""
-    global discovered_fortresses, current_fortress_discovery, discovery_timer
-    
+def build_fortress(origin_x, ground_y, fortress_type="safe_outpost", rng=random):
+    """Build a red brick fortress of the specified type (every random draw comes from rng)"""
     fortress_info = FORTRESS_TYPES.get(fortress_type, FORTRESS_TYPES["safe_outpost"])
     
     # Get fortress dimensions
-    width = random.randint(fortress_info["min_size"], fortress_info["max_size"])
-    height = random.randint(10, 14)
+    width = rng.randint(fortress_info["min_size"], fortress_info["max_size"])
+    height = rng.randint(10, 14)
     
     # All fortresses are made of red brick
     primary_material = "red_brick"
@@ -7517,13 +7507,13 @@ def build_fortress(origin_x, ground_y, fortress_type="safe_outpost"):
         for i in range(monster_count):
             # Try to place monster in a valid location
             for attempt in range(10):  # Try up to 10 times to find a spot
-                monster_x = origin_x + random.randint(2, width - 3)
-                monster_y = base_level - random.randint(2, height - 2)
+                monster_x = origin_x + rng.randint(2, width - 3)
+                monster_y = base_level - rng.randint(2, height - 2)
                 
                 # Make sure there's no block at the monster position
                 if get_block(monster_x, monster_y) in (None, "air"):
                     # Randomly choose monster or zombie
-                    monster_type = "zombie" if random.random() < 0.3 else "monster"
+                    monster_type = "zombie" if rng.random() < 0.3 else "monster"
                     entities.append({
                         "type": monster_type,
                         "x": float(monster_x),
@@ -7534,13 +7524,30 @@ def build_fortress(origin_x, ground_y, fortress_type="safe_outpost"):
                     })
                     break
     
-    # Trigger discovery if this is a new fortress type
-    is_first_fortress = len(discovered_fortresses) == 0  # Check if this is the VERY first fortress
-    if fortress_type not in discovered_fortresses:
-        discovered_fortresses.add(fortress_type)
-        current_fortress_discovery = fortress_type
-        discovery_timer = 180  # 3 seconds at 60 FPS
-        print(f"🏰 DISCOVERED NEW FORTRESS: {fortress_info['name']}")
+    # Register the fortress - it's discovered when the player walks into it (check_structure_discovery)
+    if structure_registry:
+        structure_registry.add("fortress", origin_x, base_level - height, origin_x + width - 1, base_level,
+                               subtype=fortress_type)
+    else:
+        discover_fortress(fortress_type)
+    
+    print(f"🏰 {fortress_info['name']} built at ({origin_x}, {ground_y}) with {len(floor_levels)} floors!")
+
+def discover_fortress(fortress_type):
+    """Announce a fortress type the player hasn't found before"""
+    global current_fortress_discovery, discovery_timer
+    
+    if fortress_type not in FORTRESS_TYPES:
+        return
+    fortress_info = FORTRESS_TYPES[fortress_type]
+    
+    # Trigger discovery if this is a new fortress type
+    is_first_fortress = len(discovered_fortresses) == 0  # Check if this is the VERY first fortress
+    if fortress_type not in discovered_fortresses:
+        discovered_fortresses.add(fortress_type)
+        current_fortress_discovery = fortress_type
+        discovery_timer = 180  # 3 seconds at 60 FPS
+        print(f"🏰 DISCOVERED NEW FORTRESS: {fortress_info['name']}")
         # Trigger achievement ONLY for the very first fortress discovered
         if is_first_fortress:
             try:
@@ -7548,14 +7555,22 @@ def build_fortress(origin_x, ground_y, fortress_type="safe_outpost"):
                 print(f"🏆 First fortress achievement triggered!")
             except Exception as e:
                 print(f"⚠️ Error triggering first fortress achievement: {e}")
-    
-    print(f"🏰 {fortress_info['name']} built at ({origin_x}, {ground_y}) with {len(floor_levels)} floors!")
+
+def check_structure_discovery():
+    """Discover the structure the player is standing in (one registry lookup per frame)"""
+    if structure_registry is None:
+        return
+    structure = structure_registry.at(player["x"], player["y"])
+    if structure is None or structure.discovered or structure.kind == "underground_fortress":
+        return  # The underground fortress has its own trigger
+    structure.discovered = True
+    if structure.kind == "fortress":
+        discover_fortress(structure.subtype)
 
 def maybe_generate_fortress_for_chunk(chunk_id, base_x):
-    """Generate a random fortress type in this chunk"""
-    rng = random.Random(f"fortress-{chunk_id}")
-    global discovered_fortresses
-    # Prevent overlap by checking an exclusion radius against existing fortresses (tracked via discovery list)
+    """Generate a random fortress type in this chunk (the same one for the same world seed)"""
+    rng = random.Random(f"fortress-{biome_map.seed if biome_map else 'default'}-{chunk_id}")
+    # Prevent overlap by keeping an exclusion radius clear of every registered structure
     exclusion_radius = 40
     
     # Select fortress type based on spawn chances
@@ -7570,12 +7585,10 @@ def maybe_generate_fortress_for_chunk(chunk_id, base_x):
         return
     
     fortress_x = base_x + rng.randint(10, 40)
-    # Simple overlap avoidance: ensure no other fortress is within exclusion_radius on X
-    # We approximate by checking a handful of nearby columns for existing red_brick walls
-    for check_x in range(fortress_x - exclusion_radius, fortress_x + exclusion_radius, 2):
-        for check_y in range(80, 130):
-            if get_block(check_x, check_y) == "red_brick":
-                return  # Skip spawning here; too close to an existing fortress
+    # Skip spawning here if another structure is within exclusion_radius (a few chunk buckets, not a block scan)
+    if structure_registry and structure_registry.overlaps(fortress_x - exclusion_radius, 80,
+                                                          fortress_x + exclusion_radius, 129):
+        return
     fortress_y = ground_y_of_column(fortress_x)
     if fortress_y is None:
         # Find surface level
@@ -7588,7 +7601,7 @@ def maybe_generate_fortress_for_chunk(chunk_id, base_x):
         set_block(fortress_x, fortress_y, "grass")
     
     # Build the fortress with the selected type
-    build_fortress(fortress_x, fortress_y, fortress_type)
+    build_fortress(fortress_x, fortress_y, fortress_type, rng)
 
 def select_fortress_type(rng):
     """Select a fortress type based on spawn chances"""
@@ -7633,59 +7646,16 @@ def can_place_surface_item(x: int, ground_y: int) -> bool:
     return True
 
 def get_biome_type(x):
-    """Determine biome type based on position - creates forest, field, mixed, and desert biomes"""
-    # Use sine waves to create natural biome boundaries
-    import math
-    
-    # Distance from spawn (x=0) - deserts spawn further away
-    distance_from_spawn = abs(x)
-    
-    # Large-scale biome variation
-    forest_noise = math.sin(x * 0.02) + math.sin(x * 0.05) * 0.5
-    field_noise = math.sin(x * 0.03) + math.sin(x * 0.07) * 0.3
-    desert_noise = math.sin(x * 0.01) + math.sin(x * 0.04) * 0.6
-    
-    # Add some randomness for natural variation
-    forest_noise += random.uniform(-0.3, 0.3)
-    field_noise += random.uniform(-0.2, 0.2)
-    desert_noise += random.uniform(-0.4, 0.4)
-    
-    # Desert biomes spawn far from spawn (distance > 200) with high desert noise
-    if distance_from_spawn > 200 and desert_noise > 0.4:
-        return "desert"
-    elif forest_noise > 0.3:
-        return "forest"
-    elif field_noise > 0.2:
-        return "field"
-    else:
-        # Mixed biome - sparse trees
+    """Biome of column x - forest, field, mixed or desert, from the world's seeded biome map"""
+    if biome_map is None:
         return "mixed"
+    return biome_map.biome(x)
 
-def should_generate_tree(x, surface_y, biome_type):
-    """Determine if a tree should be generated based on biome and conditions"""
-    # Check if there's already a tree nearby
-    for check_x in range(x - 5, x + 6):
-        for check_y in range(surface_y - 4, surface_y):
-            if get_block(check_x, check_y) in ["log", "leaves"]:
-                return False
-    
-    # DON'T place trees on village structures (oak_planks, beds, chests)
-    for check_x in range(x - 2, x + 3):
-        for check_y in range(surface_y - 5, surface_y + 1):
-            block = get_block(check_x, check_y)
-            if block in ["oak_planks", "bed", "chest", "door"]:
-                return False  # This is a village area - no trees!
-    
-    # Biome-based tree generation
-    if biome_type == "forest":
-        # Forests: High tree density (30% chance)
-        return random.random() < 0.3
-    elif biome_type == "field":
-        # Fields: Very few trees (2% chance)
-        return random.random() < 0.02
-    else:  # mixed
-        # Mixed: Moderate tree density (8% chance)
-        return random.random() < 0.08
+def should_generate_tree(x, surface_y, biome_type=None):
+    """Roll for a tree at the column's tree density - never next to another tree or on a village"""
+    if tree_allowed is None or biome_map is None:
+        return False
+    return tree_allowed(x, surface_y, biome_map.tree_density(x), get_block, random)
 
 def can_place_chest_on_grass(x, y):
     """Check if a chest can be placed according to the grass rule"""
@@ -7717,11 +7687,9 @@ def mark_grass_broken(x, y):
 # --- Carrot biome helper (10% chance per 50-wide chunk) ---
 def in_carrot_biome(x):
     """Return True if world column x belongs to a 'carrot biome'.
-    Deterministic per 50-column chunk so the same columns stay in the same biome across sessions.
+    Decided per 50-column chunk by the world seed, so the same columns stay carrot patches across sessions.
     """
-    chunk = math.floor(x / 50)
-    rng = random.Random(f"carrot-{chunk}")
-    return rng.random() < 0.10
+    return biome_map is not None and biome_map.has_carrots(x)
 
 # --- Hotbar normalization helper ---
 def normalize_inventory():
@@ -8269,41 +8237,37 @@ def send_multiplayer_updates():
     if not multiplayer_ui:
         return
     
-    # Only send updates every 6 frames to avoid spam (10 times per second)
-    # This prevents ghost trails and reduces network traffic
-    if frame_count % 6 != 0:  # Send 10 times per second instead of 60
-        return
-    
     # Get LAN client (if we're connected as a client)
     lan_client = multiplayer_ui.get_lan_client()
     
+    # Our block changes go out as one batch per network tick (every 3 frames)
+    if lan_client and lan_client.is_connected() and frame_count % 3 == 0:
+        lan_client.flush_block_changes()
+    
+    # Position updates go out at a rate that follows our speed: a heartbeat when
+    # standing still, up to 10 per second when running or changing direction
+    health = player.get("health", 10)
+    facing_direction = player.get("facing_direction", 1)
+    if multiplayer_send_rate:
+        if not multiplayer_send_rate.should_send(time.time(), player["x"], player["y"],
+                                                 (health, facing_direction)):
+            return
+    elif frame_count % 6 != 0:  # Fall back to 10 times per second
+        return
+    
     if lan_client and lan_client.is_connected():
         # Send our position update to server
         position = (player["x"], player["y"])
-        health = player.get("health", 10)
-        facing_direction = player.get("facing_direction", 1)
-        
         lan_client.send_player_update(position, health, facing_direction)
     
     # Also update server if we're hosting (so clients can see us)
     lan_server = multiplayer_ui.get_lan_server()
     if lan_server:
         # Update our position in the server's player list
+        # (and send it to the clients close enough to see us)
         host_username = get_current_username() or "Host"
-        with lan_server.player_lock:
-            if host_username in lan_server.players:
-                lan_server.players[host_username]["position"] = (player["x"], player["y"])
-                lan_server.players[host_username]["health"] = player.get("health", 10)
-                lan_server.players[host_username]["facing_direction"] = player.get("facing_direction", 1)
-        
-        # Broadcast our position to all clients
-        lan_server._broadcast({
-            "type": "player_update",
-            "username": host_username,
-            "position": (player["x"], player["y"]),
-            "health": player.get("health", 10),
-            "facing_direction": player.get("facing_direction", 1)
-        })
+        lan_server.update_player_state(host_username, (player["x"], player["y"]),
+                                       health, facing_direction)
 
 def send_time_sync():
     """Send game time sync to server (if hosting) - called less frequently"""
@@ -8348,6 +8312,8 @@ def on_block_change_received(username, x, y, block_type):
         # Block was placed
         world_data[block_key] = block_type
         print(f"🧱 {username} placed {block_type} at ({x}, {y})")
+    
+    notify_block_changed(x, y)
 
 def sync_block_change(x, y, block_type):
     """Send block change to multiplayer server/clients"""
@@ -8363,13 +8329,44 @@ def sync_block_change(x, y, block_type):
     lan_server = multiplayer_ui.get_lan_server()
     if lan_server:
         host_username = get_current_username() or "Host"
-        lan_server._broadcast({
-            "type": "block_change",
-            "username": host_username,
-            "x": x,
-            "y": y,
-            "block_type": block_type
-        })
+        lan_server.broadcast_block_change(host_username, x, y, block_type)
+
+def apply_streamed_world_chunks(max_chunks=4):
+    """Merge streamed chunks and batched block changes from the server (a few per frame)"""
+    if not multiplayer_ui:
+        return
+    
+    lan_client = multiplayer_ui.get_lan_client()
+    if not lan_client:
+        return
+    
+    for cx, blocks, replace_span in lan_client.pop_world_chunks(max_chunks):
+        start_x = cx * lan_client.chunk_size
+        if replace_span:
+            # Full chunk resend: clear the chunk first so removed blocks disappear
+            y_min, y_max = replace_span
+            for x in range(start_x, start_x + lan_client.chunk_size):
+                for y in range(y_min, y_max + 1):
+                    world_data.pop(f"{x},{y}", None)
+        
+        for key, block_type in blocks.items():
+            if block_type is None or block_type == "air":
+                world_data.pop(key, None)
+            else:
+                world_data[key] = block_type
+        
+        if replace_span is None and len(blocks) < 16:
+            # Small delta: wake items and refresh caches just around each block
+            for key in blocks:
+                x, y = key.split(",")
+                notify_block_changed(int(x), int(y))
+            continue
+        
+        # Terrain caches (spawn candidates, mob paths) must see the new chunk
+        if mob_spawner:
+            mob_spawner.notify_block_change(start_x, 0)
+        if mob_flow_field:
+            mob_flow_field.invalidate()
 
 def setup_multiplayer_callbacks():
     """Set up callbacks for multiplayer client (if connected) - CALL ONLY ONCE!"""
@@ -8402,14 +8399,9 @@ def draw_multiplayer_players():
     # Also check if we're hosting (so host can see clients)
     lan_server = multiplayer_ui.get_lan_server()
     if lan_server:
-        # Get connected players from server
-        connected_players = lan_server.get_players()
-        for player_username in connected_players:
-            if player_username not in other_players:
-                # Get player data from server
-                with lan_server.player_lock:
-                    if player_username in lan_server.players:
-                        other_players[player_username] = lan_server.players[player_username]
+        # Connected players from the server, at their interpolated positions
+        for player_username, player_data in lan_server.get_remote_players().items():
+            other_players.setdefault(player_username, player_data)
     
     # Draw all other players
     for username, player_data in other_players.items():
@@ -8609,8 +8601,11 @@ def draw_world():
 
     # Cave entrance indicators removed - caves are disabled
 
-        # Draw Lost Ruins entrance indicators
-        for ruins_x, ruins_y in lost_ruins_entrances:
+        # Draw Lost Ruins entrance indicators (only ruins in the visible columns)
+        visible_ruins = structure_registry.in_columns(camera_x // TILE_SIZE - 1, (camera_x + SCREEN_WIDTH) // TILE_SIZE + 1,
+                                                      kind="lost_ruins") if structure_registry else []
+        for ruins in visible_ruins:
+            ruins_x, ruins_y = ruins.data["entrance"]
             screen_x = (ruins_x * TILE_SIZE) - camera_x
             screen_y = (ruins_y * TILE_SIZE) - camera_y
             
@@ -8785,18 +8780,6 @@ def draw_world():
             pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, int(bar_width * health_ratio), bar_height))
             # Border
             pygame.draw.rect(screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 1)
-        elif entity["type"] == "projectile":
-            ex = int(entity["x"] * TILE_SIZE) - camera_x
-            ey = int(entity["y"] * TILE_SIZE) - camera_y
-            pygame.draw.rect(screen, (200, 50, 50), (ex + 12, ey + 12, 8, 8))
-        elif entity["type"] == "boss_projectile":
-            ex = int(entity["x"] * TILE_SIZE) - camera_x
-            ey = int(entity["y"] * TILE_SIZE) - camera_y
-            pygame.draw.rect(screen, (255, 100, 0), (ex + 12, ey + 12, 12, 12))  # Larger, orange projectile
-        elif entity["type"] == "fireball":
-            ex = int(entity["x"] * TILE_SIZE) - camera_x
-            ey = int(entity["y"] * TILE_SIZE) - camera_y
-            pygame.draw.circle(screen, (255, 100, 0), (ex + 16, ey + 16), 8)  # Orange fireball
         elif entity["type"] == "villager":
             ex = int(entity["x"] * TILE_SIZE) - camera_x
             ey = int(entity["y"] * TILE_SIZE) - camera_y
@@ -8849,20 +8832,10 @@ def draw_world():
             # Boss name
             boss_text = font.render("Fortress Boss", True, (255, 100, 0))
             screen.blit(boss_text, (ex, ey - 30))
-        elif entity["type"] == "fireball":
-            ex = int(entity["x"] * TILE_SIZE) - camera_x
-            ey = int(entity["y"] * TILE_SIZE) - camera_y
-            pygame.draw.circle(screen, (255, 100, 0), (ex + 16, ey + 16), 8)  # Orange fireball
         elif entity["type"] == "zombie":
             ex = int(entity["x"] * TILE_SIZE) - camera_x
             ey = int(entity["y"] * TILE_SIZE) - camera_y
             screen.blit(textures["zombie"], (ex, ey))
-        elif entity["type"] == "rock_projectile":
-            ex = int(entity["x"] * TILE_SIZE) - camera_x
-            ey = int(entity["y"] * TILE_SIZE) - camera_y
-            # Draw rock projectile as a brown circle
-            pygame.draw.circle(screen, (139, 69, 19), (ex + 16, ey + 16), 8)
-        
         elif entity["type"] == "villager":
             # Draw villagers with a simple character sprite
             ex = int(entity["x"] * TILE_SIZE) - camera_x
@@ -8914,8 +8887,7 @@ def draw_world():
             screen.blit(boss_label, (boss_screen_x, boss_screen_y - 20))
 
     # Draw thrown sword projectile
-    draw_thrown_sword()
-    draw_thrown_sword_entities()
+    draw_projectiles()
 
     # Draw player with animation system
     px = int(player["x"] * TILE_SIZE) - camera_x
@@ -8954,6 +8926,9 @@ def draw_world():
     # Send time sync if hosting (less frequently)
     send_time_sync()
     
+    # Merge any world chunks still streaming in from the server
+    apply_streamed_world_chunks()
+    
     # Draw multiplayer chat if connected
     if is_connected:
         draw_multiplayer_chat()
@@ -9201,60 +9176,6 @@ def nuclear_block_removal():
     
     return True
 
-def monitor_world_data():
-    """EXTREME ENGINEERING: Continuous monitoring of world_data for anomalies"""
-    global world_data
-    
-    print("🔍 EXTREME ENGINEERING MONITORING SYSTEM ACTIVATED")
-    print("=" * 60)
-    
-    # Check for any blocks that might be causing issues
-    problematic_blocks = []
-    
-    for key, value in world_data.items():
-        # Check for invalid keys
-        if not isinstance(key, str):
-            problematic_blocks.append(f"Invalid key type: {type(key)} = {key}")
-            continue
-        
-        # Check for invalid values
-        if not isinstance(value, str):
-            problematic_blocks.append(f"Invalid value type at {key}: {type(value)} = {value}")
-            continue
-        
-        # Check for empty or None values
-        if value is None or value == "":
-            problematic_blocks.append(f"Empty value at {key}: {value}")
-            continue
-    
-    if problematic_blocks:
-        print("🚨 PROBLEMATIC BLOCKS DETECTED:")
-        for problem in problematic_blocks[:10]:  # Show first 10 problems
-            print(f"   ❌ {problem}")
-        print(f"   📊 Total problems: {len(problematic_blocks)}")
-        
-        # Auto-fix common issues
-        print("🔧 Attempting auto-fix...")
-        fixed_count = 0
-        
-        for key in list(world_data.keys()):
-            if not isinstance(key, str):
-                world_data.pop(key, None)
-                fixed_count += 1
-            elif world_data[key] is None or world_data[key] == "":
-                world_data.pop(key, None)
-                fixed_count += 1
-        
-        print(f"   🧹 Auto-fixed {fixed_count} problematic blocks")
-    else:
-        print("✅ No problematic blocks detected")
-    
-    print(f"📊 World data status: {len(world_data)} blocks")
-    print(f"🔍 Sample keys: {list(world_data.keys())[:5]}")
-    print("=" * 60)
-    
-    return len(problematic_blocks) == 0
-
 def break_block(mx, my):
     """Break blocks instantly - back to normal"""
     global final_boss_active
@@ -9370,6 +9291,7 @@ def break_block(mx, my):
             world_data.pop(block_key, None)
         
         # MULTIPLAYER: Sync block break to other players
+        notify_block_changed(bx, by)
         sync_block_change(bx, by, None)
         
         # Check for mining achievements
@@ -9409,6 +9331,7 @@ def break_block(mx, my):
             world_data.pop(block_key, None)
         
         # MULTIPLAYER: Sync block break to other players
+        notify_block_changed(bx, by)
         sync_block_change(bx, by, None)
         
         # Clear carve count for this log (if it was being carved)
@@ -9461,6 +9384,7 @@ def break_block(mx, my):
             del world_data[block_key]
         
         # MULTIPLAYER: Sync block break to other players
+        notify_block_changed(bx, by)
         sync_block_change(bx, by, None)
         
         if block_key in world_data:
@@ -9493,6 +9417,7 @@ def break_block(mx, my):
                 del world_data[block_key]
             
             # MULTIPLAYER: Sync block break to other players
+            notify_block_changed(bx, by)
             sync_block_change(bx, by, None)
         else:
             # No crop data, just remove block
@@ -9500,6 +9425,7 @@ def break_block(mx, my):
                 del world_data[block_key]
             
             # MULTIPLAYER: Sync block break to other players
+            notify_block_changed(bx, by)
             sync_block_change(bx, by, None)
         
         return True
@@ -9534,6 +9460,7 @@ def break_block(mx, my):
             world_data.pop(block_key, None)
         
         # MULTIPLAYER: Sync block break to other players
+        notify_block_changed(bx, by)
         sync_block_change(bx, by, None)
         
         # Check for sand blocks above that need to fall
@@ -9699,17 +9626,18 @@ def throw_sword_at_target(target_x, target_y):
     # We'll use a special marker that normalize_inventory will skip
     player["inventory"][original_slot] = {"type": "__THROWN_SWORD__", "count": 1, "reserved": True}
     
-    # Create thrown sword projectile
-    thrown_sword = {
-        'x': px,
-        'y': py,
-        'target_x': final_target_x,
-        'target_y': final_target_y,
-        'returning': False,
-        'sword_type': sword_item["type"],
-        'original_slot': original_slot,
-        'sword_item': sword_item
-    }
+    # Create thrown sword projectile (flies to the target, then comes back)
+    if distance > 0:
+        dir_x = (final_target_x - px) / distance
+        dir_y = (final_target_y - py) / distance
+    else:
+        dir_x, dir_y = player.get("facing_direction", 1), 0
+    thrown_sword = spawn_projectile(
+        "sword", px, py, dir_x * sword_throw_speed, dir_y * sword_throw_speed,
+        damage=1, lifetime=600, team=TEAM_FRIENDLY, radius=0.8,
+        tile_collision=False, returns=True, max_distance=max(distance, 0.1), owner="player",
+        payload={"sword_item": sword_item, "sword_type": sword_item["type"], "original_slot": original_slot}
+    )
     
     if closest_monster:
         print(f"🗡️ Throwing {sword_item['type']} at {closest_monster['type']} from slot {original_slot}!")
@@ -9730,277 +9658,48 @@ def slash_sword_at_target(target_x, target_y):
     # Trigger slash animation (will be handled by animation system)
     return True
 
-def update_thrown_sword():
-    """Update thrown sword position and handle collisions"""
+def return_thrown_sword(sword):
+    """Put a thrown sword back into the slot it was thrown from"""
     global thrown_sword
     
-    if not thrown_sword:
-        return
-    
-    sword = thrown_sword
-    px, py = player["x"], player["y"]
+    slot = sword["original_slot"]
+    while len(player["inventory"]) <= slot:
+        player["inventory"].append(None)
     
-    if not sword["returning"]:
-        # Check for monster hits along the sword's path BEFORE moving
-        hit_monster = False
-        for mob in entities[:]:
-            if mob["type"] in ["monster", "zombie"]:
-                mob_x, mob_y = mob["x"], mob["y"]
-                # Check if sword is close enough to hit the monster
-                if math.hypot(sword["x"] - mob_x, sword["y"] - mob_y) <= 0.8:
-                    # Hit monster!
-                    mob["hp"] = mob.get("hp", 4) - 1
-                    hit_monster = True
-                    print(f"🗡️ Sword hit {mob['type']}! HP: {mob['hp']}/4")
-                    
-                    # Create hit effect particles
-                    hit_x = (mob["x"] * TILE_SIZE) - camera_x
-                    hit_y = (mob["y"] * TILE_SIZE) - camera_y
-                    create_blood_particles(hit_x, hit_y, 8)
-                    
-                    if mob["hp"] <= 0:
-                        # Track monster kill
-                        track_monster_kill()
-                        
-                        # Create dramatic blood spray for death
-                        death_x = (mob["x"] * TILE_SIZE) - camera_x
-                        death_y = (mob["y"] * TILE_SIZE) - camera_y
-                        create_monster_death_blood_spray(death_x, death_y)
-                        
-                        # Monster defeated - chance to drop coins
-                        if random.random() < 0.15 and coins_manager:
-                            coin_amount = random.randint(1, 2)
-                            coins_manager.add_coins(coin_amount)
-                        
-                        entities.remove(mob)
-                        print(f"💀 {mob['type']} defeated!")
-                    break
-        
-        if hit_monster:
-            # Sword hit something, start returning immediately
-            sword["returning"] = True
-        else:
-            # Move towards target
-            dx = sword["target_x"] - sword["x"]
-            dy = sword["target_y"] - sword["y"]
-            distance = math.hypot(dx, dy)
-            
-            if distance < 0.1:  # Reached target
-                # Start returning to player
-                sword["returning"] = True
-            else:
-                # Move towards target
-                move_x = (dx / distance) * sword_throw_speed
-                move_y = (dy / distance) * sword_throw_speed
-                sword["x"] += move_x
-                sword["y"] += move_y
+    current = player["inventory"][slot]
+    if current is None or current.get("type") == "__THROWN_SWORD__":
+        # Replace the marker (or empty slot) with the actual sword
+        player["inventory"][slot] = sword["sword_item"]
     else:
-        # Returning to player
-        dx = px - sword["x"]
-        dy = py - sword["y"]
-        distance = math.hypot(dx, dy)
-        
-        if distance < 0.5:  # Close enough to player
-            # Return sword to the SAME slot it was thrown from
-            while len(player["inventory"]) <= sword["original_slot"]:
-                player["inventory"].append(None)
-            
-            # Debug: Check what's in the slot before returning
-            print(f"📊 Slot {sword['original_slot']} before return: {player['inventory'][sword['original_slot']]}")
-            
-            # Replace the marker (or whatever is there) with the actual sword
-            player["inventory"][sword["original_slot"]] = sword["sword_item"]
-            
-            # Debug: Confirm return
-            print(f"🗡️ {sword['sword_type']} returned to slot {sword['original_slot']}!")
-            print(f"📊 Full inventory after return: {[item['type'] if item else None for item in player['inventory'][:9]]}")
-            
-            thrown_sword = None
-        else:
-            # Move towards player
-            move_x = (dx / distance) * sword_return_speed
-            move_y = (dy / distance) * sword_return_speed
-            sword["x"] += move_x
-            sword["y"] += move_y
-
-def update_thrown_sword_entities():
-    """Update thrown sword entities in the entities list"""
-    global entities, player
-    
-    entities_to_remove = []
-    
-    for entity in entities[:]:
-        if entity["type"] == "thrown_sword":
-            sword = entity
-            px, py = player["x"], player["y"]
-            
-            if not sword["returning"]:
-                # Check for monster hits
-                hit_monster = False
-                for mob in entities[:]:
-                    if mob["type"] in ["monster", "zombie", "boss"] and mob != sword:
-                        # Check if sword is close to monster
-                        if abs(sword["x"] - mob["x"]) < 1.0 and abs(sword["y"] - mob["y"]) < 1.0:
-                            # Hit the monster
-                            damage = 3  # Sword damage
-                            mob["health"] = mob.get("health", 4) - damage
-                            print(f"⚔️ Sword hit {mob['type']} for {damage} damage!")
-                            
-                            # Add blood particle effect
-                            add_blood_particle(sword["x"], sword["y"])
-                            
-                            # Remove monster if health is 0
-                            if mob["health"] <= 0:
-                                # Create dramatic blood spray for death
-                                death_x = (mob["x"] * TILE_SIZE) - camera_x
-                                death_y = (mob["y"] * TILE_SIZE) - camera_y
-                                create_monster_death_blood_spray(death_x, death_y)
-                                
-                                entities.remove(mob)
-                                print(f"💀 {mob['type']} defeated by thrown sword!")
-                            
-                            hit_monster = True
-                            break
-                
-                if hit_monster:
-                    # Sword hit something, start returning
-                    sword["returning"] = True
-                    continue
-                
-                # Move towards target monster
-                if sword["target"] and sword["target"] in entities:
-                    target = sword["target"]
-                    dx = target["x"] - sword["x"]
-                    dy = target["y"] - sword["y"]
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    
-                    if distance < 0.1:
-                        # Reached target, start returning
-                        sword["returning"] = True
-                    else:
-                        # Move towards target
-                        move_x = (dx / distance) * sword["speed"]
-                        move_y = (dy / distance) * sword["speed"]
-                        sword["x"] += move_x
-                        sword["y"] += move_y
-                else:
-                    # Target lost, start returning
-                    sword["returning"] = True
-            else:
-                # Sword is returning to player
-                dx = px - sword["x"]
-                dy = py - sword["y"]
-                distance = math.sqrt(dx*dx + dy*dy)
-                
-                if distance < 0.5:
-                    # Sword returned to player
-                    # Put sword back in inventory
-                    if sword["original_slot"] < len(player["inventory"]):
-                        player["inventory"][sword["original_slot"]] = sword["sword_item"]
-                    else:
-                        # Add to first available slot
-                        for i, slot in enumerate(player["inventory"]):
-                            if slot is None:
-                                player["inventory"][i] = sword["sword_item"]
-                                break
-                    
-                    normalize_inventory()
-                    print(f"🗡️ {sword['sword_type']} returned to inventory!")
-                    entities_to_remove.append(sword)
-                else:
-                    # Move towards player
-                    move_x = (dx / distance) * sword["speed"]
-                    move_y = (dy / distance) * sword["speed"]
-                    sword["x"] += move_x
-                    sword["y"] += move_y
-    
-    # Remove returned swords
-    for entity in entities_to_remove:
-        if entity in entities:
-            entities.remove(entity)
-
-def draw_thrown_sword():
-    """Draw the thrown sword projectile with visual effects"""
-    if not thrown_sword:
-        return
+        # Slot was taken while the sword was flying - use the first free slot
+        add_to_inventory(sword["sword_item"]["type"], sword["sword_item"].get("count", 1))
     
-    sword = thrown_sword
-    screen_x = (sword["x"] * TILE_SIZE) - camera_x
-    screen_y = (sword["y"] * TILE_SIZE) - camera_y
-    
-    # Only draw if sword is on screen
-    if -TILE_SIZE < screen_x < SCREEN_WIDTH and -TILE_SIZE < screen_y < SCREEN_HEIGHT:
-        # Draw sword texture (use sword texture from textures dict)
-        sword_texture = textures.get(sword["sword_type"], textures.get("sword"))
-        if sword_texture:
-            # Rotate sword based on direction
-            dx = sword["target_x"] - sword["x"] if not sword["returning"] else player["x"] - sword["x"]
-            dy = sword["target_y"] - sword["y"] if not sword["returning"] else player["y"] - sword["y"]
-            angle = math.atan2(dy, dx) * 180 / math.pi
-            
-            # Rotate and draw sword
-            rotated_sword = pygame.transform.rotate(sword_texture, -angle)
-            sword_rect = rotated_sword.get_rect(center=(screen_x + TILE_SIZE//2, screen_y + TILE_SIZE//2))
-            screen.blit(rotated_sword, sword_rect)
-            
-            # Add a glowing effect around the sword
-            glow_radius = 8
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            glow_color = (255, 255, 100, 80)  # Yellow glow with transparency
-            pygame.draw.circle(glow_surface, glow_color, (glow_radius, glow_radius), glow_radius)
-            glow_rect = glow_surface.get_rect(center=(screen_x + TILE_SIZE//2, screen_y + TILE_SIZE//2))
-            screen.blit(glow_surface, glow_rect)
-        else:
-            # Fallback: draw a simple sword shape
-            pygame.draw.rect(screen, (200, 200, 200), (screen_x + 12, screen_y + 8, 8, 16))
-            pygame.draw.rect(screen, (139, 69, 19), (screen_x + 14, screen_y + 20, 4, 8))  # Handle
-
-def draw_thrown_sword_entities():
-    """Draw thrown sword entities in the entities list"""
-    for entity in entities:
-        if entity["type"] == "thrown_sword":
-            sword = entity
-            screen_x = (sword["x"] * TILE_SIZE) - camera_x
-            screen_y = (sword["y"] * TILE_SIZE) - camera_y
-            
-            # Only draw if sword is on screen
-            if -TILE_SIZE < screen_x < SCREEN_WIDTH and -TILE_SIZE < screen_y < SCREEN_HEIGHT:
-                # Draw sword image - use the correct texture based on sword type
-                sword_type = sword.get("sword_type", "sword")
-                sword_image = textures.get(sword_type, textures.get("sword"))
-                if sword_image:
-                    sword_image = sword_image.copy()  # Copy to avoid modifying the cached texture
-                    
-                    # Rotate sword based on direction
-                    if sword["returning"]:
-                        # Point towards player
-                        dx = player["x"] - sword["x"]
-                        dy = player["y"] - sword["y"]
-                        if dx != 0 or dy != 0:
-                            angle = math.degrees(math.atan2(dy, dx))
-                            sword_image = pygame.transform.rotate(sword_image, -angle)
-                    else:
-                        # Point towards target
-                        if sword["target"] and sword["target"] in entities:
-                            target = sword["target"]
-                            dx = target["x"] - sword["x"]
-                            dy = target["y"] - sword["y"]
-                            if dx != 0 or dy != 0:
-                                angle = math.degrees(math.atan2(dy, dx))
-                                sword_image = pygame.transform.rotate(sword_image, -angle)
-                    
-                    screen.blit(sword_image, (screen_x, screen_y))
-                else:
-                    # Fallback: draw a simple sword shape if texture not found
-                    pygame.draw.rect(screen, (200, 200, 200), (screen_x + 12, screen_y + 8, 8, 16))
-                    pygame.draw.rect(screen, (139, 69, 19), (screen_x + 14, screen_y + 20, 4, 8))  # Handle
-                
-                # Draw sword trail effect
-                trail_alpha = 100
-                trail_color = (255, 255, 100, trail_alpha)
-                trail_surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-                pygame.draw.circle(trail_surface, trail_color, (TILE_SIZE//2, TILE_SIZE//2), TILE_SIZE//3)
-                screen.blit(trail_surface, (screen_x, screen_y))
+    normalize_inventory()
+    thrown_sword = None
+    print(f"🗡️ {sword['sword_type']} returned to slot {slot}!")
+
+def draw_thrown_sword(slot, screen_x, screen_y, dx, dy):
+    """Draw a thrown sword projectile with visual effects"""
+    sword = projectile_system.payload[slot]
+    sword_texture = textures.get(sword["sword_type"], textures.get("sword"))
+    if sword_texture:
+        # Rotate sword to point along its flight direction
+        angle = math.atan2(dy, dx) * 180 / math.pi
+        rotated_sword = pygame.transform.rotate(sword_texture, -angle)
+        sword_rect = rotated_sword.get_rect(center=(screen_x + TILE_SIZE//2, screen_y + TILE_SIZE//2))
+        screen.blit(rotated_sword, sword_rect)
+        
+        # Add a glowing effect around the sword
+        glow_radius = 8
+        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+        glow_color = (255, 255, 100, 80)  # Yellow glow with transparency
+        pygame.draw.circle(glow_surface, glow_color, (glow_radius, glow_radius), glow_radius)
+        glow_rect = glow_surface.get_rect(center=(screen_x + TILE_SIZE//2, screen_y + TILE_SIZE//2))
+        screen.blit(glow_surface, glow_rect)
+    else:
+        # Fallback: draw a simple sword shape
+        pygame.draw.rect(screen, (200, 200, 200), (screen_x + 12, screen_y + 8, 8, 16))
+        pygame.draw.rect(screen, (139, 69, 19), (screen_x + 14, screen_y + 20, 4, 8))  # Handle
 
 def attack_monsters(mx, my):
     """Attack monsters with sword - distance-based combat"""
@@ -12186,12 +11885,38 @@ def sleep_in_bed():
         pygame.display.flip()
         clock.tick(60)
 
+# Dropped item sleeping, stack merging and per-chunk caps
+try:
+    from system.item_drops import DroppedItemTracker
+except ImportError:
+    print("⚠️ Warning: Dropped item tracker not available")
+    DroppedItemTracker = None
+
+if DroppedItemTracker:
+    dropped_item_tracker = DroppedItemTracker(chunk_size=config.world_chunk_size, max_per_chunk=64)
+else:
+    dropped_item_tracker = None
+
+# Biomes of the loaded world (replaced with the world's own seed in load_world_data)
+biome_map = BiomeMap("default", chunk_width=config.world_chunk_size) if BiomeMap else None
+
+# Infinite world: chunks around the player are planned on a background thread and installed within a frame budget
+if ChunkPregenerator:
+    chunk_pregenerator = ChunkPregenerator(
+        lambda chunk_id: plan_chunk(chunk_id, biome_map, get_block, config.world_chunk_size),
+        chunk_width=config.world_chunk_size)
+else:
+    chunk_pregenerator = None
+fortress_checked_chunks = set()  # Chunks that already had their fortress roll this session
+
+DROPPED_ITEM_MAX_LIFETIME = 18000  # Despawn after 5 minutes (18000 frames at 60 FPS)
+
 def drop_item(item_type, x, y, count=1):
     """Drop an item at a position with physics"""
     global dropped_items
     
     # Create a dropped item entity
-    dropped_items.append({
+    item = {
         "type": item_type,
         "count": count,
         "x": x,
@@ -12200,9 +11925,21 @@ def drop_item(item_type, x, y, count=1):
         "vel_y": -0.2,  # Initial upward velocity
         "on_ground": False,
         "lifetime": 0,  # How long the item has existed (for despawn)
-    })
+    }
+    if dropped_item_tracker:
+        # Merges into a nearby stack of the same item instead of adding an entity
+        dropped_item_tracker.add(dropped_items, item)
+    else:
+        dropped_items.append(item)
     print(f"📦 Dropped {count}x {item_type} at ({x:.1f}, {y:.1f})")
 
+def remove_dropped_item(item):
+    """Remove a dropped item from the world"""
+    if item in dropped_items:
+        dropped_items.remove(item)
+    if dropped_item_tracker:
+        dropped_item_tracker.discard(item)
+
 def update_dropped_items():
     """Update physics for all dropped items"""
     global dropped_items
@@ -12211,7 +11948,21 @@ def update_dropped_items():
     friction = 0.95  # Ground friction
     air_resistance = 0.98  # Slow down in air
     
+    if dropped_item_tracker:
+        dropped_item_tracker.tick()
+        
+        # Wake items the player walks into so they can be pushed
+        dropped_item_tracker.wake_pushed(player["x"], player["y"], 0.8)
+        
+        # Sleeping items age without being touched - sweep them every 5 seconds
+        if dropped_item_tracker.frame % 300 == 0:
+            dropped_item_tracker.despawn_expired(dropped_items, DROPPED_ITEM_MAX_LIFETIME)
+    
     for item in dropped_items[:]:
+        # Resting items skip physics until a nearby block changes
+        if item.get("sleeping"):
+            continue
+        
         # Apply gravity
         if not item.get("on_ground", False):
             item["vel_y"] += gravity
@@ -12296,8 +12047,17 @@ def update_dropped_items():
         item["lifetime"] = item.get("lifetime", 0) + 1
         
         # Despawn after 5 minutes (18000 frames at 60 FPS)
-        if item["lifetime"] > 18000:
-            dropped_items.remove(item)
+        if item["lifetime"] > DROPPED_ITEM_MAX_LIFETIME:
+            remove_dropped_item(item)
+            continue
+        
+        if dropped_item_tracker:
+            dropped_item_tracker.moved(item)
+            # Put items to sleep once they have settled
+            if item.get("on_ground", False) and item["vel_x"] == 0 and item["vel_y"] == 0:
+                dropped_item_tracker.note_resting(dropped_items, item)
+            else:
+                item["rest_frames"] = 0
 
 def pickup_dropped_item(item):
     """Try to pickup a dropped item"""
@@ -12339,7 +12099,7 @@ def pickup_dropped_item(item):
                     break
     
     if added:
-        dropped_items.remove(item)
+        remove_dropped_item(item)
         print(f"✅ Picked up {item['count']}x {item['type']}")
         return True
     else:
@@ -12365,7 +12125,8 @@ def draw_dropped_items():
             mini_texture = pygame.transform.scale(item_texture, (mini_size, mini_size))
             
             # Draw with slight bobbing animation
-            bob_offset = math.sin(item.get("lifetime", 0) * 0.1) * 2
+            lifetime = dropped_item_tracker.effective_lifetime(item) if dropped_item_tracker else item.get("lifetime", 0)
+            bob_offset = math.sin(lifetime * 0.1) * 2
             draw_y = screen_y + int(bob_offset)
             
             # Center the mini texture
@@ -12458,20 +12219,13 @@ def update_player():
     player_feet_block = get_block(int(px), int(py + 0.5))
     in_water = (player_head_block == "water" or player_feet_block == "water")
 
+    # Horizontal movement intent in tiles this frame (left and right cancel out)
+    move_dx = (speed if move_right else 0) - (speed if move_left else 0)
+
     if on_ladder:
         # Normal horizontal movement while on ladder
-        if move_left:
-            new_x = px - speed
-            # Use improved collision detection for ladder movement too
-            has_collision, block_type, collision_pos = check_collision_at_position(new_x, player["y"], 1.0, 1.0)
-            if not has_collision:
-                player["x"] = new_x
-        if move_right:
-            new_x = px + speed
-            # Use improved collision detection for ladder movement too
-            has_collision, block_type, collision_pos = check_collision_at_position(new_x, player["y"], 1.0, 1.0)
-            if not has_collision:
-                player["x"] = new_x
+        if move_dx:
+            player["x"] = move_box(px, player["y"], ENTITY_WIDTH, ENTITY_HEIGHT, move_dx, 0, is_collision_tile).x
 
         # Climb up/down cancels gravity
         climb_speed = 0.12  # Responsive ladder climbing
@@ -12497,19 +12251,11 @@ def update_player():
         player["on_ground"] = False
     elif in_water:
         # SWIMMING PHYSICS - player moves differently in water
-        swim_speed = speed * 0.7  # Slower movement in water
+        swim_dx = move_dx * 0.7  # Slower movement in water
         
         # Horizontal movement in water
-        if move_left:
-            new_x = px - swim_speed
-            has_collision, block_type, collision_pos = check_collision_at_position(new_x, player["y"], 1.0, 1.0)
-            if not has_collision:
-                player["x"] = new_x
-        if move_right:
-            new_x = px + swim_speed
-            has_collision, block_type, collision_pos = check_collision_at_position(new_x, player["y"], 1.0, 1.0)
-            if not has_collision:
-                player["x"] = new_x
+        if swim_dx:
+            player["x"] = move_box(px, player["y"], ENTITY_WIDTH, ENTITY_HEIGHT, swim_dx, 0, is_collision_tile).x
         
         # Swimming up/down with buoyancy
         swim_vertical_speed = 0.10
@@ -12548,126 +12294,85 @@ def update_player():
             player["vel_y"] = -0.1
         
         # Apply water velocity
-        next_y = player["y"] + player["vel_y"]
-        
-        # Check for ground collision in water
-        target_y = int(next_y + 1)
-        has_ground_collision, ground_block, ground_pos = check_collision_at_position(player["x"], target_y, 1.0, 1.0)
-        if has_ground_collision:
+        result = move_box(player["x"], player["y"], ENTITY_WIDTH, ENTITY_HEIGHT, 0, player["vel_y"], is_collision_tile)
+        player["y"] = result.y
+        player["on_ground"] = result.on_ground
+        if result.normal_y:
             player["vel_y"] = 0
-            player["on_ground"] = True
-            player["y"] = target_y - 1
-        else:
-            player["on_ground"] = False
-            player["y"] = next_y
         
         # Reset fall tracking when in water (no fall damage in water)
         player["fall_start_y"] = None
         player["fall_height"] = 0.0
     else:
-        # Normal horizontal movement with enhanced collision detection
-        if move_left:
-            new_x = px - speed
-            # Use improved collision detection
-            has_collision, block_type, collision_pos = check_collision_at_position(new_x, player["y"], 1.0, 1.0)
-            if not has_collision:
-                player["x"] = new_x
-            else:
-                # Prevent movement through solid blocks
-                print(f"🚫 Collision detected: {block_type} at {collision_pos} - preventing left movement")
-
-        if move_right:
-            new_x = px + speed
-            # Use improved collision detection
-            has_collision, block_type, collision_pos = check_collision_at_position(new_x, player["y"], 1.0, 1.0)
-            if not has_collision:
-                player["x"] = new_x
-            else:
-                # Prevent movement through solid blocks
-                print(f"🚫 Collision detected: {block_type} at {collision_pos} - preventing right movement")
-
         # Normal gravity
         player["vel_y"] += GRAVITY
         if player["vel_y"] > MAX_FALL_SPEED:
             player["vel_y"] = MAX_FALL_SPEED
 
-        # Normal fall speed
-        next_y = player["y"] + player["vel_y"] / TILE_SIZE
-        
-        # Check collision at the target position using improved collision detection
-        target_y = int(next_y + 1)
-        
-        # Check for head collision when moving up (jumping)
-        if player["vel_y"] < 0:  # Moving up
-            # Check for head collision at the target position (above player)
-            head_y = int(next_y)  # Check where we're going to be
-            has_head_collision, head_block, head_pos = check_collision_at_position(player["x"], head_y, 1.0, 0.5)
-            if has_head_collision:
-                # Head bump! Stop upward movement
-                player["vel_y"] = 0
-                trigger_head_bump()
-                player["y"] = head_y + 1  # Keep player below the ceiling
-                player["on_ground"] = False
-            else:
-                # No head collision, continue moving up
-                player["y"] = next_y
-                player["on_ground"] = False
-        else:
-            # Moving down (falling) - check for ground collision
-            has_ground_collision, ground_block, ground_pos = check_collision_at_position(player["x"], target_y, 1.0, 1.0)
-            if has_ground_collision:
-                # Ground collision - stop falling and place player on top
-                
-                # Calculate fall damage before landing
-                if player["fall_start_y"] is not None:
-                    fall_height = player["fall_start_y"] - player["y"]
-                    if fall_height >= FALL_DAMAGE_THRESHOLD:
-                        # Calculate damage: 1 damage per block above threshold
-                        damage = max(1, int((fall_height - FALL_DAMAGE_THRESHOLD) * FALL_DAMAGE_MULTIPLIER))
-                        player["health"] = max(0, player["health"] - damage)
-                        print(f"💥 FALL DAMAGE: Fell {fall_height:.1f} blocks, took {damage} damage! Health: {player['health']}")
-                        
-                        # Add damage particles
-                        add_blood_particle(player["x"], player["y"])
-                        
-                        # Check if player died from fall damage
-                        if player["health"] <= 0:
-                            print("💀 Player died from fall damage!")
-                            # Trigger death sequence
-                            player["health"] = 0
+        # Sweep the hitbox through the horizontal move and the fall in one go
+        result = move_box(px, player["y"], ENTITY_WIDTH, ENTITY_HEIGHT,
+                          move_dx, player["vel_y"] / TILE_SIZE, is_collision_tile)
+        player["x"] = result.x
+
+        if result.hit_ceiling:
+            # Head bump! Stop upward movement
+            player["vel_y"] = 0
+            trigger_head_bump()
+            player["y"] = result.y  # Keep player below the ceiling
+            player["on_ground"] = False
+        elif result.on_ground:
+            # Ground collision - stop falling and place player on top
+            
+            # Calculate fall damage before landing
+            if player["fall_start_y"] is not None:
+                fall_height = player["fall_start_y"] - player["y"]
+                if fall_height >= FALL_DAMAGE_THRESHOLD:
+                    # Calculate damage: 1 damage per block above threshold
+                    damage = max(1, int((fall_height - FALL_DAMAGE_THRESHOLD) * FALL_DAMAGE_MULTIPLIER))
+                    player["health"] = max(0, player["health"] - damage)
+                    print(f"💥 FALL DAMAGE: Fell {fall_height:.1f} blocks, took {damage} damage! Health: {player['health']}")
                     
-                    # Reset fall tracking
-                    player["fall_start_y"] = None
-                    player["fall_height"] = 0.0
+                    # Add damage particles
+                    add_blood_particle(player["x"], player["y"])
+                    
+                    # Check if player died from fall damage
+                    if player["health"] <= 0:
+                        print("💀 Player died from fall damage!")
+                        # Trigger death sequence
+                        player["health"] = 0
                 
-                player["vel_y"] = 0
-                player["on_ground"] = True
-                player["y"] = target_y - 1  # Position player on top of the block
-            else:
+                # Reset fall tracking
+                player["fall_start_y"] = None
+                player["fall_height"] = 0.0
+            
+            player["vel_y"] = 0
+            player["on_ground"] = True
+            player["y"] = result.y  # Position player on top of the block
+        else:
+            if player["vel_y"] >= 0:
                 # No ground collision - continue falling
                 # Track fall height
                 if player["fall_start_y"] is None:
                     player["fall_start_y"] = player["y"]
                 player["fall_height"] = player["fall_start_y"] - player["y"]
-                
-                player["on_ground"] = False
-                player["y"] = next_y
+            
+            player["on_ground"] = False
+            player["y"] = result.y
 
     # Simple jump system - press space to jump
     if keys[pygame.K_SPACE] and player.get("on_ground", False) and not on_ladder:
         # Check if there's a block above the player before jumping using improved collision detection
-        head_y = int(player["y"] - 1)  # Check one block above current position
-        has_head_collision, head_block, head_pos = check_collision_at_position(player["x"], head_y, 1.0, 0.5)
+        head_tile = find_solid_tile(player["x"], player["y"] - 1, ENTITY_WIDTH, ENTITY_HEIGHT, is_collision_tile)
         
         # Only jump if there's no solid block above
-        if not has_head_collision:
+        if not head_tile:
             # Simple, responsive jump
             player["vel_y"] = JUMP_STRENGTH
             # Reset fall tracking when jumping
             player["fall_start_y"] = None
             player["fall_height"] = 0.0
         else:
-            print(f"🚫 Can't jump - blocked by {head_block} above!")
+            print(f"🚫 Can't jump - blocked by {get_block(*head_tile)} above!")
     
         # Ability system removed - no more wall jump
 
@@ -12694,13 +12399,28 @@ def load_world_data():
         
         # Load world data - UPDATE the existing globals, don't create new objects!
         new_blocks = world_system.current_world_data.get("blocks", {})
+        # Only chunks that no longer match their saved checksum get checked - no whole-world validation pass
+        saved_checksums = world_system.current_world_data.get("chunk_checksums")
+        if saved_checksums and mismatched_chunks:
+            damaged_chunks = mismatched_chunks(new_blocks, saved_checksums, config.world_chunk_size)
+            if damaged_chunks:
+                removed = repair_chunks(new_blocks, damaged_chunks, config.world_chunk_size)
+                print(f"⚠️ {len(damaged_chunks)} chunks changed outside the game or are corrupted "
+                      f"(chunks {', '.join(damaged_chunks[:5])}) - removed {removed} unreadable blocks")
         world_data.update(new_blocks)  # Use update to modify the global dict
         
         new_entities = world_system.current_world_data.get("entities", [])
-        entities.extend(new_entities)  # Use extend to modify the global list
+        # Projectiles are transient - drop any saved by older versions
+        entities.extend(e for e in new_entities if e.get("type") not in LEGACY_PROJECTILE_TYPES)
+        if projectile_system:
+            projectile_system.clear()
         
         new_dropped_items = world_system.current_world_data.get("dropped_items", [])
         dropped_items.extend(new_dropped_items)  # Use extend to modify the global list
+        if dropped_item_tracker:
+            dropped_item_tracker.rebuild(dropped_items)
+        if mob_spawner:
+            mob_spawner.reset()
         
         print(f"✅ Loaded fresh world data with {len(world_data)} blocks, {len(entities)} entities")
         
@@ -12802,16 +12522,40 @@ def load_world_data():
             print("📦 No chest data to load or chest system not available")
         
         # Mark all existing columns as generated to prevent terrain regeneration
-        global generated_terrain_columns
+        global generated_terrain_columns, biome_map
         generated_terrain_columns.clear()
-        for block_key in world_data.keys():
+        fortress_checked_chunks.clear()
+        if BiomeMap:
+            # Older saves have no seed - their name keeps their biomes stable from session to session
+            biome_seed = world_system.current_world_data.get("seed", world_system.current_world_name)
+            biome_map = BiomeMap(biome_seed, chunk_width=config.world_chunk_size)
+        if chunk_pregenerator:
+            chunk_pregenerator.reset()
+        red_bricks = []
+        for block_key, block_type in world_data.items():
             try:
                 x, y = block_key.split(',')
                 x = int(x)
                 generated_terrain_columns.add(x)
+                if block_type == "red_brick":
+                    red_bricks.append((x, int(y)))
             except (ValueError, TypeError):
                 continue  # Skip invalid keys
         
+        # Structures: saved boxes, or rebuilt from red brick for saves made before the registry
+        if structure_registry:
+            saved_structures = world_system.current_world_data.get("structures")
+            if saved_structures is not None:
+                structure_registry.load(saved_structures)
+            else:
+                structure_registry.clear()
+                structure_registry.add_block_clusters("fortress", red_bricks)
+            register_world_landmarks()
+            discovered_fortresses.clear()
+            discovered_fortresses.update(f.subtype for f in structure_registry.of_kind("fortress", discovered=True)
+                                         if f.subtype)
+            print(f"🏰 {len(structure_registry)} structures registered")
+        
         # Initialize torch light sources from loaded world
         global light_sources
         light_sources.clear()
@@ -12859,31 +12603,21 @@ def throw_sword_at_monster(monster):
     if sword_slot is None:
         return False
     
-    # Create thrown sword entity
+    # Create a homing sword projectile that returns after the hit
     sword_item = player["inventory"][sword_slot].copy()
-    sword_item["throwing"] = True
-    sword_item["throw_target"] = monster
-    sword_item["throw_distance"] = 0
-    sword_item["max_throw_distance"] = 8.0  # Maximum throw distance
-    
-    # Create sword projectile
-    thrown_sword = {
-        "type": "thrown_sword",
-        "x": player["x"],
-        "y": player["y"],
-        "target": monster,
-        "sword_item": sword_item,
-        "original_slot": sword_slot,
-        "sword_type": "Iron Sword",
-        "returning": False,
-        "speed": 0.3
-    }
+    dx = monster["x"] - player["x"]
+    dy = monster["y"] - player["y"]
+    distance = math.hypot(dx, dy) or 1.0
+    spawn_projectile(
+        "sword", player["x"], player["y"], 0.3 * dx / distance, 0.3 * dy / distance,
+        damage=3, lifetime=600, team=TEAM_FRIENDLY, radius=1.0,
+        tile_collision=False, returns=True, max_distance=sword_throw_range * 2,
+        owner="player", target=monster,
+        payload={"sword_item": sword_item, "sword_type": sword_item["type"], "original_slot": sword_slot}
+    )
     
-    entities.append(thrown_sword)
-    
-    # Remove sword from inventory temporarily
-    player["inventory"][sword_slot] = None
-    normalize_inventory()
+    # Remove sword from inventory temporarily (reserved so items don't shift)
+    player["inventory"][sword_slot] = {"type": "__THROWN_SWORD__", "count": 1, "reserved": True}
     
     print(f"🗡️ Sword thrown at monster!")
     return True
@@ -12942,7 +12676,7 @@ def cleanup_distant_entities():
         distance = math.sqrt(dx*dx + dy*dy)
         
         if distance > cleanup_distance:
-            dropped_items.remove(item)
+            remove_dropped_item(item)
             items_removed += 1
     
     if entities_removed > 0 or items_removed > 0:
@@ -12972,76 +12706,6 @@ def update_crops():
             # Still growing - green
             world_data[block_key] = "crop_young"
 
-def update_animals():
-    """Update physics and behavior for animals (horses, cows, etc.)"""
-    global player_mounted, mounted_horse
-    
-    for entity in entities:
-        if entity["type"] in ["horse", "cow", "pig", "sheep", "donkey", "mule"]:
-            # Initialize velocity if missing
-            if "vel_y" not in entity:
-                entity["vel_y"] = 0
-            if "vel_x" not in entity:
-                entity["vel_x"] = 0
-                
-            # Apply gravity
-            entity["vel_y"] += GRAVITY
-            if entity["vel_y"] > MAX_FALL_SPEED:
-                entity["vel_y"] = MAX_FALL_SPEED
-                
-            # Check if this is the mounted horse
-            is_mounted = (player_mounted and mounted_horse is entity)
-            
-            # Horizontal movement and collision
-            # For mounted horses, x-movement is handled by player input in update_player
-            # For unmounted, we apply friction or random wandering
-            if not is_mounted:
-                entity["vel_x"] *= 0.8  # Friction
-                if abs(entity["vel_x"]) < 0.01:
-                    entity["vel_x"] = 0
-            
-            # Apply horizontal velocity
-            new_x = entity["x"] + entity["vel_x"]
-            
-            # Check horizontal collision
-            # Use a slightly smaller bounding box for animals to avoid getting stuck
-            has_collision, block_type, collision_pos = check_collision_at_position(new_x, entity["y"], 1.0, 1.0)
-            
-            if not has_collision:
-                entity["x"] = new_x
-            else:
-                entity["vel_x"] = 0
-                
-            # Vertical movement (Gravity)
-            new_y = entity["y"] + entity["vel_y"] / TILE_SIZE
-            
-            # Check vertical collision (Ground/Ceiling)
-            target_y_int = int(new_y + 1)
-            
-            if entity["vel_y"] > 0: # Falling
-                 has_ground, ground_block, ground_pos = check_collision_at_position(entity["x"], target_y_int, 1.0, 1.0)
-                 if has_ground:
-                     entity["y"] = int(new_y)
-                     entity["vel_y"] = 0
-                     entity["on_ground"] = True
-                 else:
-                     entity["y"] = new_y
-                     entity["on_ground"] = False
-            elif entity["vel_y"] < 0: # Jumping
-                 # Check ceiling
-                 has_ceiling, ceiling_block, ceiling_pos = check_collision_at_position(entity["x"], int(new_y), 1.0, 1.0)
-                 if has_ceiling:
-                     entity["vel_y"] = 0
-                     entity["y"] = int(new_y) + 1
-                 else:
-                     entity["y"] = new_y
-                     entity["on_ground"] = False
-            
-            # Keep within world bounds
-            if entity["y"] > 200: # Void
-                entity["y"] = 0
-                entity["vel_y"] = 0
-
 def update_animals():
     """Update physics and behavior for animals (horses, cows, etc.)"""
     global player_mounted, mounted_horse
@@ -13068,48 +12732,18 @@ def update_animals():
                 if abs(entity["vel_x"]) < 0.01:
                     entity["vel_x"] = 0
             
-            # Apply horizontal velocity
-            new_x = entity["x"] + entity["vel_x"]
-            
-            # Check horizontal collision
-            has_collision, block_type, collision_pos = check_collision_at_position(new_x, entity["y"], 1.0, 1.0)
-            
-            if not has_collision:
-                entity["x"] = new_x
-            else:
-                # If mounted, try auto-step up
-                stepped_up = False
-                if is_mounted:
-                    # Check block above collision
-                    if not check_collision_at_position(new_x, entity["y"] - 1, 1.0, 1.0)[0]:
-                         entity["x"] = new_x
-                         entity["y"] -= 1
-                         stepped_up = True
-                
-                if not stepped_up:
-                    entity["vel_x"] = 0
-                
-            # Vertical movement (Gravity)
-            new_y = entity["y"] + entity["vel_y"] / TILE_SIZE
-            
-            # Check vertical collision
-            if entity["vel_y"] > 0: # Falling
-                 has_ground, ground_block, ground_pos = check_collision_at_position(entity["x"], int(new_y + 1), 1.0, 1.0)
-                 if has_ground:
-                     entity["y"] = int(new_y)
-                     entity["vel_y"] = 0
-                     entity["on_ground"] = True
-                 else:
-                     entity["y"] = new_y
-                     entity["on_ground"] = False
-            elif entity["vel_y"] < 0: # Jumping
-                 has_ceiling, ceiling_block, ceiling_pos = check_collision_at_position(entity["x"], int(new_y), 1.0, 1.0)
-                 if has_ceiling:
-                     entity["vel_y"] = 0
-                     entity["y"] = int(new_y) + 1
-                 else:
-                     entity["y"] = new_y
-                     entity["on_ground"] = False
+            # Move with swept collision; the mounted horse steps up single blocks
+            step_height = 1.0 if is_mounted and entity.get("on_ground", False) else 0.0
+            result = move_box(entity["x"], entity["y"], ENTITY_WIDTH, ENTITY_HEIGHT,
+                              entity["vel_x"], entity["vel_y"] / TILE_SIZE,
+                              is_collision_tile, step_height)
+            entity["x"] = result.x
+            entity["y"] = result.y
+            if result.normal_x:
+                entity["vel_x"] = 0
+            if result.normal_y:
+                entity["vel_y"] = 0
+            entity["on_ground"] = result.on_ground
             
             # Keep within world bounds
             if entity["y"] > 200:
@@ -13123,8 +12757,7 @@ def update_monsters():
     if not is_day:  # Only spawn monsters at night
         # Spawn monsters everywhere when night first falls
         if not night_monsters_spawned:
-            print(f"🔍 DEBUG: is_day={is_day}, spawning monsters everywhere!")
-            spawn_monsters_everywhere_at_night()
+            start_night_spawn_wave()
             night_monsters_spawned = True
             print("🌙 Night has fallen! Monsters are spawning everywhere!")
         
@@ -13149,22 +12782,17 @@ def update_monsters():
         # Reset timer during day and clean up night-spawned monsters
         night_monster_spawn_timer = 0
         night_monsters_spawned = False  # Reset for next night
+        if mob_spawner:
+            mob_spawner.cancel("night_wave")
         cleanup_night_monsters()
     
-    # Spawn slimes randomly during both day and night (harmless until approached)
-    spawn_slimes_randomly()
-    
-    # Spawn cows randomly during day
-    if is_day:
-        spawn_cows_randomly()
-    
-    # Spawn horses in grassy fields
-    spawn_horses_randomly()
-    
-    # Spawn mad pigeons on trees ONLY at night and only in the overworld (not inside fortresses)
-    if not is_day:
-        spawn_pigeons_on_trees()
+    # Slimes, cows (day), horses and mad pigeons (night) spawn through the
+    # budgeted spawner, along with any queued nightfall wave
+    if mob_spawner:
+        mob_spawner.update(entities, player["x"])
     
+    # Refresh the shared pathfinding field before any hostile mob moves
+    update_mob_flow_field()
     # Update monster movement and combat
     update_monster_movement_and_combat()
     # Update slime behavior
@@ -13240,81 +12868,49 @@ def draw_night_overlay():
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
                 screen.blit(text_surface, text_rect)
 
-def spawn_monsters_everywhere_at_night():
-    """Spawn monsters across the entire world when night falls"""
-    global entities
-    import random
-    
-    # Get the current world bounds (explored area)
-    if not world_data:
-        return
+def create_night_monster(x, y, biome):
+    """Build a night monster for a spawn position, choosing its type by biome"""
+    # Choose monster type based on biome
+    if biome == BIOME_DESERT and random.random() < 0.4:  # 40% chance for mad pigeon in desert
+        monster_type = "pigeon"
+        monster_hp = 6  # Pigeons are weaker but faster
+        monster_img = textures["monster"]  # Use monster texture for now
+    elif random.random() < 0.3:  # 30% chance for zombie
+        monster_type = "zombie"
+        monster_hp = 12  # Zombies are stronger
+        monster_img = textures["zombie"]  # Use original zombie texture
+    else:
+        monster_type = "monster"
+        monster_hp = 8
+        monster_img = textures["monster"]  # Use original monster texture
     
-    # Find the explored area bounds
-    min_x = min(int(pos.split(',')[0]) for pos in world_data.keys())
-    max_x = max(int(pos.split(',')[0]) for pos in world_data.keys())
+    return {
+        "type": monster_type,
+        "x": float(x),
+        "y": float(y),
+        "hp": monster_hp,
+        "cooldown": 0,
+        "image": monster_img,
+        "night_spawned": True  # Mark as night-spawned
+    }
+
+def start_night_spawn_wave():
+    """Queue monster spawns across the explored world when night falls.
     
-    # Spawn monsters across the explored world
-    monsters_spawned = 0
-    max_world_monsters = 25  # Maximum monsters to spawn across the world
+    The spawner works through the queue a little each frame, so nightfall
+    doesn't stall the game.
+    """
+    if not mob_spawner:
+        return
     
-    # Spawn monsters in a grid pattern across the explored area
-    for x in range(min_x, max_x + 1, 20):  # Every 20 blocks
-        if monsters_spawned >= max_world_monsters:
-            break
-            
-        # Find surface level at this position
-        surface_y = find_surface_level(x)
-        if surface_y is not None:
-                        # Check if there's already a monster nearby
-            nearby_monster = False
-            for entity in entities:
-                if entity["type"] in ["monster", "zombie"]:
-                    distance = abs(entity["x"] - x)
-                    if distance < 15:  # Within 15 blocks
-                        nearby_monster = True
-                        break
-            
-            # Spawn a monster if none nearby
-            if not nearby_monster and random.random() < 0.7:  # 70% chance to spawn at night
-                # Check if this is a desert biome (sand blocks nearby)
-                is_desert = False
-                for check_x in range(x - 5, x + 6):
-                    for check_y in range(surface_y - 2, surface_y + 3):
-                        if f"{check_x},{check_y}" in world_data and world_data[f"{check_x},{check_y}"] == "sand":
-                            is_desert = True
-                            break
-                    if is_desert:
-                        break
-                
-                # Choose monster type based on biome
-                if is_desert and random.random() < 0.4:  # 40% chance for mad pigeon in desert
-                    monster_type = "pigeon"
-                    monster_hp = 6  # Pigeons are weaker but faster
-                    monster_img = textures["monster"]  # Use monster texture for now
-                elif random.random() < 0.3:  # 30% chance for zombie
-                    monster_type = "zombie"
-                    monster_hp = 12  # Zombies are stronger
-                    monster_img = textures["zombie"]  # Use original zombie texture
-                else:
-                    monster_type = "monster"
-                    monster_hp = 8
-                    monster_img = textures["monster"]  # Use original monster texture
-                
-                # Spawn the monster
-                entities.append({
-                    "type": monster_type,
-                    "x": float(x),
-                    "y": float(surface_y),
-                    "hp": monster_hp,
-                    "cooldown": 0,
-                    "image": monster_img,
-                    "night_spawned": True  # Mark as night-spawned
-                })
-                
-                monsters_spawned += 1
-                print(f"👹 Night {monster_type} spawned at world position ({x}, {int(surface_y)})")
+    if generated_terrain_columns:
+        first_chunk = mob_spawner.chunk_of(min(generated_terrain_columns))
+        last_chunk = mob_spawner.chunk_of(max(generated_terrain_columns))
+    else:
+        first_chunk = last_chunk = mob_spawner.chunk_of(player["x"])
     
-    print(f"🌙 Night monster spawning complete! Spawned {monsters_spawned} monsters across the world!")
+    # Two attempts per chunk - roughly one every 20 blocks
+    mob_spawner.queue_wave("night_wave", range(first_chunk, last_chunk + 1), attempts_per_chunk=2)
 
 def spawn_night_monster_near_player():
     """Spawn a monster right next to the player for intense nighttime combat"""
@@ -13348,41 +12944,11 @@ def spawn_night_monster_near_player():
                     break
                         
         if not too_close:
-            # Check if this is a desert biome (sand blocks nearby)
-            is_desert = False
-            for check_x in range(int(spawn_x) - 5, int(spawn_x) + 6):
-                for check_y in range(surface_y - 2, surface_y + 3):
-                    if f"{check_x},{check_y}" in world_data and world_data[f"{check_x},{check_y}"] == "sand":
-                        is_desert = True
-                        break
-                if is_desert:
-                    break
-            
-            # Choose monster type based on biome
-            import random
-            if is_desert and random.random() < 0.4:  # 40% chance for mad pigeon in desert
-                monster_type = "pigeon"
-                monster_hp = 6  # Pigeons are weaker but faster
-                monster_img = textures["monster"]  # Use monster texture for now
-            elif random.random() < 0.3:  # 30% chance for zombie
-                monster_type = "zombie"
-                monster_hp = 12  # Zombies are stronger
-                monster_img = textures["zombie"]  # Use original zombie texture
-            else:
-                monster_type = "monster"
-                monster_hp = 8
-                monster_img = textures["monster"]  # Use original monster texture
-            
-            # Spawn the monster
-            entities.append({
-                "type": monster_type,
-                "x": float(spawn_x),
-                "y": float(spawn_y),
-                "hp": monster_hp,
-                "cooldown": 0,
-                "image": monster_img,
-                "night_spawned": True  # Mark as night-spawned
-            })
+            # Biome comes from the spawner's cached column classification
+            biome = mob_spawner.biome_at(int(spawn_x)) if mob_spawner else None
+            monster = create_night_monster(spawn_x, spawn_y, biome)
+            monster_type = monster["type"]
+            entities.append(monster)
             
             monster_count = sum(1 for mob in entities if mob["type"] in ["monster", "zombie", "pigeon"])
             print(f"👹 Night {monster_type} spawned near player at ({int(spawn_x)}, {int(spawn_y)}) - Total: {monster_count}/{max_night_monsters}")
@@ -13412,7 +12978,6 @@ def find_surface_level(x):
     return None
 
 # Slime spawning system
-slime_spawn_timer = 0
 slime_spawn_cooldown = 600  # 10 seconds at 60 FPS
 max_slimes = 100  # Maximum slimes in the world
 # Distance at which slimes become aggressive and can hurt the player.
@@ -13420,43 +12985,22 @@ max_slimes = 100  # Maximum slimes in the world
 # but tighten the actual damage range so they only hit when truly adjacent.
 slime_aggro_distance = 3
 
-def spawn_slimes_randomly():
-    """Spawn slimes randomly across the world (harmless until approached)"""
-    global entities, slime_spawn_timer
-    
-    slime_spawn_timer += 1
-    
-    # Check if it's time to try spawning a slime
-    if slime_spawn_timer >= slime_spawn_cooldown:
-        # Count existing slimes
-        slime_count = sum(1 for mob in entities if mob["type"] == "slime")
-        
-        # Spawn a slime if under the limit
-        if slime_count < max_slimes and random.random() < 0.7:  # 70% chance
-            # Spawn near player but not too close
-            spawn_distance = random.uniform(10, 30)  # 10-30 blocks away
-            spawn_angle = random.uniform(0, 2 * math.pi)
-            
-            spawn_x = player["x"] + math.cos(spawn_angle) * spawn_distance
-            spawn_y_surface = find_surface_level(int(spawn_x))
-            
-            if spawn_y_surface is not None:
-                entities.append({
-                    "type": "slime",
-                    "x": float(spawn_x),
-                    "y": float(spawn_y_surface),
-                    "hp": 3,  # Weak enemy
-                    "cooldown": 0,
-                    "image": textures["slime"],
-                    "aggressive": False,  # Harmless until approached
-                    "vel_y": 0,  # Vertical velocity for jumping/falling
-                    "on_ground": True,  # Is slime on ground
-                    "jump_cooldown": 0,  # Cooldown between jumps
-                    "squish_amount": 0,  # For squish animation on landing
-                })
-                print(f"🟢 Slime spawned at ({int(spawn_x)}, {int(spawn_y_surface)})")
-        
-        slime_spawn_timer = 0  # Reset timer
+def create_slime(x, y, biome):
+    """Build a slime (harmless until approached)"""
+    print(f"🟢 Slime spawned at ({x}, {y})")
+    return {
+        "type": "slime",
+        "x": float(x),
+        "y": float(y),
+        "hp": 3,  # Weak enemy
+        "cooldown": 0,
+        "image": textures["slime"],
+        "aggressive": False,  # Harmless until approached
+        "vel_y": 0,  # Vertical velocity for jumping/falling
+        "on_ground": True,  # Is slime on ground
+        "jump_cooldown": 0,  # Cooldown between jumps
+        "squish_amount": 0,  # For squish animation on landing
+    }
 
 def update_slime_behavior():
     """Update slime behavior - Terraria-style bouncing physics"""
@@ -13535,11 +13079,16 @@ def update_slime_behavior():
                 if slime.get("aggressive", False):
                     # Aggressive: jump towards player
                     if distance > 1.5:
-                        # Calculate jump direction
-                        jump_direction_x = dx / distance if distance > 0 else 0
+                        # Calculate jump direction (flow field steers slimes around walls)
+                        flow = mob_flow_field.direction(slime["x"], slime["y"]) if mob_flow_field else None
+                        if flow and flow[0] != 0:
+                            jump_direction_x = 1 if flow[0] > 0 else -1
+                        else:
+                            jump_direction_x = dx / distance if distance > 0 else 0
                         
-                        # Jump with horizontal and vertical velocity
-                        slime["x"] += jump_direction_x * 0.4  # Horizontal jump
+                        # Jump with horizontal and vertical velocity (the hop still stops at walls)
+                        slime["x"] = move_box(slime["x"], slime["y"], ENTITY_WIDTH, ENTITY_HEIGHT,
+                                              jump_direction_x * 0.4, 0, is_collision_tile).x
                         slime["vel_y"] = -0.25  # Jump strength (negative = up)
                         slime["on_ground"] = False
                         slime["jump_cooldown"] = random.randint(30, 60)  # 0.5-1 second between jumps
@@ -13568,7 +13117,6 @@ def update_slime_behavior():
             slime["cooldown"] -= 1
 
 # Cow spawning system
-cow_spawn_timer = 0
 cow_spawn_cooldown = 1200  # 20 seconds at 60 FPS
 max_cows = 4  # Maximum 3-4 cows near spawn
 
@@ -13624,44 +13172,21 @@ def spawn_initial_cows():
     
     print(f"✅ Spawned {cows_spawned} cows near spawn!")
 
-def spawn_cows_randomly():
-    """Spawn peaceful cows NEAR SPAWN on solid ground only"""
-    global entities, cow_spawn_timer
-    
-    cow_spawn_timer += 1
-    
-    if cow_spawn_timer >= cow_spawn_cooldown:
-        cow_count = sum(1 for e in entities if e["type"] == "cow")
-        
-        if cow_count < max_cows and random.random() < 0.6:
-            # Spawn near spawn area (safe zone) - within 40 blocks
-            spawn_area_max = 40
-            spawn_x = random.uniform(-spawn_area_max, spawn_area_max)
-            
-            # Use ground level finder to avoid spawning on trees
-            spawn_y_ground = find_ground_level(int(spawn_x))
-            
-            if spawn_y_ground is not None:
-                # Make sure there's no tree above the spawn position
-                spawn_y_check = int(spawn_y_ground)
-                block_at_spawn = get_block(int(spawn_x), spawn_y_check)
-                
-                if not block_at_spawn or block_at_spawn == "air":
-                    entities.append({
-                        "type": "cow",
-                        "x": float(spawn_x),
-                        "y": float(spawn_y_ground),
-                        "hp": 5,
-                        "image": textures["cow"],
-                        "wander_target": None,
-                        "wander_cooldown": 0,
-                        "vel_y": 0,
-                        "on_ground": True,
-                        "facing_direction": 1  # Default facing right
-                    })
-                    print(f"🐄 Cow spawned near spawn at ({spawn_x:.1f}, {spawn_y_ground:.1f})")
-        
-        cow_spawn_timer = 0
+def create_cow(x, y, biome):
+    """Build a peaceful cow"""
+    print(f"🐄 Cow spawned near spawn at ({x}, {y})")
+    return {
+        "type": "cow",
+        "x": float(x),
+        "y": float(y),
+        "hp": 5,
+        "image": textures["cow"],
+        "wander_target": None,
+        "wander_cooldown": 0,
+        "vel_y": 0,
+        "on_ground": True,
+        "facing_direction": 1  # Default facing right
+    }
 
 def update_cow_behavior():
     """Update cow wandering behavior with gravity and collision"""
@@ -13733,70 +13258,27 @@ def update_cow_behavior():
 
 
 # Horse spawning and behavior
-horse_spawn_timer = 0
 horse_spawn_cooldown = 2400  # 40 seconds at 60 FPS
 max_horses = 10
 
-def spawn_horses_randomly():
-    """Spawn horses in grassy areas far from oceans and underground."""
-    global entities, horse_spawn_timer
-    horse_spawn_timer += 1
-    
-    if horse_spawn_timer < horse_spawn_cooldown:
-        return
-    
-    # Count existing horses
-    horse_count = sum(1 for e in entities if e.get("type") == "horse")
-    if horse_count >= max_horses:
-        horse_spawn_timer = 0
-        return
-    
-    # Try a few random positions near player
-    for _ in range(10):
-        spawn_distance = random.uniform(20, 60)
-        angle = random.uniform(0, 2 * math.pi)
-        spawn_x = int(player["x"] + math.cos(angle) * spawn_distance)
-        
-        surface_y = find_surface_level(spawn_x)
-        if surface_y is None:
-            continue
-        
-        # Check the block BELOW the surface air (which should be the ground)
-        block = get_block(spawn_x, surface_y + 1)
-        # Only spawn on grass (nice fields)
-        if block != "grass":
-            continue
-        
-        # Don't spawn in water or lava nearby (avoid oceans)
-        unsafe = False
-        for check_y in range(surface_y + 1, surface_y + 4):
-            b = get_block(spawn_x, check_y)
-            if b in ("water", "lava"):
-                unsafe = True
-                break
-        if unsafe:
-            continue
-        
-        # Spawn a horse entity
-        entities.append({
-            "id": str(uuid.uuid4()),  # Unique ID for saving/loading
-            "type": "horse",
-            "x": float(spawn_x),
-            "y": float(surface_y),
-            "image": "horse",
-            "has_saddle": False,
-            "tamed": False,  # Untamed by default
-            "owner": None,
-            "vel_y": 0.0,
-            "on_ground": True,
-            "wander_target": None,
-            "wander_cooldown": 0,
-            "facing_direction": 1,
-        })
-        print(f"🐎 Horse spawned at ({spawn_x}, {surface_y})")
-        break
-    
-    horse_spawn_timer = 0
+def create_horse(x, y, biome):
+    """Build a wild horse for a grassy field"""
+    print(f"🐎 Horse spawned at ({x}, {y})")
+    return {
+        "id": str(uuid.uuid4()),  # Unique ID for saving/loading
+        "type": "horse",
+        "x": float(x),
+        "y": float(y),
+        "image": "horse",
+        "has_saddle": False,
+        "tamed": False,  # Untamed by default
+        "owner": None,
+        "vel_y": 0.0,
+        "on_ground": True,
+        "wander_target": None,
+        "wander_cooldown": 0,
+        "facing_direction": 1,
+    }
 
 def update_horse_behavior():
     """Update horse gravity, wandering, and movement when not controlled by the player."""
@@ -13882,7 +13364,6 @@ def update_horse_behavior():
             horse["wander_cooldown"] -= 1
 
 # Mad Pigeon spawning system  
-pigeon_spawn_timer = 0
 pigeon_spawn_cooldown = 1800  # 30 seconds at 60 FPS
 max_pigeons = 200  # Allow up to 200 pigeons (100 initial + natural spawning)
 
@@ -13938,52 +13419,54 @@ def spawn_initial_pigeons():
     
     print(f"✅ Spawned {pigeons_spawned} pigeons far from spawn (safe zone)!")
 
-def spawn_pigeons_on_trees():
-    """Spawn mad pigeons on tree leaves (far from spawn area)"""
-    global entities, pigeon_spawn_timer
-    
-    pigeon_spawn_timer += 1
-    
-    if pigeon_spawn_timer >= pigeon_spawn_cooldown:
-        pigeon_count = sum(1 for e in entities if e["type"] == "mad_pigeon")
-        
-        if pigeon_count < max_pigeons and random.random() < 0.7:
-            # Find a tree (log block with leaves nearby), avoid spawn area
-            search_range = 40
-            safe_spawn_radius = 50
-            
-            for attempt in range(20):  # Try 20 times to find a tree
-                search_x = int(player["x"] + random.uniform(-search_range, search_range))
-                
-                # Skip if too close to spawn (0, 0)
-                if abs(search_x) < safe_spawn_radius:
-                    continue
-                
-                # Find surface and check for trees
-                for y in range(90, 130):
-                    block = get_block(search_x, y)
-                    if block == "leaves":
-                        # Found leaves! Spawn pigeon here
-                        entities.append({
-                            "type": "mad_pigeon",
-                            "x": float(search_x),
-                            "y": float(y),
-                            "hp": 4,
-                            "image": textures["mad_pigeon"],
-                            "aggressive": False,
-                            "tamed": False,
-                            "cooldown": 0,
-                            "fly_target": None,
-                            "perched": True,  # Start perched on tree
-                            "facing_direction": 1  # Default facing right
-                        })
-                        print(f"🐦 Mad Pigeon spawned on tree at ({search_x}, {y})")
-                        break
-                else:
-                    continue
-                break
-        
-        pigeon_spawn_timer = 0
+def create_mad_pigeon(x, y, biome):
+    """Build a mad pigeon perched on tree leaves"""
+    print(f"🐦 Mad Pigeon spawned on tree at ({x}, {y})")
+    return {
+        "type": "mad_pigeon",
+        "x": float(x),
+        "y": float(y),
+        "hp": 4,
+        "image": textures["mad_pigeon"],
+        "aggressive": False,
+        "tamed": False,
+        "cooldown": 0,
+        "fly_target": None,
+        "perched": True,  # Start perched on tree
+        "facing_direction": 1  # Default facing right
+    }
+
+# Budgeted mob spawning: per-chunk candidates by biome, caps and a frame time budget
+try:
+    from system.mob_spawning import MobSpawner, SpawnRule, GROUND_BIOMES, BIOME_GRASSLAND, BIOME_CANOPY, BIOME_DESERT
+except ImportError:
+    print("⚠️ Warning: Mob spawner not available")
+    MobSpawner = None
+    BIOME_DESERT = "desert"
+
+if MobSpawner:
+    mob_spawner = MobSpawner(get_block, chunk_size=config.world_chunk_size)
+    # Nightfall wave across the explored world (queued by start_night_spawn_wave)
+    mob_spawner.add_rule(SpawnRule("night_wave", create_night_monster, ("monster", "zombie", "pigeon"),
+                                   max_global=25, max_per_chunk=3, interval=0, chance=0.7, spacing=15))
+    # Slimes 10-30 blocks from the player, day and night
+    mob_spawner.add_rule(SpawnRule("slime", create_slime, ("slime",),
+                                   max_global=max_slimes, max_per_chunk=8, interval=slime_spawn_cooldown,
+                                   chance=0.7, min_distance=10, max_distance=30))
+    # Cows near the spawn point during the day
+    mob_spawner.add_rule(SpawnRule("cow", create_cow, ("cow",),
+                                   max_global=max_cows, max_per_chunk=max_cows, interval=cow_spawn_cooldown,
+                                   chance=0.6, anchor="origin", max_distance=40, condition=lambda: is_day))
+    # Horses in grassy fields away from water
+    mob_spawner.add_rule(SpawnRule("horse", create_horse, ("horse",), biomes=(BIOME_GRASSLAND,),
+                                   max_global=max_horses, max_per_chunk=3, interval=horse_spawn_cooldown,
+                                   min_distance=20, max_distance=60))
+    # Mad pigeons on tree tops at night, never near spawn
+    mob_spawner.add_rule(SpawnRule("mad_pigeon", create_mad_pigeon, ("mad_pigeon",), biomes=(BIOME_CANOPY,),
+                                   max_global=max_pigeons, max_per_chunk=12, interval=pigeon_spawn_cooldown,
+                                   chance=0.7, max_distance=40, min_abs_x=50, condition=lambda: not is_day))
+else:
+    mob_spawner = None
 
 def update_pigeon_behavior():
     """Update mad pigeon AI - aggressive unless player holds steak, with collision detection"""
@@ -14050,15 +13533,23 @@ def update_pigeon_behavior():
             # Dive at player aggressively
             if distance > 0.5:
                 speed = 0.08  # Fast dive speed
-                move_x = (dx / distance) * speed if distance > 0 else 0
-                move_y = (dy / distance) * speed if distance > 0 else 0
-                
-                # Check collision before moving
-                new_x = pigeon["x"] + move_x
-                new_y = pigeon["y"] + move_y
-                if not get_block(int(new_x), int(new_y)):
-                    pigeon["x"] = new_x
-                    pigeon["y"] = new_y
+                flow = mob_flow_field.direction(pigeon["x"], pigeon["y"]) if mob_flow_field else None
+                if flow:
+                    # Follow the shared flow field around obstacles; the box can still clip corners
+                    result = move_box(pigeon["x"], pigeon["y"], ENTITY_WIDTH, ENTITY_HEIGHT,
+                                      flow[0] * speed, flow[1] * speed, is_mob_solid)
+                    pigeon["x"] = result.x
+                    pigeon["y"] = result.y
+                else:
+                    move_x = (dx / distance) * speed if distance > 0 else 0
+                    move_y = (dy / distance) * speed if distance > 0 else 0
+                    
+                    # Check collision before moving
+                    new_x = pigeon["x"] + move_x
+                    new_y = pigeon["y"] + move_y
+                    if not get_block(int(new_x), int(new_y)):
+                        pigeon["x"] = new_x
+                        pigeon["y"] = new_y
             
             # Peck player if very close
             if pigeon["cooldown"] <= 0 and distance < 1.5:
@@ -14106,6 +13597,44 @@ def update_pigeon_behavior():
         if pigeon["cooldown"] > 0:
             pigeon["cooldown"] -= 1
 
+def get_remote_player_positions():
+    """Get positions of other LAN players so hostile mobs can hunt them too"""
+    positions = []
+    if not multiplayer_ui:
+        return positions
+    
+    try:
+        lan_client = multiplayer_ui.get_lan_client()
+        if lan_client and lan_client.is_connected():
+            for player_data in lan_client.get_other_players().values():
+                positions.append(player_data.get("position", (0, 0)))
+        
+        lan_server = multiplayer_ui.get_lan_server()
+        if lan_server:
+            for player_data in lan_server.get_remote_players().values():
+                positions.append(player_data["position"])
+    except Exception as e:
+        print(f"⚠️ Could not read remote player positions: {e}")
+    
+    return positions
+
+def flow_field_in_use():
+    """Is any mob that follows the flow field (monsters, angry slimes and pigeons) inside its window?"""
+    radius = mob_flow_field.radius
+    player_x, player_y = player["x"], player["y"]
+    for mob in entities:
+        mob_type = mob["type"]
+        if mob_type == "monster" or (mob_type in ("slime", "mad_pigeon") and mob.get("aggressive", False)):
+            if abs(mob["x"] - player_x) <= radius and abs(mob["y"] - player_y) <= radius:
+                return True
+    return False
+
+def update_mob_flow_field():
+    """Patch the shared mob flow field if players moved or blocks changed - only while a hostile mob can use it"""
+    if not mob_flow_field or not flow_field_in_use():
+        return
+    mob_flow_field.update((player["x"], player["y"]), get_remote_player_positions())
+
 def update_monster_movement_and_combat():
     """Update monster movement and combat (separated for performance)"""
     # OPTIMIZED: Cache player position to avoid repeated lookups
@@ -14135,9 +13664,14 @@ def update_monster_movement_and_combat():
                 else:  # Player is far
                     speed = 0.02  # Reduced from 0.04
                 
-                # Calculate movement
-                move_x = speed * dx / dist
-                move_y = speed * dy / dist
+                # PATHFINDING: Follow the shared flow field when the mob is inside it
+                flow = mob_flow_field.direction(mob["x"], mob["y"]) if mob_flow_field else None
+                if flow:
+                    move_x = speed * flow[0]
+                    move_y = speed * flow[1]
+                else:
+                    move_x = speed * dx / dist
+                    move_y = speed * dy / dist
                 
                 # Update facing direction based on horizontal movement
                 if move_x > 0:
@@ -14145,43 +13679,23 @@ def update_monster_movement_and_combat():
                 elif move_x < 0:
                     mob["facing_direction"] = -1  # Moving left
                 
-                # Check collision before moving
-                new_x = mob["x"] + move_x
-                new_y = mob["y"] + move_y
-                
-                # Check if new position is blocked (mobs can walk through water)
-                block_at_new = get_block(int(new_x), int(new_y))
-                
-                if not block_at_new or block_at_new in ["air", "water", "lava"]:
-                    # No collision - move freely through air and water
-                    mob["x"] = new_x
-                    mob["y"] = new_y
-                else:
-                    # Collision detected - try to move around the obstacle
-                    # Try horizontal only
-                    block_at_x = get_block(int(mob["x"] + move_x), int(mob["y"]))
-                    if not block_at_x or block_at_x in ["air", "water", "lava"]:
-                        mob["x"] += move_x
-                    
-                    # Try vertical only
-                    block_at_y = get_block(int(mob["x"]), int(mob["y"] + move_y))
-                    if not block_at_y or block_at_y in ["air", "water", "lava"]:
-                        mob["y"] += move_y
+                # Slide along obstacles (mobs can move through water). The flow field only
+                # picks passable tiles, but the box is 0.9 wide and can still clip a corner on the way
+                result = move_box(mob["x"], mob["y"], ENTITY_WIDTH, ENTITY_HEIGHT,
+                                  move_x, move_y, is_mob_solid)
+                mob["x"] = result.x
+                mob["y"] = result.y
 
             # Ranged attack: throw rock projectiles every 1.5s
             mob["cooldown"] = mob.get("cooldown", 0) + 1
             if mob["cooldown"] >= 90:  # 1.5 seconds at 60 FPS
                 mob["cooldown"] = 0
                 if dist_squared > 0:  # Use squared distance for efficiency
-                    entities.append({
-                        "type": "rock_projectile",  # Changed to rock_projectile
-                        "x": mob["x"],
-                        "y": mob["y"],
-                        "dx": 0.12 * dx / dist,  # Slower projectile speed
-                        "dy": 0.12 * dy / dist,
-                        "damage": 1,  # Reduced damage to 1 heart for balance
-                        "lifetime": 180  # 3 seconds lifetime
-                    })
+                    spawn_projectile("rock", mob["x"], mob["y"],
+                                     0.12 * dx / dist, 0.12 * dy / dist,  # Slower projectile speed
+                                     damage=1,  # Reduced damage to 1 heart for balance
+                                     lifetime=180,  # 3 seconds lifetime
+                                     owner=mob)
                     print(f"🪨 Monster threw a rock at player!")
 
             # OPTIMIZED: Contact damage with squared distance check
@@ -14221,17 +13735,15 @@ def update_monster_movement_and_combat():
             
             # Apply gravity
             mob["vel_y"] += 0.02  # Gravity
-            mob["y"] += mob["vel_y"]
-            
-            # Check ground collision
-            mob_x = int(mob["x"])
-            mob_y = int(mob["y"])
-            block_below = get_block(mob_x, mob_y + 1)
             
             # Zombies fall through water (not solid ground)
-            if block_below and block_below not in ["air", None, "water", "lava"]:
+            result = move_box(mob["x"], mob["y"], ENTITY_WIDTH, ENTITY_HEIGHT, 0, mob["vel_y"], is_mob_solid)
+            mob["y"] = result.y
+            if result.hit_ceiling:
+                mob["vel_y"] = 0
+            
+            if result.on_ground:
                 # On ground - stop falling
-                mob["y"] = float(mob_y)
                 mob["vel_y"] = 0
                 mob["on_ground"] = True
                 
@@ -14272,14 +13784,10 @@ def update_monster_movement_and_combat():
                     if abs(dx) > 0.3:
                         # Move horizontally towards player
                         move_dir = 1 if dx > 0 else -1
-                        new_x = mob["x"] + zombie_speed * move_dir
-                        
-                        # Check wall collision
-                        block_ahead = get_block(int(new_x), int(mob["y"]))
-                        
-                        if not block_ahead or block_ahead == "air":
-                            mob["x"] = new_x
-                        # If blocked, zombie just stops (no flying over walls!)
+                        # Check wall collision - if blocked, zombie just stops (no flying over walls!)
+                        result = move_box(mob["x"], mob["y"], ENTITY_WIDTH, ENTITY_HEIGHT,
+                                          zombie_speed * move_dir, 0, is_mob_solid)
+                        mob["x"] = result.x
                 
                 # Contact damage (2 hearts) when close
                 if abs(player["x"] - mob["x"]) < 0.8 and abs(player["y"] - mob["y"]) < 1:
@@ -14297,77 +13805,6 @@ def update_monster_movement_and_combat():
                         if player["health"] <= 0:
                             show_death_screen()
 
-    # Projectiles step and collision
-    entities_to_remove = []
-    
-    for proj in entities[:]:
-        if proj["type"] == "projectile":
-            proj["x"] += proj["dx"]
-            proj["y"] += proj["dy"]
-            if abs(player["x"] - proj["x"]) < 0.5 and abs(player["y"] - proj["y"]) < 0.5:
-                base_damage = proj.get("damage", 3)
-                damage = calculate_armor_damage_reduction(base_damage)
-                player["health"] -= damage
-                play_damage_sound()
-                entities_to_remove.append(proj)
-                if player["health"] <= 0:
-                    show_death_screen()
-            elif proj["x"] < -100 or proj["x"] > 100 or proj["y"] > 100:
-                entities_to_remove.append(proj)
-        
-        # Rock projectile update and collision
-        elif proj["type"] == "rock_projectile":
-            # Update position
-            proj["x"] += proj["dx"]
-            proj["y"] += proj["dy"]
-            
-            # Check collision with player
-            if abs(player["x"] - proj["x"]) < 0.5 and abs(player["y"] - proj["y"]) < 0.5:
-                base_damage = proj.get("damage", 2)
-                damage = calculate_armor_damage_reduction(base_damage)
-                player["health"] -= damage
-                play_damage_sound()
-                entities_to_remove.append(proj)
-                print(f"💥 Rock projectile hit player! Damage: {damage}")
-                if player["health"] <= 0:
-                    show_death_screen()
-            
-            # Check lifetime and boundaries
-            proj["lifetime"] = proj.get("lifetime", 180) - 1
-            if (proj["lifetime"] <= 0 or 
-                proj["x"] < -100 or proj["x"] > 100 or 
-                proj["y"] > 100):
-                entities_to_remove.append(proj)
-        
-        # Boss projectile update and collision
-        elif proj["type"] == "boss_projectile":
-            # Update position
-            proj["x"] += proj["dx"]
-            proj["y"] += proj["dy"]
-            
-            # Check collision with player
-            if abs(player["x"] - proj["x"]) < 0.8 and abs(player["y"] - proj["y"]) < 0.8:
-                base_damage = proj.get("damage", 5)
-                damage = calculate_armor_damage_reduction(base_damage)
-                player["health"] -= damage
-                play_damage_sound()
-                entities_to_remove.append(proj)
-                print(f"🔥 Boss projectile hit player! Damage: {damage}")
-                if player["health"] <= 0:
-                    show_death_screen()
-            
-            # Check lifetime and boundaries
-            proj["lifetime"] = proj.get("lifetime", 180) - 1
-            if (proj["lifetime"] <= 0 or 
-                proj["x"] < -100 or proj["x"] > 100 or 
-                proj["y"] > 100):
-                entities_to_remove.append(proj)
-    
-    # Remove entities after iteration
-    for entity in entities_to_remove:
-        if entity in entities:
-            entities.remove(entity)
-
 
 
 # --- Villager update logic ---
@@ -14420,6 +13857,9 @@ def generate_initial_world(world_seed=None):
     # Set random seed for this world generation
     world_rng = random.Random(world_seed)
     print(f"🌍 Using world seed: {world_seed}")
+    global biome_map
+    if BiomeMap:
+        biome_map = BiomeMap(world_seed, chunk_width=config.world_chunk_size)
     
     # Generate a clean starting area for the player
     start_x = world_rng.randint(-100, 100)  # Random starting X position
@@ -14476,9 +13916,6 @@ def generate_initial_world(world_seed=None):
         if get_block(x, bedrock_y) is None:
             set_block(x, bedrock_y, "bedrock")
         
-        # TEMPORARILY DISABLE VALIDATION TO SEE IF GRASS GENERATES
-        # validate_column_integrity(x, ground_y)
-        
         # Ensure NO blocks generate below bedrock
         for y in range(bedrock_y + 1, 100):
             if get_block(x, y) is not None:
@@ -14499,8 +13936,8 @@ def generate_initial_world(world_seed=None):
         
         # BIOME-BASED TREE GENERATION: Forests have lots of trees, fields have few
         if biome_type == "desert":
-            # Deserts have very few trees
-            if random.random() < 0.02 and should_generate_tree(x, ground_y, biome_type):
+            # Deserts have very few trees (their tree density is tiny)
+            if should_generate_tree(x, ground_y, biome_type):
                 # Same tree generation as other biomes
                 if get_block(x, ground_y - 1) is None and (ground_y - 1) < ground_y:
                     set_block(x, ground_y - 1, "log")
@@ -14617,217 +14054,8 @@ def generate_initial_world(world_seed=None):
     print(f"Stone starts at Y=13 (3 blocks below surface)")
     print(f"Bedrock at Y: 22")
     
-    # ENABLE STRICT VALIDATION TO ENFORCE SURFACE-ONLY RULE
-    validate_and_fix_terrain()
-    print("🔍 STRICT VALIDATION ENABLED: Enforcing surface-only rule!")
-    
     return world_seed
 
-def validate_and_fix_terrain():
-    """ABSOLUTE VALIDATION: Grass and dirt NEVER underground, trees NEVER underground - NO EXCEPTIONS!"""
-    global world_data
-    
-    print("🔍 STRICT VALIDATION: Enforcing surface-only rule...")
-    print(f"🌱 Checking for grass blocks...")
-    fixes_applied = 0
-    
-    # Get all X coordinates that have terrain
-    terrain_columns = set()
-    grass_count = 0
-    for (x, y), block in world_data.items():
-        if block in ["grass", "dirt", "stone", "bedrock"]:
-            terrain_columns.add(x)
-        if block == "grass":
-            grass_count += 1
-    
-    print(f"🌱 Found {grass_count} grass blocks in world")
-    print(f"🏗️ Found {len(terrain_columns)} terrain columns")
-    
-    for x in sorted(terrain_columns):
-        # Find the surface grass block for this column
-        surface_y = None
-        for y in range(100):
-            if get_block(x, y) == "grass":
-                surface_y = y
-                break
-        
-        if surface_y is None:
-            # No grass found - this is a critical error
-            print(f"❌ CRITICAL: Column {x} has no grass surface - fixing...")
-            # Find the highest terrain block and place grass above it
-            highest_y = -1
-            for y in range(100):
-                if get_block(x, y) in ["dirt", "stone", "bedrock"]:
-                    highest_y = max(highest_y, y)
-            
-            if highest_y >= 0:
-                set_block(x, highest_y + 1, "grass")
-                surface_y = highest_y + 1
-                fixes_applied += 1
-                print(f"✅ Fixed: Added grass at Y={surface_y} for column {x}")
-            else:
-                # No terrain at all - place at default height
-                set_block(x, 10, "grass")
-                surface_y = 10
-                fixes_applied += 1
-                print(f"✅ Fixed: Added grass at Y=10 for column {x}")
-        
-        # STEP 1: Remove ALL underground grass (guaranteed)
-        for y in range(surface_y + 1, 100):
-            if get_block(x, y) == "grass":
-                world_data.pop((x, y), None)
-                fixes_applied += 1
-                print(f"✅ Fixed: Removed underground grass at ({x}, {y})")
-        
-        # STEP 2: ABSOLUTE RULE - Dirt can NEVER be underground - NO EXCEPTIONS!
-        # Remove ALL dirt that's deeper than 2 blocks below surface
-        for y in range(surface_y + 3, 400):  # Check deep underground for misplaced dirt
-            if get_block(x, y) == "dirt":
-                # This dirt is underground - replace with stone immediately
-                world_data.pop((x, y), None)
-                set_block(x, y, "stone")
-                fixes_applied += 1
-                print(f"🚫 ABSOLUTE FIX: Removed underground dirt at ({x}, {y}) - replaced with stone - NEVER ALLOWED!")
-        
-        # Ensure dirt layer is complete (ONLY 2 blocks deep)
-        for y in range(surface_y + 1, surface_y + 3):  # FIXED: Only 2 blocks deep
-            if get_block(x, y) != "dirt":
-                if get_block(x, y) is None:
-                    set_block(x, y, "dirt")
-                    fixes_applied += 1
-                    print(f"✅ Fixed: Added missing dirt at ({x}, {y})")
-                elif get_block(x, y) != "dirt":
-                    # Replace non-dirt blocks with dirt
-                    world_data.pop((x, y), None)
-                    set_block(x, y, "dirt")
-                    fixes_applied += 1
-                    print(f"✅ Fixed: Replaced {get_block(x, y)} with dirt at ({x}, {y})")
-        
-        # STEP 3: Ensure stone layer is complete (8 blocks deep, NO HOLES)
-        for y in range(surface_y + 4, surface_y + 12):
-            if get_block(x, y) is None:
-                # Fill hole with stone
-                set_block(x, y, "stone")
-                fixes_applied += 1
-                print(f"✅ Fixed: Filled stone layer hole at ({x}, {y})")
-            elif get_block(x, y) not in ["stone", "coal", "iron", "gold", "diamond"]:
-                # Replace non-stone blocks with stone
-                old_block = get_block(x, y)
-                world_data.pop((x, y), None)
-                set_block(x, y, "stone")
-                fixes_applied += 1
-                print(f"✅ Fixed: Replaced {old_block} with stone at ({x}, {y})")
-        
-        # STEP 4: ABSOLUTE RULE - Trees (logs/leaves) can NEVER be underground - NO EXCEPTIONS!
-        # Remove any logs or leaves that are at or below surface level
-        for y in range(surface_y, 400):  # Check deep underground for misplaced tree parts
-            if get_block(x, y) in ["log", "leaves"]:
-                # This tree part is underground - remove it immediately
-                old_block = get_block(x, y)
-                world_data.pop((x, y), None)
-                fixes_applied += 1
-                print(f"🚫 ABSOLUTE FIX: Removed underground tree part at ({x}, {y}) - {old_block} - NEVER ALLOWED!")
-        
-        # STEP 5: Ensure bedrock at the bottom of the 200-block stone layer
-        bedrock_y = surface_y + 200  # 200 blocks below surface
-        if get_block(x, bedrock_y) != "bedrock":
-            if get_block(x, bedrock_y) is None:
-                set_block(x, bedrock_y, "bedrock")
-                fixes_applied += 1
-                print(f"✅ Fixed: Added missing bedrock at ({x}, {bedrock_y})")
-            else:
-                # Replace non-bedrock with bedrock
-                old_block = get_block(x, bedrock_y)
-                world_data.pop((x, bedrock_y), None)
-                set_block(x, bedrock_y, "bedrock")
-                fixes_applied += 1
-                print(f"✅ Fixed: Replaced {old_block} with bedrock at ({x}, {bedrock_y})")
-        
-        # STEP 6: Remove any blocks below bedrock
-        for y in range(bedrock_y + 1, bedrock_y + 100):  # Check a reasonable range below bedrock
-            if get_block(x, y) is not None:
-                world_data.pop((x, y), None)
-                fixes_applied += 1
-                print(f"✅ Fixed: Removed block below bedrock at ({x}, {y})")
-    
-    # FINAL VERIFICATION: Double-check no grass exists underground
-    underground_grass_found = 0
-    # Create a copy of items to avoid RuntimeError when modifying dictionary
-    grass_positions = [(x, y) for (x, y), block in world_data.items() if block == "grass"]
-    
-    for x, y in grass_positions:
-        # Check if this grass has any blocks above it (only remove if truly underground)
-        has_blocks_above = False
-        for check_y in range(y + 1, 100):
-            if get_block(x, check_y) is not None:
-                has_blocks_above = True
-                break
-        
-        if has_blocks_above:
-            # This grass is underground - CRITICAL ERROR
-            world_data.pop((x, y), None)
-            underground_grass_found += 1
-            print(f"🚨 CRITICAL: Found and removed underground grass at ({x}, {y})")
-        else:
-            # This grass is on the surface - KEEP IT
-            print(f"✅ Surface grass verified at ({x}, {y})")
-    
-    if fixes_applied > 0:
-        print(f"🔧 Applied {fixes_applied} terrain fixes")
-    
-    if underground_grass_found > 0:
-        print(f"🚨 Removed {underground_grass_found} underground grass blocks")
-    
-    print("✅ ABSOLUTE VALIDATION COMPLETE: Rules ENFORCED - NO EXCEPTIONS!")
-    print("🚫 ENFORCED: Grass NEVER underground - NO EXCEPTIONS!")
-    print("🚫 ENFORCED: Dirt NEVER underground - NO EXCEPTIONS!")
-    print("🚫 ENFORCED: Trees NEVER underground - NO EXCEPTIONS!")
-
-def validate_column_integrity(x, ground_y):
-    """Validate and fix a single column during generation"""
-    global world_data
-    
-    # Ensure grass is ONLY at the surface (but don't remove surface grass)
-    for y in range(ground_y + 1, 100):
-        if get_block(x, y) == "grass":
-            # Only remove grass that's truly underground (has blocks above it)
-            has_blocks_above = False
-            for check_y in range(y + 1, 100):
-                if get_block(x, check_y) is not None:
-                    has_blocks_above = True
-                    break
-            
-            if has_blocks_above:
-                world_data.pop((x, y), None)
-                print(f"🚨 CRITICAL: Removed underground grass during generation at ({x}, {y})")
-            # If no blocks above, this grass is fine (surface grass)
-    
-    # Ensure dirt layer is complete (3 blocks deep)
-    for y in range(ground_y + 1, ground_y + 4):
-        if get_block(x, y) != "dirt":
-            if get_block(x, y) is None:
-                set_block(x, y, "dirt")
-            elif get_block(x, y) != "dirt":
-                world_data.pop((x, y), None)
-                set_block(x, y, "dirt")
-    
-    # Ensure stone layer is complete (8 blocks deep, NO HOLES)
-    for y in range(ground_y + 4, ground_y + 12):
-        if get_block(x, y) is None:
-            set_block(x, y, "stone")
-        elif get_block(x, y) not in ["stone", "coal", "iron", "gold", "diamond"]:
-            world_data.pop((x, y), None)
-            set_block(x, y, "stone")
-    
-    # Ensure bedrock at Y=22
-    bedrock_y = 22
-    if get_block(x, bedrock_y) != "bedrock":
-        if get_block(x, bedrock_y) is None:
-            set_block(x, bedrock_y, "bedrock")
-        else:
-            world_data.pop((x, bedrock_y), None)
-            set_block(x, bedrock_y, "bedrock")
-
 # --- Virtual Keyboard and Username Creation ---
 def create_virtual_keyboard():
     """Create a virtual keyboard layout for username input"""
@@ -15245,6 +14473,8 @@ def draw_studio_loading_screen():
     global loading_progress, loading_stage, studio_logo, loading_start_time
     
     # Load studio logo if not already loaded
+    if studio_logo is None and asset_loader:
+        studio_logo = asset_loader.assets.get("studio_logo")
     if studio_logo is None:
         try:
             logo_path = os.path.join(assets_root, "studio logo", "Banana labs logo copy.png")
@@ -15305,7 +14535,7 @@ def draw_studio_loading_screen():
     screen.blit(progress_text, progress_rect)
 
 def update_loading_progress():
-    """Update the loading progress and handle stage transitions"""
+    """Drive the progress bar from the asset loader and move on once everything has loaded"""
     global loading_progress, loading_stage, game_state, loading_start_time
     
     current_time = pygame.time.get_ticks()
@@ -15314,33 +14544,26 @@ def update_loading_progress():
     if loading_start_time == 0:
         loading_start_time = current_time
     
-    # Calculate progress based on time elapsed
     elapsed_time = current_time - loading_start_time
     
-    # Each stage takes 2 seconds (2000ms)
-    stage_duration = 2000
-    total_duration = len(loading_stages) * stage_duration
-    
-    # Calculate overall progress
-    overall_progress = min(100, (elapsed_time / total_duration) * 100)
-    
-    # Calculate current stage
-    current_stage = min(len(loading_stages) - 1, int(elapsed_time / stage_duration))
+    if asset_loader:
+        loading_progress = asset_loader.progress() * 100
+        loading_kind = asset_loader.next_kind()
+        current_stage = 2 if loading_kind is None else 1 if loading_kind == "sound" else 0
+        loaded = asset_loader.done
+    else:
+        # Everything was loaded at startup - just show the logo
+        loading_progress = min(100, (elapsed_time / STUDIO_SCREEN_MIN_MS) * 100)
+        current_stage = len(loading_stages) - 1
+        loaded = True
     
     # Update stage if changed
     if current_stage != loading_stage:
         loading_stage = current_stage
         print(f"🔄 Loading stage: {loading_stages[loading_stage]}")
     
-    # Calculate progress within current stage
-    stage_elapsed = elapsed_time % stage_duration
-    stage_progress = min(100, (stage_elapsed / stage_duration) * 100)
-    
-    # Update loading progress
-    loading_progress = overall_progress
-    
-    # Check if loading is complete
-    if elapsed_time >= total_duration:
+    # Check if loading is complete (the logo stays up a moment even when loading is instant)
+    if loaded and elapsed_time >= STUDIO_SCREEN_MIN_MS:
         print("✅ Loading complete! Moving to title screen")
         game_state = GameState.TITLE
 
@@ -15879,13 +15102,14 @@ def save_game():
                     "total_monsters_killed": total_monsters_killed
                 },
                 "villages": villages,
+                "structures": structure_registry.to_list() if structure_registry else [],
                 "chest_data": {
                     "chest_inventories": {f"{k[0]},{k[1]}": v for k, v in chest_system.chest_inventories.items()} if chest_system else {},
                     "player_placed_chests": [f"{k[0]},{k[1]}" for k in chest_system.player_placed_chests] if chest_system else []
                 }
             }
             
-            # Update world system with current data
+            # Update world system with current data (save_world adds the chunk checksums)
             world_system.current_world_data = save_data
             
             # Save using world system
@@ -15936,6 +15160,8 @@ def save_game_fallback():
             "monster_data": {
                 "total_monsters_killed": total_monsters_killed
             },
+            "structures": structure_registry.to_list() if structure_registry else [],
+            "chunk_checksums": chunk_checksums(world_data) if chunk_checksums else {},
             "chest_data": {
                 "chest_inventories": {f"{k[0]},{k[1]}": v for k, v in chest_system.chest_inventories.items()} if chest_system else {},
                 "player_placed_chests": [f"{k[0]},{k[1]}" for k in chest_system.player_placed_chests] if chest_system else []
@@ -16070,7 +15296,7 @@ def update_player_animation():
 
 def load_game():
     """Load game using improved world generation system"""
-    global world_data, entities, player, is_day, day_start_time
+    global world_data, entities, player, is_day, day_start_time, biome_map
     
     try:
         # Use the new world generation module
@@ -16089,6 +15315,11 @@ def load_game():
         
         # Generate world using the new system with random seed
         world_info = generate_world(seed=world_seed, world_width=200)
+        if BiomeMap:
+            biome_map = BiomeMap(world_seed, chunk_width=config.world_chunk_size)
+        if structure_registry:
+            structure_registry.clear()
+            register_world_landmarks()
         
         # Extract world data
         world_data = world_info["blocks"]
@@ -16205,6 +15436,7 @@ loading_stage = 0  # 0 = assets, 1 = sounds, 2 = logic
 loading_stages = ["Loading Assets...", "Loading Sounds...", "Loading Logic..."]
 studio_logo = None
 loading_start_time = 0
+STUDIO_SCREEN_MIN_MS = 1500  # Shortest time the studio logo is shown
 # World creation variables removed - game goes directly to play
 world_deletion_state = None  # None or world name to delete
 
@@ -16254,6 +15486,15 @@ while running:
     
     frame_count += 1
     
+    # Finish loading assets - a slice per frame behind the studio screen, everything at once if a later screen needs it
+    if asset_loader and not asset_loader.done:
+        if game_state == GameState.STUDIO_LOADING:
+            asset_loader.pump(ASSET_SLICE_MS)
+        else:
+            asset_loader.finish()
+        if asset_loader.done and sprite_sheets:
+            sprite_sheets.flush()  # Record sheets built on the loader's threads
+    
     # Initialize clouds on first frame
     if frame_count == 1:
         generate_clouds()
@@ -17332,7 +16573,7 @@ while running:
                                 print(f"🌍 Generating fresh world for multiplayer...")
                                 
                                 # Create and start LAN server (will be started after world gen)
-                                lan_server = LANServer(host_username, world_name)
+                                lan_server = LANServer(host_username, world_name, MULTIPLAYER_MAX_PLAYERS)
                                 multiplayer_ui.set_lan_server(lan_server)
                                 
                                 # Store the world name for after generation
@@ -17380,18 +16621,25 @@ while running:
                                     # Set up multiplayer callbacks ONCE after connecting
                                     setup_multiplayer_callbacks()
                                     
-                                    # Wait a moment for world data
-                                    import time
+                                    # Wait for the chunks around spawn; the rest streams in while playing
                                     print("⏳ Waiting for world data from server...")
-                                    time.sleep(1.0)  # Give more time for server response
+                                    world_data.clear()
+                                    
+                                    def show_join_progress(received, total):
+                                        global world_generation_progress, world_generation_total, world_generation_status
+                                        world_generation_progress = received
+                                        world_generation_total = max(total, 1)
+                                        world_generation_status = "Downloading world from server..."
+                                        pygame.event.pump()
+                                        draw_world_generation_screen()
+                                        pygame.display.flip()
                                     
                                     # Load world data from server
-                                    if lan_client.world_data:
-                                        print(f"📦 Received world data: {len(lan_client.world_data.get('blocks', {}))} blocks")
+                                    if lan_client.wait_for_spawn_area(timeout=15.0, on_progress=show_join_progress):
+                                        print(f"📦 Received spawn area ({lan_client.stream_received}/{lan_client.stream_total} chunks)")
                                         
                                         # Clear and update game with server's world
-                                        world_data.clear()
-                                        world_data.update(lan_client.world_data.get("blocks", {}))
+                                        apply_streamed_world_chunks(max_chunks=None)
                                         
                                         # Update player data
                                         server_player = lan_client.world_data.get("player", {})
@@ -17512,13 +16760,11 @@ while running:
         # Infinite world generation: calculate terrain generation bounds
         left_edge = int((camera_x) // TILE_SIZE) - 8  # Increased buffer for smoother exploration
         right_edge = int((camera_x + SCREEN_WIDTH) // TILE_SIZE) + 8  # Increased buffer
-        # Village check per 50‑column chunk
-        chunk_left = left_edge // 50
-        chunk_right = right_edge // 50
-        for ch in range(chunk_left, chunk_right + 1):
-            base_x = ch * 50
-            # Generate fortresses for chunk - red brick fortresses
-            maybe_generate_fortress_for_chunk(ch, base_x)
+        # Chunks around the player are planned in the background; install what's ready within the frame budget
+        if chunk_pregenerator:
+            chunk_pregenerator.request_around(player["x"], chunk_terrain_complete)
+            chunk_pregenerator.install(install_terrain_column, roll_chunk_fortress)
+        # Anything on screen the background hasn't reached yet (teleports, first frames) is generated right away
         for x in range(left_edge, right_edge):
             # CRITICAL FIX: Only generate terrain for columns that have NEVER been generated
             # This prevents broken blocks from being replaced by terrain regeneration
@@ -17569,6 +16815,11 @@ while running:
                                 "cooldown": 0
                             })
                             print(f"👹 Night {monster_type} spawned at ({x}, {spawn_surface_y}) - Total monsters: {total_monsters + 1}/8")
+        
+        # Fortresses: one roll per chunk in view, once its terrain is in (pre-generated chunks roll on install)
+        for ch in range(left_edge // config.world_chunk_size, right_edge // config.world_chunk_size + 1):
+            if ch not in fortress_checked_chunks and chunk_terrain_complete(ch):
+                roll_chunk_fortress(ch)
                 
         # NPC spawning systems removed - no more random NPCs
 
@@ -17591,11 +16842,9 @@ while running:
         update_final_boss()  # Update final boss AI
         update_boss()  # EXTREME ENGINEERING: Legendary boss AI and attacks
         update_hunger()  # Update hunger system
-        update_thrown_sword()  # Update sword throwing system
-        update_thrown_sword_entities()  # Update thrown sword entities
+        update_projectiles()  # Update rocks, fireballs, boss shots and thrown swords
         update_blood_particles()  # Update blood particle effects
         update_block_particles()  # Update block breaking particle effects
-        update_fireball_projectiles()  # Update fireball projectiles
         update_dropped_items()  # Update dropped item physics
         # update_light_sources()  # DISABLED - lighting system disabled
         
@@ -17608,8 +16857,9 @@ while running:
             if not (keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]):
                 shift_key_pressed = False
         
-        # Check for underground fortress trigger
+        # Check for underground fortress trigger and structures the player just walked into
         check_underground_fortress_trigger()
+        check_structure_discovery()
         
         # Update chat system
         if chat_system:
@@ -17621,10 +16871,6 @@ while running:
         # Clean up distant entities every 30 seconds to prevent lag
         if frame_count % 1800 == 0:  # Every 30 seconds at 60 FPS
             cleanup_distant_entities()
-        
-        # Validate world integrity every 10 minutes (600 frames at 60 FPS)
-        if frame_count % 36000 == 0:  # Every 10 minutes
-            validate_world_integrity()
 
         draw_world()
         # draw_darkness_overlay()  # DISABLED - caused glitches
@@ -45,56 +45,52 @@ class CharacterManager:
             self.character_textures["default"] = fallback
             print("⚠️ Created fallback default character texture")
         
-        # Load other character textures (you'll create these)
-        for char in self.available_characters:
-            if char["name"] != "default":
-                try:
-                    texture_path = os.path.join(self.player_dir, f"{char['name']}.png")
-                    if os.path.exists(texture_path):
-                        self.character_textures[char["name"]] = pygame.transform.scale(
-                            pygame.image.load(texture_path).convert_alpha(), 
-                            (self.tile_size, self.tile_size)
-                        )
-                        print(f"✅ Loaded character texture: {char['name']}")
-                    else:
-                        # Create placeholder texture if file doesn't exist
-                        placeholder = pygame.Surface((self.tile_size, self.tile_size))
-                        placeholder.fill((100, 100, 100))
-                        # Draw placeholder text
-                        font_small = pygame.font.SysFont("Arial", 16)
-                        placeholder_text = font_small.render(char['name'][:3].upper(), True, (255, 255, 255))
-                        text_x = (self.tile_size - placeholder_text.get_width()) // 2
-                        text_y = (self.tile_size - placeholder_text.get_height()) // 2
-                        placeholder.blit(placeholder_text, (text_x, text_y))
-                        self.character_textures[char["name"]] = placeholder
-                        print(f"⏳ Waiting for {char['name']} texture (you'll create this)")
-                except Exception as e:
-                    print(f"❌ Error loading texture for {char['name']}: {e}")
-                    # Create error texture
-                    error_texture = pygame.Surface((self.tile_size, self.tile_size))
-                    error_texture.fill((255, 0, 0))
-                    # Draw error symbol
-                    font_small = pygame.font.SysFont("Arial", 16)
-                    error_text = font_small.render("!", True, (255, 255, 255))
-                    text_x = (self.tile_size - error_text.get_width()) // 2
-                    text_y = (self.tile_size - error_text.get_height()) // 2
-                    error_texture.blit(error_text, (text_x, text_y))
-                    self.character_textures[char["name"]] = error_texture
-        
+        # Other characters are loaded the first time they're shown (see get_character_texture)
         print(f"🎭 Character textures loaded: {list(self.character_textures.keys())}")
     
+    def load_character_texture(self, character_name):
+        """Load one character's texture, or a labelled placeholder until its PNG exists"""
+        try:
+            texture_path = os.path.join(self.player_dir, f"{character_name}.png")
+            if os.path.exists(texture_path):
+                texture = pygame.transform.scale(
+                    pygame.image.load(texture_path).convert_alpha(), 
+                    (self.tile_size, self.tile_size)
+                )
+                print(f"✅ Loaded character texture: {character_name}")
+            else:
+                # Create placeholder texture if file doesn't exist
+                texture = pygame.Surface((self.tile_size, self.tile_size))
+                texture.fill((100, 100, 100))
+                # Draw placeholder text
+                font_small = pygame.font.SysFont("Arial", 16)
+                placeholder_text = font_small.render(character_name[:3].upper(), True, (255, 255, 255))
+                text_x = (self.tile_size - placeholder_text.get_width()) // 2
+                text_y = (self.tile_size - placeholder_text.get_height()) // 2
+                texture.blit(placeholder_text, (text_x, text_y))
+                print(f"⏳ Waiting for {character_name} texture (you'll create this)")
+        except Exception as e:
+            print(f"❌ Error loading texture for {character_name}: {e}")
+            # Create error texture
+            texture = pygame.Surface((self.tile_size, self.tile_size))
+            texture.fill((255, 0, 0))
+            # Draw error symbol
+            font_small = pygame.font.SysFont("Arial", 16)
+            error_text = font_small.render("!", True, (255, 255, 255))
+            text_x = (self.tile_size - error_text.get_width()) // 2
+            text_y = (self.tile_size - error_text.get_height()) // 2
+            texture.blit(error_text, (text_x, text_y))
+        self.character_textures[character_name] = texture
+        return texture
+    
     def select_character(self, character_name):
         """Select a character to use"""
         if character_name != self.selected_character:
             self.selected_character = character_name
             print(f"🎭 Character changed to: {character_name}")
             
-            # Debug: Check if texture exists
-            if character_name in self.character_textures:
-                print(f"✅ Texture found for {character_name}")
-            else:
-                print(f"❌ No texture found for {character_name}")
-                print(f"Available textures: {list(self.character_textures.keys())}")
+            # Load its texture now rather than on the first frame drawn with it
+            self.get_character_texture(character_name)
             
             return True
         return False
@@ -120,6 +116,8 @@ class CharacterManager:
         
         if character_name in self.character_textures:
             return self.character_textures[character_name]
+        elif self.get_character_info(character_name):
+            return self.load_character_texture(character_name)
         else:
             # Fallback to default
             return self.character_textures.get("default", None)
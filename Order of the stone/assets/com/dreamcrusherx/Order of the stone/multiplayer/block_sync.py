@@ -0,0 +1,114 @@
+"""
+Block change batching for Order of the Stone LAN multiplayer
+Collects block changes over one network tick and sends them per chunk, as a
+small delta or - when a chunk changed a lot - as the whole chunk again
+"""
+
+import threading
+import zlib
+from typing import Dict, List, Optional, Set, Tuple
+
+from .world_stream import (ChunkIndex, pack_blocks, unpack_blocks, decode_chunk_blocks,
+                           DEFAULT_CHUNK_SIZE)
+
+NETWORK_TICK_RATE = 20      # Block batches sent per second
+FULL_CHUNK_THRESHOLD = 64   # Changes in one chunk per tick before the whole chunk is resent
+COMPRESS_OVER = 128         # Delta payloads bigger than this (bytes) are zlib-compressed
+
+MODE_DELTA = 0       # Raw palette-packed changes (None = block removed)
+MODE_DELTA_ZLIB = 1  # Same, compressed
+MODE_FULL = 2        # Whole chunk; replaces every block between y_min and y_max
+
+
+def encode_delta(changes: Dict[Tuple[int, int], Optional[str]], origin_x: int) -> Tuple[int, bytes]:
+    """Pack one chunk's changes, compressing only when it pays off"""
+    raw = pack_blocks(changes, origin_x)
+    if len(raw) > COMPRESS_OVER:
+        return MODE_DELTA_ZLIB, zlib.compress(raw, 6)
+    return MODE_DELTA, raw
+
+
+def decode_batch_chunk(chunk: List, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Turn one ``block_batch`` entry into ``(cx, {"x,y": block or None}, replace_span)``.
+
+    ``replace_span`` is ``(y_min, y_max)`` for full-chunk resends - every block
+    of the chunk in that range not listed must be removed - and None for deltas
+    (whose y_min/y_max only record the rows they touch).
+    """
+    cx, mode, data, y_min, y_max = chunk
+    origin_x = cx * chunk_size
+    if mode == MODE_FULL:
+        return cx, decode_chunk_blocks(data, origin_x), (y_min, y_max)
+    if mode == MODE_DELTA_ZLIB:
+        data = zlib.decompress(data)
+    return cx, unpack_blocks(data, origin_x), None
+
+
+def full_chunk_entry(chunk_index: ChunkIndex, cx: int, ys: List[int] = ()) -> Dict:
+    """Entry resending a whole chunk; the span also covers ``ys`` so removed blocks clear"""
+    ys = list(ys)
+    span = chunk_index.y_range(cx)
+    if span:
+        ys.extend(span)
+    if not ys:
+        ys = [0]
+    return {"cx": cx, "editors": set(), "mode": MODE_FULL, "data": chunk_index.encode(cx),
+            "y_min": min(ys), "y_max": max(ys)}
+
+
+def build_batch_message(entries: List[Dict], exclude_editor: str = None) -> Optional[Dict]:
+    """One ``block_batch`` message for a recipient.
+
+    Chunks changed only by ``exclude_editor`` are left out - that player
+    already has those changes.
+    """
+    chunks = [[e["cx"], e["mode"], e["data"], e["y_min"], e["y_max"]] for e in entries
+              if not (exclude_editor and e["editors"] == {exclude_editor})]
+    if not chunks:
+        return None
+    return {"type": "block_batch", "chunks": chunks}
+
+
+class BlockChangeBatcher:
+    """Block changes waiting for the next network tick, grouped by chunk"""
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, full_chunk_threshold: int = FULL_CHUNK_THRESHOLD):
+        self.chunk_size = chunk_size
+        self.full_chunk_threshold = full_chunk_threshold
+        self.changes: Dict[int, Dict[Tuple[int, int], Optional[str]]] = {}
+        self.editors: Dict[int, Set[str]] = {}
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return sum(len(blocks) for blocks in self.changes.values())
+
+    def add(self, x: int, y: int, block_type: Optional[str], username: str = None):
+        """Queue a change; a later change to the same block replaces it"""
+        cx = x // self.chunk_size
+        with self.lock:
+            self.changes.setdefault(cx, {})[(x, y)] = block_type
+            if username:
+                self.editors.setdefault(cx, set()).add(username)
+
+    def flush(self, chunk_index: ChunkIndex = None) -> List[Dict]:
+        """Take the queued changes as one entry per chunk.
+
+        With a ``chunk_index`` (the server's up-to-date world), chunks with at
+        least ``full_chunk_threshold`` changes are sent whole instead.
+        """
+        with self.lock:
+            changes, editors = self.changes, self.editors
+            self.changes, self.editors = {}, {}
+
+        entries = []
+        for cx, blocks in changes.items():
+            ys = [y for _, y in blocks]
+            if chunk_index is not None and len(blocks) >= self.full_chunk_threshold:
+                entry = full_chunk_entry(chunk_index, cx, ys)
+            else:
+                mode, data = encode_delta(blocks, cx * self.chunk_size)
+                entry = {"cx": cx, "mode": mode, "data": data, "y_min": min(ys), "y_max": max(ys)}
+            entry["editors"] = editors.get(cx, set())
+            entries.append(entry)
+        return entries
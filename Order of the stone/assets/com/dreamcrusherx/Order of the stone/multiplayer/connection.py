@@ -0,0 +1,129 @@
+"""
+Client connections for the Order of the Stone LAN server
+Non-blocking socket with a bounded send queue, so one slow player can't stall the rest
+"""
+
+import socket
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from .protocol import FrameDecoder
+from .net_stats import NetStats
+
+SEND_QUEUE_HIGH_WATER = 256 * 1024    # Above this: drop droppable updates, pause world streaming
+SEND_QUEUE_LIMIT = 4 * 1024 * 1024    # A client this far behind is disconnected
+SLOW_CLIENT_TIMEOUT = 10.0            # Seconds above the high-water mark before disconnecting
+
+
+class ClientConnection:
+    """One connected client: read buffer, send queue and back-pressure state.
+
+    Any thread may ``enqueue`` frames; only the server's event loop calls
+    ``flush``/``recv`` so frames never interleave on the wire.
+    """
+
+    def __init__(self, sock: socket.socket, address: tuple):
+        sock.setblocking(False)
+        self.sock = sock
+        self.address = address
+        self.username: Optional[str] = None
+        self.decoder = FrameDecoder()
+        self.queue = deque()
+        self.queued_bytes = 0
+        self.backed_up_since: Optional[float] = None
+        self.dropped = 0  # Droppable frames skipped under back-pressure
+        self.close_reason: Optional[str] = None  # Set when the connection should be closed
+        self.lock = threading.Lock()
+        self.stats = NetStats()  # Messages/bytes by type, RTT, malformed frames
+        
+        # Optional UDP state channel (see udp_channel.py)
+        self.udp_token: Optional[int] = None
+        self.udp_address: Optional[tuple] = None  # Known once the client's hello arrives
+        self.udp_sequence = 0
+
+    @property
+    def backed_up(self) -> bool:
+        """True while the client isn't keeping up with what we send"""
+        return self.queued_bytes > SEND_QUEUE_HIGH_WATER
+
+    def enqueue(self, frame: bytes, droppable: bool = False, msg_type: str = None) -> bool:
+        """Queue a frame to send; returns False if the client was marked for disconnect.
+
+        ``droppable`` frames (e.g. position updates, which the next one
+        replaces) are skipped while the client is backed up. ``msg_type``
+        is only used for the traffic counters.
+        """
+        with self.lock:
+            if self.close_reason:
+                return False
+            if droppable and self.queued_bytes > SEND_QUEUE_HIGH_WATER:
+                self.dropped += 1
+                self.stats.record_dropped()
+                return True
+            if self.queued_bytes + len(frame) > SEND_QUEUE_LIMIT:
+                self.close_reason = "send queue full"
+                return False
+            self.queue.append(memoryview(frame))
+            self.queued_bytes += len(frame)
+            self.stats.record_out(msg_type, len(frame))
+            if self.queued_bytes > SEND_QUEUE_HIGH_WATER and self.backed_up_since is None:
+                self.backed_up_since = time.monotonic()
+            return True
+
+    def flush(self) -> bool:
+        """Write as much of the queue as the socket takes without blocking.
+
+        Returns True when the queue is empty afterwards.
+        """
+        with self.lock:
+            while self.queue:
+                frame = self.queue[0]
+                try:
+                    sent = self.sock.send(frame)
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError as e:
+                    self.close_reason = f"send failed: {e}"
+                    self.queue.clear()
+                    self.queued_bytes = 0
+                    break
+                self.queued_bytes -= sent
+                if sent == len(frame):
+                    self.queue.popleft()
+                else:
+                    self.queue[0] = frame[sent:]
+                    break
+            if self.queued_bytes <= SEND_QUEUE_HIGH_WATER:
+                self.backed_up_since = None
+            return not self.queue
+
+    def next_udp_sequence(self) -> int:
+        with self.lock:
+            self.udp_sequence = (self.udp_sequence + 1) & 0xFFFFFFFF
+            return self.udp_sequence
+    
+    def check_slow(self, now: float = None) -> bool:
+        """Mark the client for disconnect if it has been backed up too long"""
+        with self.lock:
+            if self.backed_up_since is not None and self.close_reason is None:
+                now = time.monotonic() if now is None else now
+                if now - self.backed_up_since > SLOW_CLIENT_TIMEOUT:
+                    self.close_reason = "too slow to keep up"
+            return self.close_reason is not None
+
+    def recv(self) -> Optional[bytes]:
+        """Read what's available; b"" means the client hung up, None means nothing yet"""
+        try:
+            return self.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return None
+        except OSError:
+            return b""
+
+    def close(self):
+        try:
+            self.sock.close()
+        except OSError:
+            pass
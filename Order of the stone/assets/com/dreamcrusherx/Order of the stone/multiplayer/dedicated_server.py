@@ -0,0 +1,185 @@
+"""
+Dedicated (headless) server for Order of the Stone
+Loads a saved world, simulates it and hosts LAN players - no display or pygame needed
+
+Run from the game folder:
+    python -m multiplayer.dedicated_server --world "My World"
+"""
+
+import argparse
+import os
+import signal
+import sys
+import threading
+import time
+from collections import deque
+from typing import List, Optional, Tuple
+
+# Allow running as a script as well as with -m
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from multiplayer.lan_server import LANServer, DEFAULT_MAX_PLAYERS
+from multiplayer.world_stream import parse_block_key
+from system.world_simulation import WorldSimulation
+from system.world_system import WorldSystem
+
+SERVER_USERNAME = "Server"     # Shown as the author of simulation block changes
+TICK_RATE = 20                 # Simulation ticks per second
+MOB_SNAPSHOT_INTERVAL = 0.25   # Seconds between mob snapshots to players
+AUTOSAVE_INTERVAL = 300.0      # Seconds between automatic saves
+STATS_LOG_INTERVAL = 60.0      # Seconds between network stats log entries
+
+
+class DedicatedServer:
+    """A world that runs on its own: load, simulate, serve players, save"""
+
+    def __init__(self, world_name: str, save_dir: str = "save_data", seed: Optional[str] = None,
+                 port: int = 25565, max_players: int = DEFAULT_MAX_PLAYERS,
+                 autosave_interval: float = AUTOSAVE_INTERVAL, stats_interval: float = STATS_LOG_INTERVAL):
+        self.world_name = world_name
+        self.seed = seed
+        self.autosave_interval = autosave_interval
+        self.world_system = WorldSystem(save_dir)
+        self.lan_server = LANServer(SERVER_USERNAME, world_name, max_players)
+        self.lan_server.port = port
+        self.lan_server.server_name = f"{world_name} (Dedicated)"
+        # Network stats go to <save dir>/logs/<world>_network.jsonl
+        self.lan_server.stats_log_interval = stats_interval
+        log_dir = os.path.join(save_dir, "logs")
+        os.makedirs(log_dir, exist_ok=True)
+        self.lan_server.stats_log_path = os.path.join(log_dir, f"{world_name}_network.jsonl")
+        self.simulation: Optional[WorldSimulation] = None
+        self.pending_changes = deque()  # Player block changes for the simulation to pick up
+        self.running = False
+
+    def load_world(self) -> bool:
+        """Load the world, creating it first if it doesn't exist yet"""
+        if not self.world_system.world_exists(self.world_name):
+            print(f"🌍 World '{self.world_name}' not found - creating it")
+            if not self.world_system.create_world(self.world_name, self.seed):
+                return False
+        return self.world_system.load_world(self.world_name)
+
+    def start(self) -> bool:
+        """Load the world and open the server to players"""
+        if not self.load_world():
+            print(f"❌ Could not load world '{self.world_name}'")
+            return False
+
+        world = self.world_system.current_world_data
+        spawn = world.get("player", {})
+        # Only the spawn point goes to clients - not the single-player inventory
+        server_world = {
+            "blocks": world.get("blocks", {}),
+            "player": {"x": spawn.get("x", 0.0), "y": spawn.get("y", 48.0)},
+        }
+        if not self.lan_server.start(server_world, include_host=False):
+            return False
+
+        chunk_index = self.lan_server.chunk_index
+        settings = world.get("world_settings", {})
+        crops = {parse_block_key(key): value for key, value in world.get("crops", {}).items()}
+        now = time.time()
+        self.simulation = WorldSimulation(
+            chunk_index.get_block,
+            lambda x, y, block: self.lan_server.broadcast_block_change(SERVER_USERNAME, x, y, block),
+            blocks=((x, y, block) for chunk in chunk_index.chunks.values() for (x, y), block in chunk.items()),
+            chunk_size=self.lan_server.chunk_size,
+            entities=[e for e in world.get("entities", []) if isinstance(e, dict)],
+            crops=crops,
+            is_day=settings.get("day", True),
+            day_count=settings.get("day_count", 1),
+            now=now,
+        )
+        self.lan_server.on_block_change = self._on_block_change
+        print(f"🖥️ Dedicated server running '{self.world_name}' on port {self.lan_server.port}")
+        return True
+
+    def _on_block_change(self, username: str, x: int, y: int, block_type):
+        # Called from the network thread; the simulation is only touched from run()
+        if username != SERVER_USERNAME:
+            self.pending_changes.append((x, y, block_type))
+
+    def get_player_positions(self) -> List[Tuple[float, float]]:
+        with self.lan_server.player_lock:
+            return [tuple(data["position"]) for data in self.lan_server.players.values()]
+
+    def tick(self, now: float):
+        """One authoritative simulation step"""
+        while self.pending_changes:
+            x, y, block_type = self.pending_changes.popleft()
+            self.simulation.notify_block_change(x, y, block_type)
+
+        self.simulation.tick(now, self.get_player_positions())
+
+        # Clients sync their day/night cycle to ours
+        self.lan_server.game_time = self.simulation.phase_elapsed(now)
+        self.lan_server.is_day = self.simulation.is_day
+
+    def save(self) -> bool:
+        """Write the current world to disk through the world system"""
+        world = self.world_system.current_world_data
+        world["blocks"] = self.lan_server.chunk_index.to_blocks()
+        world.update(self.simulation.get_save_data())
+        return self.world_system.save_world()
+
+    def run(self):
+        """Tick until stopped (Ctrl+C or SIGTERM), saving now and then and on exit"""
+        if not self.start():
+            return False
+        self.running = True
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+
+        tick_interval = 1.0 / TICK_RATE
+        next_tick = time.time()
+        next_snapshot = next_tick
+        next_save = next_tick + self.autosave_interval
+        try:
+            while self.running:
+                now = time.time()
+                self.tick(now)
+                if now >= next_snapshot:
+                    next_snapshot = now + MOB_SNAPSHOT_INTERVAL
+                    self.lan_server.broadcast_entities(self.simulation.entities)
+                if now >= next_save:
+                    next_save = now + self.autosave_interval
+                    self.save()
+
+                next_tick += tick_interval
+                delay = next_tick - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_tick = time.time()  # Running behind - don't try to catch up
+        except KeyboardInterrupt:
+            print("\n🛑 Shutting down...")
+        finally:
+            self.save()
+            self.lan_server.stop()
+        return True
+
+    def stop(self):
+        self.running = False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run an Order of the Stone world as a dedicated LAN server")
+    parser.add_argument("--world", required=True, help="World to host (created if it doesn't exist)")
+    parser.add_argument("--save-dir", default="save_data", help="Folder holding worlds (default: save_data)")
+    parser.add_argument("--seed", default=None, help="Seed for a newly created world")
+    parser.add_argument("--port", type=int, default=25565, help="Game port (default: 25565)")
+    parser.add_argument("--max-players", type=int, default=DEFAULT_MAX_PLAYERS)
+    parser.add_argument("--autosave", type=float, default=AUTOSAVE_INTERVAL,
+                        help="Seconds between automatic saves (default: 300)")
+    parser.add_argument("--stats-interval", type=float, default=STATS_LOG_INTERVAL,
+                        help="Seconds between network stats log entries, 0 to turn off (default: 60)")
+    args = parser.parse_args(argv)
+
+    server = DedicatedServer(args.world, args.save_dir, args.seed, args.port, args.max_players, args.autosave,
+                             args.stats_interval)
+    return 0 if server.run() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
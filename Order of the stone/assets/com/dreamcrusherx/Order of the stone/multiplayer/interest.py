@@ -0,0 +1,110 @@
+"""
+Interest management for Order of the Stone LAN multiplayer
+Tracks which chunks each player can see so updates only go to players in range
+"""
+
+import threading
+from typing import Dict, List, Set, Tuple
+
+VIEW_DISTANCE_CHUNKS = 2  # Chunks either side of a player they receive updates for
+
+
+class InterestManager:
+    """Per-player chunk interest sets and who-can-see-whom bookkeeping.
+
+    A player's interest set is the chunks within ``view_distance`` of the
+    chunk they stand in. Player A "sees" player B while B's chunk is in A's
+    interest set; crossing that boundary produces enter/leave events.
+    """
+
+    def __init__(self, view_distance: int = VIEW_DISTANCE_CHUNKS):
+        self.view_distance = view_distance
+        self.player_chunks: Dict[str, int] = {}
+        self.interests: Dict[str, Set[int]] = {}
+        self.watchers: Dict[int, Set[str]] = {}   # chunk -> players whose interest includes it
+        self.visible: Dict[str, Set[str]] = {}    # observer -> players they currently see
+        self.missed: Dict[str, Dict[int, Tuple[int, int]]] = {}  # block changes skipped while out of range
+        self.lock = threading.RLock()
+
+    def update_position(self, username: str, cx: int) -> Tuple[List[int], List[Tuple[str, str, bool]]]:
+        """Move a player to chunk ``cx``.
+
+        Returns the chunks that just came into their view and the visibility
+        events ``(observer, subject, entered)`` the move caused.
+        """
+        with self.lock:
+            old = self.interests.get(username)
+            if old is not None and self.player_chunks.get(username) == cx:
+                return [], []
+            old = old or set()
+            new = set(range(cx - self.view_distance, cx + self.view_distance + 1))
+            self.player_chunks[username] = cx
+            self.interests[username] = new
+            self.visible.setdefault(username, set())
+
+            for chunk in old - new:
+                watchers = self.watchers.get(chunk)
+                if watchers:
+                    watchers.discard(username)
+                    if not watchers:
+                        del self.watchers[chunk]
+            for chunk in new - old:
+                self.watchers.setdefault(chunk, set()).add(username)
+
+            events = []
+            for other, other_cx in self.player_chunks.items():
+                if other != username:
+                    events += self._set_visible(username, other, other_cx in new)
+                    events += self._set_visible(other, username, cx in self.interests[other])
+            return sorted(new - old), events
+
+    def _set_visible(self, observer: str, subject: str, visible: bool) -> List[Tuple[str, str, bool]]:
+        seen = self.visible[observer]
+        if visible == (subject in seen):
+            return []
+        if visible:
+            seen.add(subject)
+        else:
+            seen.discard(subject)
+        return [(observer, subject, visible)]
+
+    def remove(self, username: str):
+        """Forget a player who left"""
+        with self.lock:
+            for chunk in self.interests.pop(username, ()):
+                watchers = self.watchers.get(chunk)
+                if watchers:
+                    watchers.discard(username)
+                    if not watchers:
+                        del self.watchers[chunk]
+            self.player_chunks.pop(username, None)
+            self.visible.pop(username, None)
+            self.missed.pop(username, None)
+            for seen in self.visible.values():
+                seen.discard(username)
+
+    def chunks_of(self, username: str) -> Set[int]:
+        """Chunks a player currently receives updates for"""
+        with self.lock:
+            return set(self.interests.get(username, ()))
+
+    def observers_of(self, username: str) -> List[str]:
+        """Other players who can see this player"""
+        with self.lock:
+            cx = self.player_chunks.get(username)
+            return [other for other in self.watchers.get(cx, ()) if other != username]
+
+    def note_missed(self, username: str, cx: int, y_min: int, y_max: int):
+        """Remember that a player skipped changes to a chunk (rows y_min..y_max)"""
+        with self.lock:
+            missed = self.missed.setdefault(username, {})
+            if cx in missed:
+                old_min, old_max = missed[cx]
+                y_min, y_max = min(y_min, old_min), max(y_max, old_max)
+            missed[cx] = (y_min, y_max)
+
+    def take_missed(self, username: str, chunks: List[int]) -> Dict[int, Tuple[int, int]]:
+        """Skipped-change spans for the given chunks; they are cleared once taken"""
+        with self.lock:
+            missed = self.missed.get(username, {})
+            return {cx: missed.pop(cx) for cx in chunks if cx in missed}
@@ -0,0 +1,178 @@
+"""
+Smooth remote movement for Order of the Stone LAN multiplayer
+Per-entity snapshot buffers (interpolate a little in the past, extrapolate when
+packets are late) and a velocity-driven send rate for our own position
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Optional, Tuple
+
+INTERPOLATION_DELAY = 0.15    # Seconds behind the newest snapshot we render (covers ~1 update at 5-10 Hz)
+MAX_EXTRAPOLATION = 0.25      # Seconds we keep moving an entity along its last velocity when packets are late
+TELEPORT_DISTANCE = 8.0       # Tiles; bigger jumps between snapshots snap instead of sliding
+SNAPSHOT_CAPACITY = 32
+CLOCK_SMOOTHING = 0.1         # How quickly the sender clock offset follows new samples
+
+MIN_SEND_RATE = 1.0           # Updates per second while standing still (heartbeat)
+MOVING_SEND_RATE = 5.0        # Updates per second at walking speed
+MAX_SEND_RATE = 10.0          # Updates per second at full speed or when prediction drifts
+REFERENCE_SPEED = 8.0         # Tiles per second that counts as "full speed"
+PREDICTION_TOLERANCE = 0.35   # Tiles receivers may drift from us before we send early
+
+# (sender time, x, y)
+Snapshot = Tuple[float, float, float]
+
+
+class SnapshotBuffer:
+    """Timestamped positions of one remote entity.
+
+    Snapshots are stamped with the sender's clock; the offset between that
+    clock and ours is estimated per entity, so machines don't need synced
+    clocks. :meth:`sample` renders ``delay`` seconds in the past, between
+    two real snapshots, and extrapolates along the last velocity for up to
+    ``max_extrapolation`` seconds when nothing newer has arrived.
+    """
+
+    def __init__(self, delay: float = INTERPOLATION_DELAY, max_extrapolation: float = MAX_EXTRAPOLATION,
+                 capacity: int = SNAPSHOT_CAPACITY):
+        self.delay = delay
+        self.max_extrapolation = max_extrapolation
+        self.snapshots = deque(maxlen=capacity)
+        self.clock_offset: Optional[float] = None  # Sender time minus our time
+        self.late_samples = 0   # Samples that needed extrapolation
+        self.lock = threading.Lock()
+
+    def add(self, x: float, y: float, received_at: float, sent_at: float = None):
+        """Store a snapshot; ``sent_at`` is the sender's timestamp (arrival time if unknown)"""
+        sent_at = received_at if sent_at is None else sent_at
+        with self.lock:
+            offset = sent_at - received_at
+            if self.clock_offset is None:
+                self.clock_offset = offset
+            elif offset > self.clock_offset:
+                # A packet arrived faster than we thought possible: trust it straight away
+                self.clock_offset = offset
+            else:
+                self.clock_offset += (offset - self.clock_offset) * CLOCK_SMOOTHING
+
+            if self.snapshots and sent_at <= self.snapshots[-1][0]:
+                return  # Out of order or duplicate
+            self.snapshots.append((sent_at, float(x), float(y)))
+
+    def latest(self) -> Optional[Tuple[float, float]]:
+        with self.lock:
+            if not self.snapshots:
+                return None
+            _, x, y = self.snapshots[-1]
+            return x, y
+
+    def velocity(self) -> Tuple[float, float]:
+        """Velocity between the two newest snapshots (tiles per second)"""
+        with self.lock:
+            return self._velocity(len(self.snapshots) - 1)
+
+    def _velocity(self, index: int) -> Tuple[float, float]:
+        if index < 1:
+            return 0.0, 0.0
+        t0, x0, y0 = self.snapshots[index - 1]
+        t1, x1, y1 = self.snapshots[index]
+        if t1 <= t0 or math.hypot(x1 - x0, y1 - y0) > TELEPORT_DISTANCE:
+            return 0.0, 0.0
+        return (x1 - x0) / (t1 - t0), (y1 - y0) / (t1 - t0)
+
+    def sample(self, now: float) -> Optional[Tuple[float, float]]:
+        """Position to draw at local time ``now``"""
+        with self.lock:
+            if not self.snapshots:
+                return None
+            render_time = now + self.clock_offset - self.delay
+            snapshots = self.snapshots
+
+            # Forget snapshots we've rendered past (keep one before the render time)
+            while len(snapshots) > 2 and snapshots[1][0] <= render_time:
+                snapshots.popleft()
+
+            t0, x0, y0 = snapshots[0]
+            if render_time <= t0:
+                return x0, y0
+            for index in range(1, len(snapshots)):
+                t1, x1, y1 = snapshots[index]
+                if render_time <= t1:
+                    if math.hypot(x1 - x0, y1 - y0) > TELEPORT_DISTANCE:
+                        return x1, y1
+                    f = (render_time - t0) / (t1 - t0)
+                    return x0 + (x1 - x0) * f, y0 + (y1 - y0) * f
+                t0, x0, y0 = t1, x1, y1
+
+            # Past the newest snapshot: dead-reckon along the last velocity, briefly
+            self.late_samples += 1
+            vx, vy = self._velocity(len(snapshots) - 1)
+            ahead = min(render_time - t0, self.max_extrapolation)
+            return x0 + vx * ahead, y0 + vy * ahead
+
+
+class AdaptiveSendRate:
+    """Decides when our own position is worth sending.
+
+    Standing still sends a heartbeat at ``min_rate``; moving scales from
+    ``moving_rate`` up to ``max_rate`` with speed. An update also goes out
+    early (never above ``max_rate``) when receivers' extrapolation of the
+    last update would be off by more than ``tolerance`` tiles, e.g. when we
+    stop or turn, and straight away when ``state`` (health, facing) changes.
+    """
+
+    def __init__(self, min_rate: float = MIN_SEND_RATE, moving_rate: float = MOVING_SEND_RATE,
+                 max_rate: float = MAX_SEND_RATE, reference_speed: float = REFERENCE_SPEED,
+                 tolerance: float = PREDICTION_TOLERANCE):
+        self.min_rate = min_rate
+        self.moving_rate = moving_rate
+        self.max_rate = max_rate
+        self.reference_speed = reference_speed
+        self.tolerance = tolerance
+        self.last_sample: Optional[Snapshot] = None
+        self.last_sent: Optional[Snapshot] = None
+        self.last_velocity = (0.0, 0.0)
+        self.last_state = None
+        self.sent = 0
+
+    def should_send(self, now: float, x: float, y: float, state=None) -> bool:
+        """Call every frame with our position; returns True when an update should be sent"""
+        if self.last_sample and now > self.last_sample[0]:
+            t, px, py = self.last_sample
+            velocity = ((x - px) / (now - t), (y - py) / (now - t))
+        else:
+            velocity = self.last_velocity
+        self.last_sample = (now, x, y)
+
+        send = False
+        if self.last_sent is None or state != self.last_state:
+            send = True
+        else:
+            sent_time, sent_x, sent_y = self.last_sent
+            elapsed = now - sent_time
+            if elapsed >= 1.0 / self.min_rate:
+                send = True
+            elif elapsed >= 1.0 / self.max_rate:
+                # What receivers are showing: the last update carried on along its velocity
+                ahead = min(elapsed, MAX_EXTRAPOLATION)
+                predicted_x = sent_x + self.last_velocity[0] * ahead
+                predicted_y = sent_y + self.last_velocity[1] * ahead
+                speed = math.hypot(*velocity)
+                if math.hypot(x - predicted_x, y - predicted_y) > self.tolerance:
+                    send = True
+                elif speed > 0.05 and elapsed >= 1.0 / self.rate_for_speed(speed):
+                    send = True
+
+        if send:
+            self.last_sent = (now, x, y)
+            self.last_velocity = velocity
+            self.last_state = state
+            self.sent += 1
+        return send
+
+    def rate_for_speed(self, speed: float) -> float:
+        """Updates per second while moving at ``speed`` tiles per second"""
+        f = min(speed / self.reference_speed, 1.0)
+        return self.moving_rate + (self.max_rate - self.moving_rate) * f
@@ -7,8 +7,18 @@ import socket
 import threading
 import json
 import time
+from collections import deque
 from typing import Dict, List, Optional, Callable
 
+from .protocol import encode_message, decode_frame, FrameDecoder, ProtocolError
+from .world_stream import decode_chunk_blocks, DEFAULT_CHUNK_SIZE
+from .block_sync import BlockChangeBatcher, build_batch_message, decode_batch_chunk
+from .interpolation import SnapshotBuffer, INTERPOLATION_DELAY
+from .net_stats import NetStats
+from .udp_channel import (pack_datagram, unpack_datagram, SequenceFilter, UDP_ENABLED,
+                          KIND_HELLO, KIND_READY, KIND_STATE, HELLO_INTERVAL, HELLO_ATTEMPTS,
+                          MAX_DATAGRAM_SIZE)
+
 class LANClient:
     """Simple LAN multiplayer client"""
     
@@ -23,10 +33,31 @@ class LANClient:
         self.connected = False
         self.server_socket = None
         self.server_address = None
+        self.stats = NetStats()  # Messages/bytes by type, RTT, malformed frames (kept across reconnects)
+        
+        # Optional UDP channel for position updates (offered by the server in its welcome)
+        self.use_udp = UDP_ENABLED
+        self.udp_socket = None
+        self.udp_token = None
+        self.udp_ready = False
+        self.udp_sequence = 0
+        self.udp_filter = SequenceFilter()  # Newest state datagram per player (or message type)
+        self.udp_thread = None
         
         # Received data
         self.world_data = None
-        self.other_players = {}  # {username: {"position": (x, y), "health": 10, etc}}
+        
+        # World streaming (chunks arrive after the welcome message)
+        self.chunk_size = DEFAULT_CHUNK_SIZE
+        self.stream_total = 0
+        self.stream_received = 0
+        self.spawn_chunks_missing = set()
+        self.pending_chunks = deque()  # (chunk x, {"x,y": block or None}, replace span) waiting for the game to apply
+        self.chunk_lock = threading.Lock()  # Receive thread queues and patches chunks, the game thread pops them
+        self.block_batcher = BlockChangeBatcher(self.chunk_size)  # Our changes waiting for the next tick
+        self.other_players = {}  # {username: {"position": (x, y), "health": 10, "snapshots": SnapshotBuffer, etc}}
+        self.interpolation_delay = INTERPOLATION_DELAY  # Seconds remote players are drawn behind real time
+        self.server_mobs = {}  # {id: {"type", "x", "y", "hp"}} from a dedicated server's simulation
         
         # Game state sync
         self.game_time = 0
@@ -40,6 +71,7 @@ class LANClient:
         self.on_block_change = None  # Callback(username, x, y, block_type)
         self.on_chat_message = None  # Callback(username, message)
         self.on_time_sync = None  # Callback(game_time, is_day, weather)
+        self.on_world_progress = None  # Callback(chunks_received, total_chunks)
         
         # Receive thread
         self.receive_thread = None
@@ -102,6 +134,9 @@ class LANClient:
         if server_port is None:
             server_port = self.game_port
         
+        if self.server_address == (server_ip, server_port):
+            self.stats.reconnects += 1
+        
         try:
             # Create TCP socket for game connection
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -115,7 +150,8 @@ class LANClient:
             # Send join request
             join_message = {
                 "type": "join",
-                "username": self.username
+                "username": self.username,
+                "udp": self.use_udp  # Ask for the UDP state channel
             }
             self._send_message(join_message)
             
@@ -135,6 +171,14 @@ class LANClient:
         """Disconnect from the server"""
         self.running = False
         self.connected = False
+        self.udp_ready = False
+        
+        if self.udp_socket:
+            try:
+                self.udp_socket.close()
+            except OSError:
+                pass
+            self.udp_socket = None
         
         if self.server_socket:
             try:
@@ -154,22 +198,37 @@ class LANClient:
             "type": "player_update",
             "position": position,
             "health": health,
-            "facing_direction": facing_direction
+            "facing_direction": facing_direction,
+            "t": time.time()  # Lets receivers place the snapshot in time
         }
+        if self.udp_ready:
+            self.udp_sequence = (self.udp_sequence + 1) & 0xFFFFFFFF
+            datagram = pack_datagram(KIND_STATE, self.udp_token, self.udp_sequence, encode_message(message))
+            try:
+                self.udp_socket.send(datagram)
+                self.stats.record_out("player_update", len(datagram))
+                return
+            except OSError:
+                self.udp_ready = False  # Fall back to TCP
         self._send_message(message)
     
     def send_block_change(self, x: int, y: int, block_type: str):
-        """Send block change to server"""
+        """Queue a block change for the next flush_block_changes()"""
         if not self.connected:
             return
         
-        message = {
-            "type": "block_change",
-            "x": x,
-            "y": y,
-            "block_type": block_type
-        }
-        self._send_message(message)
+        # Our own edit must not be undone by an older streamed chunk still in the queue
+        self._patch_pending_chunks(x, y, block_type)
+        self.block_batcher.add(x, y, block_type)
+    
+    def flush_block_changes(self):
+        """Send queued block changes to the server as one batch (call once per network tick)"""
+        if not self.connected:
+            return
+        
+        message = build_batch_message(self.block_batcher.flush())
+        if message:
+            self._send_message(message)
     
     def send_chat_message(self, text: str):
         """Send chat message to server"""
@@ -188,63 +247,147 @@ class LANClient:
             return
         
         try:
-            data = json.dumps(message).encode('utf-8')
-            self.server_socket.send(data + b'\n')
+            frame = encode_message(message)
+            self.server_socket.sendall(frame)
+            self.stats.record_out(message.get("type"), len(frame))
         except Exception as e:
             print(f"⚠️ Error sending message: {e}")
             self.connected = False
     
     def _receive_messages(self):
         """Receive messages from the server"""
-        buffer = ""
+        decoder = FrameDecoder()  # Reassembles frames split across recv calls
         
         while self.running and self.connected:
             try:
-                data = self.server_socket.recv(4096).decode('utf-8')
+                data = self.server_socket.recv(65536)
                 if not data:
                     print("⚠️ Connection lost")
                     self.connected = False
                     break
                 
-                # Add to buffer and process complete messages
-                buffer += data
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    if line:
-                        try:
-                            message = json.loads(line)
-                            self._process_server_message(message)
-                        except json.JSONDecodeError as e:
-                            print(f"⚠️ Invalid JSON: {e}")
+                malformed = decoder.malformed
+                messages = decoder.feed(data)
+                if decoder.malformed > malformed:
+                    self.stats.record_malformed(decoder.malformed - malformed)
+                for message, size in zip(messages, decoder.sizes):
+                    self.stats.record_in(message.get("type"), size)
+                    self._process_server_message(message)
             
             except socket.timeout:
                 continue
+            except ProtocolError as e:
+                print(f"⚠️ Bad data from server: {e}")
+                self.stats.record_malformed()
+                self.connected = False
+                break
             except Exception as e:
                 if self.running:
                     print(f"⚠️ Error receiving message: {e}")
                 self.connected = False
                 break
     
+    def _open_udp(self, token: int, port: int):
+        """Start the UDP state channel the server offered; stays on TCP if it doesn't answer"""
+        try:
+            self.udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.udp_socket.settimeout(HELLO_INTERVAL)
+            self.udp_socket.connect((self.server_address[0], port))
+        except OSError as e:
+            print(f"⚠️ UDP state channel unavailable, using TCP only: {e}")
+            self.udp_socket = None
+            return
+        self.udp_token = token
+        self.udp_thread = threading.Thread(target=self._receive_datagrams, daemon=True)
+        self.udp_thread.start()
+    
+    def _receive_datagrams(self):
+        """Say hello until the server answers, then receive position/mob state over UDP"""
+        udp_socket = self.udp_socket
+        attempts = 0
+        while self.running and self.connected:
+            if not self.udp_ready:
+                if attempts >= HELLO_ATTEMPTS:
+                    print("⚠️ No answer on the UDP state channel, using TCP only")
+                    return
+                attempts += 1
+                try:
+                    udp_socket.send(pack_datagram(KIND_HELLO, self.udp_token, 0))
+                except OSError:
+                    pass
+            try:
+                data = udp_socket.recv(MAX_DATAGRAM_SIZE)
+            except socket.timeout:
+                continue
+            except OSError:
+                if not self.running or udp_socket is not self.udp_socket:
+                    return  # Closed by disconnect()
+                continue  # e.g. ICMP unreachable while the server was busy
+            
+            datagram = unpack_datagram(data)
+            if datagram is None or datagram[1] != self.udp_token:
+                continue
+            kind, _, sequence, frame = datagram
+            if kind == KIND_READY:
+                self.stats.record_in("udp_ready", len(data))
+                if not self.udp_ready:
+                    self.udp_ready = True
+                    print("📶 Position updates now use the UDP state channel")
+            elif kind == KIND_STATE:
+                message = decode_frame(frame)
+                if not message:
+                    self.stats.record_malformed()
+                    continue
+                self.stats.record_in(message.get("type"), len(data))
+                key = message.get("username") or message.get("type")
+                if not self.udp_filter.accept(key, sequence):
+                    continue  # An older update than one we already have
+                if message.get("type") == "player_update" and key not in self.other_players:
+                    continue  # Arrived after they left our view (entity_leave is on TCP)
+                self._process_server_message(message)
+    
     def _process_server_message(self, message: Dict):
         """Process a message from the server"""
         msg_type = message.get("type")
         
         if msg_type == "welcome":
-            # Received welcome with world data
-            self.world_data = message.get("world_data")
+            # Received welcome with world info; blocks are streamed in chunks
+            self.world_data = dict(message.get("world_info", {}), blocks={})
+            self.chunk_size = message.get("chunk_size", DEFAULT_CHUNK_SIZE)
+            self.block_batcher.chunk_size = self.chunk_size
+            self.stream_total = message.get("total_chunks", 0)
+            self.stream_received = 0
+            self.spawn_chunks_missing = set(message.get("spawn_chunks", []))
             players = message.get("players", [])
             print(f"✅ Joined server: {message.get('server_name')}")
             print(f"👥 Players online: {', '.join(players)}")
+            print(f"📦 Downloading world: {self.stream_total} chunks")
+            if self.use_udp and message.get("udp_token"):
+                self._open_udp(message["udp_token"], message.get("udp_port", self.server_address[1]))
+        
+        elif msg_type == "world_chunk":
+            # One streamed chunk of the world
+            cx = message.get("cx")
+            blocks = decode_chunk_blocks(message["data"], cx * self.chunk_size)
+            with self.chunk_lock:
+                self.pending_chunks.append((cx, blocks, None))
+            self.stream_received += 1
+            self.spawn_chunks_missing.discard(cx)
+            
+            # Acknowledge so the server sends the next chunks
+            self._send_message({"type": "chunk_ack", "count": 1})
+            
+            if self.on_world_progress:
+                self.on_world_progress(self.stream_received, self.stream_total)
+        
+        elif msg_type == "server_full":
+            print(f"🚫 Server is full ({message.get('max_players')} players)")
+            self.connected = False
         
         elif msg_type == "player_joined":
-            # Another player joined
+            # Another player joined (they appear once they come into range)
             username = message.get("username")
             position = message.get("position", (0, 100))
-            self.other_players[username] = {
-                "position": position,
-                "health": 10,
-                "facing_direction": 1
-            }
             print(f"👋 {username} joined the game")
             
             if self.on_player_joined:
@@ -260,6 +403,16 @@ class LANClient:
             if self.on_player_left:
                 self.on_player_left(username)
         
+        elif msg_type == "entity_enter":
+            # Another player came within view distance
+            username = message.get("username")
+            self._track_player(username, message.get("position"), message.get("health", 10),
+                               message.get("facing_direction", 1))
+        
+        elif msg_type == "entity_leave":
+            # Another player went out of view (still in the game)
+            self.other_players.pop(message.get("username"), None)
+        
         elif msg_type == "player_update":
             # Another player moved/updated
             username = message.get("username")
@@ -267,22 +420,8 @@ class LANClient:
             health = message.get("health")
             facing_direction = message.get("facing_direction", 1)
             
-            # Store old position for smooth interpolation
-            if username in self.other_players:
-                self.other_players[username]["old_position"] = self.other_players[username]["position"]
-                self.other_players[username]["position"] = position
-                self.other_players[username]["health"] = health
-                self.other_players[username]["facing_direction"] = facing_direction
-                self.other_players[username]["last_update"] = time.time()
-            else:
-                # New player we just learned about
-                self.other_players[username] = {
-                    "position": position,
-                    "old_position": position,
-                    "health": health,
-                    "facing_direction": facing_direction,
-                    "last_update": time.time()
-                }
+            # Buffered as a timestamped snapshot for smooth interpolation
+            self._track_player(username, position, health, facing_direction, message.get("t"))
             
             if self.on_player_update:
                 self.on_player_update(username, position, health, facing_direction)
@@ -293,9 +432,23 @@ class LANClient:
             x, y = message.get("x"), message.get("y")
             block_type = message.get("block_type")
             
+            # Queued chunks of this area are older - patch them so applying them later can't undo this change
+            self._patch_pending_chunks(x, y, block_type)
+            
             if self.on_block_change:
                 self.on_block_change(username, x, y, block_type)
         
+        elif msg_type == "block_batch":
+            # Block changes from the last server tick, per chunk
+            chunks = [decode_batch_chunk(chunk, self.chunk_size) for chunk in message.get("chunks", [])]
+            with self.chunk_lock:
+                self.pending_chunks.extend(chunks)
+        
+        elif msg_type == "mob_snapshot":
+            # Mobs simulated by the server, within our view distance
+            self.server_mobs = {mob_id: {"type": mob_type, "x": x, "y": y, "hp": hp}
+                                for mob_id, mob_type, x, y, hp in message.get("mobs", [])}
+        
         elif msg_type == "chat":
             # Chat message received
             username = message.get("username")
@@ -305,6 +458,12 @@ class LANClient:
             if self.on_chat_message:
                 self.on_chat_message(username, text)
         
+        elif msg_type == "ping":
+            # Server measures our round trip; it tells us the last result in each ping
+            self._send_message({"type": "pong", "id": message.get("id")})
+            if message.get("rtt") is not None:
+                self.stats.set_rtt(message["rtt"] / 1000.0)
+        
         elif msg_type == "time_sync":
             # Server is syncing game time to us
             self.game_time = message.get("game_time", 0)
@@ -318,29 +477,93 @@ class LANClient:
         """Check if client is connected to a server"""
         return self.connected
     
+    def is_spawn_area_ready(self) -> bool:
+        """Check if the chunks around spawn have arrived (enough to start playing)"""
+        return self.world_data is not None and not self.spawn_chunks_missing
+    
+    def is_world_complete(self) -> bool:
+        """Check if every chunk of the world has arrived"""
+        return self.world_data is not None and self.stream_received >= self.stream_total
+    
+    def wait_for_spawn_area(self, timeout: float = 15.0, on_progress: Callable = None) -> bool:
+        """Block until the spawn neighbourhood has arrived (or timeout/disconnect).
+        
+        ``on_progress(received, total)`` is called while waiting, e.g. to draw a loading bar.
+        """
+        deadline = time.time() + timeout
+        while self.connected and time.time() < deadline:
+            if self.is_spawn_area_ready():
+                return True
+            if on_progress:
+                on_progress(self.stream_received, self.stream_total)
+            time.sleep(0.02)
+        return self.is_spawn_area_ready()
+    
+    def pop_world_chunks(self, max_chunks: int = None) -> List:
+        """Take received chunks and block batches for the game to merge into its world"""
+        chunks = []
+        with self.chunk_lock:
+            while self.pending_chunks and (max_chunks is None or len(chunks) < max_chunks):
+                chunks.append(self.pending_chunks.popleft())
+        return chunks
+    
+    def _patch_pending_chunks(self, x: int, y: int, block_type: Optional[str]):
+        """Write a newer block change into every queued chunk that covers it"""
+        cx = x // self.chunk_size
+        key = f"{x},{y}"
+        with self.chunk_lock:
+            for chunk_x, blocks, _ in self.pending_chunks:
+                if chunk_x == cx:
+                    blocks[key] = None if block_type == "air" else block_type
+    
+    @property
+    def bytes_sent(self) -> int:
+        return self.stats.total_out
+    
+    @property
+    def bytes_received(self) -> int:
+        return self.stats.total_in
+    
+    def get_network_stats(self) -> Dict:
+        """Traffic counters for our connection (messages/bytes by type, RTT, malformed frames)"""
+        stats = self.stats.snapshot()
+        stats["connected"] = self.connected
+        stats["transport"] = "udp+tcp" if self.udp_ready else "tcp"
+        stats["server"] = f"{self.server_address[0]}:{self.server_address[1]}" if self.server_address else None
+        return stats
+    
+    def get_server_mobs(self) -> Dict:
+        """Mobs the server is simulating near us (dedicated servers only)"""
+        return dict(self.server_mobs)
+    
+    def _track_player(self, username: str, position, health: int, facing_direction: int,
+                      sent_at: float = None):
+        """Record a remote player's state and add a position snapshot"""
+        now = time.time()
+        player_data = self.other_players.get(username)
+        if player_data is None:
+            # New player we just learned about
+            player_data = {"snapshots": SnapshotBuffer(self.interpolation_delay)}
+            self.other_players[username] = player_data
+        player_data["position"] = position
+        player_data["health"] = health
+        player_data["facing_direction"] = facing_direction
+        player_data["last_update"] = now
+        if position:
+            player_data["snapshots"].add(position[0], position[1], now, sent_at)
+    
     def get_other_players(self) -> Dict:
-        """Get dictionary of other players with smooth interpolation"""
+        """Get dictionary of other players at their interpolated positions"""
         result = {}
         current_time = time.time()
         
-        for username, player_data in self.other_players.items():
-            # Create a copy
-            player_copy = player_data.copy()
+        for username, player_data in list(self.other_players.items()):
+            player_copy = {key: value for key, value in player_data.items() if key != "snapshots"}
             
-            # Smooth interpolation for position (prevents teleporting)
-            if "old_position" in player_data and "last_update" in player_data:
-                time_since_update = current_time - player_data["last_update"]
-                # Interpolate over 0.1 seconds (100ms)
-                t = min(time_since_update / 0.1, 1.0)
-                
-                old_x, old_y = player_data["old_position"]
-                new_x, new_y = player_data["position"]
-                
-                # Linear interpolation
-                smooth_x = old_x + (new_x - old_x) * t
-                smooth_y = old_y + (new_y - old_y) * t
-                
-                player_copy["position"] = (smooth_x, smooth_y)
+            # Drawn slightly in the past between real snapshots (or extrapolated if late)
+            smooth = player_data["snapshots"].sample(current_time)
+            if smooth:
+                player_copy["position"] = smooth
             
             result[username] = player_copy
         
@@ -3,16 +3,30 @@ Simple LAN Server for Order of the Stone
 Hosts a game world that other players on the same Wi-Fi can join
 """
 
+import selectors
 import socket
 import threading
 import json
 import time
-from typing import Dict, List, Any
+from typing import Dict, List, Optional
+
+from .protocol import encode_message, decode_frame, ProtocolError
+from .connection import ClientConnection
+from .world_stream import ChunkIndex, ChunkStream, spawn_chunks, parse_block_key, DEFAULT_CHUNK_SIZE
+from .block_sync import (BlockChangeBatcher, build_batch_message, decode_batch_chunk,
+                         full_chunk_entry, NETWORK_TICK_RATE)
+from .interest import InterestManager
+from .interpolation import SnapshotBuffer
+from .net_stats import PING_INTERVAL, format_rate
+from .udp_channel import (pack_datagram, unpack_datagram, new_session_token, SequenceFilter,
+                          KIND_HELLO, KIND_READY, KIND_STATE, MAX_DATAGRAM_SIZE, DATAGRAM)
+
+DEFAULT_MAX_PLAYERS = 64  # Updates are range-limited, so traffic doesn't grow with everyone x everyone
 
 class LANServer:
     """Simple LAN multiplayer server"""
     
-    def __init__(self, host_player_name: str, world_name: str):
+    def __init__(self, host_player_name: str, world_name: str, max_players: int = DEFAULT_MAX_PLAYERS):
         self.host_player_name = host_player_name
         self.world_name = world_name
         self.server_name = f"{host_player_name}'s World"
@@ -21,61 +35,91 @@ class LANServer:
         self.host = '0.0.0.0'  # Listen on all network interfaces
         self.port = 25565  # Default game port
         self.discovery_port = 25566  # Port for server discovery broadcasts
+        self.max_players = max_players
         
         # Server state
         self.running = False
         self.server_socket = None
         self.discovery_socket = None
+        self.udp_socket = None  # Optional state channel on the game port
+        self.udp_sessions = {}  # {session token: ClientConnection}
+        self.udp_filter = SequenceFilter()  # Newest state datagram per connection
+        self.selector = None
+        self.loop_thread = None
+        self._waker_recv = None  # Socket pair that interrupts select() when other threads queue data
+        self._waker_send = None
+        self.connections = {}  # {fileno: ClientConnection}, owned by the event loop
+        self.dirty = set()  # Connections with newly queued frames
+        self.dirty_lock = threading.Lock()
         
         # Connected players
-        self.players = {}  # {username: {"socket": socket, "position": (x, y), "health": 10, etc}}
+        self.players = {}  # {username: {"connection": ClientConnection, "position": (x, y), "health": 10, etc}}
         self.player_lock = threading.Lock()
         
         # World state (synchronized across all clients)
         self.world_blocks = {}  # Shared block changes
         self.world_data = None
+        self.chunk_size = DEFAULT_CHUNK_SIZE
+        self.chunk_index = None  # World blocks split into chunks for streaming
+        self.streams = {}  # {username: ChunkStream} for players still downloading the world
+        self.stream_lock = threading.Lock()  # Keeps chunk sends and block changes in order
+        self.block_batcher = BlockChangeBatcher(self.chunk_size)  # Changes waiting for the next tick
+        self.interest = InterestManager()  # Which chunks (and so which players) each player can see
         
         # Game state (time/weather sync)
         self.game_time = 0  # Server is the source of truth for time
         self.is_day = True
         self.weather = "clear"
         
+        # Callback(username, x, y, block_type) after any block change is applied
+        self.on_block_change = None
+        
+        # Network statistics (see get_network_stats)
+        self.join_counts = {}  # {username: joins this session}, for reconnect counts
+        self.stats_log_interval = 60.0  # Seconds between stats log entries (0 = off)
+        self.stats_log_path = None  # JSON lines file for full stats; None = console summary only
+        
         print(f"🌐 LAN Server initialized: {self.server_name}")
     
-    def start(self, world_data: Dict) -> bool:
-        """Start the LAN server"""
+    def start(self, world_data: Dict, include_host: bool = True) -> bool:
+        """Start the LAN server (``include_host=False`` for a dedicated server with no local player)"""
         try:
             self.world_data = world_data
+            self.chunk_index = ChunkIndex(world_data.get("blocks", {}), self.chunk_size)
             
             # Add host as a player (so clients can see them!)
-            with self.player_lock:
-                self.players[self.host_player_name] = {
-                    "socket": None,  # Host doesn't have a socket
-                    "address": ("localhost", 0),
-                    "position": (world_data.get("player", {}).get("x", 0), world_data.get("player", {}).get("y", 100)),
-                    "health": world_data.get("player", {}).get("health", 10),
-                    "facing_direction": 1
-                }
-            print(f"👤 Added host player: {self.host_player_name}")
+            if include_host:
+                with self.player_lock:
+                    self.players[self.host_player_name] = {
+                        "connection": None,  # Host doesn't have a connection
+                        "address": ("localhost", 0),
+                        "position": (world_data.get("player", {}).get("x", 0), world_data.get("player", {}).get("y", 100)),
+                        "health": world_data.get("player", {}).get("health", 10),
+                        "facing_direction": 1
+                    }
+                self._update_interest(self.host_player_name, world_data.get("player", {}).get("x", 0))
+                print(f"👤 Added host player: {self.host_player_name}")
             
             # Start main game server
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.server_socket.bind((self.host, self.port))
-            self.server_socket.listen(10)
-            self.running = True
+            self.server_socket.listen(64)
+            self.server_socket.setblocking(False)
             
-            # Start accepting connections
-            accept_thread = threading.Thread(target=self._accept_connections, daemon=True)
-            accept_thread.start()
+            # One event loop handles accepting, every client, discovery and timers
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.server_socket, selectors.EVENT_READ, "accept")
+            self._waker_recv, self._waker_send = socket.socketpair()
+            self._waker_recv.setblocking(False)
+            self._waker_send.setblocking(False)
+            self.selector.register(self._waker_recv, selectors.EVENT_READ, "wake")
+            self._start_discovery()
+            self._start_udp()
             
-            # Start discovery responder (so others can find this server)
-            discovery_thread = threading.Thread(target=self._discovery_responder, daemon=True)
-            discovery_thread.start()
-            
-            # Start game state sync broadcaster (time/weather)
-            sync_thread = threading.Thread(target=self._broadcast_game_state, daemon=True)
-            sync_thread.start()
+            self.running = True
+            self.loop_thread = threading.Thread(target=self._event_loop, daemon=True)
+            self.loop_thread.start()
             
             print(f"✅ LAN Server started on port {self.port}")
             print(f"🔍 Server discoverable on port {self.discovery_port}")
@@ -88,181 +132,323 @@ class LANServer:
     def stop(self):
         """Stop the LAN server"""
         self.running = False
+        self._wake()
+        if self.loop_thread and self.loop_thread is not threading.current_thread():
+            self.loop_thread.join(timeout=2.0)
         
         # Disconnect all players
+        for connection in list(self.connections.values()):
+            connection.flush()
+            connection.close()
+        self.connections.clear()
         with self.player_lock:
-            for username, player_data in list(self.players.items()):
-                try:
-                    player_data["socket"].close()
-                except:
-                    pass
             self.players.clear()
         
         # Close sockets
-        if self.server_socket:
+        self.udp_sessions.clear()
+        for sock in (self.server_socket, self.discovery_socket, self.udp_socket,
+                     self._waker_recv, self._waker_send):
+            if sock:
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+        if self.selector:
+            self.selector.close()
+            self.selector = None
+        
+        print("🛑 LAN Server stopped")
+    
+    def _wake(self):
+        """Interrupt the event loop's select() (after queueing data from another thread)"""
+        if self._waker_send:
             try:
-                self.server_socket.close()
-            except:
-                pass
+                self._waker_send.send(b"\0")
+            except OSError:
+                pass  # Already has a wake-up pending
+    
+    def _event_loop(self):
+        """Run every socket on one thread: reads, non-blocking writes and the network tick"""
+        tick_interval = 1.0 / NETWORK_TICK_RATE
+        next_tick = time.monotonic() + tick_interval
+        next_state_sync = time.monotonic() + 1.0
+        next_ping = time.monotonic() + PING_INTERVAL
+        next_stats_log = time.monotonic() + self.stats_log_interval
         
-        if self.discovery_socket:
+        while self.running:
+            timeout = max(0.0, next_tick - time.monotonic())
             try:
-                self.discovery_socket.close()
-            except:
+                events = self.selector.select(timeout)
+            except OSError as e:
+                if self.running:
+                    print(f"⚠️ Server event loop error: {e}")
+                break
+            
+            for key, mask in events:
+                try:
+                    if key.data == "accept":
+                        self._accept_connections()
+                    elif key.data == "wake":
+                        self._drain_waker()
+                    elif key.data == "discovery":
+                        self._answer_discovery()
+                    elif key.data == "udp":
+                        self._read_datagrams()
+                    else:
+                        connection = key.data
+                        if mask & selectors.EVENT_READ:
+                            self._read_from(connection)
+                        if mask & selectors.EVENT_WRITE:
+                            self._write_to(connection)
+                except Exception as e:
+                    if self.running:
+                        print(f"⚠️ Server event loop error: {e}")
+            
+            now = time.monotonic()
+            if now >= next_tick:
+                next_tick = now + tick_interval
+                try:
+                    self.flush_block_changes()
+                except Exception as e:
+                    print(f"⚠️ Error sending block changes: {e}")
+                for connection in list(self.connections.values()):
+                    connection.check_slow(now)
+            if now >= next_state_sync:
+                # Time/weather sync every second (not every frame!)
+                next_state_sync = now + 1.0
+                self._broadcast({
+                    "type": "time_sync",
+                    "game_time": self.game_time,
+                    "is_day": self.is_day,
+                    "weather": self.weather
+                })
+            if now >= next_ping:
+                next_ping = now + PING_INTERVAL
+                self._ping_clients()
+            
+            self._service_connections()
+            if self.stats_log_interval > 0 and now >= next_stats_log:
+                next_stats_log = now + self.stats_log_interval
+                self._write_stats_log()
+    
+    def _drain_waker(self):
+        try:
+            while self._waker_recv.recv(4096):
                 pass
-        
-        print("🛑 LAN Server stopped")
+        except (BlockingIOError, InterruptedError):
+            pass
+    
+    def _service_connections(self):
+        """Write queued frames, close dropped clients and resume paused world streams"""
+        with self.dirty_lock:
+            dirty, self.dirty = self.dirty, set()
+        for connection in dirty:
+            if connection.sock.fileno() != -1:
+                self._write_to(connection)
+        for connection in list(self.connections.values()):
+            if connection.close_reason:
+                self._close_connection(connection)
+    
+    def _write_to(self, connection: ClientConnection):
+        """Send what the socket will take; only watch for writability while data is left"""
+        drained = connection.flush()
+        events = selectors.EVENT_READ if drained else selectors.EVENT_READ | selectors.EVENT_WRITE
+        try:
+            if self.selector.get_key(connection.sock).events != events:
+                self.selector.modify(connection.sock, events, connection)
+        except (KeyError, ValueError):
+            return
+        if connection.username in self.streams and not connection.backed_up:
+            self._pump_stream(connection.username, connection)
     
     def _accept_connections(self):
         """Accept incoming player connections"""
-        while self.running:
+        while True:
             try:
                 client_socket, address = self.server_socket.accept()
-                print(f"🔌 New connection from {address[0]}:{address[1]}")
-                
-                # Handle this client in a separate thread
-                client_thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket, address),
-                    daemon=True
-                )
-                client_thread.start()
-                
-            except Exception as e:
-                if self.running:
-                    print(f"⚠️ Error accepting connection: {e}")
+            except (BlockingIOError, InterruptedError):
+                return
+            print(f"🔌 New connection from {address[0]}:{address[1]}")
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            connection = ClientConnection(client_socket, address)
+            self.connections[client_socket.fileno()] = connection
+            self.selector.register(client_socket, selectors.EVENT_READ, connection)
     
-    def _handle_client(self, client_socket: socket.socket, address: tuple):
-        """Handle communication with a connected player"""
-        username = None
-        buffer = ""  # Buffer for incomplete messages
+    def _read_from(self, connection: ClientConnection):
+        """Handle data from a connected player"""
+        data = connection.recv()
+        if data is None:
+            return
+        if not data:
+            connection.close_reason = connection.close_reason or "disconnected"
+            return
         
+        decoder = connection.decoder
+        malformed = decoder.malformed
+        try:
+            messages = decoder.feed(data)
+        except ProtocolError as e:
+            print(f"⚠️ Dropping client {connection.username}: {e}")
+            connection.stats.record_malformed()
+            connection.close_reason = str(e)
+            return
+        if decoder.malformed > malformed:
+            connection.stats.record_malformed(decoder.malformed - malformed)
+        
+        for message, size in zip(messages, decoder.sizes):
+            msg_type = message.get("type")
+            connection.stats.record_in(msg_type, size)
+            if connection.close_reason:
+                break
+            if msg_type == "pong":
+                connection.stats.finish_ping(message.get("id"))
+            elif msg_type == "ping":
+                self._send_to_client(connection, {"type": "pong", "id": message.get("id")})
+            elif connection.username is None:
+                # First message should be login
+                if message.get("type") == "join":
+                    connection.username = self._handle_join(connection, message)
+            else:
+                try:
+                    self._process_client_message(connection.username, message)
+                except Exception as e:
+                    print(f"⚠️ Error handling client {connection.username}: {e}")
+    
+    def _close_connection(self, connection: ClientConnection):
+        """Remove a client: last non-blocking flush, then clean up their player"""
         try:
-            # Set socket to non-blocking mode to avoid hanging
-            client_socket.settimeout(30.0)
+            self.selector.unregister(connection.sock)
+        except (KeyError, ValueError):
+            pass
+        self.connections.pop(connection.sock.fileno(), None)
+        self.udp_sessions.pop(connection.udp_token, None)
+        self.udp_filter.forget(connection)
+        connection.flush()
+        connection.close()
+        
+        username = connection.username
+        if username:
+            with self.player_lock:
+                if self.players.get(username, {}).get("connection") is connection:
+                    del self.players[username]
+            with self.stream_lock:
+                self.streams.pop(username, None)
+            self.interest.remove(username)
             
-            # First message should be login
-            data = client_socket.recv(4096).decode('utf-8')
-            if not data:
-                return
+            # Notify other players
+            self._broadcast({
+                "type": "player_left",
+                "username": username
+            })
             
-            buffer += data
-            if '\n' in buffer:
-                line, buffer = buffer.split('\n', 1)
-                message = json.loads(line)
+            if connection.close_reason not in ("disconnected", "server full"):
+                print(f"⚠️ Disconnected {username}: {connection.close_reason}")
+            print(f"👋 {username} left the game")
+    
+    def _handle_join(self, connection: ClientConnection, message: Dict) -> Optional[str]:
+        """Register a joining player and send them the world; returns their username (None if full)"""
+        username = message.get("username", f"Player_{connection.address[1]}")
+        spawn_x = self.world_data.get("player", {}).get("x", 0)
+        spawn_y = self.world_data.get("player", {}).get("y", 100)
+        
+        # Add player to server
+        with self.player_lock:
+            if len(self.players) >= self.max_players:
+                full = True
             else:
-                message = json.loads(data)
-            
-            if message.get("type") == "join":
-                username = message.get("username", f"Player_{address[1]}")
-                
-                # Add player to server
-                with self.player_lock:
-                    self.players[username] = {
-                        "socket": client_socket,
-                        "address": address,
-                        "position": (0, 100),
-                        "health": 10,
-                        "facing_direction": 1
-                    }
-                
-                # Send welcome message with world data
-                welcome = {
-                    "type": "welcome",
-                    "server_name": self.server_name,
-                    "world_name": self.world_name,
-                    "world_data": self.world_data,
-                    "players": list(self.players.keys())
+                full = False
+                self.players[username] = {
+                    "connection": connection,
+                    "address": connection.address,
+                    "position": (spawn_x, spawn_y),
+                    "health": 10,
+                    "facing_direction": 1,
+                    "snapshots": SnapshotBuffer()  # For drawing them smoothly on the host
                 }
-                self._send_to_client(client_socket, welcome)
-                
-                # Notify other players
-                self._broadcast({
-                    "type": "player_joined",
-                    "username": username,
-                    "position": self.players[username]["position"]
-                }, exclude_username=username)
-                
-                print(f"👋 {username} joined the game! ({len(self.players)} players total)")
-                
-                # Keep receiving messages from this client
-                while self.running:
-                    try:
-                        data = client_socket.recv(4096).decode('utf-8')
-                        if not data:
-                            break
-                        
-                        buffer += data
-                        while '\n' in buffer:
-                            line, buffer = buffer.split('\n', 1)
-                            if line.strip():
-                                try:
-                                    message = json.loads(line)
-                                    self._process_client_message(username, message)
-                                except json.JSONDecodeError:
-                                    pass  # Ignore malformed messages
-                    
-                    except socket.timeout:
-                        continue  # Keep connection alive
+        if full:
+            self._send_to_client(connection, {"type": "server_full", "max_players": self.max_players})
+            connection.close_reason = "server full"
+            print(f"🚫 Turned away {username}: server full ({self.max_players} players)")
+            return None
         
-        except Exception as e:
-            print(f"⚠️ Error handling client {username}: {e}")
+        # Send a small welcome; the blocks follow as a chunk stream
+        chunk_ids = self.chunk_index.chunk_ids()
+        existing = set(chunk_ids)
+        welcome = {
+            "type": "welcome",
+            "server_name": self.server_name,
+            "world_name": self.world_name,
+            "world_info": {key: value for key, value in self.world_data.items() if key != "blocks"},
+            "chunk_size": self.chunk_size,
+            "total_chunks": len(chunk_ids),
+            "spawn_chunks": [cx for cx in spawn_chunks(spawn_x, self.chunk_size) if cx in existing],
+            "players": list(self.players.keys())
+        }
+        if message.get("udp") and self.udp_socket:
+            # Offer the UDP state channel; it opens once the client's hello arrives
+            connection.udp_token = new_session_token()
+            self.udp_sessions[connection.udp_token] = connection
+            welcome["udp_token"] = connection.udp_token
+            welcome["udp_port"] = self.port
+        self._send_to_client(connection, welcome)
+        connection.stats.reconnects = self.join_counts.get(username, 0)
+        self.join_counts[username] = connection.stats.reconnects + 1
         
-        finally:
-            # Remove player on disconnect
-            if username:
-                with self.player_lock:
-                    if username in self.players:
-                        del self.players[username]
-                
-                # Notify other players
-                self._broadcast({
-                    "type": "player_left",
-                    "username": username
-                })
-                
-                print(f"👋 {username} left the game")
-            
-            try:
-                client_socket.close()
-            except:
-                pass
+        with self.stream_lock:
+            self.streams[username] = ChunkStream(chunk_ids, self.chunk_index.chunk_of(spawn_x))
+        self._pump_stream(username, connection)
+        
+        # Start receiving updates for the chunks around spawn
+        self._update_interest(username, spawn_x)
+        
+        # Notify other players
+        self._broadcast({
+            "type": "player_joined",
+            "username": username,
+            "position": self.players[username]["position"]
+        }, exclude_username=username)
+        
+        print(f"👋 {username} joined the game! ({len(self.players)} players total)")
+        return username
     
     def _process_client_message(self, username: str, message: Dict):
         """Process a message from a client"""
         msg_type = message.get("type")
         
         if msg_type == "player_update":
-            # Update player position and state
-            with self.player_lock:
-                if username in self.players:
-                    self.players[username]["position"] = message.get("position", (0, 0))
-                    self.players[username]["health"] = message.get("health", 10)
-                    self.players[username]["facing_direction"] = message.get("facing_direction", 1)
+            # Stream the chunks around where the player actually is first
+            position = message.get("position")
+            stream = self.streams.get(username)
+            if stream and position:
+                with self.stream_lock:
+                    stream.reprioritize(self.chunk_index.chunk_of(position[0]))
             
-            # Broadcast to other players
-            self._broadcast({
-                "type": "player_update",
-                "username": username,
-                "position": message.get("position"),
-                "health": message.get("health"),
-                "facing_direction": message.get("facing_direction")
-            }, exclude_username=username)
+            # Update player state and pass it on to players in range
+            self.update_player_state(username, position or (0, 0), message.get("health", 10),
+                                     message.get("facing_direction", 1), message.get("t"))
         
         elif msg_type == "block_change":
             # Synchronize block changes
-            x, y = message.get("x"), message.get("y")
-            block_type = message.get("block_type")
-            self.world_blocks[f"{x},{y}"] = block_type
-            
-            # Broadcast to all players
-            self._broadcast({
-                "type": "block_change",
-                "username": username,
-                "x": x,
-                "y": y,
-                "block_type": block_type
-            })
+            self.broadcast_block_change(username, message.get("x"), message.get("y"), message.get("block_type"))
+        
+        elif msg_type == "block_batch":
+            # A tick's worth of block changes from one client
+            for chunk in message.get("chunks", []):
+                _, blocks, _ = decode_batch_chunk(chunk, self.chunk_size)
+                for key, block_type in blocks.items():
+                    x, y = parse_block_key(key)
+                    self.broadcast_block_change(username, x, y, block_type)
+        
+        elif msg_type == "chunk_ack":
+            # Client finished applying streamed chunks - send more
+            stream = self.streams.get(username)
+            if stream:
+                with self.stream_lock:
+                    stream.ack(message.get("count", 1))
+                with self.player_lock:
+                    connection = self.players.get(username, {}).get("connection")
+                if connection:
+                    self._pump_stream(username, connection)
         
         elif msg_type == "chat":
             # Broadcast chat message
@@ -280,58 +466,342 @@ class LANServer:
             self.is_day = message.get("is_day", True)
             self.weather = message.get("weather", "clear")
     
-    def _send_to_client(self, client_socket: socket.socket, message: Dict):
+    def update_player_state(self, username: str, position, health: int, facing_direction: int,
+                            sent_at: float = None):
+        """Record a player's position/state and send it to the players who can see them.
+        
+        ``sent_at`` is the sender's timestamp, passed on so receivers can interpolate.
+        """
+        now = time.time()
+        sent_at = now if sent_at is None else sent_at
+        with self.player_lock:
+            if username not in self.players:
+                return
+            state = self.players[username]
+            state["position"] = position
+            state["health"] = health
+            state["facing_direction"] = facing_direction
+            if "snapshots" in state:
+                state["snapshots"].add(position[0], position[1], now, sent_at)
+        
+        self._update_interest(username, position[0])
+        self._send_state({
+            "type": "player_update",
+            "username": username,
+            "position": position,
+            "health": health,
+            "facing_direction": facing_direction,
+            "t": sent_at
+        }, self.interest.observers_of(username))
+    
+    def _update_interest(self, username: str, x: float):
+        """Move a player's interest area; sends enter/leave events and catches up skipped chunks"""
+        entered_chunks, events = self.interest.update_position(username, self.chunk_index.chunk_of(x))
+        
+        for observer, subject, entered in events:
+            if entered:
+                with self.player_lock:
+                    state = self.players.get(subject)
+                    if not state:
+                        continue
+                    message = {
+                        "type": "entity_enter",
+                        "username": subject,
+                        "position": state["position"],
+                        "health": state["health"],
+                        "facing_direction": state["facing_direction"]
+                    }
+            else:
+                message = {"type": "entity_leave", "username": subject}
+            self._send_to_players(message, [observer])
+        
+        # Chunks that changed while this player was away are resent whole
+        missed = self.interest.take_missed(username, entered_chunks)
+        if missed:
+            with self.stream_lock:
+                entries = [full_chunk_entry(self.chunk_index, cx, span) for cx, span in missed.items()]
+                self._send_to_players(build_batch_message(entries), [username])
+    
+    def broadcast_block_change(self, username: str, x: int, y: int, block_type):
+        """Apply a block change to the server's world; players get it on the next network tick"""
+        self.world_blocks[f"{x},{y}"] = block_type
+        with self.stream_lock:
+            if self.chunk_index:
+                self.chunk_index.set_block(x, y, block_type)
+            self.block_batcher.add(x, y, block_type, username)
+        if self.on_block_change:
+            self.on_block_change(username, x, y, block_type)
+    
+    def flush_block_changes(self):
+        """Send this tick's block changes: one frame per player, only for chunks they can see"""
+        # Same lock as streaming, so a chunk can't overtake a change to it
+        with self.stream_lock:
+            entries = self.block_batcher.flush(self.chunk_index)
+            if not entries:
+                return
+            frames = {}  # Players seeing the same chunks share one encoded frame
+            with self.player_lock:
+                connections = [(username, player_data["connection"]) for username, player_data in self.players.items()
+                               if player_data["connection"] is not None]
+            for username, connection in connections:
+                visible = self.interest.chunks_of(username)
+                included = []
+                for i, entry in enumerate(entries):
+                    if entry["editors"] == {username}:
+                        continue  # Only this player changed it - they already have it
+                    if entry["cx"] in visible:
+                        included.append(i)
+                    else:
+                        self.interest.note_missed(username, entry["cx"], entry["y_min"], entry["y_max"])
+                if not included:
+                    continue
+                key = tuple(included)
+                frame = frames.get(key)
+                if frame is None:
+                    frame = frames[key] = encode_message(build_batch_message([entries[i] for i in included]))
+                self._queue_frame(connection, frame, msg_type="block_batch")
+    
+    def broadcast_entities(self, entities: List[Dict]):
+        """Send each player a snapshot of the server-simulated mobs in their view"""
+        with self.player_lock:
+            usernames = [username for username, player_data in self.players.items()
+                         if player_data["connection"] is not None]
+        for username in usernames:
+            visible = self.interest.chunks_of(username)
+            mobs = [[entity["id"], entity["type"], round(entity["x"], 2), round(entity["y"], 2), entity.get("hp", 0)]
+                    for entity in entities if "id" in entity and self.chunk_index.chunk_of(entity["x"]) in visible]
+            # Droppable (and UDP if available): the next snapshot replaces this one anyway
+            self._send_state({"type": "mob_snapshot", "mobs": mobs}, [username])
+    
+    def _pump_stream(self, username: str, connection: ClientConnection):
+        """Queue the next world chunks a player is waiting for (within its window)"""
+        if connection.backed_up:
+            return  # Resumes from _write_to once their queue drains
+        with self.stream_lock:
+            stream = self.streams.get(username)
+            if not stream:
+                return
+            batch = stream.next_chunks()
+            for index, cx in enumerate(batch, stream.sent - len(batch) + 1):
+                self._send_to_client(connection, {
+                    "type": "world_chunk",
+                    "cx": cx,
+                    "index": index,
+                    "total": stream.total,
+                    "data": self.chunk_index.encode(cx)
+                })
+            if stream.done:
+                del self.streams[username]
+                print(f"📦 Finished streaming world to {username} ({stream.total} chunks)")
+    
+    def _queue_frame(self, connection: ClientConnection, frame: bytes, droppable: bool = False,
+                     msg_type: str = None):
+        """Hand a frame to a client's send queue; the event loop writes it"""
+        connection.enqueue(frame, droppable, msg_type)
+        with self.dirty_lock:
+            self.dirty.add(connection)
+        if threading.current_thread() is not self.loop_thread:
+            self._wake()
+    
+    def _send_to_client(self, connection: ClientConnection, message: Dict):
         """Send a message to a specific client"""
-        try:
-            data = json.dumps(message).encode('utf-8')
-            client_socket.send(data + b'\n')
-        except Exception as e:
-            print(f"⚠️ Error sending to client: {e}")
+        self._queue_frame(connection, encode_message(message), msg_type=message.get("type"))
+    
+    def _send_to_players(self, message: Dict, usernames: List[str], droppable: bool = False):
+        """Send a message to some players (encoded once)"""
+        if not usernames:
+            return
+        frame = encode_message(message)
+        with self.player_lock:
+            connections = [self.players.get(username, {}).get("connection") for username in usernames]
+        for connection in connections:
+            if connection is not None:
+                self._queue_frame(connection, frame, droppable, message.get("type"))
+    
+    def _send_state(self, message: Dict, usernames: List[str]):
+        """Send a droppable state update: over UDP where the client has it, else TCP"""
+        if not usernames:
+            return
+        frame = encode_message(message)
+        with self.player_lock:
+            connections = [self.players.get(username, {}).get("connection") for username in usernames]
+        for connection in connections:
+            if connection is None:
+                continue
+            address = connection.udp_address
+            if address and self.udp_socket and DATAGRAM.size + len(frame) <= MAX_DATAGRAM_SIZE:
+                datagram = pack_datagram(KIND_STATE, connection.udp_token, connection.next_udp_sequence(), frame)
+                try:
+                    self.udp_socket.sendto(datagram, address)
+                    connection.stats.record_out(message.get("type"), len(datagram))
+                    continue
+                except (BlockingIOError, InterruptedError):
+                    connection.dropped += 1  # Socket buffer full: a newer update will follow
+                    connection.stats.record_dropped()
+                    continue
+                except OSError:
+                    connection.udp_address = None  # Channel broken, back to TCP
+            self._queue_frame(connection, frame, True, message.get("type"))
     
     def _broadcast(self, message: Dict, exclude_username: str = None):
         """Broadcast a message to all connected players"""
+        frame = encode_message(message)  # Encode once, send to everyone
         with self.player_lock:
-            for username, player_data in self.players.items():
-                if username != exclude_username and player_data["socket"] is not None:
-                    self._send_to_client(player_data["socket"], message)
+            connections = [player_data["connection"] for username, player_data in self.players.items()
+                           if username != exclude_username and player_data["connection"] is not None]
+        for connection in connections:
+            self._queue_frame(connection, frame, msg_type=message.get("type"))
     
-    def _discovery_responder(self):
-        """Respond to server discovery broadcasts"""
+    def _start_discovery(self):
+        """Open the UDP socket that answers server discovery broadcasts"""
         try:
-            # Create UDP socket for discovery
             self.discovery_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.discovery_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.discovery_socket.bind(('', self.discovery_port))
-            
+            self.discovery_socket.setblocking(False)
+            self.selector.register(self.discovery_socket, selectors.EVENT_READ, "discovery")
             print(f"🔍 Discovery responder listening on port {self.discovery_port}")
+        except Exception as e:
+            print(f"⚠️ Failed to start discovery responder: {e}")
+            self.discovery_socket = None
+    
+    def _start_udp(self):
+        """Open the UDP state channel on the game port (TCP alone still works without it)"""
+        try:
+            self.udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.udp_socket.bind((self.host, self.port))
+            self.udp_socket.setblocking(False)
+            self.selector.register(self.udp_socket, selectors.EVENT_READ, "udp")
+        except Exception as e:
+            print(f"⚠️ UDP state channel unavailable, using TCP only: {e}")
+            if self.udp_socket:
+                self.udp_socket.close()
+            self.udp_socket = None
+    
+    def _read_datagrams(self):
+        """Handle UDP hellos and position updates from clients"""
+        while True:
+            try:
+                data, address = self.udp_socket.recvfrom(MAX_DATAGRAM_SIZE)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                return  # e.g. ICMP port unreachable from a client that went away
+            
+            datagram = unpack_datagram(data)
+            if datagram is None:
+                continue
+            kind, token, sequence, frame = datagram
+            connection = self.udp_sessions.get(token)
+            if connection is None or connection.close_reason:
+                continue
             
-            while self.running:
+            if kind == KIND_HELLO:
+                connection.stats.record_in("udp_hello", len(data))
+                if connection.udp_address is None:
+                    print(f"📶 UDP state channel open for {connection.username}")
+                connection.udp_address = address
                 try:
-                    data, addr = self.discovery_socket.recvfrom(1024)
-                    message = data.decode('utf-8')
-                    
-                    if message == "DISCOVER_SERVER":
-                        # Respond with server info
-                        response = {
-                            "server_name": self.server_name,
-                            "host_player": self.host_player_name,
-                            "world_name": self.world_name,
-                            "players": len(self.players),
-                            "max_players": 10,
-                            "port": self.port
-                        }
-                        response_data = json.dumps(response).encode('utf-8')
-                        self.discovery_socket.sendto(response_data, addr)
-                        print(f"📡 Responded to discovery request from {addr[0]}")
-                
-                except socket.timeout:
+                    self.udp_socket.sendto(pack_datagram(KIND_READY, token, 0), address)
+                except OSError:
+                    pass
+            elif kind == KIND_STATE and address == connection.udp_address:
+                if not self.udp_filter.accept(connection, sequence):
+                    continue  # Older than one we've already used
+                message = decode_frame(frame)
+                if message is None:
+                    connection.stats.record_malformed()
                     continue
-                except Exception as e:
-                    if self.running:
-                        print(f"⚠️ Discovery error: {e}")
+                connection.stats.record_in(message.get("type"), len(data))
+                # Only position updates may come this way; everything else needs TCP
+                if message and message.get("type") == "player_update" and connection.username:
+                    try:
+                        self._process_client_message(connection.username, message)
+                    except Exception as e:
+                        print(f"⚠️ Error handling client {connection.username}: {e}")
+    
+    def _answer_discovery(self):
+        """Respond to server discovery broadcasts"""
+        try:
+            data, addr = self.discovery_socket.recvfrom(1024)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            print(f"⚠️ Discovery error: {e}")
+            return
         
-        except Exception as e:
-            print(f"⚠️ Failed to start discovery responder: {e}")
+        if data == b"DISCOVER_SERVER":
+            # Respond with server info
+            response = {
+                "server_name": self.server_name,
+                "host_player": self.host_player_name,
+                "world_name": self.world_name,
+                "players": len(self.players),
+                "max_players": self.max_players,
+                "port": self.port
+            }
+            response_data = json.dumps(response).encode('utf-8')
+            try:
+                self.discovery_socket.sendto(response_data, addr)
+                print(f"📡 Responded to discovery request from {addr[0]}")
+            except OSError as e:
+                print(f"⚠️ Discovery error: {e}")
+    
+    def _ping_clients(self):
+        """Ping every player (RTT); each ping carries their last measured RTT back to them"""
+        for connection in list(self.connections.values()):
+            if connection.username is None or connection.close_reason:
+                continue
+            stats = connection.stats
+            self._send_to_client(connection, {
+                "type": "ping",
+                "id": stats.start_ping(),
+                "rtt": round(stats.rtt * 1000, 1) if stats.rtt is not None else None
+            })
+    
+    def get_network_stats(self) -> Dict:
+        """Traffic counters per connected player plus server totals"""
+        players = {}
+        for connection in list(self.connections.values()):
+            if connection.username is None:
+                continue
+            stats = connection.stats.snapshot()
+            stats["send_queue_bytes"] = connection.queued_bytes
+            stats["send_queue_frames"] = len(connection.queue)
+            stats["transport"] = "udp+tcp" if connection.udp_address else "tcp"
+            players[connection.username] = stats
+        
+        rtts = [stats["rtt_ms"] for stats in players.values() if stats["rtt_ms"] is not None]
+        totals = {
+            "players": len(players),
+            "bytes_in_per_s": round(sum(stats["bytes_in_per_s"] for stats in players.values()), 1),
+            "bytes_out_per_s": round(sum(stats["bytes_out_per_s"] for stats in players.values()), 1),
+            "total_bytes_in": sum(stats["total_bytes_in"] for stats in players.values()),
+            "total_bytes_out": sum(stats["total_bytes_out"] for stats in players.values()),
+            "send_queue_bytes": sum(stats["send_queue_bytes"] for stats in players.values()),
+            "max_rtt_ms": max(rtts) if rtts else None,
+            "malformed": sum(stats["malformed"] for stats in players.values()),
+            "dropped": sum(stats["dropped"] for stats in players.values()),
+            "reconnects": sum(stats["reconnects"] for stats in players.values()),
+        }
+        return {"time": time.time(), "totals": totals, "players": players}
+    
+    def _write_stats_log(self):
+        """Periodic stats: a one-line console summary, plus a JSON line when stats_log_path is set"""
+        stats = self.get_network_stats()
+        totals = stats["totals"]
+        if not totals["players"]:
+            return
+        rtt = f"{totals['max_rtt_ms']} ms" if totals["max_rtt_ms"] is not None else "n/a"
+        print(f"📈 Net: {totals['players']} players, in {format_rate(totals['bytes_in_per_s'])}, "
+              f"out {format_rate(totals['bytes_out_per_s'])}, worst RTT {rtt}, "
+              f"queued {totals['send_queue_bytes']} B, malformed {totals['malformed']}")
+        if self.stats_log_path:
+            try:
+                with open(self.stats_log_path, "a") as f:
+                    f.write(json.dumps(stats) + "\n")
+            except OSError as e:
+                print(f"⚠️ Could not write network stats log: {e}")
     
     def get_player_count(self) -> int:
         """Get the current number of connected players"""
@@ -343,22 +813,17 @@ class LANServer:
         with self.player_lock:
             return list(self.players.keys())
     
-    def _broadcast_game_state(self):
-        """Periodically broadcast game state (time/weather) to all clients"""
-        while self.running:
-            try:
-                # Broadcast game state every second (not every frame!)
-                time.sleep(1.0)
-                
-                # Send time sync to all clients
-                self._broadcast({
-                    "type": "time_sync",
-                    "game_time": self.game_time,
-                    "is_day": self.is_day,
-                    "weather": self.weather
-                })
-                
-            except Exception as e:
-                if self.running:
-                    print(f"⚠️ Error broadcasting game state: {e}")
-
+    def get_remote_players(self) -> Dict[str, Dict]:
+        """Connected players (not the host) at their interpolated positions, for drawing"""
+        now = time.time()
+        result = {}
+        with self.player_lock:
+            for username, state in self.players.items():
+                if state.get("connection") is None:
+                    continue
+                result[username] = {
+                    "position": state["snapshots"].sample(now) or state["position"],
+                    "health": state["health"],
+                    "facing_direction": state["facing_direction"]
+                }
+        return result
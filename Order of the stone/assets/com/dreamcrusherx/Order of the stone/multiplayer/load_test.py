@@ -0,0 +1,338 @@
+"""
+Network load test for Order of the Stone LAN multiplayer
+Spawns headless bot clients over loopback that join, walk, break/place blocks and chat,
+then reports server CPU, message latency percentiles, bytes/sec and dropped connections.
+
+Run from the game folder (no display needed):
+    python -m multiplayer.load_test --bots 30 --duration 30
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Allow running as a script as well as with -m
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from multiplayer.lan_server import LANServer
+from multiplayer.lan_client import LANClient
+from multiplayer.block_sync import decode_batch_chunk, NETWORK_TICK_RATE
+from multiplayer.interpolation import AdaptiveSendRate
+
+GROUND_Y = 100          # Top of the flat test world
+BOT_TICK = 1.0 / NETWORK_TICK_RATE  # Seconds between bot actions (same as the network tick)
+WALK_SPEED = 4.0        # Tiles per second
+CHAT_PREFIX = "load "   # Chat lines the bots time: "load <sent time>"
+
+
+def build_flat_world(width: int) -> Dict:
+    """Grass on dirt on stone, ``width`` columns wide (no world generator needed)"""
+    blocks = {}
+    for x in range(width):
+        blocks[f"{x},{GROUND_Y}"] = "grass"
+        for y in range(GROUND_Y + 1, GROUND_Y + 4):
+            blocks[f"{x},{y}"] = "dirt"
+        for y in range(GROUND_Y + 4, GROUND_Y + 10):
+            blocks[f"{x},{y}"] = "stone"
+    return {"blocks": blocks, "player": {"x": width / 2, "y": GROUND_Y - 2}}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of unsorted values (0 for none)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(values: List[float]) -> Dict:
+    """Latency summary in milliseconds"""
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p90_ms": round(percentile(values, 90) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+        "max_ms": round(max(values) * 1000, 2) if values else 0.0,
+    }
+
+
+class LoadStats:
+    """Latency samples and counters shared by every bot"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = {}
+        self.sent: Dict[str, int] = {}
+        self.block_times: Dict[tuple, float] = {}  # (x, y, block) -> send time
+
+    def record(self, kind: str, seconds: float):
+        with self.lock:
+            self.latencies.setdefault(kind, []).append(seconds)
+
+    def count_sent(self, kind: str):
+        with self.lock:
+            self.sent[kind] = self.sent.get(kind, 0) + 1
+
+    def reset(self):
+        """Forget warm-up samples (joins are kept)"""
+        with self.lock:
+            self.latencies = {kind: values for kind, values in self.latencies.items() if kind == "join"}
+            self.sent.clear()
+
+
+class BotClient(LANClient):
+    """A headless player: walks back and forth, edits blocks and chats at set rates"""
+
+    def __init__(self, username: str, stats: LoadStats, home_x: float, block_rate: float,
+                 chat_rate: float, fixed_rate: Optional[float] = None):
+        super().__init__(username)
+        self.load_stats = stats
+        self.home_x = home_x
+        self.x = home_x
+        self.direction = random.choice((-1, 1))
+        self.block_rate = block_rate
+        self.chat_rate = chat_rate
+        self.fixed_rate = fixed_rate
+        self.send_rate = AdaptiveSendRate()
+        self.last_sent = 0.0
+        self.placed: Optional[tuple] = None  # Block we put down and will break next
+        self.joined_at: Optional[float] = None
+        self.connect_time = 0.0
+        self.lost = False  # Disconnected without us asking
+
+    def _process_server_message(self, message: Dict):
+        """Time the messages bots care about; leave the rest to the normal client"""
+        now = time.time()
+        msg_type = message.get("type")
+        if msg_type == "player_update":
+            if message.get("t") is not None:
+                self.load_stats.record("player_update", now - message["t"])
+        elif msg_type == "chat":
+            text = message.get("message", "")
+            if text.startswith(CHAT_PREFIX):
+                self.load_stats.record("chat", now - float(text[len(CHAT_PREFIX):]))
+        elif msg_type == "block_batch":
+            # Bots keep no world: time the deltas instead of queueing them
+            for chunk in message.get("chunks", []):
+                _, blocks, replace_span = decode_batch_chunk(chunk, self.chunk_size)
+                if replace_span is not None:
+                    continue  # Whole-chunk resend, can't tell which block is new
+                for key, block in blocks.items():
+                    x, y = map(int, key.split(","))
+                    sent_at = self.load_stats.block_times.get((x, y, block))
+                    if sent_at is not None:
+                        self.load_stats.record("block_change", now - sent_at)
+        else:
+            super()._process_server_message(message)
+            if self.joined_at is None and self.is_spawn_area_ready():
+                self.joined_at = now
+                self.load_stats.record("join", now - self.connect_time)
+
+    def step(self, now: float):
+        """One bot tick: move, maybe edit a block or chat, send what's due"""
+        if not self.connected:
+            return
+        self.pending_chunks.clear()  # World data isn't kept
+        if self.joined_at is None:
+            return  # Still downloading the spawn area
+
+        # Walk back and forth around home
+        self.x += self.direction * WALK_SPEED * BOT_TICK
+        if abs(self.x - self.home_x) > 20:
+            self.direction = -self.direction
+        if self.fixed_rate:
+            due = now - self.last_sent >= 1.0 / self.fixed_rate
+        else:
+            due = self.send_rate.should_send(now, self.x, GROUND_Y - 2, (10, self.direction))
+        if due:
+            self.last_sent = now
+            self.send_player_update((self.x, GROUND_Y - 2), 10, self.direction)
+            self.load_stats.count_sent("player_update")
+
+        # Place a block, then break it on the next go
+        if random.random() < self.block_rate * BOT_TICK:
+            if self.placed:
+                x, y = self.placed
+                block, self.placed = None, None
+            else:
+                x, y = int(self.x) + random.randint(-3, 3), GROUND_Y - 1
+                block, self.placed = "stone", (x, y)
+            self.load_stats.block_times[(x, y, block)] = now
+            self.send_block_change(x, y, block)
+            self.load_stats.count_sent("block_change")
+        self.flush_block_changes()
+
+        if random.random() < self.chat_rate * BOT_TICK:
+            self.send_chat_message(f"{CHAT_PREFIX}{time.time():.6f}")
+            self.load_stats.count_sent("chat")
+
+
+def _serve(port: int, world_width: int, max_players: int, ready, measure, stop, results, verbose: bool):
+    """Server process: run a LANServer and report its CPU use for the measured window"""
+    if not verbose:
+        sys.stdout = open(os.devnull, "w")
+    server = LANServer("LoadTest", "Load Test World", max_players)
+    server.port = port
+    server.discovery_port = port + 1
+    server.start(build_flat_world(world_width), include_host=False)
+    ready.set()
+
+    measure.wait()
+    cpu_start, wall_start = time.process_time(), time.time()
+    stop.wait()
+    cpu, wall = time.process_time() - cpu_start, time.time() - wall_start
+
+    connections = list(server.connections.values())
+    results.put({
+        "cpu_seconds": round(cpu, 3),
+        "cpu_percent": round(100.0 * cpu / wall, 1) if wall > 0 else 0.0,
+        "connections": len(connections),
+        "udp_sessions": sum(1 for c in connections if c.udp_address),
+        "dropped_frames": sum(c.dropped for c in connections),
+        "network": server.get_network_stats()["totals"],
+    })
+    server.stop()
+
+
+def run_load_test(bots: int = 20, duration: float = 30.0, warmup: float = 3.0, port: int = 25575,
+                  host: Optional[str] = None, world_width: int = 2000, join_interval: float = 0.05,
+                  block_rate: float = 0.5, chat_rate: float = 0.05, fixed_rate: Optional[float] = None,
+                  use_udp: bool = True, verbose: bool = False) -> Dict:
+    """Run the load test and return the report (see ``print_report``)"""
+    server_process = None
+    ctx = multiprocessing.get_context("spawn")
+    ready, measure, stop = ctx.Event(), ctx.Event(), ctx.Event()
+    results = ctx.Queue()
+    if host is None:
+        # Own process, so its CPU time is the server's alone
+        server_process = ctx.Process(target=_serve, args=(port, world_width, bots + 1, ready, measure,
+                                                          stop, results, verbose), daemon=True)
+        server_process.start()
+        if not ready.wait(30):
+            raise RuntimeError("Load test server didn't start")
+        host = "127.0.0.1"
+
+    real_stdout = sys.stdout
+    if not verbose:
+        sys.stdout = open(os.devnull, "w")  # Each client prints joins/leaves
+    stats = LoadStats()
+    clients: List[BotClient] = []
+    try:
+        spacing = world_width / max(bots, 1)
+        for i in range(bots):
+            bot = BotClient(f"Bot{i:03d}", stats, (i + 0.5) * spacing, block_rate, chat_rate, fixed_rate)
+            bot.use_udp = use_udp
+            bot.connect_time = time.time()
+            if not bot.connect_to_server(host, port):
+                bot.lost = True
+            clients.append(bot)
+            time.sleep(join_interval)
+
+        def tick_for(seconds: float):
+            end = time.time() + seconds
+            next_tick = time.time()
+            while time.time() < end:
+                now = time.time()
+                for bot in clients:
+                    bot.step(now)
+                next_tick += BOT_TICK
+                time.sleep(max(0.0, next_tick - time.time()))
+
+        print(f"🤖 {bots} bots joined, warming up...", file=real_stdout)
+        tick_for(warmup)
+        stats.reset()
+        measure.set()
+        bytes_start = [(bot.bytes_sent, bot.bytes_received) for bot in clients]
+        print(f"⏱️ Measuring for {duration:.0f}s...", file=real_stdout)
+        start = time.time()
+        tick_for(duration)
+        elapsed = time.time() - start
+        bytes_sent = sum(bot.bytes_sent - before[0] for bot, before in zip(clients, bytes_start))
+        bytes_received = sum(bot.bytes_received - before[1] for bot, before in zip(clients, bytes_start))
+        lost = [bot.username for bot in clients if bot.lost or not bot.connected]
+    finally:
+        for bot in clients:
+            bot.disconnect()
+        stop.set()
+        if sys.stdout is not real_stdout:
+            sys.stdout.close()
+            sys.stdout = real_stdout
+
+    server = {}
+    if server_process:
+        try:
+            server = results.get(timeout=10)
+        except Exception:
+            server = {}
+        server_process.join(5)
+
+    with stats.lock:
+        latency = {kind: summarize(values) for kind, values in sorted(stats.latencies.items())}
+        sent = dict(stats.sent)
+    return {
+        "bots": bots,
+        "duration_s": round(elapsed, 1),
+        "transport": "udp+tcp" if use_udp else "tcp",
+        "joined": sum(1 for bot in clients if bot.joined_at is not None),
+        "dropped_connections": lost,
+        "server": server,
+        "latency": latency,
+        "sent": sent,
+        "bytes_per_sec": {"to_server": round(bytes_sent / elapsed), "from_server": round(bytes_received / elapsed)},
+    }
+
+
+def print_report(report: Dict):
+    print(f"\n📊 Load test: {report['bots']} bots for {report['duration_s']}s ({report['transport']})")
+    print(f"   Joined: {report['joined']}/{report['bots']}   Dropped connections: {len(report['dropped_connections'])}")
+    server = report["server"]
+    if server:
+        print(f"   Server CPU: {server['cpu_percent']}% ({server['cpu_seconds']}s)   "
+              f"UDP sessions: {server['udp_sessions']}   Frames skipped under back-pressure: {server['dropped_frames']}")
+        network = server.get("network", {})
+        print(f"   Worst RTT: {network.get('max_rtt_ms')} ms   Malformed frames: {network.get('malformed', 0)}")
+    rates = report["bytes_per_sec"]
+    print(f"   Traffic: {rates['to_server'] / 1024:.1f} KB/s to server, {rates['from_server'] / 1024:.1f} KB/s from server")
+    print(f"   {'message':<15}{'count':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for kind, row in report["latency"].items():
+        print(f"   {kind:<15}{row['count']:>8}{row['p50_ms']:>10}{row['p90_ms']:>10}{row['p99_ms']:>10}{row['max_ms']:>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the Order of the Stone LAN server with bot clients")
+    parser.add_argument("--bots", type=int, default=20, help="Number of bot players (default: 20)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to measure (default: 30)")
+    parser.add_argument("--warmup", type=float, default=3.0, help="Seconds after joining before measuring")
+    parser.add_argument("--port", type=int, default=25575, help="Game port for the test server (default: 25575)")
+    parser.add_argument("--host", default=None, help="Test an already running server instead of starting one")
+    parser.add_argument("--world-width", type=int, default=2000, help="Width of the flat test world in tiles")
+    parser.add_argument("--block-rate", type=float, default=0.5, help="Block edits per bot per second")
+    parser.add_argument("--chat-rate", type=float, default=0.05, help="Chat messages per bot per second")
+    parser.add_argument("--update-rate", type=float, default=None,
+                        help="Fixed position updates per second (default: adaptive, like the game)")
+    parser.add_argument("--tcp-only", action="store_true", help="Don't use the UDP state channel")
+    parser.add_argument("--json", default=None, help="Also write the report to this JSON file")
+    parser.add_argument("--verbose", action="store_true", help="Show client and server logs")
+    args = parser.parse_args(argv)
+
+    report = run_load_test(args.bots, args.duration, args.warmup, args.port, args.host, args.world_width,
+                           block_rate=args.block_rate, chat_rate=args.chat_rate, fixed_rate=args.update_rate,
+                           use_udp=not args.tcp_only, verbose=args.verbose)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    # Non-zero exit when players couldn't join or got dropped, for CI
+    return 0 if report["joined"] == report["bots"] and not report["dropped_connections"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+Network statistics for Order of the Stone LAN multiplayer
+Per-connection counters: messages and bytes by type, round-trip time, malformed frames
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+PING_INTERVAL = 2.0        # Seconds between server pings
+RTT_SMOOTHING = 0.2        # Weight of a new RTT sample in the smoothed value
+RATE_WINDOW = 1.0          # Seconds between traffic rate samples
+MAX_PENDING_PINGS = 8      # Unanswered pings remembered per connection
+
+
+class NetStats:
+    """Traffic counters for one connection (or one client), safe to update from any thread"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.messages_in: Dict[str, int] = {}
+        self.bytes_in: Dict[str, int] = {}
+        self.messages_out: Dict[str, int] = {}
+        self.bytes_out: Dict[str, int] = {}
+        self.total_in = 0
+        self.total_out = 0
+        self.malformed = 0      # Frames or datagrams that couldn't be decoded
+        self.dropped = 0        # Droppable updates skipped (back-pressure or full UDP buffer)
+        self.reconnects = 0
+        self.rtt: Optional[float] = None       # Smoothed round-trip time (seconds)
+        self.rtt_last: Optional[float] = None
+        self.pending_pings: Dict[int, float] = {}
+        self.next_ping_id = 1
+        # Traffic rates, resampled every RATE_WINDOW seconds
+        self._rate_sample = (time.time(), 0, 0, 0, 0)
+        self.rates = {"bytes_in": 0.0, "bytes_out": 0.0, "messages_in": 0.0, "messages_out": 0.0}
+
+    def record_in(self, msg_type: Optional[str], size: int):
+        msg_type = msg_type or "unknown"
+        with self.lock:
+            self.messages_in[msg_type] = self.messages_in.get(msg_type, 0) + 1
+            self.bytes_in[msg_type] = self.bytes_in.get(msg_type, 0) + size
+            self.total_in += size
+
+    def record_out(self, msg_type: Optional[str], size: int):
+        msg_type = msg_type or "unknown"
+        with self.lock:
+            self.messages_out[msg_type] = self.messages_out.get(msg_type, 0) + 1
+            self.bytes_out[msg_type] = self.bytes_out.get(msg_type, 0) + size
+            self.total_out += size
+
+    def record_malformed(self, count: int = 1):
+        with self.lock:
+            self.malformed += count
+
+    def record_dropped(self):
+        with self.lock:
+            self.dropped += 1
+
+    def start_ping(self, now: float = None) -> int:
+        """Remember a ping we're about to send; returns its id"""
+        now = time.time() if now is None else now
+        with self.lock:
+            ping_id = self.next_ping_id
+            self.next_ping_id += 1
+            self.pending_pings[ping_id] = now
+            if len(self.pending_pings) > MAX_PENDING_PINGS:
+                del self.pending_pings[min(self.pending_pings)]
+            return ping_id
+
+    def finish_ping(self, ping_id: int, now: float = None) -> Optional[float]:
+        """A pong came back; returns the round-trip time (None for unknown ids)"""
+        now = time.time() if now is None else now
+        with self.lock:
+            sent_at = self.pending_pings.pop(ping_id, None)
+            if sent_at is None:
+                return None
+        self.set_rtt(now - sent_at)
+        return now - sent_at
+
+    def set_rtt(self, rtt: float):
+        with self.lock:
+            self.rtt_last = rtt
+            self.rtt = rtt if self.rtt is None else self.rtt + (rtt - self.rtt) * RTT_SMOOTHING
+
+    def update_rates(self, now: float = None) -> Dict[str, float]:
+        """Per-second traffic since the last sample (resampled at most every RATE_WINDOW seconds)"""
+        now = time.time() if now is None else now
+        with self.lock:
+            t, b_in, b_out, m_in, m_out = self._rate_sample
+            elapsed = now - t
+            if elapsed >= RATE_WINDOW:
+                messages_in = sum(self.messages_in.values())
+                messages_out = sum(self.messages_out.values())
+                self.rates = {
+                    "bytes_in": (self.total_in - b_in) / elapsed,
+                    "bytes_out": (self.total_out - b_out) / elapsed,
+                    "messages_in": (messages_in - m_in) / elapsed,
+                    "messages_out": (messages_out - m_out) / elapsed,
+                }
+                self._rate_sample = (now, self.total_in, self.total_out, messages_in, messages_out)
+            return dict(self.rates)
+
+    def snapshot(self) -> Dict:
+        """Plain-dict copy of every counter (for the API, overlays and logs)"""
+        rates = self.update_rates()
+        with self.lock:
+            return {
+                "uptime_s": round(time.time() - self.started, 1),
+                "messages_in": dict(self.messages_in),
+                "bytes_in": dict(self.bytes_in),
+                "messages_out": dict(self.messages_out),
+                "bytes_out": dict(self.bytes_out),
+                "total_bytes_in": self.total_in,
+                "total_bytes_out": self.total_out,
+                "bytes_in_per_s": round(rates["bytes_in"], 1),
+                "bytes_out_per_s": round(rates["bytes_out"], 1),
+                "messages_in_per_s": round(rates["messages_in"], 1),
+                "messages_out_per_s": round(rates["messages_out"], 1),
+                "rtt_ms": round(self.rtt * 1000, 1) if self.rtt is not None else None,
+                "malformed": self.malformed,
+                "dropped": self.dropped,
+                "reconnects": self.reconnects,
+            }
+
+
+def format_rate(bytes_per_second: float) -> str:
+    """Human-readable traffic rate"""
+    if bytes_per_second >= 1024 * 1024:
+        return f"{bytes_per_second / (1024 * 1024):.1f} MB/s"
+    if bytes_per_second >= 1024:
+        return f"{bytes_per_second / 1024:.1f} KB/s"
+    return f"{bytes_per_second:.0f} B/s"
@@ -0,0 +1,406 @@
+"""
+Wire protocol for Order of the Stone LAN multiplayer
+Length-prefixed binary frames with compact payloads (and a JSON fallback for debugging)
+
+Every frame is::
+
+    uint32 payload length | uint8 protocol version | uint8 message type | payload
+
+Hot messages (player updates, block changes) have fixed ``struct`` layouts;
+everything else is packed with a small msgpack-style value encoder. Frames
+of type ``MSG_JSON`` carry plain UTF-8 JSON, which is handy when watching
+traffic with a packet sniffer - set ``OOTS_NET_JSON=1`` to send only JSON.
+"""
+
+import json
+import os
+import struct
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PROTOCOL_VERSION = 1
+
+HEADER = struct.Struct("!IBB")
+MAX_FRAME_SIZE = 16 * 1024 * 1024  # Anything bigger means the stream is corrupt
+
+# Message type ids
+MSG_JSON = 0
+MSG_PACKED = 1
+MSG_PLAYER_UPDATE = 2
+MSG_BLOCK_CHANGE = 3
+
+USE_JSON = os.environ.get("OOTS_NET_JSON") == "1"
+
+
+class ProtocolError(Exception):
+    """Raised when the byte stream can't be framed (wrong version, bad length)"""
+
+
+# ----------------------------------------------------------------------
+# Compact value packing (msgpack-style subset)
+# ----------------------------------------------------------------------
+
+_U8 = struct.Struct("!B")
+_U16 = struct.Struct("!H")
+_U32 = struct.Struct("!I")
+_I8 = struct.Struct("!b")
+_I16 = struct.Struct("!h")
+_I32 = struct.Struct("!i")
+_I64 = struct.Struct("!q")
+_F64 = struct.Struct("!d")
+
+
+def _pack_value(value: Any, out: bytearray):
+    """Append the packed form of a JSON-like value to ``out``"""
+    if value is None:
+        out.append(0xC0)
+    elif value is True:
+        out.append(0xC3)
+    elif value is False:
+        out.append(0xC2)
+    elif isinstance(value, int):
+        if 0 <= value < 0x80:
+            out.append(value)
+        elif -32 <= value < 0:
+            out.append(value & 0xFF)
+        elif -0x80 <= value < 0x80:
+            out.append(0xD0)
+            out += _I8.pack(value)
+        elif -0x8000 <= value < 0x8000:
+            out.append(0xD1)
+            out += _I16.pack(value)
+        elif -0x80000000 <= value < 0x80000000:
+            out.append(0xD2)
+            out += _I32.pack(value)
+        else:
+            out.append(0xD3)
+            out += _I64.pack(value)
+    elif isinstance(value, float):
+        out.append(0xCB)
+        out += _F64.pack(value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        size = len(data)
+        if size < 32:
+            out.append(0xA0 | size)
+        elif size < 0x100:
+            out.append(0xD9)
+            out.append(size)
+        elif size < 0x10000:
+            out.append(0xDA)
+            out += _U16.pack(size)
+        else:
+            out.append(0xDB)
+            out += _U32.pack(size)
+        out += data
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        size = len(value)
+        if size < 0x100:
+            out.append(0xC4)
+            out.append(size)
+        elif size < 0x10000:
+            out.append(0xC5)
+            out += _U16.pack(size)
+        else:
+            out.append(0xC6)
+            out += _U32.pack(size)
+        out += value
+    elif isinstance(value, (list, tuple)):
+        size = len(value)
+        if size < 16:
+            out.append(0x90 | size)
+        elif size < 0x10000:
+            out.append(0xDC)
+            out += _U16.pack(size)
+        else:
+            out.append(0xDD)
+            out += _U32.pack(size)
+        for item in value:
+            _pack_value(item, out)
+    elif isinstance(value, dict):
+        size = len(value)
+        if size < 16:
+            out.append(0x80 | size)
+        elif size < 0x10000:
+            out.append(0xDE)
+            out += _U16.pack(size)
+        else:
+            out.append(0xDF)
+            out += _U32.pack(size)
+        for key, item in value.items():
+            _pack_value(str(key), out)
+            _pack_value(item, out)
+    else:
+        raise TypeError(f"Can't pack value of type {type(value).__name__}")
+
+
+def pack_value(value: Any) -> bytes:
+    """Pack a JSON-like value into compact bytes"""
+    out = bytearray()
+    _pack_value(value, out)
+    return bytes(out)
+
+
+def _unpack_value(view: memoryview, offset: int) -> Tuple[Any, int]:
+    """Decode one value from ``view`` at ``offset``; returns (value, new offset)"""
+    tag = view[offset]
+    offset += 1
+    if tag < 0x80:
+        return tag, offset
+    if tag >= 0xE0:
+        return tag - 0x100, offset
+    if 0xA0 <= tag <= 0xBF:
+        size = tag & 0x1F
+        return str(view[offset:offset + size], "utf-8"), offset + size
+    if 0x90 <= tag <= 0x9F:
+        return _unpack_list(view, offset, tag & 0x0F)
+    if 0x80 <= tag <= 0x8F:
+        return _unpack_dict(view, offset, tag & 0x0F)
+    if tag == 0xC0:
+        return None, offset
+    if tag == 0xC2:
+        return False, offset
+    if tag == 0xC3:
+        return True, offset
+    if tag == 0xCB:
+        return _F64.unpack_from(view, offset)[0], offset + 8
+    if tag == 0xD0:
+        return _I8.unpack_from(view, offset)[0], offset + 1
+    if tag == 0xD1:
+        return _I16.unpack_from(view, offset)[0], offset + 2
+    if tag == 0xD2:
+        return _I32.unpack_from(view, offset)[0], offset + 4
+    if tag == 0xD3:
+        return _I64.unpack_from(view, offset)[0], offset + 8
+    if tag in (0xD9, 0xDA, 0xDB, 0xC4, 0xC5, 0xC6):
+        if tag in (0xD9, 0xC4):
+            size = view[offset]
+            offset += 1
+        elif tag in (0xDA, 0xC5):
+            size = _U16.unpack_from(view, offset)[0]
+            offset += 2
+        else:
+            size = _U32.unpack_from(view, offset)[0]
+            offset += 4
+        if offset + size > len(view):
+            raise ValueError("Truncated value")
+        data = view[offset:offset + size]
+        value = str(data, "utf-8") if tag in (0xD9, 0xDA, 0xDB) else bytes(data)
+        return value, offset + size
+    if tag == 0xDC:
+        return _unpack_list(view, offset + 2, _U16.unpack_from(view, offset)[0])
+    if tag == 0xDD:
+        return _unpack_list(view, offset + 4, _U32.unpack_from(view, offset)[0])
+    if tag == 0xDE:
+        return _unpack_dict(view, offset + 2, _U16.unpack_from(view, offset)[0])
+    if tag == 0xDF:
+        return _unpack_dict(view, offset + 4, _U32.unpack_from(view, offset)[0])
+    raise ValueError(f"Unknown value tag 0x{tag:02x}")
+
+
+def _unpack_list(view: memoryview, offset: int, size: int) -> Tuple[List, int]:
+    items = []
+    for _ in range(size):
+        item, offset = _unpack_value(view, offset)
+        items.append(item)
+    return items, offset
+
+
+def _unpack_dict(view: memoryview, offset: int, size: int) -> Tuple[Dict, int]:
+    result = {}
+    for _ in range(size):
+        key, offset = _unpack_value(view, offset)
+        result[key], offset = _unpack_value(view, offset)
+    return result, offset
+
+
+def unpack_value(data) -> Any:
+    """Decode bytes produced by :func:`pack_value`"""
+    view = memoryview(data)
+    value, offset = _unpack_value(view, 0)
+    if offset != len(view):
+        raise ValueError("Trailing bytes after value")
+    return value
+
+
+# ----------------------------------------------------------------------
+# Fixed layouts for hot messages
+# ----------------------------------------------------------------------
+
+_PLAYER_UPDATE = struct.Struct("!ddBb")
+_BLOCK_CHANGE = struct.Struct("!ii")
+
+
+def _pack_str8(value: Optional[str], out: bytearray) -> bool:
+    """Short optional string: uint8 length (0xFF = None) + UTF-8 bytes.
+
+    Returns False for strings longer than 254 bytes, so the caller can fall
+    back to the generic encoding instead of cutting the string.
+    """
+    if value is None:
+        out.append(0xFF)
+        return True
+    data = value.encode("utf-8")
+    if len(data) > 254:
+        return False
+    out.append(len(data))
+    out += data
+    return True
+
+
+def _unpack_str8(view: memoryview, offset: int) -> Tuple[Optional[str], int]:
+    size = view[offset]
+    offset += 1
+    if size == 0xFF:
+        return None, offset
+    return str(view[offset:offset + size], "utf-8"), offset + size
+
+
+def _encode_player_update(message: Dict) -> Optional[bytes]:
+    position = message.get("position") or (0.0, 0.0)
+    health = message.get("health")
+    facing = message.get("facing_direction", 1)
+    if not isinstance(health, int) or not 0 <= health < 255 or facing not in (-1, 1):
+        return None  # Unusual values go through the generic encoding
+    out = bytearray(_PLAYER_UPDATE.pack(float(position[0]), float(position[1]), health, facing))
+    if not _pack_str8(message.get("username"), out):
+        return None
+    if message.get("t") is not None:
+        out += _F64.pack(float(message["t"]))  # Optional send time, for interpolation
+    return bytes(out)
+
+
+def _decode_player_update(view: memoryview) -> Dict:
+    x, y, health, facing = _PLAYER_UPDATE.unpack_from(view, 0)
+    username, offset = _unpack_str8(view, _PLAYER_UPDATE.size)
+    message = {"type": "player_update", "position": [x, y], "health": health,
+               "facing_direction": facing}
+    if username is not None:
+        message["username"] = username
+    if len(view) >= offset + _F64.size:
+        message["t"] = _F64.unpack_from(view, offset)[0]
+    return message
+
+
+def _encode_block_change(message: Dict) -> Optional[bytes]:
+    out = bytearray(_BLOCK_CHANGE.pack(int(message["x"]), int(message["y"])))
+    if not (_pack_str8(message.get("block_type"), out) and _pack_str8(message.get("username"), out)):
+        return None  # Over-long names go through the generic encoding
+    return bytes(out)
+
+
+def _decode_block_change(view: memoryview) -> Dict:
+    x, y = _BLOCK_CHANGE.unpack_from(view, 0)
+    block_type, offset = _unpack_str8(view, _BLOCK_CHANGE.size)
+    username, _ = _unpack_str8(view, offset)
+    message = {"type": "block_change", "x": x, "y": y, "block_type": block_type}
+    if username is not None:
+        message["username"] = username
+    return message
+
+
+# message type name -> (type id, encoder returning bytes or None to fall back)
+_ENCODERS: Dict[str, Tuple[int, Callable[[Dict], Optional[bytes]]]] = {
+    "player_update": (MSG_PLAYER_UPDATE, _encode_player_update),
+    "block_change": (MSG_BLOCK_CHANGE, _encode_block_change),
+}
+
+_DECODERS: Dict[int, Callable[[memoryview], Dict]] = {
+    MSG_PLAYER_UPDATE: _decode_player_update,
+    MSG_BLOCK_CHANGE: _decode_block_change,
+    MSG_PACKED: lambda view: unpack_value(view),
+    MSG_JSON: lambda view: json.loads(str(view, "utf-8")),
+}
+
+
+def register_message(name: str, type_id: int, encoder: Callable[[Dict], Optional[bytes]],
+                     decoder: Callable[[memoryview], Dict]):
+    """Give a message type its own compact layout"""
+    _ENCODERS[name] = (type_id, encoder)
+    _DECODERS[type_id] = decoder
+
+
+# ----------------------------------------------------------------------
+# Framing
+# ----------------------------------------------------------------------
+
+def encode_message(message: Dict, use_json: bool = None) -> bytes:
+    """Encode a message dict into one complete frame"""
+    if use_json is None:
+        use_json = USE_JSON
+    payload = None
+    type_id = MSG_PACKED
+    if use_json:
+        type_id = MSG_JSON
+        payload = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    else:
+        codec = _ENCODERS.get(message.get("type"))
+        if codec:
+            payload = codec[1](message)
+            if payload is not None:
+                type_id = codec[0]
+        if payload is None:
+            type_id = MSG_PACKED
+            payload = pack_value(message)
+    return HEADER.pack(len(payload), PROTOCOL_VERSION, type_id) + payload
+
+
+class FrameDecoder:
+    """Incremental frame parser over a growable receive buffer.
+
+    Feed it whatever ``recv`` returned; it yields every complete message
+    and keeps partial frames for next time. Payloads are parsed straight
+    out of a ``memoryview`` so large frames aren't copied.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.malformed = 0  # Frames that framed correctly but failed to decode
+        self.sizes: List[int] = []  # Frame size of each message the last feed() returned
+
+    def feed(self, data: bytes) -> List[Dict]:
+        """Add received bytes; returns the complete messages now available"""
+        buffer = self.buffer
+        buffer += data
+        messages = []
+        sizes = []
+        offset = 0
+        size = len(buffer)
+        header_size = HEADER.size
+        with memoryview(buffer) as view:
+            while size - offset >= header_size:
+                length, version, type_id = HEADER.unpack_from(view, offset)
+                if version != PROTOCOL_VERSION:
+                    raise ProtocolError(f"Unsupported protocol version {version}")
+                if length > MAX_FRAME_SIZE:
+                    raise ProtocolError(f"Frame too large ({length} bytes)")
+                end = offset + header_size + length
+                if end > size:
+                    break
+                decoder = _DECODERS.get(type_id)
+                try:
+                    if decoder is None:
+                        raise ValueError(f"Unknown message type {type_id}")
+                    messages.append(decoder(view[offset + header_size:end]))
+                    sizes.append(end - offset)
+                except (ValueError, KeyError, IndexError, struct.error, UnicodeDecodeError):
+                    self.malformed += 1
+                offset = end
+        if offset:
+            del buffer[:offset]
+        self.sizes = sizes
+        return messages
+
+
+def decode_frame(frame: bytes) -> Optional[Dict]:
+    """Decode one complete frame on its own (e.g. a UDP datagram); None if it's malformed"""
+    if len(frame) < HEADER.size:
+        return None
+    length, version, type_id = HEADER.unpack_from(frame, 0)
+    decoder = _DECODERS.get(type_id)
+    if version != PROTOCOL_VERSION or decoder is None or HEADER.size + length != len(frame):
+        return None
+    try:
+        with memoryview(frame) as view:
+            return decoder(view[HEADER.size:])
+    except (ValueError, KeyError, IndexError, struct.error, UnicodeDecodeError):
+        return None
@@ -0,0 +1,77 @@
+"""
+Unreliable state channel for Order of the Stone LAN multiplayer
+Sequenced UDP datagrams for position updates, so one lost packet never holds up the
+ones behind it the way it does on TCP. Chat, blocks and joins stay on TCP.
+
+Every datagram is::
+
+    uint8 magic | uint8 kind | uint32 session token | uint32 sequence | frame
+
+The token is handed out in the TCP welcome and ties datagrams to a session;
+``frame`` is a normal protocol frame (see protocol.py).
+"""
+
+import os
+import random
+import struct
+from typing import Dict, Hashable, Optional, Tuple
+
+DATAGRAM = struct.Struct("!BBII")
+DATAGRAM_MAGIC = 0x4F
+MAX_DATAGRAM_SIZE = 1200   # Stays under a typical Wi-Fi MTU, so datagrams are never fragmented
+
+KIND_HELLO = 1     # Client -> server: "this is my UDP address" (sent until acknowledged)
+KIND_READY = 2     # Server -> client: hello received, state will come this way
+KIND_STATE = 3     # Either way: a sequenced, droppable state message
+
+HELLO_INTERVAL = 0.25  # Seconds between hello attempts
+HELLO_ATTEMPTS = 8     # Give up (and stay on TCP) after this many
+
+UDP_ENABLED = os.environ.get("OOTS_NET_NO_UDP") != "1"  # Set OOTS_NET_NO_UDP=1 to force TCP only
+
+
+def new_session_token() -> int:
+    """Random non-zero token identifying one player's UDP session"""
+    return random.SystemRandom().randrange(1, 1 << 32)
+
+
+def pack_datagram(kind: int, token: int, sequence: int, frame: bytes = b"") -> bytes:
+    return DATAGRAM.pack(DATAGRAM_MAGIC, kind, token, sequence & 0xFFFFFFFF) + frame
+
+
+def unpack_datagram(data: bytes) -> Optional[Tuple[int, int, int, bytes]]:
+    """(kind, token, sequence, frame), or None for anything that isn't ours"""
+    if len(data) < DATAGRAM.size:
+        return None
+    magic, kind, token, sequence = DATAGRAM.unpack_from(data, 0)
+    if magic != DATAGRAM_MAGIC:
+        return None
+    return kind, token, sequence, data[DATAGRAM.size:]
+
+
+def sequence_newer(a: int, b: int) -> bool:
+    """True if sequence ``a`` comes after ``b`` (32-bit wraparound safe)"""
+    return 0 < ((a - b) & 0xFFFFFFFF) < 0x80000000
+
+
+class SequenceFilter:
+    """Drop-old filter: only the newest datagram per key gets through.
+
+    Keys are whatever a datagram updates (e.g. the username of the player
+    it moves), so an old position never overwrites a newer one.
+    """
+
+    def __init__(self):
+        self.latest: Dict[Hashable, int] = {}
+        self.dropped = 0  # Late or duplicate datagrams thrown away
+
+    def accept(self, key: Hashable, sequence: int) -> bool:
+        last = self.latest.get(key)
+        if last is not None and not sequence_newer(sequence, last):
+            self.dropped += 1
+            return False
+        self.latest[key] = sequence
+        return True
+
+    def forget(self, key: Hashable):
+        self.latest.pop(key, None)
@@ -0,0 +1,216 @@
+"""
+World streaming for Order of the Stone LAN multiplayer
+Sends the world to joining players chunk by chunk, nearest chunks first
+"""
+
+import math
+import struct
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .protocol import register_message
+
+DEFAULT_CHUNK_SIZE = 50
+DEFAULT_WINDOW = 8        # Chunks a client may have un-acknowledged at once
+SPAWN_RADIUS_CHUNKS = 1   # Chunks either side of spawn needed before playing
+
+MSG_WORLD_CHUNK = 4
+
+_PALETTE_SIZE = struct.Struct("!H")
+_BLOCK_COUNT = struct.Struct("!I")
+_CHUNK_HEADER = struct.Struct("!iII")  # Chunk x, index, total
+
+
+def parse_block_key(key: str) -> Tuple[int, int]:
+    """Turn a world_data key "x,y" into integer coordinates"""
+    x, y = key.split(",")
+    return int(x), int(y)
+
+
+REMOVED = 0xFFFF  # Palette index meaning "no block here" (used by block deltas)
+
+
+def pack_blocks(blocks: Dict[Tuple[int, int], Optional[str]], origin_x: int) -> bytes:
+    """Pack blocks into the uncompressed palette layout.
+
+    Layout: palette (uint16 count + uint8-length names), uint32 block count,
+    then column arrays of x offsets (uint8), y (int16) and palette indexes
+    (uint16, ``REMOVED`` for a block that was taken away).
+    """
+    palette: Dict[str, int] = {}
+    xs, ys, ids = [], [], []
+    for (x, y), block in blocks.items():
+        if block is None or block == "air":
+            index = REMOVED
+        else:
+            index = palette.get(block)
+            if index is None:
+                index = palette[block] = len(palette)
+        xs.append(x - origin_x)
+        ys.append(y)
+        ids.append(index)
+
+    out = bytearray(_PALETTE_SIZE.pack(len(palette)))
+    for name in palette:
+        data = name.encode("utf-8")
+        out.append(len(data))
+        out += data
+    count = len(xs)
+    out += _BLOCK_COUNT.pack(count)
+    out += struct.pack(f"!{count}B", *xs)
+    out += struct.pack(f"!{count}h", *ys)
+    out += struct.pack(f"!{count}H", *ids)
+    return bytes(out)
+
+
+def unpack_blocks(raw: bytes, origin_x: int) -> Dict[str, Optional[str]]:
+    """Unpack the palette layout into world_data-style {"x,y": block} entries"""
+    raw = memoryview(raw)
+    (palette_size,) = _PALETTE_SIZE.unpack_from(raw, 0)
+    offset = _PALETTE_SIZE.size
+    palette = []
+    for _ in range(palette_size):
+        size = raw[offset]
+        palette.append(str(raw[offset + 1:offset + 1 + size], "utf-8"))
+        offset += 1 + size
+    (count,) = _BLOCK_COUNT.unpack_from(raw, offset)
+    offset += _BLOCK_COUNT.size
+    xs = struct.unpack_from(f"!{count}B", raw, offset)
+    offset += count
+    ys = struct.unpack_from(f"!{count}h", raw, offset)
+    offset += count * 2
+    ids = struct.unpack_from(f"!{count}H", raw, offset)
+    return {f"{origin_x + x},{y}": (None if i == REMOVED else palette[i]) for x, y, i in zip(xs, ys, ids)}
+
+
+def encode_chunk_blocks(blocks: Dict[Tuple[int, int], str], origin_x: int) -> bytes:
+    """Pack one chunk's blocks into a compressed, palette-based payload"""
+    return zlib.compress(pack_blocks(blocks, origin_x), 6)
+
+
+def decode_chunk_blocks(payload: bytes, origin_x: int) -> Dict[str, str]:
+    """Unpack a chunk payload into world_data-style {"x,y": block} entries"""
+    return unpack_blocks(zlib.decompress(payload), origin_x)
+
+
+def _encode_world_chunk(message: Dict) -> bytes:
+    return _CHUNK_HEADER.pack(message["cx"], message["index"], message["total"]) + message["data"]
+
+
+def _decode_world_chunk(view: memoryview) -> Dict:
+    cx, index, total = _CHUNK_HEADER.unpack_from(view, 0)
+    return {"type": "world_chunk", "cx": cx, "index": index, "total": total,
+            "data": bytes(view[_CHUNK_HEADER.size:])}
+
+
+register_message("world_chunk", MSG_WORLD_CHUNK, _encode_world_chunk, _decode_world_chunk)
+
+
+class ChunkIndex:
+    """The server's copy of the world, split into chunks with cached encodings"""
+
+    def __init__(self, blocks: Dict[str, str], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.chunks: Dict[int, Dict[Tuple[int, int], str]] = {}
+        self._encoded: Dict[int, bytes] = {}
+        self.lock = threading.RLock()
+        for key, block in blocks.items():
+            if block is None or block == "air":
+                continue
+            x, y = parse_block_key(key)
+            self.chunks.setdefault(x // chunk_size, {})[(x, y)] = block
+
+    def chunk_of(self, x: float) -> int:
+        """Chunk index for a world x coordinate"""
+        return math.floor(x / self.chunk_size)
+
+    def chunk_ids(self) -> List[int]:
+        """All chunks that contain blocks"""
+        with self.lock:
+            return sorted(self.chunks)
+
+    def get_block(self, x: int, y: int) -> Optional[str]:
+        """Block at a position (None if empty)"""
+        with self.lock:
+            chunk = self.chunks.get(x // self.chunk_size)
+            return chunk.get((x, y)) if chunk else None
+
+    def set_block(self, x: int, y: int, block_type: Optional[str]):
+        """Apply a block change (None or "air" removes the block)"""
+        cx = x // self.chunk_size
+        with self.lock:
+            chunk = self.chunks.setdefault(cx, {})
+            if block_type is None or block_type == "air":
+                chunk.pop((x, y), None)
+            else:
+                chunk[(x, y)] = block_type
+            self._encoded.pop(cx, None)
+
+    def encode(self, cx: int) -> bytes:
+        """Compressed payload for a chunk (cached until the chunk changes)"""
+        with self.lock:
+            data = self._encoded.get(cx)
+            if data is None:
+                data = encode_chunk_blocks(self.chunks.get(cx, {}), cx * self.chunk_size)
+                self._encoded[cx] = data
+            return data
+
+    def y_range(self, cx: int) -> Optional[Tuple[int, int]]:
+        """Lowest and highest y holding a block in a chunk (None if empty)"""
+        with self.lock:
+            ys = [y for _, y in self.chunks.get(cx, {})]
+            return (min(ys), max(ys)) if ys else None
+
+    def to_blocks(self) -> Dict[str, str]:
+        """Flatten back into world_data form"""
+        with self.lock:
+            return {f"{x},{y}": block for chunk in self.chunks.values() for (x, y), block in chunk.items()}
+
+
+class ChunkStream:
+    """Send order and flow control for streaming the world to one client.
+
+    Chunks go out nearest-first around the client's position; at most
+    ``window`` may be un-acknowledged, so a slow client isn't buried.
+    """
+
+    def __init__(self, chunk_ids: Iterable[int], center_chunk: int, window: int = DEFAULT_WINDOW):
+        self.remaining = list(chunk_ids)
+        self.total = len(self.remaining)
+        self.window = window
+        self.sent = 0
+        self.acked = 0
+        self.center_chunk = None
+        self.reprioritize(center_chunk)
+
+    @property
+    def done(self) -> bool:
+        return not self.remaining
+
+    def reprioritize(self, center_chunk: int):
+        """Re-sort the unsent chunks around a new position"""
+        if center_chunk == self.center_chunk:
+            return
+        self.center_chunk = center_chunk
+        # Farthest first so the next chunk to send can be popped off the end
+        self.remaining.sort(key=lambda cx: abs(cx - center_chunk), reverse=True)
+
+    def next_chunks(self) -> List[int]:
+        """Chunks to send now without exceeding the in-flight window"""
+        batch = []
+        while self.remaining and self.sent - self.acked < self.window:
+            batch.append(self.remaining.pop())
+            self.sent += 1
+        return batch
+
+    def ack(self, count: int = 1):
+        """The client finished processing ``count`` more chunks"""
+        self.acked = min(self.sent, self.acked + count)
+
+
+def spawn_chunks(center_x: float, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 radius: int = SPAWN_RADIUS_CHUNKS) -> List[int]:
+    """Chunks a client needs before it can start playing at ``center_x``"""
+    center = math.floor(center_x / chunk_size)
+    return list(range(center - radius, center + radius + 1))
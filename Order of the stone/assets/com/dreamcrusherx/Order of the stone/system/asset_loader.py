@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+📦 Asset Loader for Order of the Stone
+A manifest of every texture, sound, animation and font with a priority, decoded on a thread pool
+(file I/O, PIL decoding and scaling) while the main thread turns finished decodes into pygame objects
+in small per-frame slices - so the window shows up at once and title-screen assets are ready first
+"""
+
+import io
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError:
+    # Without PIL pygame decodes the file bytes on the main thread instead
+    Image = None
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+PRIORITY_TITLE = 0      # Needed to draw the loading and title screens
+PRIORITY_GAME = 1       # Needed once a world is played
+PRIORITY_LATE = 2       # Nice to have early, fine to finish last
+
+MAX_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class Asset:
+    """One manifest entry - source is a file path, or the family name for system fonts"""
+    name: str
+    kind: str                                   # "texture", "sound", "animation" or "font"
+    source: str
+    priority: int = PRIORITY_GAME
+    size: Optional[Tuple[int, int]] = None      # Scale textures/frames to this; point size for fonts
+
+
+class AssetManifest:
+    """Assets in the order they should load - by priority, then in the order they were listed"""
+
+    def __init__(self):
+        self.assets: List[Asset] = []
+        self._names = set()
+
+    def add(self, name: str, kind: str, source: str, priority: int = PRIORITY_GAME, size=None) -> Asset:
+        if name in self._names:
+            raise ValueError(f"asset {name!r} is already in the manifest")
+        asset = Asset(name, kind, source, priority, size)
+        self.assets.append(asset)
+        self._names.add(name)
+        return asset
+
+    def ordered(self) -> List[Asset]:
+        return sorted(self.assets, key=lambda asset: asset.priority)  # Stable, so listing order breaks ties
+
+    def __len__(self) -> int:
+        return len(self.assets)
+
+
+# --- Worker-thread decoders: plain data only, no pygame surfaces ---
+
+def decode_image(asset: Asset):
+    """((width, height), RGBA bytes) decoded and scaled by PIL, or the raw file bytes without PIL"""
+    if Image is None:
+        with open(asset.source, "rb") as f:
+            return f.read()
+    with Image.open(asset.source) as img:
+        img = img.convert("RGBA")
+        if asset.size and img.size != tuple(asset.size):
+            img = img.resize(tuple(asset.size), Image.NEAREST)  # Same look as pygame.transform.scale
+        return img.size, img.tobytes()
+
+
+def read_file(asset: Asset) -> bytes:
+    with open(asset.source, "rb") as f:
+        return f.read()
+
+
+_font_lock = threading.Lock()
+
+
+def find_font(asset: Asset) -> Optional[str]:
+    """Path of a system font - the first lookup scans every installed font, which is the slow part"""
+    with _font_lock:
+        return pygame.font.match_font(asset.source)
+
+
+def decode_animation(asset: Asset, sheets) -> Tuple[Dict, bytes]:
+    """Sprite sheet info and PNG bytes for a GIF (converting it first if it changed)"""
+    entry = sheets.entry(asset.source)
+    if entry is None:
+        raise RuntimeError("no sprite sheet")
+    with open(sheets.sheet_path(entry), "rb") as f:
+        return entry, f.read()
+
+
+# --- Main-thread finishers: turn decoded data into pygame objects ---
+
+def _display_ready() -> bool:
+    return pygame.display.get_surface() is not None
+
+
+def finish_image(asset: Asset, decoded):
+    if isinstance(decoded, bytes):
+        surface = pygame.image.load(io.BytesIO(decoded), os.path.basename(asset.source))
+        if asset.size and surface.get_size() != tuple(asset.size):
+            surface = pygame.transform.scale(surface, asset.size)
+    else:
+        size, rgba = decoded
+        from_bytes = getattr(pygame.image, "frombytes", None) or pygame.image.fromstring
+        surface = from_bytes(rgba, size, "RGBA")
+    return surface.convert_alpha() if _display_ready() else surface
+
+
+def finish_sound(asset: Asset, data: bytes):
+    return pygame.mixer.Sound(file=io.BytesIO(data))
+
+
+def finish_font(asset: Asset, path: Optional[str]):
+    return pygame.font.Font(path, asset.size)  # No match falls back to the default font, like SysFont
+
+
+def finish_animation(asset: Asset, decoded) -> Tuple[list, List[int]]:
+    from system.sprite_sheets import frames_from_sheet
+    entry, data = decoded
+    sheet = pygame.image.load(io.BytesIO(data), "sheet.png")
+    if _display_ready():
+        sheet = sheet.convert_alpha()
+    return frames_from_sheet(sheet, entry, asset.size), list(entry["durations"])
+
+
+DECODERS: Dict[str, Callable] = {"texture": decode_image, "sound": read_file, "font": find_font}
+FINISHERS: Dict[str, Callable] = {"texture": finish_image, "sound": finish_sound, "font": finish_font,
+                                  "animation": finish_animation}
+
+
+class AssetLoader:
+    """Decodes a manifest on worker threads and finishes it on the main thread.
+
+    `on_loaded(asset, value)` is called on the main thread for every asset, with None if it
+    couldn't be loaded (the error is kept in `errors`), so callers can put their fallback in place.
+    """
+
+    def __init__(self, manifest: AssetManifest, on_loaded: Callable[[Asset, Any], None],
+                 decoders: Optional[Dict[str, Callable]] = None, finishers: Optional[Dict[str, Callable]] = None,
+                 workers: Optional[int] = None):
+        self.manifest = manifest
+        self.on_loaded = on_loaded
+        self.decoders = dict(DECODERS, **(decoders or {}))
+        self.finishers = dict(FINISHERS, **(finishers or {}))
+        self.workers = workers or min(MAX_WORKERS, os.cpu_count() or 1)
+        self.assets: Dict[str, Any] = {}
+        self.errors: Dict[str, str] = {}
+        self._pending: List[Tuple[Asset, Future]] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.started_at = 0.0
+        self.finished_at = 0.0
+
+    def start(self):
+        """Queue every decode, most important first"""
+        self.started_at = time.time()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="assets")
+        for asset in self.manifest.ordered():
+            decoder = self.decoders.get(asset.kind)
+            if decoder is None:
+                future = Future()
+                future.set_exception(ValueError(f"no decoder for {asset.kind!r} assets"))
+            else:
+                future = self._executor.submit(decoder, asset)
+            self._pending.append((asset, future))
+        return self
+
+    @property
+    def done(self) -> bool:
+        return not self._pending
+
+    def progress(self) -> float:
+        """Fraction of the manifest that's finished"""
+        return len(self.assets) / len(self.manifest) if len(self.manifest) else 1.0
+
+    def next_kind(self) -> Optional[str]:
+        """Kind of the next asset still loading (for the loading screen's stage text)"""
+        return self._pending[0][0].kind if self._pending else None
+
+    def ready(self, priority: int) -> bool:
+        """Everything at this priority or more important is loaded"""
+        return all(asset.priority > priority for asset, _ in self._pending)
+
+    def pump(self, budget_ms: float = 4.0) -> int:
+        """Finish decoded assets (in manifest order) until the frame's budget runs out; at least one if any are ready"""
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        finished = 0
+        for asset, future in list(self._pending):
+            if not future.done():
+                continue
+            self._finish(asset, future)
+            finished += 1
+            if time.perf_counter() >= deadline:
+                break
+        self._check_done()
+        return finished
+
+    def finish(self, max_priority: Optional[int] = None) -> int:
+        """Block until everything (or everything at max_priority or more important) is loaded"""
+        finished = 0
+        for asset, future in list(self._pending):
+            if max_priority is None or asset.priority <= max_priority:
+                self._finish(asset, future)
+                finished += 1
+        self._check_done()
+        return finished
+
+    def _finish(self, asset: Asset, future: Future):
+        self._pending.remove((asset, future))
+        value = None
+        try:
+            value = self.finishers[asset.kind](asset, future.result())
+        except Exception as e:
+            self.errors[asset.name] = str(e)
+        self.assets[asset.name] = value
+        self.on_loaded(asset, value)
+
+    def _check_done(self):
+        if self._pending or self.finished_at:
+            return
+        self.finished_at = time.time()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+        print(f"📦 Loaded {len(self.assets)} assets in {self.finished_at - self.started_at:.2f}s"
+              f"{f' ({len(self.errors)} missing)' if self.errors else ''}")
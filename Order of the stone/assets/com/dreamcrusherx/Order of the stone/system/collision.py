@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+🧱 Tile Collision for Order of the Stone
+Swept AABB movement against the block grid, shared by the player, animals and mobs
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+# is_solid(tile_x, tile_y) -> bool
+SolidCallback = Callable[[int, int], bool]
+
+# Tolerance so boxes resting exactly on a tile edge don't count as overlapping it
+EPSILON = 1e-6
+
+
+@dataclass
+class CollisionResult:
+    """Where a box ended up after a move and what it touched.
+
+    ``normal_x``/``normal_y`` are the contact normals: ``normal_y == -1``
+    means the box landed on a floor, ``1`` means it hit a ceiling,
+    ``normal_x == -1``/``1`` means a wall on the right/left stopped it.
+    """
+    x: float
+    y: float
+    normal_x: int = 0
+    normal_y: int = 0
+    hit_x: Optional[Tuple[int, int]] = None  # Tile that stopped horizontal movement
+    hit_y: Optional[Tuple[int, int]] = None  # Tile that stopped vertical movement
+    stepped: bool = False
+
+    @property
+    def on_ground(self) -> bool:
+        return self.normal_y == -1
+
+    @property
+    def hit_ceiling(self) -> bool:
+        return self.normal_y == 1
+
+
+def _span(start: float, size: float) -> range:
+    """Tile indices a box edge-span [start, start + size) covers"""
+    return range(math.floor(start + EPSILON), math.floor(start + size - EPSILON) + 1)
+
+
+def find_solid_tile(x: float, y: float, width: float, height: float,
+                    is_solid: SolidCallback) -> Optional[Tuple[int, int]]:
+    """Return the first solid tile overlapping the box, or None if it is clear"""
+    rows = _span(y, height)
+    for tx in _span(x, width):
+        for ty in rows:
+            if is_solid(tx, ty):
+                return tx, ty
+    return None
+
+
+def sweep_x(x: float, y: float, width: float, height: float, dx: float,
+            is_solid: SolidCallback) -> Tuple[float, int, Optional[Tuple[int, int]]]:
+    """Move a box horizontally, stopping flush against the first solid column.
+
+    Every tile column between the start and end position is checked, so
+    fast movement cannot skip through a thin wall.
+    Returns (new_x, normal_x, hit_tile).
+    """
+    if dx == 0:
+        return x, 0, None
+    rows = _span(y, height)
+    if dx > 0:
+        lead = x + width
+        for tx in range(math.floor(lead - EPSILON) + 1, math.floor(lead + dx - EPSILON) + 1):
+            for ty in rows:
+                if is_solid(tx, ty):
+                    return tx - width, -1, (tx, ty)
+    else:
+        for tx in range(math.floor(x + EPSILON) - 1, math.floor(x + dx + EPSILON) - 1, -1):
+            for ty in rows:
+                if is_solid(tx, ty):
+                    return tx + 1.0, 1, (tx, ty)
+    return x + dx, 0, None
+
+
+def sweep_y(x: float, y: float, width: float, height: float, dy: float,
+            is_solid: SolidCallback) -> Tuple[float, int, Optional[Tuple[int, int]]]:
+    """Move a box vertically, stopping flush against the first solid row.
+
+    Returns (new_y, normal_y, hit_tile); y grows downwards like the world.
+    """
+    if dy == 0:
+        return y, 0, None
+    cols = _span(x, width)
+    if dy > 0:
+        lead = y + height
+        for ty in range(math.floor(lead - EPSILON) + 1, math.floor(lead + dy - EPSILON) + 1):
+            for tx in cols:
+                if is_solid(tx, ty):
+                    return ty - height, -1, (tx, ty)
+    else:
+        for ty in range(math.floor(y + EPSILON) - 1, math.floor(y + dy + EPSILON) - 1, -1):
+            for tx in cols:
+                if is_solid(tx, ty):
+                    return ty + 1.0, 1, (tx, ty)
+    return y + dy, 0, None
+
+
+def move_box(x: float, y: float, width: float, height: float, dx: float, dy: float,
+             is_solid: SolidCallback, step_height: float = 0.0) -> CollisionResult:
+    """Resolve a move of (dx, dy) tiles for a box with its top-left at (x, y).
+
+    Horizontal movement is resolved first, then vertical. With
+    ``step_height`` set (mounted horses), a box blocked by a wall tries
+    again that much higher and keeps the raised position if it gets further.
+    """
+    new_x, normal_x, hit_x = sweep_x(x, y, width, height, dx, is_solid)
+    stepped = False
+
+    if normal_x and step_height > 0:
+        raised_y, blocked, _ = sweep_y(x, y, width, height, -step_height, is_solid)
+        if not blocked:
+            step_x, step_normal, step_hit = sweep_x(x, raised_y, width, height, dx, is_solid)
+            if abs(step_x - x) > abs(new_x - x):
+                new_x, normal_x, hit_x = step_x, step_normal, step_hit
+                y = raised_y
+                stepped = True
+
+    new_y, normal_y, hit_y = sweep_y(new_x, y, width, height, dy, is_solid)
+    return CollisionResult(new_x, new_y, normal_x, normal_y, hit_x, hit_y, stepped)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+📦 Dropped Item Tracker for Order of the Stone
+Puts resting items to sleep, merges nearby stacks and caps items per chunk
+"""
+
+import math
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class DroppedItemTracker:
+    """Bookkeeping that keeps dropped-item physics cheap.
+
+    Dropped items stay plain dicts in the game's ``dropped_items`` list (so
+    saves keep working); the tracker only adds a per-chunk index and a few
+    keys on each item:
+
+    - ``sleeping``: resting items skip physics until a nearby block
+      changes or the player bumps them
+    - ``sleep_frame``: frame the item fell asleep, so its ``lifetime`` can
+      be caught up without ticking every frame
+    - ``rest_frames``: how long the item has been still
+    """
+
+    def __init__(self, chunk_size: int = 50, max_per_chunk: int = 64,
+                 merge_radius: float = 1.5, sleep_after: int = 10):
+        self.chunk_size = chunk_size
+        self.max_per_chunk = max_per_chunk
+        self.merge_radius = merge_radius
+        self.sleep_after = sleep_after
+
+        self.chunks: Dict[int, List[Dict]] = {}
+        self.frame = 0
+        self.player_pos: Optional[Tuple[float, float]] = None
+
+        # Statistics for the F3 overlay
+        self.merged_total = 0
+        self.despawned_total = 0
+
+    def chunk_of(self, x: float) -> int:
+        """Chunk index for a world x coordinate"""
+        return math.floor(x / self.chunk_size)
+
+    # ------------------------------------------------------------------
+    # Membership
+    # ------------------------------------------------------------------
+
+    def rebuild(self, items: List[Dict]):
+        """Re-index every item (after loading a world)"""
+        self.chunks.clear()
+        for item in items:
+            item["chunk"] = self.chunk_of(item["x"])
+            if item.get("sleeping"):
+                item["sleep_frame"] = self.frame
+            self.chunks.setdefault(item["chunk"], []).append(item)
+
+    def add(self, items: List[Dict], item: Dict) -> Dict:
+        """Add a new drop, merging it into a nearby identical stack if possible.
+
+        Returns the item dict that now holds the drop.
+        """
+        target = self.find_mergeable(item)
+        if target is not None:
+            target["count"] += item["count"]
+            self.wake(target)
+            self.merged_total += 1
+            return target
+
+        item["chunk"] = self.chunk_of(item["x"])
+        items.append(item)
+        bucket = self.chunks.setdefault(item["chunk"], [])
+        bucket.append(item)
+        if len(bucket) > self.max_per_chunk:
+            self._despawn_oldest(items, bucket)
+        return item
+
+    def discard(self, item: Dict):
+        """Forget an item that the game removed from ``dropped_items``"""
+        bucket = self.chunks.get(item.get("chunk"))
+        if bucket and item in bucket:
+            bucket.remove(item)
+            if not bucket:
+                del self.chunks[item["chunk"]]
+
+    def clear(self):
+        """Forget every item"""
+        self.chunks.clear()
+
+    def moved(self, item: Dict):
+        """Update the chunk index after an awake item moved"""
+        chunk = self.chunk_of(item["x"])
+        if chunk != item.get("chunk"):
+            self.discard(item)
+            item["chunk"] = chunk
+            self.chunks.setdefault(chunk, []).append(item)
+
+    def _despawn_oldest(self, items: List[Dict], bucket: List[Dict]):
+        """Drop the oldest items in an over-full chunk"""
+        bucket.sort(key=self.effective_lifetime, reverse=True)
+        while len(bucket) > self.max_per_chunk:
+            oldest = bucket.pop(0)
+            if oldest in items:
+                items.remove(oldest)
+            self.despawned_total += 1
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def items_near(self, x: float, y: float, radius: float) -> Iterator[Dict]:
+        """Yield items within ``radius`` tiles (box test) of (x, y)"""
+        for chunk in range(self.chunk_of(x - radius), self.chunk_of(x + radius) + 1):
+            for item in self.chunks.get(chunk, ()):
+                if abs(item["x"] - x) <= radius and abs(item["y"] - y) <= radius:
+                    yield item
+
+    def find_mergeable(self, item: Dict) -> Optional[Dict]:
+        """Find an existing stack of the same type close enough to merge with"""
+        for other in self.items_near(item["x"], item["y"], self.merge_radius):
+            if other is not item and other["type"] == item["type"]:
+                return other
+        return None
+
+    def effective_lifetime(self, item: Dict) -> int:
+        """Lifetime in frames, including time spent asleep"""
+        lifetime = item.get("lifetime", 0)
+        if item.get("sleeping"):
+            lifetime += self.frame - item.get("sleep_frame", self.frame)
+        return lifetime
+
+    # ------------------------------------------------------------------
+    # Sleeping
+    # ------------------------------------------------------------------
+
+    def tick(self):
+        """Advance the tracker clock (once per game frame)"""
+        self.frame += 1
+
+    def note_resting(self, items: List[Dict], item: Dict) -> bool:
+        """Count frames an awake item has been still; put it to sleep when settled.
+
+        Settling items also merge into a sleeping identical stack nearby.
+        Returns True if the item was merged away (and removed from ``items``).
+        """
+        item["rest_frames"] = item.get("rest_frames", 0) + 1
+        if item["rest_frames"] < self.sleep_after:
+            return False
+
+        target = self.find_mergeable(item)
+        if target is not None and target.get("sleeping"):
+            target["count"] += item["count"]
+            self.discard(item)
+            if item in items:
+                items.remove(item)
+            self.merged_total += 1
+            return True
+
+        item["sleeping"] = True
+        item["sleep_frame"] = self.frame
+        return False
+
+    def wake(self, item: Dict):
+        """Wake a sleeping item so physics runs on it again"""
+        item["rest_frames"] = 0
+        if item.get("sleeping"):
+            item["lifetime"] = self.effective_lifetime(item)
+            item["sleeping"] = False
+            item.pop("sleep_frame", None)
+            item["on_ground"] = False
+
+    def wake_around(self, x: int, y: int, radius: float = 1.5):
+        """Wake items next to a block that just changed"""
+        for item in self.items_near(x, y, radius):
+            if item.get("sleeping"):
+                self.wake(item)
+
+    def wake_pushed(self, x: float, y: float, radius: float = 0.8):
+        """Wake items the player walks into.
+
+        Only runs when the player moved since the last call, so items next
+        to a player standing still can settle and fall asleep.
+        """
+        if self.player_pos == (x, y):
+            return
+        self.player_pos = (x, y)
+        for item in self.items_near(x, y, radius):
+            self.wake(item)
+
+    def despawn_expired(self, items: List[Dict], max_lifetime: int) -> int:
+        """Remove items older than ``max_lifetime`` frames; returns how many"""
+        removed = 0
+        for item in items[:]:
+            if self.effective_lifetime(item) > max_lifetime:
+                items.remove(item)
+                self.discard(item)
+                removed += 1
+        self.despawned_total += removed
+        return removed
+
+    def get_stats(self, items: List[Dict]) -> Dict:
+        """Get dropped item statistics"""
+        sleeping = sum(1 for item in items if item.get("sleeping"))
+        return {
+            "items": len(items),
+            "sleeping": sleeping,
+            "chunks": len(self.chunks),
+            "merged_total": self.merged_total,
+            "despawned_total": self.despawned_total,
+        }
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+👹 Mob Spawning Service for Order of the Stone
+Per-chunk spawn candidates by biome, mob caps and a per-frame time budget
+"""
+
+import math
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Candidate biomes, derived from the blocks actually in each column
+BIOME_DESERT = "desert"         # Standing on sand
+BIOME_GRASSLAND = "grassland"   # Grass with no water/lava just below (horse fields)
+BIOME_GROUND = "ground"         # Any other standable ground
+BIOME_CANOPY = "canopy"         # Top leaves of a tree (pigeon perches)
+
+GROUND_BIOMES = (BIOME_DESERT, BIOME_GRASSLAND, BIOME_GROUND)
+
+GROUND_BLOCKS = {"grass", "dirt", "stone", "sand"}
+LIQUID_BLOCKS = {"water", "lava"}
+
+# (x, y, biome) - y is where the mob's feet go
+Candidate = Tuple[int, int, str]
+
+
+@dataclass
+class SpawnRule:
+    """How, where and how often one kind of mob spawns.
+
+    ``factory(x, y, biome)`` builds the entity dict (or returns None to
+    skip); ``entity_types`` are the entity types counted against the caps.
+    Timed rules fire every ``interval`` frames; rules with ``interval=0``
+    only spawn through :meth:`MobSpawner.queue_wave`. Each attempt succeeds
+    with probability ``chance``.
+    """
+    name: str
+    factory: Callable[[int, int, str], Optional[Dict]]
+    entity_types: Tuple[str, ...]
+    biomes: Tuple[str, ...] = GROUND_BIOMES
+    max_global: int = 10
+    max_per_chunk: int = 4
+    interval: int = 600
+    chance: float = 1.0
+    anchor: str = "player"         # "player" or "origin"
+    min_distance: float = 0.0      # Horizontal distance band around the anchor
+    max_distance: float = 40.0
+    min_abs_x: float = 0.0         # Keep this far from the spawn point (x=0)
+    spacing: float = 0.0           # No spawn within this distance of a counted mob
+    condition: Optional[Callable[[], bool]] = None
+    timer: int = 0
+
+
+class MobSpawner:
+    """Spawns mobs from cached per-chunk candidates within a frame time budget.
+
+    Candidate lists are built lazily the first time a chunk is needed and
+    dropped when a block in the chunk changes. Spawn attempts go into a
+    queue that :meth:`update` drains until the budget runs out, so a
+    nightfall wave is spread over several frames.
+    """
+
+    def __init__(self, get_block: Callable[[int, int], Optional[str]], chunk_size: int = 50,
+                 surface_top: int = 90, surface_bottom: int = 250, canopy_bottom: int = 130,
+                 budget_ms: float = 1.5):
+        self.get_block = get_block
+        self.chunk_size = chunk_size
+        self.surface_top = surface_top
+        self.surface_bottom = surface_bottom
+        self.canopy_bottom = canopy_bottom
+        self.budget = budget_ms / 1000.0
+
+        self.rules: Dict[str, SpawnRule] = {}
+        self.candidates: Dict[int, Dict[str, List[Candidate]]] = {}
+        self.column_biomes: Dict[int, str] = {}
+        self.pending = deque()  # (rule name, chunk or None)
+
+        # Census of counted mobs, rebuilt once per frame when there is work
+        self._counts: Dict[str, int] = {}
+        self._chunk_mobs: Dict[Tuple[str, int], List[float]] = {}
+
+        # Statistics
+        self.spawned_total = 0
+        self.chunks_built = 0
+        self.last_update_ms = 0.0
+
+    def chunk_of(self, x: float) -> int:
+        """Chunk index for a world x coordinate"""
+        return math.floor(x / self.chunk_size)
+
+    def add_rule(self, rule: SpawnRule):
+        """Register a spawn rule"""
+        self.rules[rule.name] = rule
+
+    # ------------------------------------------------------------------
+    # Candidate cache
+    # ------------------------------------------------------------------
+
+    def notify_block_change(self, x: int, y: int):
+        """Forget cached candidates for the chunk containing a changed block"""
+        chunk = self.chunk_of(x)
+        if chunk in self.candidates:
+            del self.candidates[chunk]
+            start = chunk * self.chunk_size
+            for column in range(start, start + self.chunk_size):
+                self.column_biomes.pop(column, None)
+
+    def reset(self):
+        """Forget all cached candidates and queued spawns (world change)"""
+        self.candidates.clear()
+        self.column_biomes.clear()
+        self.pending.clear()
+        for rule in self.rules.values():
+            rule.timer = 0
+
+    def _scan_column(self, x: int, lists: Dict[str, List[Candidate]]):
+        """Classify one column from the top down and add its candidates"""
+        get_block = self.get_block
+        found_canopy = False
+        above = None
+        for y in range(self.surface_top, self.surface_bottom):
+            block = get_block(x, y)
+            if block == "leaves" and not found_canopy and y < self.canopy_bottom:
+                lists[BIOME_CANOPY].append((x, y, BIOME_CANOPY))
+                found_canopy = True
+            elif block in GROUND_BLOCKS:
+                # Ground under a trunk or overhang has nowhere to stand
+                if above is None or above == "air":
+                    if block == "sand":
+                        biome = BIOME_DESERT
+                    elif block == "grass" and not any(get_block(x, y + d) in LIQUID_BLOCKS for d in (1, 2, 3)):
+                        biome = BIOME_GRASSLAND
+                    else:
+                        biome = BIOME_GROUND
+                    lists[biome].append((x, y - 1, biome))
+                    self.column_biomes[x] = biome
+                return
+            elif block in LIQUID_BLOCKS:
+                return
+            above = block
+
+    def get_chunk_candidates(self, chunk: int) -> Dict[str, List[Candidate]]:
+        """Candidate lists for a chunk, building them on first use"""
+        lists = self.candidates.get(chunk)
+        if lists is None:
+            lists = {BIOME_DESERT: [], BIOME_GRASSLAND: [], BIOME_GROUND: [], BIOME_CANOPY: []}
+            start = chunk * self.chunk_size
+            for x in range(start, start + self.chunk_size):
+                self._scan_column(x, lists)
+            self.candidates[chunk] = lists
+            self.chunks_built += 1
+        return lists
+
+    def biome_at(self, x: int) -> Optional[str]:
+        """Ground biome of a column (builds its chunk if needed)"""
+        if x not in self.column_biomes:
+            self.get_chunk_candidates(self.chunk_of(x))
+        return self.column_biomes.get(x)
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def queue_wave(self, name: str, chunks, attempts_per_chunk: int = 1):
+        """Queue spawn attempts for a rule across many chunks (e.g. nightfall)"""
+        for chunk in chunks:
+            for _ in range(attempts_per_chunk):
+                self.pending.append((name, chunk))
+
+    def cancel(self, name: str):
+        """Drop queued attempts for a rule"""
+        self.pending = deque(item for item in self.pending if item[0] != name)
+
+    def _census(self, entities: List[Dict]):
+        """Count mobs per rule and per chunk in one pass over the entities"""
+        groups: Dict[str, List[str]] = {}
+        for rule in self.rules.values():
+            for entity_type in rule.entity_types:
+                groups.setdefault(entity_type, []).append(rule.name)
+        counts = {name: 0 for name in self.rules}
+        chunk_mobs: Dict[Tuple[str, int], List[float]] = {}
+        for entity in entities:
+            names = groups.get(entity.get("type"))
+            if not names:
+                continue
+            chunk = self.chunk_of(entity["x"])
+            for name in names:
+                counts[name] += 1
+                chunk_mobs.setdefault((name, chunk), []).append(entity["x"])
+        self._counts = counts
+        self._chunk_mobs = chunk_mobs
+
+    def update(self, entities: List[Dict], player_x: float) -> int:
+        """Tick rule timers and run queued spawn attempts within the time budget.
+
+        Returns the number of mobs spawned this frame.
+        """
+        for rule in self.rules.values():
+            if rule.interval <= 0:
+                continue
+            rule.timer += 1
+            if rule.timer >= rule.interval:
+                rule.timer = 0
+                if rule.condition is None or rule.condition():
+                    self.pending.append((rule.name, None))
+
+        if not self.pending:
+            self.last_update_ms = 0.0
+            return 0
+
+        start = time.perf_counter()
+        deadline = start + self.budget
+        self._census(entities)
+        spawned = 0
+        # Always make progress on at least one attempt per frame
+        while self.pending:
+            name, chunk = self.pending.popleft()
+            rule = self.rules.get(name)
+            if rule is not None and self._attempt(rule, chunk, entities, player_x):
+                spawned += 1
+            if time.perf_counter() >= deadline:
+                break
+
+        self.spawned_total += spawned
+        self.last_update_ms = (time.perf_counter() - start) * 1000.0
+        return spawned
+
+    def _attempt(self, rule: SpawnRule, chunk: Optional[int], entities: List[Dict],
+                 player_x: float) -> bool:
+        """Try to spawn one mob for a rule; returns True on success"""
+        if self._counts.get(rule.name, 0) >= rule.max_global:
+            return False
+        # Every attempt rolls the rule's chance - timed or queued in a wave
+        if random.random() >= rule.chance:
+            return False
+
+        if chunk is None:
+            # Timed spawn: pick a chunk inside the rule's distance band
+            anchor = player_x if rule.anchor == "player" else 0.0
+            low, high = anchor - rule.max_distance, anchor + rule.max_distance
+            chunks = list(range(self.chunk_of(low), self.chunk_of(high) + 1))
+            random.shuffle(chunks)
+        else:
+            anchor, low, high = None, None, None
+            chunks = [chunk]
+
+        for candidate_chunk in chunks:
+            if len(self._chunk_mobs.get((rule.name, candidate_chunk), ())) >= rule.max_per_chunk:
+                continue
+            options = self._filter(rule, candidate_chunk, anchor, low, high)
+            if not options:
+                continue
+            x, y, biome = random.choice(options)
+            entity = rule.factory(x, y, biome)
+            if entity is None:
+                return False
+            entities.append(entity)
+            self._counts[rule.name] = self._counts.get(rule.name, 0) + 1
+            self._chunk_mobs.setdefault((rule.name, candidate_chunk), []).append(x)
+            return True
+        return False
+
+    def _filter(self, rule: SpawnRule, chunk: int, anchor: Optional[float],
+                low: Optional[float], high: Optional[float]) -> List[Candidate]:
+        """Candidates in a chunk that satisfy a rule's area and spacing"""
+        lists = self.get_chunk_candidates(chunk)
+        nearby = []
+        if rule.spacing > 0:
+            for neighbour in (chunk - 1, chunk, chunk + 1):
+                nearby.extend(self._chunk_mobs.get((rule.name, neighbour), ()))
+        options = []
+        for biome in rule.biomes:
+            for candidate in lists.get(biome, ()):
+                x = candidate[0]
+                if abs(x) < rule.min_abs_x:
+                    continue
+                if anchor is not None:
+                    if x < low or x > high or abs(x - anchor) < rule.min_distance:
+                        continue
+                if nearby and any(abs(mob_x - x) < rule.spacing for mob_x in nearby):
+                    continue
+                options.append(candidate)
+        return options
+
+    def get_stats(self) -> Dict:
+        """Get spawning statistics"""
+        return {
+            "pending": len(self.pending),
+            "cached_chunks": len(self.candidates),
+            "chunks_built": self.chunks_built,
+            "spawned_total": self.spawned_total,
+            "last_update_ms": round(self.last_update_ms, 2),
+        }
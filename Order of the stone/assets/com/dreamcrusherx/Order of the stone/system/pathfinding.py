@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+🧭 Flow-Field Pathfinding for Order of the Stone
+One shared distance field toward the players that every hostile mob samples
+"""
+
+import heapq
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Neighbour offsets: orthogonal moves first so ties prefer straight steps
+_ORTHOGONAL = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_DIAGONAL = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+# Step costs (x10 so everything stays in integers)
+_ORTHOGONAL_COST = 10
+_DIAGONAL_COST = 14
+
+UNREACHABLE = -1
+
+# More changed blocks than this in one update and a full rebuild is cheaper than repairing
+MAX_REPAIR_CHANGES = 64
+
+# Targets may drift this many tiles from the window centre before the window is re-centred (a full rebuild)
+RETARGET_SLACK = 6
+# When a target steps to a new tile, only cells this close to it are searched again
+RETARGET_RADIUS = 6
+
+
+class FlowField:
+    """Dijkstra distance field over passable tiles around the local player.
+
+    The field covers a square window of ``radius`` tiles around the centre
+    target. It is only rebuilt when the local player drifts more than
+    ``RETARGET_SLACK`` tiles from the window centre or when it gets older
+    than ``max_age`` updates - never every frame. Smaller changes are
+    patched in place: blocks changing inside the window re-search only the
+    cells whose path ran through them, and a target stepping to a
+    neighbouring tile re-searches only the cells around its new tile.
+    Mobs then look up their next tile with ``next_step`` in O(1).
+    """
+
+    def __init__(self, is_passable: Callable[[int, int], bool], radius: int = 24, max_age: int = 120):
+        self.is_passable = is_passable
+        self.radius = radius
+        self.size = radius * 2 + 1
+        self.max_age = max_age
+
+        # Window origin (top-left tile of the field)
+        self.origin_x = 0
+        self.origin_y = 0
+
+        # Flat arrays indexed by (y - origin_y) * size + (x - origin_x)
+        self.distance: List[int] = []
+        self.next_index: List[int] = []
+        self.passable: List[bool] = []
+
+        # Tiles the field was last built for
+        self._targets: Tuple[Tuple[int, int], ...] = ()
+        self._dirty = True
+        self._changed = set()
+        self._age = 0
+
+        # Statistics for the F3 overlay
+        self.rebuilds = 0
+        self.repairs = 0
+        self.retargets = 0
+        self.cells_visited = 0
+
+    # ------------------------------------------------------------------
+    # Updating
+    # ------------------------------------------------------------------
+
+    def update(self, center: Tuple[float, float], extra_targets: Iterable[Tuple[float, float]] = ()) -> bool:
+        """Rebuild the field if a target changed tile, or repair it if blocks changed.
+
+        ``center`` is the local player's position; ``extra_targets`` are
+        other players (e.g. LAN players) that mobs may also hunt. Targets
+        outside the window are ignored. Returns True if the field changed.
+        """
+        cx, cy = int(center[0]), int(center[1])
+        targets = [(cx, cy)]
+        for tx, ty in extra_targets:
+            tile = (int(tx), int(ty))
+            if abs(tile[0] - cx) <= self.radius and abs(tile[1] - cy) <= self.radius:
+                targets.append(tile)
+        targets = tuple(targets)
+
+        self._age += 1
+        if not self._dirty and self._age < self.max_age and len(self._changed) <= MAX_REPAIR_CHANGES:
+            if targets == self._targets and not self._changed:
+                return False
+            if self._changed:
+                self._repair()
+            if targets == self._targets or self._retarget(targets):
+                return True
+
+        self._rebuild(targets)
+        return True
+
+    def notify_block_change(self, x: int, y: int):
+        """Remember a changed block inside the window for the next update's repair"""
+        if self.contains(x, y):
+            self._changed.add((y - self.origin_y) * self.size + (x - self.origin_x))
+
+    def invalidate(self):
+        """Force a rebuild on the next update (e.g. after loading a world)"""
+        self._dirty = True
+
+    def _rebuild(self, targets: Tuple[Tuple[int, int], ...]):
+        """Run a multi-source Dijkstra from every target over the window"""
+        size = self.size
+        cx, cy = targets[0]
+        self.origin_x = cx - self.radius
+        self.origin_y = cy - self.radius
+        ox, oy = self.origin_x, self.origin_y
+        cell_count = size * size
+
+        # Sample passability once per cell; the search reads this list only
+        is_passable = self.is_passable
+        passable = [False] * cell_count
+        i = 0
+        for row in range(size):
+            y = oy + row
+            for col in range(size):
+                passable[i] = is_passable(ox + col, y)
+                i += 1
+
+        distance = [UNREACHABLE] * cell_count
+        # Buckets by cost keep this a Dial's-algorithm Dijkstra (costs are small ints)
+        frontier: Dict[int, deque] = {0: deque()}
+        for tx, ty in targets:
+            index = (ty - oy) * size + (tx - ox)
+            # Targets always seed the field, even if they stand inside a door or ladder
+            if distance[index] != 0:
+                distance[index] = 0
+                frontier[0].append(index)
+
+        visited = 0
+        cost = 0
+        max_cost = cell_count * _DIAGONAL_COST
+        while frontier and cost <= max_cost:
+            bucket = frontier.pop(cost, None)
+            if bucket is None:
+                cost += 1
+                continue
+            while bucket:
+                index = bucket.popleft()
+                if distance[index] != cost:
+                    continue
+                visited += 1
+                row, col = divmod(index, size)
+                for dx, dy in _ORTHOGONAL:
+                    ncol, nrow = col + dx, row + dy
+                    if 0 <= ncol < size and 0 <= nrow < size:
+                        nindex = nrow * size + ncol
+                        if passable[nindex]:
+                            new_cost = cost + _ORTHOGONAL_COST
+                            old = distance[nindex]
+                            if old == UNREACHABLE or new_cost < old:
+                                distance[nindex] = new_cost
+                                frontier.setdefault(new_cost, deque()).append(nindex)
+                for dx, dy in _DIAGONAL:
+                    ncol, nrow = col + dx, row + dy
+                    if 0 <= ncol < size and 0 <= nrow < size:
+                        nindex = nrow * size + ncol
+                        # No corner cutting: both orthogonal neighbours must be open
+                        if (passable[nindex] and passable[row * size + ncol]
+                                and passable[nrow * size + col]):
+                            new_cost = cost + _DIAGONAL_COST
+                            old = distance[nindex]
+                            if old == UNREACHABLE or new_cost < old:
+                                distance[nindex] = new_cost
+                                frontier.setdefault(new_cost, deque()).append(nindex)
+            cost += 1
+
+        self.distance = distance
+        self.passable = passable
+        self.next_index = self._build_next_steps(distance, passable)
+        self._targets = targets
+        self._dirty = False
+        self._changed.clear()
+        self._age = 0
+        self.rebuilds += 1
+        self.cells_visited = visited
+
+    def _repair(self):
+        """Patch the field for changed blocks without touching the rest of the window.
+
+        Cells whose downhill path ran through a newly blocked tile (or cut
+        its corner) lose their distance; then a Dijkstra seeded from the
+        intact cells around them and around newly opened tiles settles only
+        the cells whose distance actually changes.
+        """
+        size = self.size
+        distance, passable, next_index = self.distance, self.passable, self.next_index
+        ox, oy = self.origin_x, self.origin_y
+        changed = self._changed
+        self._changed = set()
+
+        opened, blocked = [], []
+        for index in changed:
+            row, col = divmod(index, size)
+            now = self.is_passable(ox + col, oy + row)
+            if now != passable[index]:
+                passable[index] = now
+                (opened if now else blocked).append(index)
+        self.repairs += 1
+        if not opened and not blocked:
+            self.cells_visited = 0
+            return
+
+        # Drop every cell that routed through (or diagonally past) a blocked tile, and everything behind it
+        lost = set()
+        stack = []
+        for index in blocked:
+            row, col = divmod(index, size)
+            if distance[index] != 0:  # Targets keep seeding the field
+                stack.append(index)
+            for dx, dy in _DIAGONAL:
+                ncol, nrow = col + dx, row + dy
+                if 0 <= ncol < size and 0 <= nrow < size:
+                    a, b = row * size + ncol, nrow * size + col  # The two cells whose step cuts this corner
+                    if next_index[a] == b or next_index[b] == a:
+                        stack.extend((a, b))
+        while stack:
+            index = stack.pop()
+            if index in lost or distance[index] == 0:
+                continue
+            lost.add(index)
+            row, col = divmod(index, size)
+            for dx, dy in _ORTHOGONAL + _DIAGONAL:
+                ncol, nrow = col + dx, row + dy
+                if 0 <= ncol < size and 0 <= nrow < size:
+                    nindex = nrow * size + ncol
+                    if next_index[nindex] == index:
+                        stack.append(nindex)
+        for index in lost:
+            distance[index] = UNREACHABLE
+            next_index[index] = UNREACHABLE
+
+        # Re-search from the intact cells bordering the lost region and the opened tiles
+        heap = []
+        for index in list(lost) + opened:
+            row, col = divmod(index, size)
+            for dx, dy in _ORTHOGONAL + _DIAGONAL:
+                ncol, nrow = col + dx, row + dy
+                if 0 <= ncol < size and 0 <= nrow < size:
+                    nindex = nrow * size + ncol
+                    if distance[nindex] != UNREACHABLE:
+                        heap.append((distance[nindex], nindex))
+        settled = set(lost)
+        self.cells_visited = self._settle(heap, settled)
+
+        # Downhill steps can only change next to a cell whose distance or passability changed
+        self._refresh_steps(settled.union(opened, blocked))
+
+    def _retarget(self, targets: Tuple[Tuple[int, int], ...]) -> bool:
+        """Move the field to targets that each stepped at most one tile, without a rebuild.
+
+        Every old target is kept as a source whose distance is the cost of
+        the step to its new tile, so all distances rise by that much. Then
+        the new target tiles seed a search, limited to ``RETARGET_RADIUS``,
+        that lowers the cells around them. Mobs near a player get exact
+        steps; mobs further out head for a tile the player just left (never
+        more than ``RETARGET_SLACK`` tiles behind) until they get close.
+        Distances never drop below the true ones and always lead downhill
+        to a target. Returns False (nothing changed) if a rebuild is needed.
+        """
+        old_targets = self._targets
+        if len(targets) != len(old_targets):
+            return False
+        cx, cy = self.origin_x + self.radius, self.origin_y + self.radius
+        if abs(targets[0][0] - cx) > RETARGET_SLACK or abs(targets[0][1] - cy) > RETARGET_SLACK:
+            return False
+        offset = 0
+        for old, new in zip(old_targets, targets):
+            if not self.contains(*new):
+                return False
+            cost = self._step_cost(old, new)
+            if cost is None:
+                return False
+            offset = max(offset, cost)
+
+        size = self.size
+        distance = [d if d == UNREACHABLE else d + offset for d in self.distance]
+        heap = []
+        for tx, ty in targets:
+            index = (ty - self.origin_y) * size + (tx - self.origin_x)
+            distance[index] = 0
+            heap.append((0, index))
+        self.distance = distance
+
+        settled = {index for _, index in heap}
+        self.cells_visited = self._settle(heap, settled, [(tx, ty, RETARGET_RADIUS) for tx, ty in targets])
+        self._refresh_steps(settled.union((ty - self.origin_y) * size + (tx - self.origin_x)
+                                          for tx, ty in old_targets))
+        self._targets = targets
+        self.retargets += 1
+        return True
+
+    def _step_cost(self, old: Tuple[int, int], new: Tuple[int, int]) -> Optional[int]:
+        """Cost of a mob path from a target's new tile back to its old one, or None if it isn't a single open step"""
+        dx, dy = old[0] - new[0], old[1] - new[1]
+        if dx == dy == 0:
+            return 0
+        if abs(dx) > 1 or abs(dy) > 1 or not self.contains(*old):
+            return None
+        passable, size = self.passable, self.size
+        col, row = old[0] - self.origin_x, old[1] - self.origin_y
+        if not passable[row * size + col]:
+            return None  # Targets inside doors or blocks only seed; nothing walks through them
+        if dx and dy:
+            corners = passable[row * size + col - dx] + passable[(row - dy) * size + col]
+            if corners == 2:
+                return _DIAGONAL_COST
+            return 2 * _ORTHOGONAL_COST if corners else None  # Around the one open corner
+        return _ORTHOGONAL_COST
+
+    def _settle(self, heap: List[Tuple[int, int]], settled: set,
+                areas: Optional[List[Tuple[int, int, int]]] = None) -> int:
+        """Dijkstra from the (cost, cell) seeds, only ever lowering distances; adds lowered cells to settled.
+
+        ``areas`` ((x, y, radius) squares) limits the cells it may lower.
+        """
+        size = self.size
+        if areas:
+            areas = [(x - self.origin_x - r, x - self.origin_x + r, y - self.origin_y - r, y - self.origin_y + r)
+                     for x, y, r in areas]
+        distance, passable = self.distance, self.passable
+        heapq.heapify(heap)
+        visited = 0
+        while heap:
+            cost, index = heapq.heappop(heap)
+            if distance[index] != cost:
+                continue
+            visited += 1
+            row, col = divmod(index, size)
+            for dx, dy in _ORTHOGONAL + _DIAGONAL:
+                ncol, nrow = col + dx, row + dy
+                if not (0 <= ncol < size and 0 <= nrow < size):
+                    continue
+                nindex = nrow * size + ncol
+                if not passable[nindex]:
+                    continue
+                if areas and not any(c0 <= ncol <= c1 and r0 <= nrow <= r1 for c0, c1, r0, r1 in areas):
+                    continue
+                if dx and dy:
+                    # No corner cutting: both orthogonal neighbours must be open
+                    if not (passable[row * size + ncol] and passable[nrow * size + col]):
+                        continue
+                    new_cost = cost + _DIAGONAL_COST
+                else:
+                    new_cost = cost + _ORTHOGONAL_COST
+                old = distance[nindex]
+                if old == UNREACHABLE or new_cost < old:
+                    distance[nindex] = new_cost
+                    settled.add(nindex)
+                    heapq.heappush(heap, (new_cost, nindex))
+        return visited
+
+    def _refresh_steps(self, changed: Iterable[int]):
+        """Recompute the downhill step of the changed cells and their neighbours"""
+        size = self.size
+        distance, passable, next_index = self.distance, self.passable, self.next_index
+        stale = set()
+        for index in changed:
+            row, col = divmod(index, size)
+            stale.add(index)
+            for dx, dy in _ORTHOGONAL + _DIAGONAL:
+                ncol, nrow = col + dx, row + dy
+                if 0 <= ncol < size and 0 <= nrow < size:
+                    stale.add(nrow * size + ncol)
+        for index in stale:
+            next_index[index] = self._next_step_of(index, distance, passable)
+
+    def _build_next_steps(self, distance: List[int], passable: List[bool]) -> List[int]:
+        """Precompute the downhill neighbour of every reached cell"""
+        return [self._next_step_of(index, distance, passable) for index in range(len(distance))]
+
+    def _next_step_of(self, index: int, distance: List[int], passable: List[bool]) -> int:
+        """Downhill neighbour of one cell, or UNREACHABLE"""
+        own = distance[index]
+        if own <= 0:
+            return UNREACHABLE
+        size = self.size
+        row, col = divmod(index, size)
+        best = own
+        best_index = UNREACHABLE
+        for dx, dy in _ORTHOGONAL:
+            ncol, nrow = col + dx, row + dy
+            if 0 <= ncol < size and 0 <= nrow < size:
+                nindex = nrow * size + ncol
+                d = distance[nindex]
+                if d != UNREACHABLE and d < best:
+                    best = d
+                    best_index = nindex
+        for dx, dy in _DIAGONAL:
+            ncol, nrow = col + dx, row + dy
+            if 0 <= ncol < size and 0 <= nrow < size:
+                nindex = nrow * size + ncol
+                d = distance[nindex]
+                if (d != UNREACHABLE and d < best
+                        and passable[row * size + ncol] and passable[nrow * size + col]):
+                    best = d
+                    best_index = nindex
+        return best_index
+
+    # ------------------------------------------------------------------
+    # Sampling (O(1) per mob)
+    # ------------------------------------------------------------------
+
+    def contains(self, x: int, y: int) -> bool:
+        """Check if a tile lies inside the current window"""
+        return (0 <= x - self.origin_x < self.size) and (0 <= y - self.origin_y < self.size)
+
+    def distance_at(self, x: float, y: float) -> Optional[float]:
+        """Path distance in tiles from (x, y) to the nearest target, or None"""
+        tx, ty = int(x), int(y)
+        if not self.distance or not self.contains(tx, ty):
+            return None
+        d = self.distance[(ty - self.origin_y) * self.size + (tx - self.origin_x)]
+        if d == UNREACHABLE:
+            return None
+        return d / _ORTHOGONAL_COST
+
+    def next_step(self, x: float, y: float) -> Optional[Tuple[int, int]]:
+        """Tile a mob at (x, y) should move into next, or None.
+
+        Returns None when the mob is outside the window, cannot reach any
+        target, or is already standing on a target tile - callers fall
+        back to steering straight at the player in those cases.
+        """
+        tx, ty = int(x), int(y)
+        if not self.next_index or not self.contains(tx, ty):
+            return None
+        nindex = self.next_index[(ty - self.origin_y) * self.size + (tx - self.origin_x)]
+        if nindex == UNREACHABLE:
+            return None
+        row, col = divmod(nindex, self.size)
+        return self.origin_x + col, self.origin_y + row
+
+    def direction(self, x: float, y: float) -> Optional[Tuple[float, float]]:
+        """Unit vector from (x, y) toward the next tile on the path, or None"""
+        step = self.next_step(x, y)
+        if step is None:
+            return None
+        dx = step[0] - x
+        dy = step[1] - y
+        length = (dx * dx + dy * dy) ** 0.5
+        if length == 0:
+            return None
+        return dx / length, dy / length
+
+    def get_stats(self) -> Dict:
+        """Get flow field statistics"""
+        return {
+            "radius": self.radius,
+            "rebuilds": self.rebuilds,
+            "repairs": self.repairs,
+            "retargets": self.retargets,
+            "cells_visited": self.cells_visited,
+            "targets": len(self._targets),
+        }
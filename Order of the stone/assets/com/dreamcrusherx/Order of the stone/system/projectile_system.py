@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+🏹 Projectile System for Order of the Stone
+Pooled storage for rocks, fireballs, boss shots and thrown swords with
+swept tile collision and spatial-hash hit tests
+"""
+
+import math
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Projectile flags
+FLAG_TILE_COLLISION = 1   # Stops at solid tiles
+FLAG_RETURNS = 2          # Boomerang: flies back to its owner after a hit or at max range
+FLAG_RETURNING = 4        # Currently flying back to its owner
+
+# Teams decide which spatial index a projectile is tested against
+TEAM_HOSTILE = "hostile"  # Hits players
+TEAM_FRIENDLY = "friendly"  # Hits mobs
+
+
+class SpatialHash:
+    """Uniform grid of buckets for fast 'who is near this point' queries"""
+
+    def __init__(self, cell_size: float = 2.0):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Any]] = {}
+        self.count = 0
+
+    def clear(self):
+        """Remove everything from the index"""
+        self.cells.clear()
+        self.count = 0
+
+    def insert(self, obj: Any, x: float, y: float):
+        """Insert an object (usually an entity dict) at (x, y)"""
+        key = (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            self.cells[key] = [obj]
+        else:
+            bucket.append(obj)
+        self.count += 1
+
+    def query(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Iterator[Any]:
+        """Yield every object whose cell overlaps the given box"""
+        size = self.cell_size
+        cells = self.cells
+        for cx in range(math.floor(min_x / size), math.floor(max_x / size) + 1):
+            for cy in range(math.floor(min_y / size), math.floor(max_y / size) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+
+def raycast_tiles(x0: float, y0: float, x1: float, y1: float,
+                  is_solid: Callable[[int, int], bool]) -> Optional[Tuple[int, int, float]]:
+    """Walk the tiles crossed by a segment (Amanatides-Woo DDA).
+
+    Returns (tile_x, tile_y, t) for the first solid tile, where t in [0, 1]
+    is how far along the segment the tile was entered, or None if the
+    whole segment is clear. The starting tile is not tested so projectiles
+    fired from inside a block can still leave it.
+    """
+    tile_x, tile_y = math.floor(x0), math.floor(y0)
+    end_x, end_y = math.floor(x1), math.floor(y1)
+    if tile_x == end_x and tile_y == end_y:
+        return None
+
+    dx = x1 - x0
+    dy = y1 - y0
+    step_x = 1 if dx > 0 else -1
+    step_y = 1 if dy > 0 else -1
+    t_delta_x = abs(1.0 / dx) if dx != 0 else math.inf
+    t_delta_y = abs(1.0 / dy) if dy != 0 else math.inf
+    if dx > 0:
+        t_max_x = (tile_x + 1 - x0) * t_delta_x
+    elif dx < 0:
+        t_max_x = (x0 - tile_x) * t_delta_x
+    else:
+        t_max_x = math.inf
+    if dy > 0:
+        t_max_y = (tile_y + 1 - y0) * t_delta_y
+    elif dy < 0:
+        t_max_y = (y0 - tile_y) * t_delta_y
+    else:
+        t_max_y = math.inf
+
+    # A segment can cross at most |dx| + |dy| + 2 tiles
+    for _ in range(abs(end_x - tile_x) + abs(end_y - tile_y) + 2):
+        if t_max_x < t_max_y:
+            t = t_max_x
+            t_max_x += t_delta_x
+            tile_x += step_x
+        else:
+            t = t_max_y
+            t_max_y += t_delta_y
+            tile_y += step_y
+        if t > 1.0:
+            return None
+        if is_solid(tile_x, tile_y):
+            return tile_x, tile_y, t
+        if tile_x == end_x and tile_y == end_y:
+            return None
+    return None
+
+
+class ProjectileSystem:
+    """One pooled store for every projectile in the game.
+
+    Per-projectile numbers live in parallel ``array`` columns indexed by
+    slot, so hundreds of projectiles cost no dict allocations per frame.
+    Freed slots go on a free list and are reused by the next ``spawn``.
+    ``update`` returns a list of event dicts (``hit``, ``tile``,
+    ``expired``, ``returned``) that the game turns into damage, particles
+    and inventory changes.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = 0
+        self.x = array('d')
+        self.y = array('d')
+        self.dx = array('d')
+        self.dy = array('d')
+        self.radius = array('d')
+        self.damage = array('d')
+        self.speed = array('d')
+        self.travelled = array('d')
+        self.max_distance = array('d')
+        self.lifetime = array('i')
+        self.flags = array('i')
+        self.alive = array('b')
+        self.kind: List[Optional[str]] = []
+        self.team: List[Optional[str]] = []
+        self.owner: List[Any] = []
+        self.target: List[Any] = []
+        self.payload: List[Any] = []
+
+        self._free: List[int] = []
+        self.active_count = 0
+        self._grow(capacity)
+
+        # Statistics for the F3 overlay
+        self.spawned_total = 0
+        self.peak_active = 0
+
+    def _grow(self, new_capacity: int):
+        """Extend every column to ``new_capacity`` slots"""
+        extra = new_capacity - self.capacity
+        if extra <= 0:
+            return
+        for column in (self.x, self.y, self.dx, self.dy, self.radius, self.damage,
+                       self.speed, self.travelled, self.max_distance):
+            column.extend([0.0] * extra)
+        for column in (self.lifetime, self.flags, self.alive):
+            column.extend([0] * extra)
+        for column in (self.kind, self.team, self.owner, self.target, self.payload):
+            column.extend([None] * extra)
+        # Hand out low slots first
+        self._free.extend(range(new_capacity - 1, self.capacity - 1, -1))
+        self.capacity = new_capacity
+
+    # ------------------------------------------------------------------
+    # Spawning / removal
+    # ------------------------------------------------------------------
+
+    def spawn(self, kind: str, x: float, y: float, dx: float, dy: float,
+              damage: float = 1, lifetime: int = 180, team: str = TEAM_HOSTILE,
+              radius: float = 0.5, tile_collision: bool = True, returns: bool = False,
+              max_distance: float = 0.0, owner: Any = None, target: Any = None,
+              payload: Any = None) -> int:
+        """Create a projectile and return its slot id.
+
+        ``dx``/``dy`` is the per-frame velocity in tiles. Homing projectiles
+        pass an entity dict as ``target`` and keep their speed while
+        steering toward it. ``max_distance`` (tiles, 0 = unlimited) ends
+        the flight - or starts the return trip for boomerangs.
+        """
+        if not self._free:
+            self._grow(max(16, self.capacity * 2))
+        slot = self._free.pop()
+
+        self.x[slot] = x
+        self.y[slot] = y
+        self.dx[slot] = dx
+        self.dy[slot] = dy
+        self.radius[slot] = radius
+        self.damage[slot] = damage
+        self.speed[slot] = math.hypot(dx, dy)
+        self.travelled[slot] = 0.0
+        self.max_distance[slot] = max_distance
+        self.lifetime[slot] = lifetime
+        self.flags[slot] = (FLAG_TILE_COLLISION if tile_collision else 0) | (FLAG_RETURNS if returns else 0)
+        self.alive[slot] = 1
+        self.kind[slot] = kind
+        self.team[slot] = team
+        self.owner[slot] = owner
+        self.target[slot] = target
+        self.payload[slot] = payload
+
+        self.active_count += 1
+        self.spawned_total += 1
+        self.peak_active = max(self.peak_active, self.active_count)
+        return slot
+
+    def remove(self, slot: int):
+        """Free a projectile slot"""
+        if not self.alive[slot]:
+            return
+        self.alive[slot] = 0
+        self.kind[slot] = None
+        self.team[slot] = None
+        self.owner[slot] = None
+        self.target[slot] = None
+        self.payload[slot] = None
+        self._free.append(slot)
+        self.active_count -= 1
+
+    def clear(self):
+        """Remove every projectile (world change, return to title)"""
+        for slot in range(self.capacity):
+            if self.alive[slot]:
+                self.remove(slot)
+
+    def is_alive(self, slot: Optional[int]) -> bool:
+        """Check if a slot id still refers to a live projectile"""
+        return slot is not None and 0 <= slot < self.capacity and bool(self.alive[slot])
+
+    def start_return(self, slot: int):
+        """Send a boomerang projectile back to its owner"""
+        self.flags[slot] |= FLAG_RETURNING
+        self.target[slot] = None
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+
+    def update(self, is_solid: Callable[[int, int], bool],
+               hit_indexes: Dict[str, SpatialHash],
+               owner_positions: Optional[Dict[Any, Tuple[float, float]]] = None,
+               target_alive: Optional[Callable[[Any], bool]] = None) -> List[Dict]:
+        """Advance every projectile one frame and return the events it produced.
+
+        ``is_solid(x, y)`` tests tiles, ``hit_indexes`` maps a team to the
+        spatial index of entities it can hit, ``owner_positions`` tells
+        boomerangs where to fly back to and ``target_alive`` lets homing
+        projectiles notice that their target was removed.
+        """
+        events: List[Dict] = []
+        owner_positions = owner_positions or {}
+        x, y, dx, dy = self.x, self.y, self.dx, self.dy
+        flags, alive = self.flags, self.alive
+
+        for slot in range(self.capacity):
+            if not alive[slot]:
+                continue
+
+            self.lifetime[slot] -= 1
+            if self.lifetime[slot] <= 0 and not flags[slot] & FLAG_RETURNING:
+                events.append(self._event("expired", slot))
+                self.remove(slot)
+                continue
+
+            # Steering: returning boomerangs chase their owner, homing shots their target
+            if flags[slot] & FLAG_RETURNING:
+                home = owner_positions.get(self.owner[slot])
+                if home is None:
+                    events.append(self._event("returned", slot))
+                    self.remove(slot)
+                    continue
+                if self._steer_toward(slot, home[0], home[1]) < 0.5:
+                    events.append(self._event("returned", slot))
+                    self.remove(slot)
+                    continue
+            elif self.target[slot] is not None:
+                target = self.target[slot]
+                if target_alive is not None and not target_alive(target):
+                    self._end_flight(slot, events)
+                    continue
+                self._steer_toward(slot, target["x"], target["y"])
+
+            old_x, old_y = x[slot], y[slot]
+            new_x, new_y = old_x + dx[slot], old_y + dy[slot]
+
+            # Swept tile collision along the movement segment
+            if flags[slot] & FLAG_TILE_COLLISION and not flags[slot] & FLAG_RETURNING:
+                hit = raycast_tiles(old_x + 0.5, old_y + 0.5, new_x + 0.5, new_y + 0.5, is_solid)
+                if hit is not None:
+                    tile_x, tile_y, t = hit
+                    x[slot] = old_x + dx[slot] * t
+                    y[slot] = old_y + dy[slot] * t
+                    event = self._event("tile", slot)
+                    event["tile"] = (tile_x, tile_y)
+                    events.append(event)
+                    self._end_flight(slot, events, emit=False)
+                    continue
+
+            x[slot], y[slot] = new_x, new_y
+            self.travelled[slot] += self.speed[slot]
+
+            # Entity hit test against the spatial index for this team
+            if not flags[slot] & FLAG_RETURNING:
+                victim = self._find_victim(slot, old_x, old_y, new_x, new_y, hit_indexes.get(self.team[slot]))
+                if victim is not None:
+                    event = self._event("hit", slot)
+                    event["target"] = victim
+                    events.append(event)
+                    self._end_flight(slot, events, emit=False)
+                    continue
+
+                if self.max_distance[slot] and self.travelled[slot] >= self.max_distance[slot]:
+                    self._end_flight(slot, events)
+
+        return events
+
+    def _steer_toward(self, slot: int, tx: float, ty: float) -> float:
+        """Point a projectile at (tx, ty) keeping its speed; returns the distance"""
+        ddx = tx - self.x[slot]
+        ddy = ty - self.y[slot]
+        distance = math.hypot(ddx, ddy)
+        if distance > 0:
+            speed = self.speed[slot]
+            self.dx[slot] = ddx / distance * speed
+            self.dy[slot] = ddy / distance * speed
+        return distance
+
+    def _end_flight(self, slot: int, events: List[Dict], emit: bool = True):
+        """Stop a projectile: boomerangs turn around, everything else is freed"""
+        if self.flags[slot] & FLAG_RETURNS:
+            self.start_return(slot)
+        else:
+            if emit:
+                events.append(self._event("expired", slot))
+            self.remove(slot)
+
+    def _find_victim(self, slot: int, x0: float, y0: float, x1: float, y1: float,
+                     index: Optional[SpatialHash]) -> Optional[Any]:
+        """Closest-point-on-segment test against nearby entities"""
+        if index is None or index.count == 0:
+            return None
+        radius = self.radius[slot]
+        owner = self.owner[slot]
+        seg_x, seg_y = x1 - x0, y1 - y0
+        seg_len_sq = seg_x * seg_x + seg_y * seg_y
+        best = None
+        best_t = 2.0
+        for entity in index.query(min(x0, x1) - radius, min(y0, y1) - radius,
+                                  max(x0, x1) + radius, max(y0, y1) + radius):
+            if entity is owner:
+                continue
+            ex, ey = entity["x"], entity["y"]
+            if seg_len_sq > 0:
+                t = ((ex - x0) * seg_x + (ey - y0) * seg_y) / seg_len_sq
+                t = 0.0 if t < 0 else (1.0 if t > 1 else t)
+            else:
+                t = 0.0
+            px = x0 + seg_x * t
+            py = y0 + seg_y * t
+            if abs(ex - px) < radius and abs(ey - py) < radius and t < best_t:
+                best = entity
+                best_t = t
+        return best
+
+    def _event(self, event_type: str, slot: int) -> Dict:
+        """Build an event dict describing a projectile"""
+        return {
+            "event": event_type,
+            "slot": slot,
+            "kind": self.kind[slot],
+            "team": self.team[slot],
+            "x": self.x[slot],
+            "y": self.y[slot],
+            "damage": self.damage[slot],
+            "owner": self.owner[slot],
+            "payload": self.payload[slot],
+        }
+
+    # ------------------------------------------------------------------
+    # Rendering helpers
+    # ------------------------------------------------------------------
+
+    def iter_active(self) -> Iterator[Tuple[int, str, float, float, float, float, bool]]:
+        """Yield (slot, kind, x, y, dx, dy, returning) for every live projectile"""
+        for slot in range(self.capacity):
+            if self.alive[slot]:
+                yield (slot, self.kind[slot], self.x[slot], self.y[slot],
+                       self.dx[slot], self.dy[slot], bool(self.flags[slot] & FLAG_RETURNING))
+
+    def get_stats(self) -> Dict:
+        """Get projectile pool statistics"""
+        return {
+            "active": self.active_count,
+            "capacity": self.capacity,
+            "peak_active": self.peak_active,
+            "spawned_total": self.spawned_total,
+        }
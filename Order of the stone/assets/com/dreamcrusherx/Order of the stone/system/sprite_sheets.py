@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+🎞️ Sprite Sheets for Order of the Stone
+GIF animations pre-decoded into one PNG strip per GIF plus its frame timings, rebuilt only when the GIF
+changes (mtime, then content hash), so startup loads each animation with a single image load
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from PIL import Image, ImageSequence
+except ImportError:
+    # Without PIL existing sheets still load; new GIFs just can't be converted
+    Image = ImageSequence = None
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+SHEET_VERSION = 1                  # Bump when the sheet layout changes
+INDEX_FILE = "sheets.json"
+DEFAULT_FRAME_MS = 100             # GIFs without a frame duration
+ANIMATION_DIRS = (os.path.join("player", "animations"), "mobs", "tiles")
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(65536), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def frame_rects(frame_size: Tuple[int, int], count: int) -> List[Tuple[int, int, int, int]]:
+    """Where each frame sits in a sheet - frames run left to right in one row"""
+    width, height = frame_size
+    return [(i * width, 0, width, height) for i in range(count)]
+
+
+def frames_from_sheet(sheet, entry: Dict, size: Optional[Tuple[int, int]] = None) -> list:
+    """Cut a loaded sheet surface back into frames (scaled to size)"""
+    frames = [sheet.subsurface(rect) for rect in frame_rects(entry["frame_size"], len(entry["durations"]))]
+    if size is not None and tuple(size) != tuple(entry["frame_size"]):
+        frames = [pygame.transform.scale(frame, size) for frame in frames]
+    return frames
+
+
+def gif_to_sheet(gif_path: str, sheet_path: str) -> Dict:
+    """Decode every frame of a GIF once and write them side by side as a PNG"""
+    if Image is None:
+        raise RuntimeError("PIL is needed to convert GIFs")
+    frames, durations = [], []
+    with Image.open(gif_path) as img:
+        for frame in ImageSequence.Iterator(img):
+            durations.append(int(frame.info.get("duration") or DEFAULT_FRAME_MS))
+            frames.append(frame.convert("RGBA"))
+    width, height = frames[0].size
+    sheet = Image.new("RGBA", (width * len(frames), height), (0, 0, 0, 0))
+    for (x, y, _, _), frame in zip(frame_rects((width, height), len(frames)), frames):
+        sheet.paste(frame, (x, y))
+    sheet.save(sheet_path, "PNG")
+    return {"frame_size": [width, height], "durations": durations}
+
+
+def find_animation_gifs(assets_root: str, folders: Iterable[str] = ANIMATION_DIRS) -> List[str]:
+    """Every GIF under the animation folders"""
+    gifs = []
+    for folder in folders:
+        for root, _, files in os.walk(os.path.join(assets_root, folder)):
+            gifs.extend(os.path.join(root, name) for name in sorted(files) if name.lower().endswith(".gif"))
+    return gifs
+
+
+class SpriteSheetCache:
+    """Sheet PNGs plus a JSON index of the GIF each came from (mtime, size, hash) and its frame timings"""
+
+    def __init__(self, cache_dir: str, build: Callable[[str, str], Dict] = gif_to_sheet,
+                 version: int = SHEET_VERSION):
+        self.cache_dir = cache_dir
+        self.build = build
+        self.version = version
+        self.index: Dict[str, Dict] = {}
+        self.built = 0
+        self._dirty = False
+        self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.cache_dir, INDEX_FILE), "r") as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def flush(self):
+        """Write the index if anything changed"""
+        if not self._dirty:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_file = os.path.join(self.cache_dir, INDEX_FILE + ".tmp")
+        with open(temp_file, "w") as f:
+            json.dump(self.index, f, indent=2)
+        os.replace(temp_file, os.path.join(self.cache_dir, INDEX_FILE))
+        self._dirty = False
+
+    def sheet_path(self, entry: Dict) -> str:
+        return os.path.join(self.cache_dir, entry["sheet"])
+
+    def entry(self, gif_path: str) -> Optional[Dict]:
+        """Sheet info for a GIF, converting it first if it's new or changed; None if that fails"""
+        key = os.path.realpath(gif_path)
+        try:
+            stat = os.stat(gif_path)
+        except OSError:
+            return None
+        entry = self.index.get(key)
+        usable = (entry is not None and entry.get("version") == self.version
+                  and os.path.exists(self.sheet_path(entry)))
+        if usable and entry["mtime"] == stat.st_mtime and entry["bytes"] == stat.st_size:
+            return entry
+        digest = file_hash(gif_path)
+        if usable and entry["sha1"] == digest:
+            entry["mtime"] = stat.st_mtime  # Touched (e.g. checked out again) but not changed
+            self._dirty = True
+            return entry
+
+        stem = os.path.splitext(os.path.basename(gif_path))[0]
+        sheet = f"{stem}_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:10]}.png"
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_file = os.path.join(self.cache_dir, sheet + ".tmp")
+        try:
+            meta = self.build(gif_path, temp_file)
+            os.replace(temp_file, os.path.join(self.cache_dir, sheet))
+        except Exception as e:
+            print(f"⚠️ Could not build sprite sheet for {os.path.basename(gif_path)}: {e}")
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            return None
+        entry = {"sheet": sheet, "version": self.version, "mtime": stat.st_mtime, "bytes": stat.st_size,
+                 "sha1": digest, "frame_size": list(meta["frame_size"]), "durations": list(meta["durations"]),
+                 "built": time.time()}
+        self.index[key] = entry
+        self._dirty = True
+        self.built += 1
+        print(f"🎞️ Built sprite sheet for {os.path.basename(gif_path)} ({len(entry['durations'])} frames)")
+        return entry
+
+    def prepare(self, gif_paths: Iterable[str]) -> int:
+        """Make sure every GIF has an up-to-date sheet; returns how many had to be built"""
+        before = self.built
+        for gif_path in gif_paths:
+            self.entry(gif_path)
+        self.flush()
+        return self.built - before
+
+    def durations(self, gif_path: str) -> List[int]:
+        """Milliseconds per frame, as the GIF stores them"""
+        entry = self.entry(gif_path)
+        self.flush()
+        return list(entry["durations"]) if entry else []
+
+    def frames(self, gif_path: str, size: Optional[Tuple[int, int]] = None) -> list:
+        """The GIF's frames as surfaces - one load of the sheet, then subsurfaces (scaled to size)"""
+        entry = self.entry(gif_path)
+        self.flush()
+        if entry is None or pygame is None:
+            return []
+        sheet = pygame.image.load(self.sheet_path(entry))
+        if pygame.display.get_surface() is not None:
+            sheet = sheet.convert_alpha()
+        return frames_from_sheet(sheet, entry, size)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert GIF animations into cached sprite sheets")
+    parser.add_argument("--assets", default="assets", help="Assets folder holding player/, mobs/ and tiles/")
+    parser.add_argument("--cache-dir", default=os.path.join("save_data", "sprite_sheets"),
+                        help="Where sheets are kept (default: save_data/sprite_sheets)")
+    args = parser.parse_args(argv)
+
+    cache = SpriteSheetCache(args.cache_dir)
+    gifs = find_animation_gifs(args.assets)
+    built = cache.prepare(gifs)
+    print(f"✅ {built} sprite sheets built, {len(gifs) - built} already up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+🏰 Structure Registry for Order of the Stone
+Bounding boxes of fortresses, villages, ruins and arenas, bucketed by chunk:
+overlap checks when placing, point lookups for discovery, markers for the minimap, save/load
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+CHUNK_WIDTH = 50   # Columns per bucket (same chunks as terrain and fortress rolls)
+
+
+@dataclass
+class Structure:
+    """One placed structure - its box is inclusive on all sides (y grows downwards)"""
+    id: int
+    kind: str                  # "fortress", "village", "beach", "lost_ruins", "boss_arena", ...
+    x0: int
+    y0: int
+    x1: int
+    y1: int
+    subtype: Optional[str] = None   # e.g. the fortress type
+    discovered: bool = False
+    data: Dict = field(default_factory=dict)  # Anything else worth keeping (entrances, rooms)
+
+    def contains(self, x: int, y: int) -> bool:
+        return self.x0 <= x <= self.x1 and self.y0 <= y <= self.y1
+
+    def overlaps(self, x0: int, y0: int, x1: int, y1: int) -> bool:
+        return self.x0 <= x1 and x0 <= self.x1 and self.y0 <= y1 and y0 <= self.y1
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        return (self.x0 + self.x1) / 2, (self.y0 + self.y1) / 2
+
+    def to_dict(self) -> Dict:
+        return {"kind": self.kind, "box": [self.x0, self.y0, self.x1, self.y1], "subtype": self.subtype,
+                "discovered": self.discovered, "data": self.data}
+
+
+class StructureRegistry:
+    """Every structure in the world, indexed by the chunks its box spans.
+
+    Structures are a few dozen blocks wide, so each sits in one to three
+    buckets: placing (:meth:`overlaps`) and per-frame discovery (:meth:`at`)
+    only look at the handful of structures in the chunks concerned.
+    """
+
+    def __init__(self, chunk_width: int = CHUNK_WIDTH):
+        self.chunk_width = chunk_width
+        self.structures: Dict[int, Structure] = {}
+        self.chunks: Dict[int, List[Structure]] = {}
+        self.next_id = 1
+
+    def _chunk_span(self, x0: int, x1: int) -> range:
+        return range(math.floor(x0) // self.chunk_width, math.floor(x1) // self.chunk_width + 1)
+
+    def add(self, kind: str, x0: int, y0: int, x1: int, y1: int, subtype: Optional[str] = None,
+            discovered: bool = False, **data) -> Structure:
+        """Register a structure's box (corners in any order)"""
+        x0, x1 = sorted((int(x0), int(x1)))
+        y0, y1 = sorted((int(y0), int(y1)))
+        structure = Structure(self.next_id, kind, x0, y0, x1, y1, subtype, discovered, dict(data))
+        self.next_id += 1
+        self.structures[structure.id] = structure
+        for chunk_id in self._chunk_span(x0, x1):
+            self.chunks.setdefault(chunk_id, []).append(structure)
+        return structure
+
+    def remove(self, structure: Structure):
+        if self.structures.pop(structure.id, None) is None:
+            return
+        for chunk_id in self._chunk_span(structure.x0, structure.x1):
+            bucket = self.chunks.get(chunk_id)
+            if bucket and structure in bucket:
+                bucket.remove(structure)
+                if not bucket:
+                    del self.chunks[chunk_id]
+
+    def clear(self):
+        self.structures.clear()
+        self.chunks.clear()
+        self.next_id = 1
+
+    def __len__(self) -> int:
+        return len(self.structures)
+
+    def _candidates(self, x0: int, x1: int) -> Iterator[Structure]:
+        seen: Set[int] = set()
+        for chunk_id in self._chunk_span(x0, x1):
+            for structure in self.chunks.get(chunk_id, ()):
+                if structure.id not in seen:
+                    seen.add(structure.id)
+                    yield structure
+
+    def overlapping(self, x0: int, y0: int, x1: int, y1: int, margin: int = 0,
+                    kinds: Optional[Iterable[str]] = None) -> List[Structure]:
+        """Structures whose box comes within ``margin`` blocks of the given box"""
+        kinds = set(kinds) if kinds is not None else None
+        x0, x1 = sorted((x0, x1))
+        y0, y1 = sorted((y0, y1))
+        x0, y0, x1, y1 = x0 - margin, y0 - margin, x1 + margin, y1 + margin
+        return [s for s in self._candidates(x0, x1)
+                if (kinds is None or s.kind in kinds) and s.overlaps(x0, y0, x1, y1)]
+
+    def overlaps(self, x0: int, y0: int, x1: int, y1: int, margin: int = 0,
+                 kinds: Optional[Iterable[str]] = None) -> bool:
+        """True if a new structure here would touch (or come within margin of) an existing one"""
+        return bool(self.overlapping(x0, y0, x1, y1, margin, kinds))
+
+    def at(self, x: float, y: float, kind: Optional[str] = None) -> Optional[Structure]:
+        """The structure containing block (x, y), if any - one bucket lookup"""
+        bx, by = math.floor(x), math.floor(y)
+        for structure in self.chunks.get(bx // self.chunk_width, ()):
+            if (kind is None or structure.kind == kind) and structure.contains(bx, by):
+                return structure
+        return None
+
+    def in_columns(self, x0: float, x1: float, kind: Optional[str] = None) -> List[Structure]:
+        """Structures spanning any column from x0 to x1 (what's on screen)"""
+        x0, x1 = math.floor(x0), math.floor(x1)
+        return [s for s in self._candidates(x0, x1)
+                if (kind is None or s.kind == kind) and s.x0 <= x1 and x0 <= s.x1]
+
+    def of_kind(self, kind: str, discovered: Optional[bool] = None) -> List[Structure]:
+        return [s for s in self.structures.values()
+                if s.kind == kind and (discovered is None or s.discovered == discovered)]
+
+    def nearest(self, x: float, kind: Optional[str] = None, discovered: Optional[bool] = None,
+                limit: int = 8) -> List[Structure]:
+        """Closest structures to column x (minimap markers)"""
+        matches = [s for s in self.structures.values()
+                   if (kind is None or s.kind == kind) and (discovered is None or s.discovered == discovered)]
+        return sorted(matches, key=lambda s: abs(s.center[0] - x))[:limit]
+
+    def add_block_clusters(self, kind: str, positions: Iterable[Tuple[int, int]], gap: int = 3,
+                           min_blocks: int = 8, subtype: Optional[str] = None) -> List[Structure]:
+        """Register clusters of matching blocks (rebuilds boxes for saves made before the registry).
+
+        Blocks whose columns are within ``gap`` of each other form one
+        cluster; clusters smaller than ``min_blocks`` are ignored.
+        """
+        columns: Dict[int, List[int]] = {}
+        for x, y in positions:
+            columns.setdefault(x, []).append(y)
+        added = []
+        cluster: List[int] = []
+        for x in sorted(columns) + [None]:
+            if cluster and (x is None or x - cluster[-1] > gap):
+                ys = [y for cx in cluster for y in columns[cx]]
+                if len(ys) >= min_blocks and not self.overlaps(cluster[0], min(ys), cluster[-1], max(ys),
+                                                               kinds=(kind,)):
+                    added.append(self.add(kind, cluster[0], min(ys), cluster[-1], max(ys), subtype))
+                cluster = []
+            if x is not None:
+                cluster.append(x)
+        return added
+
+    def to_list(self) -> List[Dict]:
+        """Saveable form (JSON-friendly)"""
+        return [s.to_dict() for s in self.structures.values()]
+
+    def load(self, saved: Iterable[Dict]):
+        """Replace the registry with saved structures"""
+        self.clear()
+        for entry in saved or ():
+            try:
+                x0, y0, x1, y1 = entry["box"]
+                self.add(entry["kind"], x0, y0, x1, y1, entry.get("subtype"),
+                         bool(entry.get("discovered", False)), **(entry.get("data") or {}))
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"⚠️ Skipping invalid saved structure {entry!r}: {e}")
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+🎨 Procedural Texture Cache for Order of the Stone
+Procedural textures are drawn the first time they're looked up instead of at import, and kept on disk
+as raw RGBA keyed by generator name, size and a hash of the generator's code, so later launches skip drawing
+"""
+
+import hashlib
+import inspect
+import os
+import struct
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+try:
+    import pygame
+except ImportError:
+    # Tests and dedicated servers run without pygame; they pass their own pixel converters
+    pygame = None
+
+CACHE_VERSION = 1           # Bump to throw away every cached texture
+TEXTURE_MAGIC = b"OTSTX1"
+TEXTURE_SUFFIX = ".rgba"
+
+_HEADER = struct.Struct("!HH")
+
+# (width, height, RGBA bytes) - what goes to disk
+Pixels = Tuple[int, int, bytes]
+
+
+def code_hash(func: Callable) -> str:
+    """Short hash of a generator's source, so editing a generator redraws its textures"""
+    try:
+        code = inspect.getsource(func).encode("utf-8")
+    except (OSError, TypeError):
+        code = getattr(getattr(func, "__code__", None), "co_code", repr(func).encode("utf-8"))
+    return hashlib.sha1(code).hexdigest()[:12]
+
+
+def texture_key(name: str, size: int, args: tuple, code: str, version: int = CACHE_VERSION) -> str:
+    """Cache key for one generated texture"""
+    text = f"{version}|{name}|{size}|{args!r}|{code}"
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_pixels(width: int, height: int, rgba: bytes) -> bytes:
+    if len(rgba) != width * height * 4:
+        raise ValueError(f"expected {width * height * 4} bytes of RGBA, got {len(rgba)}")
+    return TEXTURE_MAGIC + _HEADER.pack(width, height) + bytes(rgba)
+
+
+def decode_pixels(data: bytes) -> Pixels:
+    if not data.startswith(TEXTURE_MAGIC):
+        raise ValueError("not a cached texture")
+    width, height = _HEADER.unpack_from(data, len(TEXTURE_MAGIC))
+    rgba = data[len(TEXTURE_MAGIC) + _HEADER.size:]
+    if len(rgba) != width * height * 4:
+        raise ValueError("truncated cached texture")
+    return width, height, rgba
+
+
+def surface_to_pixels(surface) -> Pixels:
+    to_bytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+    return surface.get_width(), surface.get_height(), to_bytes(surface, "RGBA")
+
+
+def pixels_to_surface(width: int, height: int, rgba: bytes):
+    from_bytes = getattr(pygame.image, "frombytes", None) or pygame.image.fromstring
+    surface = from_bytes(rgba, (width, height), "RGBA")
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
+
+
+class ProceduralTextures(dict):
+    """The textures dict, with procedural entries registered as generators and resolved on first lookup.
+
+    Lookups (`[]`, `get`, `in`) see registered names; iterating only sees textures resolved so far.
+    Assigning a texture replaces any generator registered under that name.
+    """
+
+    def __init__(self, cache_dir: str, textures: Optional[Dict[str, Any]] = None, version: int = CACHE_VERSION,
+                 to_pixels: Callable[[Any], Pixels] = surface_to_pixels,
+                 from_pixels: Callable[[int, int, bytes], Any] = pixels_to_surface):
+        super().__init__(textures or {})
+        self.cache_dir = cache_dir
+        self.version = version
+        self.to_pixels = to_pixels
+        self.from_pixels = from_pixels
+        self._generators: Dict[str, Tuple[Callable, int, tuple]] = {}
+        self._codes: Dict[Callable, str] = {}
+        self.generated = 0
+        self.loaded = 0
+
+    def register(self, name: str, generator: Callable, size: int, *args):
+        """Draw `generator(size, *args)` for this name when it's first needed"""
+        super().pop(name, None)
+        self._generators[name] = (generator, size, args)
+
+    def pending(self) -> list:
+        """Registered names not drawn or loaded yet"""
+        return list(self._generators)
+
+    def warm(self, names: Optional[Iterable[str]] = None) -> int:
+        """Resolve textures ahead of use (e.g. behind a loading screen); returns how many"""
+        names = self.pending() if names is None else [name for name in names if name in self._generators]
+        for name in names:
+            self[name]
+        return len(names)
+
+    def __setitem__(self, name, texture):
+        self._generators.pop(name, None)
+        super().__setitem__(name, texture)
+
+    def __missing__(self, name):
+        if name not in self._generators:
+            raise KeyError(name)
+        texture = self._resolve(name)
+        del self._generators[name]
+        super().__setitem__(name, texture)
+        return texture
+
+    def __contains__(self, name) -> bool:
+        return super().__contains__(name) or name in self._generators
+
+    def get(self, name, default=None):
+        if super().__contains__(name) or name in self._generators:
+            return self[name]
+        return default
+
+    def _cache_file(self, name: str) -> str:
+        generator, size, args = self._generators[name]
+        code = self._codes.get(generator)
+        if code is None:
+            code = self._codes[generator] = code_hash(generator)
+        return os.path.join(self.cache_dir, f"{name}_{texture_key(name, size, args, code, self.version)}{TEXTURE_SUFFIX}")
+
+    def _resolve(self, name: str):
+        """The cached texture if its key still matches, otherwise draw it and cache it"""
+        generator, size, args = self._generators[name]
+        path = self._cache_file(name)
+        try:
+            with open(path, "rb") as f:
+                texture = self.from_pixels(*decode_pixels(f.read()))
+            self.loaded += 1
+            return texture
+        except OSError:
+            pass
+        except (ValueError, struct.error) as e:
+            print(f"⚠️ Dropping unreadable cached texture {name}: {e}")
+
+        texture = generator(size, *args)
+        self.generated += 1
+        try:
+            self._store(name, path, texture)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not cache texture {name}: {e}")
+        return texture
+
+    def _store(self, name: str, path: str, texture):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_file = path + ".tmp"
+        with open(temp_file, "wb") as f:
+            f.write(encode_pixels(*self.to_pixels(texture)))
+        os.replace(temp_file, path)
+        # Older versions of this texture (generator edited, version bumped) are dead weight
+        current = os.path.basename(path)
+        for file_name in os.listdir(self.cache_dir):
+            if (file_name != current and file_name.endswith(TEXTURE_SUFFIX)
+                    and file_name[:-len(TEXTURE_SUFFIX)].rsplit("_", 1)[0] == name):
+                try:
+                    os.remove(os.path.join(self.cache_dir, file_name))
+                except OSError:
+                    pass
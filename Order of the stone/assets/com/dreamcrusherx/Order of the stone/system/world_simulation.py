@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+🌦️ Headless World Simulation for Order of the Stone
+Day/night, water flow, crop growth and night monsters without pygame,
+so a dedicated server can run the world on its own
+"""
+
+import math
+import random
+import uuid
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from system.collision import move_box
+from system.mob_spawning import MobSpawner, SpawnRule, BIOME_DESERT
+
+DAY_LENGTH = 120.0            # Seconds of day (or night) - matches update_daylight
+WATER_FLOW_INTERVAL = 0.5     # Seconds between water flow steps (30 frames at 60 FPS)
+CROP_GROWTH_TIME = 3 * 300    # Crops mature after 3 in-game days
+CROP_UPDATE_INTERVAL = 1.0
+
+NIGHT_MONSTER_TYPES = ("monster", "zombie", "pigeon")
+MAX_NIGHT_MONSTERS = 25
+NIGHT_WAVE_RADIUS = 3         # Chunks either side of each player that get a nightfall wave
+MONSTER_SPEEDS = {"monster": 2.4, "zombie": 1.8, "pigeon": 3.0}  # Tiles per second
+MONSTER_AGGRO_RANGE = 24.0    # Tiles
+MONSTER_GRAVITY = 40.0        # Tiles per second squared
+MONSTER_MAX_FALL = 20.0       # Tiles per second
+MONSTER_WIDTH = 0.9
+MONSTER_HEIGHT = 1.0
+WORLD_BOTTOM = 300            # Mobs that fall past this are removed
+
+MOB_PASSABLE_BLOCKS = {None, "air", "water", "lava"}
+
+
+def create_night_monster(x: int, y: int, biome: str) -> Dict:
+    """Build a night monster, choosing its type by biome (same odds as the client)"""
+    if biome == BIOME_DESERT and random.random() < 0.4:
+        monster_type, hp = "pigeon", 6
+    elif random.random() < 0.3:
+        monster_type, hp = "zombie", 12
+    else:
+        monster_type, hp = "monster", 8
+    return {
+        "id": str(uuid.uuid4()),
+        "type": monster_type,
+        "x": float(x),
+        "y": float(y),
+        "hp": hp,
+        "cooldown": 0,
+        "night_spawned": True
+    }
+
+
+class WorldSimulation:
+    """Authoritative world tick for a dedicated server.
+
+    Reads blocks through ``get_block`` and writes through ``set_block`` (the
+    server routes writes to every player). Blocks changed elsewhere - e.g. by
+    players - must be reported with :meth:`notify_block_change`.
+    """
+
+    def __init__(self, get_block: Callable[[int, int], Optional[str]],
+                 set_block: Callable[[int, int, Optional[str]], None],
+                 blocks: Iterable[Tuple[int, int, str]] = (), chunk_size: int = 50,
+                 entities: List[Dict] = None, crops: Dict[Tuple[int, int], Dict] = None,
+                 is_day: bool = True, day_count: int = 1, now: float = 0.0):
+        self.get_block = get_block
+        self._write_block = set_block
+        self.entities = entities if entities is not None else []
+        self.crops = crops if crops is not None else {}
+        self.water = set()
+        for x, y, block in blocks:
+            self._track(x, y, block, now)
+
+        self.is_day = is_day
+        self.day_count = day_count
+        self.phase_start = now
+        self.next_water = now + WATER_FLOW_INTERVAL
+        self.next_crops = now + CROP_UPDATE_INTERVAL
+        self.last_tick = now
+
+        self.spawner = MobSpawner(get_block, chunk_size=chunk_size)
+        self.spawner.add_rule(SpawnRule("night_wave", create_night_monster, NIGHT_MONSTER_TYPES,
+                                        max_global=MAX_NIGHT_MONSTERS, max_per_chunk=3, interval=0,
+                                        chance=0.7, spacing=15))
+
+    # ------------------------------------------------------------------
+    # Blocks
+    # ------------------------------------------------------------------
+
+    def _track(self, x: int, y: int, block: Optional[str], now: float):
+        """Keep the water set and crop table in step with a block"""
+        if block == "water":
+            self.water.add((x, y))
+        else:
+            self.water.discard((x, y))
+        if block in ("crop_young", "crop_mature"):
+            self.crops.setdefault((x, y), {"planted_time": now, "growth_progress": 0.0})
+        else:
+            self.crops.pop((x, y), None)
+
+    def notify_block_change(self, x: int, y: int, block: Optional[str]):
+        """A block changed outside the simulation (e.g. a player broke it)"""
+        self._track(x, y, block, self.last_tick)
+        self.spawner.notify_block_change(x, y)
+
+    def set_block(self, x: int, y: int, block: Optional[str]):
+        self._write_block(x, y, block)
+        self.notify_block_change(x, y, block)
+
+    # ------------------------------------------------------------------
+    # Tick
+    # ------------------------------------------------------------------
+
+    def tick(self, now: float, player_positions: List[Tuple[float, float]]):
+        """Advance the world to ``now`` (seconds)"""
+        dt = min(now - self.last_tick, 0.25)  # Don't let a stall teleport mobs through walls
+        self.last_tick = now
+
+        self.update_daylight(now, player_positions)
+        if now >= self.next_water:
+            self.next_water = now + WATER_FLOW_INTERVAL
+            self.update_water()
+        if now >= self.next_crops:
+            self.next_crops = now + CROP_UPDATE_INTERVAL
+            self.update_crops(now)
+        if dt > 0:
+            self.update_monsters(dt, player_positions)
+
+    def phase_elapsed(self, now: float) -> float:
+        """Seconds since the current day or night began (what clients sync to)"""
+        return now - self.phase_start
+
+    def update_daylight(self, now: float, player_positions: List[Tuple[float, float]]) -> bool:
+        """Flip day/night every DAY_LENGTH seconds; returns True on a flip"""
+        if now - self.phase_start < DAY_LENGTH:
+            return False
+        self.is_day = not self.is_day
+        self.phase_start = now
+        if self.is_day:
+            self.day_count += 1
+            self.spawner.cancel("night_wave")
+            # Night monsters burn away at dawn
+            self.entities[:] = [e for e in self.entities if not e.get("night_spawned")]
+            print(f"🌅 Day {self.day_count} has begun!")
+        else:
+            chunks = set()
+            for x, _ in player_positions:
+                center = self.spawner.chunk_of(x)
+                chunks.update(range(center - NIGHT_WAVE_RADIUS, center + NIGHT_WAVE_RADIUS + 1))
+            self.spawner.queue_wave("night_wave", sorted(chunks), attempts_per_chunk=2)
+            print("🌙 Night has fallen")
+        return True
+
+    def update_water(self):
+        """Water falls into empty space below, else spreads sideways onto support"""
+        for x, y in list(self.water):
+            if (x, y) not in self.water:
+                continue  # Already moved this step
+            below = self.get_block(x, y + 1)
+            if below is None or below == "air":
+                self.set_block(x, y, None)
+                self.set_block(x, y + 1, "water")
+                continue
+            for dx in (-1, 1):
+                side = self.get_block(x + dx, y)
+                if side is None or side == "air":
+                    side_below = self.get_block(x + dx, y + 1)
+                    if side_below is not None and side_below != "air":
+                        self.set_block(x, y, None)
+                        self.set_block(x + dx, y, "water")
+                        break
+
+    def update_crops(self, now: float):
+        """Crops turn mature once their growth time has passed"""
+        for (x, y), crop in list(self.crops.items()):
+            crop["growth_progress"] = min(1.0, (now - crop["planted_time"]) / CROP_GROWTH_TIME)
+            if crop["growth_progress"] >= 1.0 and self.get_block(x, y) != "crop_mature":
+                self.set_block(x, y, "crop_mature")
+
+    def _is_solid(self, x: int, y: int) -> bool:
+        return self.get_block(x, y) not in MOB_PASSABLE_BLOCKS
+
+    def update_monsters(self, dt: float, player_positions: List[Tuple[float, float]]):
+        """Spawn queued night monsters and walk them toward the nearest player"""
+        if self.spawner.pending:
+            anchor_x = player_positions[0][0] if player_positions else 0.0
+            self.spawner.update(self.entities, anchor_x)
+
+        fallen = []
+        for mob in self.entities:
+            if mob.get("type") not in NIGHT_MONSTER_TYPES:
+                continue
+            target = None
+            best = MONSTER_AGGRO_RANGE
+            for px, py in player_positions:
+                distance = math.hypot(px - mob["x"], py - mob["y"])
+                if distance < best:
+                    target, best = (px, py), distance
+
+            vel_x = 0.0
+            if target and abs(target[0] - mob["x"]) > 0.5:
+                vel_x = math.copysign(MONSTER_SPEEDS.get(mob["type"], 2.0), target[0] - mob["x"])
+            vel_y = min(mob.get("vel_y", 0.0) + MONSTER_GRAVITY * dt, MONSTER_MAX_FALL)
+
+            step_height = 1.0 if mob.get("on_ground") else 0.0
+            result = move_box(mob["x"], mob["y"], MONSTER_WIDTH, MONSTER_HEIGHT,
+                              vel_x * dt, vel_y * dt, self._is_solid, step_height)
+            mob["x"], mob["y"] = result.x, result.y
+            mob["vel_y"] = 0.0 if result.normal_y else vel_y
+            mob["on_ground"] = result.on_ground
+            mob["facing_direction"] = 1 if vel_x >= 0 else -1
+            if mob["y"] > WORLD_BOTTOM:
+                fallen.append(mob)
+
+        for mob in fallen:
+            self.entities.remove(mob)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def get_save_data(self) -> Dict:
+        """World fields owned by the simulation, in the save-file format"""
+        return {
+            "entities": [dict(e) for e in self.entities],
+            "crops": {f"{x},{y}": dict(crop) for (x, y), crop in self.crops.items()},
+            "world_settings": {"time": self.last_tick, "day": self.is_day, "day_count": self.day_count,
+                               "weather": "clear"}
+        }
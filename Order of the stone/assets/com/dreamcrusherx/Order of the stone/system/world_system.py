@@ -7,10 +7,29 @@ A clean, efficient world management system with proper saving and loading
 import os
 import json
 import time
-import pygame
+try:
+    import pygame
+except ImportError:
+    # Dedicated servers run without pygame; only world previews need it
+    pygame = None
 # Using MinecraftWorldGenerator directly in _generate_world_data
 import shutil
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
+
+try:
+    from system.world_templates import WorldTemplateCache
+    from world_generation.world_gen import GENERATOR_VERSION
+except ImportError as e:
+    print(f"⚠️ Warning: World templates not available: {e}")
+    WorldTemplateCache = None
+
+try:
+    from world_generation.world_checks import chunk_checksums
+except ImportError as e:
+    print(f"⚠️ Warning: World checks not available: {e}")
+    chunk_checksums = None
+
+WORLD_WIDTH = 200  # Width of newly created worlds
 
 class WorldSystem:
     """Modern world management system with proper persistence"""
@@ -21,6 +40,9 @@ class WorldSystem:
         self.current_world_name: Optional[str] = None
         self.current_world_data: Dict[str, Any] = {}
         self.world_list: List[Dict[str, Any]] = []
+        # Worlds generated from a typed-in seed are kept as templates - the same seed again is a copy
+        self.templates = (WorldTemplateCache(os.path.join(save_dir, "world_templates"), GENERATOR_VERSION)
+                          if WorldTemplateCache else None)
         
         # Ensure directories exist
         self._ensure_directories()
@@ -75,8 +97,9 @@ class WorldSystem:
         except Exception as e:
             print(f"❌ Error saving world list: {e}")
     
-    def create_world(self, name: str, seed: Optional[str] = None) -> bool:
-        """Create a new world with the given name and seed"""
+    def create_world(self, name: str, seed: Optional[str] = None,
+                     on_progress: Optional[Callable[[int, int], None]] = None) -> bool:
+        """Create a new world with the given name and seed (on_progress gets generation steps done/total)"""
         try:
             # Validate world name
             if not name or len(name) > 32:
@@ -89,7 +112,7 @@ class WorldSystem:
                 return False
             
             # Generate world data
-            world_data = self._generate_world_data(name, seed)
+            world_data = self._generate_world_data(name, seed, on_progress)
             
             # Set as current world data
             self.current_world_name = name
@@ -121,13 +144,22 @@ class WorldSystem:
             print(f"❌ Error creating world: {e}")
             return False
     
-    def _generate_world_data(self, name: str, seed: Optional[str] = None) -> Dict[str, Any]:
+    def _generate_world_data(self, name: str, seed: Optional[str] = None,
+                             on_progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
         """Generate initial world data using the world_gen module."""
         try:
             from world_generation.world_gen import generate_world
             
             print(f"🌍 Generating new world: {name}")
-            world_data = generate_world(seed=seed, world_width=200)
+            if seed is not None and self.templates:
+                world_data = self.templates.get_or_generate(
+                    seed, WORLD_WIDTH, lambda: generate_world(seed=seed, world_width=WORLD_WIDTH, on_progress=on_progress))
+            else:
+                world_data = generate_world(seed=seed, world_width=WORLD_WIDTH, on_progress=on_progress)
+            
+            # Checksums let loading spot damaged chunks without validating the whole world
+            if chunk_checksums:
+                world_data["chunk_checksums"] = chunk_checksums(world_data.get("blocks", {}))
             
             # Add world metadata
             world_data["name"] = name
@@ -327,6 +359,10 @@ class WorldSystem:
                     player[key] = default_value
                     print(f"⚠️ Fixed player field type: {key}")
             
+            # Checksums must describe the blocks being written, or every edited chunk looks damaged on load
+            if chunk_checksums:
+                self.current_world_data["chunk_checksums"] = chunk_checksums(self.current_world_data["blocks"])
+            
             # Update save time
             self.current_world_data["last_saved"] = time.time()
             
@@ -485,8 +521,10 @@ class WorldSystem:
         
         return self.current_world_data["entities"].copy()
     
-    def create_world_preview(self, world_name: str, surface: pygame.Surface) -> bool:
+    def create_world_preview(self, world_name: str, surface: "pygame.Surface") -> bool:
         """Create a preview image for a world"""
+        if pygame is None:
+            return False
         try:
             preview_dir = os.path.join(self.save_dir, "previews")
             os.makedirs(preview_dir, exist_ok=True)
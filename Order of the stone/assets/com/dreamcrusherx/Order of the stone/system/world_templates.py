@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+🗺️ World Template Cache for Order of the Stone
+Generated worlds kept on disk by (seed, generator version, width) in the compact chunk format,
+so creating another world from a known seed is a copy instead of a regeneration
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from multiplayer.world_stream import DEFAULT_CHUNK_SIZE, decode_chunk_blocks, encode_chunk_blocks, parse_block_key
+
+MAX_TEMPLATE_BYTES = 64 * 1024 * 1024   # Least recently used templates are evicted beyond this
+MAX_TEMPLATES = 32
+
+TEMPLATE_MAGIC = b"OTSWT1"
+INDEX_FILE = "index.json"
+
+_LENGTH = struct.Struct("!I")
+_CHUNK = struct.Struct("!iI")
+
+
+def template_key(seed: Any, width: int, version: int) -> str:
+    """Cache key - int and string seeds are different worlds (1234 != "1234")"""
+    text = f"{version}|{type(seed).__name__}:{seed}|{width}"
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:20]
+
+
+def encode_template(world: Dict, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytes:
+    """Everything but the blocks as compressed JSON, then one compressed palette payload per chunk"""
+    chunks: Dict[int, Dict] = {}
+    for key, block in world.get("blocks", {}).items():
+        x, y = parse_block_key(key)
+        chunks.setdefault(x // chunk_size, {})[(x, y)] = block
+    meta = {key: value for key, value in world.items() if key != "blocks"}
+    meta["chunk_size"] = chunk_size
+    meta_data = zlib.compress(json.dumps(meta).encode("utf-8"), 6)
+
+    out = bytearray(TEMPLATE_MAGIC)
+    out += _LENGTH.pack(len(meta_data)) + meta_data
+    out += _LENGTH.pack(len(chunks))
+    for cx in sorted(chunks):
+        payload = encode_chunk_blocks(chunks[cx], cx * chunk_size)
+        out += _CHUNK.pack(cx, len(payload)) + payload
+    return bytes(out)
+
+
+def decode_template(data: bytes) -> Dict:
+    """Rebuild the world dict a template was made from"""
+    if not data.startswith(TEMPLATE_MAGIC):
+        raise ValueError("not a world template")
+    view = memoryview(data)
+    offset = len(TEMPLATE_MAGIC)
+    (meta_size,) = _LENGTH.unpack_from(view, offset)
+    offset += _LENGTH.size
+    world = json.loads(zlib.decompress(view[offset:offset + meta_size]))
+    offset += meta_size
+    chunk_size = world.pop("chunk_size", DEFAULT_CHUNK_SIZE)
+    (chunk_count,) = _LENGTH.unpack_from(view, offset)
+    offset += _LENGTH.size
+    blocks: Dict[str, str] = {}
+    for _ in range(chunk_count):
+        cx, size = _CHUNK.unpack_from(view, offset)
+        offset += _CHUNK.size
+        blocks.update(decode_chunk_blocks(view[offset:offset + size], cx * chunk_size))
+        offset += size
+    world["blocks"] = blocks
+    return world
+
+
+class WorldTemplateCache:
+    """Template files plus a small JSON index recording their size and when each was last used"""
+
+    def __init__(self, cache_dir: str, version: int, max_bytes: int = MAX_TEMPLATE_BYTES,
+                 max_templates: int = MAX_TEMPLATES):
+        self.cache_dir = cache_dir
+        self.version = version
+        self.max_bytes = max_bytes
+        self.max_templates = max_templates
+        self.index: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._load_index()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.owt")
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.cache_dir, INDEX_FILE), "r") as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def _save_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_file = os.path.join(self.cache_dir, INDEX_FILE + ".tmp")
+        with open(temp_file, "w") as f:
+            json.dump(self.index, f, indent=2)
+        os.replace(temp_file, os.path.join(self.cache_dir, INDEX_FILE))
+
+    def total_bytes(self) -> int:
+        return sum(entry.get("bytes", 0) for entry in self.index.values())
+
+    def get(self, seed: Any, width: int) -> Optional[Dict]:
+        """A fresh copy of the cached world for this seed, or None"""
+        key = template_key(seed, width, self.version)
+        entry = self.index.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                world = decode_template(f.read())
+        except (OSError, ValueError, zlib.error, struct.error) as e:
+            print(f"⚠️ Dropping unreadable world template for seed {seed!r}: {e}")
+            self.remove(key)
+            self.misses += 1
+            return None
+        entry["last_used"] = time.time()
+        self._save_index()
+        self.hits += 1
+        return world
+
+    def put(self, seed: Any, width: int, world: Dict) -> str:
+        """Store a generated world as this seed's template (evicting old templates if over the limits)"""
+        key = template_key(seed, width, self.version)
+        data = encode_template(world)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_file = self._path(key) + ".tmp"
+        with open(temp_file, "wb") as f:
+            f.write(data)
+        os.replace(temp_file, self._path(key))
+        self.index[key] = {"seed": seed, "width": width, "version": self.version,
+                           "bytes": len(data), "last_used": time.time()}
+        self._evict(keep=key)
+        self._save_index()
+        return key
+
+    def get_or_generate(self, seed: Any, width: int, generate: Callable[[], Dict]) -> Dict:
+        """The cached world for this seed, generating (and caching) it the first time"""
+        world = self.get(seed, width)
+        if world is not None:
+            print(f"🗺️ World template hit for seed {seed!r} ({len(world.get('blocks', {}))} blocks)")
+            return world
+        world = generate()
+        try:
+            self.put(seed, width, world)
+        except OSError as e:
+            print(f"⚠️ Could not cache world template: {e}")
+        return world
+
+    def pregenerate(self, seeds: Iterable[Any], width: int, generate: Callable[[Any], Dict]) -> int:
+        """Build templates for seeds ahead of time (e.g. competition seeds); returns how many were new"""
+        created = 0
+        for seed in seeds:
+            if template_key(seed, width, self.version) in self.index:
+                continue
+            self.put(seed, width, generate(seed))
+            created += 1
+        return created
+
+    def remove(self, key: str):
+        self.index.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+        self._save_index()
+
+    def _evict(self, keep: Optional[str] = None):
+        """Drop least recently used templates until within the size and count limits"""
+        by_age = sorted((k for k in self.index if k != keep), key=lambda k: self.index[k].get("last_used", 0))
+        while by_age and (len(self.index) > self.max_templates or self.total_bytes() > self.max_bytes):
+            key = by_age.pop(0)
+            print(f"🗑️ Evicting world template for seed {self.index[key].get('seed')!r}")
+            self.index.pop(key, None)
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-generate world templates for popular seeds")
+    parser.add_argument("seeds", nargs="+", help="Seeds to pre-generate (typed in as text, like the world menu)")
+    parser.add_argument("--width", type=int, default=200, help="World width in blocks (default: 200)")
+    parser.add_argument("--save-dir", default="save_data", help="Folder holding worlds (default: save_data)")
+    args = parser.parse_args(argv)
+
+    from world_generation.world_gen import GENERATOR_VERSION, generate_world
+    cache = WorldTemplateCache(os.path.join(args.save_dir, "world_templates"), GENERATOR_VERSION)
+    created = cache.pregenerate(args.seeds, args.width,
+                                lambda seed: generate_world(seed=seed, world_width=args.width))
+    print(f"✅ {created} new world templates ({len(cache.index)} cached, {cache.total_bytes() / 1024:.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Asset loader test script
+Checks manifest ordering, title-first finishing, per-frame slices, progress and missing files
+"""
+
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from system.asset_loader import PRIORITY_GAME, PRIORITY_LATE, PRIORITY_TITLE, AssetLoader, AssetManifest
+
+
+def make_manifest():
+    manifest = AssetManifest()
+    manifest.add("grass", "texture", "tiles/grass.png", PRIORITY_GAME)
+    manifest.add("carrot_sheet", "texture", "tiles/carrot.gif", PRIORITY_LATE)
+    manifest.add("font", "font", "Arial", PRIORITY_TITLE, 24)
+    manifest.add("hit", "sound", "damage/hit.wav", PRIORITY_GAME)
+    return manifest
+
+
+def test_manifest_orders_by_priority():
+    """Title assets first, then listing order within a priority; names are unique"""
+    manifest = make_manifest()
+    assert [asset.name for asset in manifest.ordered()] == ["font", "grass", "hit", "carrot_sheet"]
+    try:
+        manifest.add("grass", "texture", "tiles/grass2.png")
+        assert False, "duplicate names should be rejected"
+    except ValueError:
+        pass
+
+
+def test_title_assets_finish_first_on_the_main_thread():
+    """Decoding runs on workers; finishing and callbacks run on the calling thread, title priority first"""
+    decode_threads, finish_threads, loaded = set(), set(), []
+
+    def decode(asset):
+        decode_threads.add(threading.get_ident())
+        return asset.source.upper()
+
+    def finish(asset, data):
+        finish_threads.add(threading.get_ident())
+        return f"surface<{data}>"
+
+    decoders = {kind: decode for kind in ("texture", "sound", "font")}
+    finishers = {kind: finish for kind in ("texture", "sound", "font")}
+    with contextlib.redirect_stdout(io.StringIO()):
+        loader = AssetLoader(make_manifest(), lambda asset, value: loaded.append(asset.name),
+                             decoders, finishers, workers=2).start()
+        assert loader.finish(PRIORITY_TITLE) == 1 and loaded == ["font"]
+        assert loader.ready(PRIORITY_TITLE) and not loader.ready(PRIORITY_GAME)
+        assert loader.progress() == 0.25 and loader.next_kind() == "texture"
+
+        while not loader.done:
+            loader.pump(budget_ms=0)  # A zero budget still finishes one asset per frame
+            time.sleep(0.001)
+    assert loaded == ["font", "grass", "hit", "carrot_sheet"]
+    assert loader.assets["hit"] == "surface<DAMAGE/HIT.WAV>" and loader.progress() == 1.0
+    assert finish_threads == {threading.get_ident()} and threading.get_ident() not in decode_threads
+
+
+def test_missing_files_report_none():
+    """A file that can't be decoded is handed to the callback as None so the game can use its fallback"""
+    loaded = {}
+
+    def decode(asset):
+        if "missing" in asset.source:
+            raise FileNotFoundError(asset.source)
+        return b"data"
+
+    manifest = AssetManifest()
+    manifest.add("ok", "sound", "ok.wav")
+    manifest.add("gone", "sound", "missing.wav")
+    manifest.add("odd", "video", "intro.mp4")  # No decoder for this kind
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        loader = AssetLoader(manifest, lambda asset, value: loaded.update({asset.name: value}), {"sound": decode},
+                             {"sound": lambda asset, data: len(data)}).start()
+        loader.finish()
+    assert loaded == {"ok": 4, "gone": None, "odd": None}
+    assert sorted(loader.errors) == ["gone", "odd"] and "2 missing" in output.getvalue()
+
+
+if __name__ == "__main__":
+    test_manifest_orders_by_priority()
+    test_title_assets_finish_first_on_the_main_thread()
+    test_missing_files_report_none()
+    print("✅ All asset loader tests passed!")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Biome map test script
+Checks that biomes are reproducible per seed, cached per chunk and shaped like the old biomes
+"""
+
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from world_generation.biome_map import BiomeMap, TREE_DENSITY, value_noise
+
+
+def test_same_seed_same_biomes():
+    """Two maps from the same seed agree everywhere; a different seed gives a different world"""
+    first, second, other = BiomeMap(1234), BiomeMap("1234"), BiomeMap("My World")
+    assert first.columns(-3000, 3000) == second.columns(-3000, 3000)
+    assert first.columns(-3000, 3000) != other.columns(-3000, 3000)
+    # Asking again (or in a different order) never changes the answer
+    assert [first.info(x) for x in range(2999, -3000, -1)] == list(reversed(first.columns(-2999, 3000)))
+
+
+def test_lookups_are_cached_per_chunk():
+    """A chunk's noise is computed once; later lookups in it are cache hits"""
+    biomes = BiomeMap(7, chunk_width=50, max_chunks=4)
+    for x in range(0, 50):
+        biomes.info(x)
+    assert biomes.chunks_built == 1
+    biomes.info(-1)
+    biomes.info(49.7)  # Player positions are floats
+    assert biomes.chunks_built == 2
+    for chunk_id in range(2, 8):
+        biomes.info(chunk_id * 50)
+    assert len(biomes.chunks) == 4  # Least recently used chunks were dropped
+
+
+def test_biome_shape():
+    """Biomes come in runs, deserts stay away from spawn, and trees follow the biome"""
+    biomes = BiomeMap(99)
+    columns = biomes.columns(-10000, 10000)
+    names = [info.biome for info in columns]
+    assert set(names) == {"desert", "forest", "field", "mixed"}
+    changes = sum(1 for a, b in zip(names, names[1:]) if a != b)
+    assert len(names) / changes > 10  # Biomes span many columns, no per-column flicker
+    assert all(biomes.biome(x) != "desert" for x in range(-200, 201))
+    for info in columns:
+        assert info.tree_density == TREE_DENSITY[info.biome]
+        assert 0.0 <= info.temperature <= 1.0
+    assert 0 < sum(biomes.has_carrots(chunk * 50) for chunk in range(-100, 100)) < 50
+
+
+def test_value_noise_is_smooth():
+    """Neighbouring columns never jump - the noise eases between its lattice points"""
+    values = [value_noise(5, 1, x, 40) for x in range(-400, 400)]
+    assert all(0.0 <= v <= 1.0 for v in values)
+    assert max(abs(a - b) for a, b in zip(values, values[1:])) < 0.05
+
+
+if __name__ == "__main__":
+    test_same_seed_same_biomes()
+    test_lookups_are_cached_per_chunk()
+    test_biome_shape()
+    test_value_noise_is_smooth()
+    print("✅ All biome map tests passed!")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Block change batching test script
+Checks per-chunk deltas, full-chunk resends and skipping a player's own changes
+"""
+
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from multiplayer.protocol import encode_message, FrameDecoder
+from multiplayer.world_stream import ChunkIndex
+from multiplayer.block_sync import (BlockChangeBatcher, build_batch_message, decode_batch_chunk,
+                                    MODE_DELTA, MODE_FULL)
+
+
+def send(message):
+    """Round-trip a message through the wire format"""
+    return FrameDecoder().feed(encode_message(message))[0]
+
+
+def test_changes_grouped_into_deltas():
+    """A tick's changes arrive as one small delta per chunk, last change wins"""
+    batcher = BlockChangeBatcher(chunk_size=50)
+    batcher.add(3, 100, "stone", "Alex")
+    batcher.add(3, 100, None, "Alex")       # Placed then broken in the same tick
+    batcher.add(4, 100, "dirt", "Alex")
+    batcher.add(-7, 120, "wood", "Steve")
+    assert len(batcher) == 3
+
+    message = send(build_batch_message(batcher.flush()))
+    applied = {}
+    for chunk in message["chunks"]:
+        assert chunk[1] == MODE_DELTA
+        cx, blocks, span = decode_batch_chunk(chunk, 50)
+        assert span is None
+        applied.update(blocks)
+    assert applied == {"3,100": None, "4,100": "dirt", "-7,120": "wood"}
+    assert len(encode_message(message)) < 100
+    assert len(batcher) == 0 and batcher.flush() == []
+
+
+def test_busy_chunk_is_resent_whole():
+    """Past the threshold the whole chunk goes out, with a span covering removals"""
+    blocks = {f"{x},{y}": "stone" for x in range(0, 50) for y in range(100, 110)}
+    index = ChunkIndex(blocks, chunk_size=50)
+    batcher = BlockChangeBatcher(chunk_size=50, full_chunk_threshold=10)
+    for x in range(20):
+        index.set_block(x, 109, None)   # Server applies changes as they happen
+        batcher.add(x, 109, None, "Alex")
+
+    chunk = send(build_batch_message(batcher.flush(index)))["chunks"][0]
+    assert chunk[1] == MODE_FULL
+    cx, full, (y_min, y_max) = decode_batch_chunk(chunk, 50)
+    assert cx == 0 and y_min <= 100 and y_max == 109
+    assert "5,109" not in full and full["30,109"] == "stone"
+
+
+def test_own_changes_not_echoed():
+    """Chunks changed only by the recipient are left out of their batch"""
+    batcher = BlockChangeBatcher(chunk_size=50)
+    batcher.add(1, 100, "stone", "Alex")
+    batcher.add(60, 100, "stone", "Steve")
+    batcher.add(61, 100, "dirt", "Alex")
+    entries = batcher.flush()
+
+    alex = build_batch_message(entries, exclude_editor="Alex")
+    assert [chunk[0] for chunk in alex["chunks"]] == [1]   # Steve also changed chunk 1
+    assert len(build_batch_message(entries)["chunks"]) == 2
+    assert build_batch_message([e for e in entries if e["cx"] == 0], exclude_editor="Alex") is None
+
+
+if __name__ == "__main__":
+    test_changes_grouped_into_deltas()
+    test_busy_chunk_is_resent_whole()
+    test_own_changes_not_echoed()
+    print("✅ All block sync tests passed!")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Chunk pre-generation test script
+Checks deterministic chunk plans, background planning and budgeted installs
+"""
+
+import os
+import sys
+import time
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from world_generation.biome_map import BiomeInfo, BiomeMap, TREE_DENSITY
+from world_generation.chunk_pregen import (ChunkPregenerator, plan_chunk, plan_terrain_column, surface_height,
+                                           BEDROCK_Y)
+
+
+class SplitBiomes(BiomeMap):
+    """Desert west of spawn, forest east of it"""
+
+    def classify(self, x):
+        biome = "desert" if x < 0 else "forest"
+        return BiomeInfo(biome, 0.5, TREE_DENSITY[biome])
+
+
+biomes = SplitBiomes("test")
+
+
+def test_chunk_plans_are_deterministic():
+    """The same chunk of the same seed always plans the same terrain: layers, biome surface and ores"""
+    first = plan_chunk(3, biomes, lambda x, y: None)
+    assert first == plan_chunk(3, SplitBiomes("test"), lambda x, y: None)
+    assert first != plan_chunk(3, SplitBiomes("another seed"), lambda x, y: None)
+    assert [x for x, _ in first] == list(range(150, 200))
+
+    blocks = {(bx, by): block for _, column in first for bx, by, block in column}
+    for x in range(150, 200):
+        top = surface_height(x)
+        assert blocks[(x, top)] == "grass"
+        assert blocks[(x, top + 1)] == blocks[(x, top + 2)] == "dirt"
+        assert blocks[(x, BEDROCK_Y)] == "bedrock"
+    assert any(block in ("coal", "iron", "gold", "diamond") for block in blocks.values())
+    assert any(block == "log" for block in blocks.values())  # Forest chunk grew trees
+
+    desert = {(bx, by): block for _, column in plan_chunk(-2, biomes, lambda x, y: None)
+              for bx, by, block in column}
+    assert desert[(-80, surface_height(-80))] == "sand"
+
+
+def test_plans_never_cover_existing_blocks():
+    """Blocks already in the world (player builds) are left out of the plan"""
+    top = surface_height(10)
+    world = {(10, top): "chest", (10, top + 40): "torch"}
+    field = BiomeInfo("field", 0.5, TREE_DENSITY["field"])
+    column = plan_terrain_column(10, field, __import__("random").Random(1), lambda x, y: world.get((x, y)))
+    planned = {(bx, by) for bx, by, _ in column}
+    assert (10, top) not in planned and (10, top + 40) not in planned
+    assert (10, top + 1) in planned
+
+
+def test_far_columns_are_planned_in_full():
+    """Columns far out in the infinite world plan the same full terrain as ones near spawn"""
+    field = BiomeInfo("field", 0.5, TREE_DENSITY["field"])
+    for x in (10001, -250000):
+        column = {(by, block) for _, by, block in plan_terrain_column(x, field, __import__("random").Random(1),
+                                                                       lambda x, y: None)}
+        assert (surface_height(x), "grass") in column and (BEDROCK_Y, "bedrock") in column
+        assert len(column) > 100
+
+
+def test_background_planning_and_budgeted_install():
+    """Chunks near the player are planned off-thread; installs stop at the budget and resume next frame"""
+    planned_chunks = []
+
+    def plan(chunk_id):
+        planned_chunks.append(chunk_id)
+        return [(x, [(x, 0, "grass")]) for x in range(chunk_id * 10, chunk_id * 10 + 10)]
+
+    pregen = ChunkPregenerator(plan, chunk_width=10, lookahead=1, budget_ms=5)
+    pregen.request_around(25.0, lambda chunk_id: chunk_id == 3)  # Chunk 3 already has terrain
+    deadline = time.time() + 5
+    while len(pregen.ready) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert sorted(planned_chunks) == [1, 2] and planned_chunks[0] == 2  # Player's own chunk first
+
+    installed_columns, finished = [], []
+
+    def slow_install(x, blocks):
+        time.sleep(0.002)
+        installed_columns.append(x)
+
+    first_frame = pregen.install(slow_install, finished.append)
+    assert 0 < first_frame < 20  # Stopped at the budget
+    while pregen.pending():
+        pregen.install(slow_install, finished.append)
+    assert sorted(installed_columns) == list(range(10, 30)) and sorted(finished) == [1, 2]
+
+    pregen.request_around(25.0, lambda chunk_id: False)  # Nothing new to plan
+    pregen.reset()
+    pregen.request_around(25.0, lambda chunk_id: True)
+    assert pregen.pending() == 0
+    pregen.stop()
+
+
+if __name__ == "__main__":
+    test_chunk_plans_are_deterministic()
+    test_plans_never_cover_existing_blocks()
+    test_far_columns_are_planned_in_full()
+    test_background_planning_and_budgeted_install()
+    print("✅ All chunk pre-generation tests passed!")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tile collision test script
+Checks swept AABB movement, contact normals, tunnelling and horse step-up
+"""
+
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from system.collision import move_box, find_solid_tile
+
+
+def make_world(solid):
+    """Build a collision callback from a set of solid tiles"""
+    return lambda x, y: (x, y) in solid
+
+
+FLOOR = {(x, 10) for x in range(-20, 21)}
+
+
+def test_lands_flush_on_floor():
+    """Falling boxes stop exactly on top of the floor with an upward normal"""
+    result = move_box(0.0, 8.5, 0.9, 1.0, 0, 0.8, make_world(FLOOR))
+    assert result.on_ground
+    assert result.y == 9.0
+    assert result.hit_y == (0, 10)
+
+
+def test_fast_fall_does_not_tunnel():
+    """A fall of several tiles in one frame still stops at a 1-tile floor"""
+    result = move_box(0.0, 0.0, 0.9, 1.0, 0, 25.0, make_world(FLOOR))
+    assert result.on_ground
+    assert result.y == 9.0
+
+
+def test_wall_normals_and_ceiling():
+    """Walls report horizontal normals, ceilings a downward one"""
+    wall = make_world({(3, 5), (-3, 5), (0, 3)})
+    right = move_box(1.0, 5.0, 0.9, 1.0, 1.5, 0, wall)
+    assert (right.x, right.normal_x, right.hit_x) == (2.1, -1, (3, 5))
+    left = move_box(-1.0, 5.0, 0.9, 1.0, -1.5, 0, wall)
+    assert (left.x, left.normal_x) == (-2.0, 1)
+    up = move_box(0.0, 5.0, 0.9, 1.0, 0, -1.5, wall)
+    assert up.hit_ceiling and up.y == 4.0
+
+
+def test_horse_steps_up_single_blocks():
+    """Step-up climbs one block but not a two-block wall"""
+    step = FLOOR | {(2, 9)}
+    result = move_box(1.0, 9.0, 0.9, 1.0, 0.3, 0.03, make_world(step), step_height=1.0)
+    assert result.stepped
+    assert result.y == 8.0 and result.on_ground
+
+    wall = step | {(2, 8)}
+    blocked = move_box(1.0, 9.0, 0.9, 1.0, 0.3, 0.03, make_world(wall), step_height=1.0)
+    assert not blocked.stepped
+    assert blocked.normal_x == -1 and blocked.y == 9.0
+
+
+def test_find_solid_tile():
+    """Overlap test ignores tiles the box only touches on an edge"""
+    world = make_world({(1, 0)})
+    assert find_solid_tile(0.0, 0.0, 1.0, 1.0, world) is None
+    assert find_solid_tile(0.5, 0.0, 0.9, 1.0, world) == (1, 0)
+
+
+if __name__ == "__main__":
+    test_lands_flush_on_floor()
+    test_fast_fall_does_not_tunnel()
+    test_wall_normals_and_ceiling()
+    test_horse_steps_up_single_blocks()
+    test_find_solid_tile()
+    print("✅ All collision tests passed!")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Server connection test script
+Checks non-blocking send queues, back-pressure and the slow-client policy
+"""
+
+import os
+import socket
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from multiplayer.connection import (ClientConnection, SEND_QUEUE_HIGH_WATER, SEND_QUEUE_LIMIT,
+                                    SLOW_CLIENT_TIMEOUT)
+
+
+def make_pair():
+    server_side, client_side = socket.socketpair()
+    client_side.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    return ClientConnection(server_side, ("test", 0)), client_side
+
+
+def read_all(sock, size):
+    data = b""
+    while len(data) < size:
+        data += sock.recv(65536)
+    return data
+
+
+def test_flush_keeps_order_across_partial_writes():
+    """Frames bigger than the socket buffer go out in order over several flushes"""
+    connection, peer = make_pair()
+    frames = [bytes([i]) * 100000 for i in range(3)]
+    for frame in frames:
+        assert connection.enqueue(frame)
+    assert not connection.flush()          # Socket full, data still queued
+    received = b""
+    while len(received) < 300000:
+        received += read_all(peer, 1)
+        connection.flush()
+    assert received == b"".join(frames)
+    assert connection.queued_bytes == 0 and connection.flush()
+
+
+def test_backpressure_drops_only_droppable_frames():
+    """A backed-up client skips position updates but keeps everything else"""
+    connection, peer = make_pair()
+    big = b"x" * (SEND_QUEUE_HIGH_WATER + 1)
+    connection.enqueue(big)
+    assert connection.backed_up
+    assert connection.enqueue(b"position", droppable=True) and connection.dropped == 1
+    assert connection.enqueue(b"block batch")
+    assert connection.queue[-1] == b"block batch"
+
+    assert not connection.enqueue(b"y" * SEND_QUEUE_LIMIT)
+    assert connection.close_reason == "send queue full"
+    assert not connection.enqueue(b"more")
+
+
+def test_slow_client_is_marked_for_disconnect():
+    """Staying above the high-water mark too long marks the client for closing"""
+    connection, peer = make_pair()
+    connection.enqueue(b"x" * (SEND_QUEUE_HIGH_WATER + 1))
+    start = connection.backed_up_since
+    assert not connection.check_slow(start + SLOW_CLIENT_TIMEOUT / 2)
+    assert connection.check_slow(start + SLOW_CLIENT_TIMEOUT + 1)
+    assert connection.close_reason == "too slow to keep up"
+
+
+if __name__ == "__main__":
+    test_flush_keeps_order_across_partial_writes()
+    test_backpressure_drops_only_droppable_frames()
+    test_slow_client_is_marked_for_disconnect()
+    print("✅ All connection tests passed!")
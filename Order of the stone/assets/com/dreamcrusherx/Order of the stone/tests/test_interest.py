@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Interest management test script
+Checks view-distance chunk sets, enter/leave events and skipped-change tracking
+"""
+
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from multiplayer.interest import InterestManager
+
+
+def test_enter_and_leave_events():
+    """Players see each other only while within view distance"""
+    interest = InterestManager(view_distance=2)
+    assert interest.update_position("Alex", 0) == ([-2, -1, 0, 1, 2], [])
+
+    _, events = interest.update_position("Steve", 10)
+    assert events == []                                  # Too far apart
+    _, events = interest.update_position("Steve", 2)
+    assert sorted(events) == [("Alex", "Steve", True), ("Steve", "Alex", True)]
+    assert interest.observers_of("Steve") == ["Alex"]
+
+    assert interest.update_position("Steve", 2) == ([], [])   # Same chunk, nothing to do
+    _, events = interest.update_position("Alex", -5)
+    assert sorted(events) == [("Alex", "Steve", False), ("Steve", "Alex", False)]
+    assert interest.observers_of("Steve") == []
+
+
+def test_many_players_only_reach_neighbours():
+    """Spread-out players each have a handful of observers, not everyone"""
+    interest = InterestManager(view_distance=2)
+    for i in range(60):
+        interest.update_position(f"P{i}", i * 2)
+    assert max(len(interest.observers_of(f"P{i}")) for i in range(60)) == 2
+
+    interest.remove("P1")
+    assert interest.observers_of("P0") == []
+    assert "P1" not in interest.visible["P0"]
+
+
+def test_missed_changes_caught_up_on_entry():
+    """Changes skipped while out of range are handed back when the chunk comes into view"""
+    interest = InterestManager(view_distance=1)
+    interest.update_position("Alex", 0)
+    interest.note_missed("Alex", 5, 100, 102)
+    interest.note_missed("Alex", 5, 90, 95)
+    interest.note_missed("Alex", 9, 100, 100)
+
+    entered, _ = interest.update_position("Alex", 5)
+    assert entered == [4, 5, 6]
+    assert interest.take_missed("Alex", entered) == {5: (90, 102)}
+    assert interest.take_missed("Alex", entered) == {}
+    assert interest.missed["Alex"] == {9: (100, 100)}
+
+
+if __name__ == "__main__":
+    test_enter_and_leave_events()
+    test_many_players_only_reach_neighbours()
+    test_missed_changes_caught_up_on_entry()
+    print("✅ All interest management tests passed!")
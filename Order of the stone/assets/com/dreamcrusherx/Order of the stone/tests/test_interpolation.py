@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Multiplayer interpolation test script
+Checks snapshot interpolation, late-packet extrapolation and the adaptive send rate
+"""
+
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from multiplayer.interpolation import SnapshotBuffer, AdaptiveSendRate, TELEPORT_DISTANCE
+
+
+def close(a, b):
+    return abs(a[0] - b[0]) < 1e-6 and abs(a[1] - b[1]) < 1e-6
+
+
+def test_interpolates_in_the_past_despite_clock_offset():
+    """Rendering sits `delay` behind the newest snapshot, whatever the sender's clock says"""
+    buffer = SnapshotBuffer(delay=0.2, max_extrapolation=0.25)
+    # Sender clock is 1000s ahead of ours; updates at 5 Hz, moving 1 tile each
+    for i in range(5):
+        buffer.add(i * 1.0, 100.0, received_at=10.0 + i * 0.2, sent_at=1000.0 + i * 0.2)
+
+    assert close(buffer.sample(10.8), (3.0, 100.0))    # 0.2s behind the newest
+    assert close(buffer.sample(10.7), (2.5, 100.0))    # Halfway between two snapshots
+    assert buffer.late_samples == 0
+
+    # Packets stop arriving: carry on along the last velocity, then hold
+    assert close(buffer.sample(11.1), (4.5, 100.0))
+    assert close(buffer.sample(12.0), (5.25, 100.0))
+    assert buffer.late_samples == 2
+
+
+def test_out_of_order_and_teleports():
+    """Stale snapshots are ignored and big jumps snap instead of sliding"""
+    buffer = SnapshotBuffer(delay=0.1)
+    buffer.add(0.0, 0.0, received_at=1.0)
+    buffer.add(TELEPORT_DISTANCE * 4, 0.0, received_at=1.1)
+    buffer.add(5.0, 5.0, received_at=1.2, sent_at=1.05)    # Arrived late, older than the newest
+    assert len(buffer.snapshots) == 2
+    assert close(buffer.sample(1.15), (TELEPORT_DISTANCE * 4, 0.0))
+    assert buffer.velocity() == (0.0, 0.0)
+
+
+def test_send_rate_follows_speed():
+    """Idle players send a heartbeat; movers send more; stopping sends at once"""
+    rate = AdaptiveSendRate(min_rate=1, moving_rate=5, max_rate=10, reference_speed=8)
+    frames = [i / 60 for i in range(180)]
+
+    idle = sum(rate.should_send(t, 0.0, 100.0, (10, 1)) for t in frames)
+    assert idle == 3                                   # First frame, then once a second
+
+    rate = AdaptiveSendRate(min_rate=1, moving_rate=5, max_rate=10, reference_speed=8)
+    walking = sum(rate.should_send(t, t * 4.0, 100.0, (10, 1)) for t in frames)
+    assert 20 <= walking <= 24                         # ~7.5 Hz at half speed
+
+    # Stopping dead: receivers would keep extrapolating, so an update goes out quickly
+    rate.should_send(3.0, 12.0, 100.0, (10, 1))
+    sends = [t for t in (3.05, 3.1, 3.15) if rate.should_send(t, 12.0, 100.0, (10, 1))]
+    assert sends and sends[0] <= 3.1
+    assert rate.should_send(3.2, 12.0, 100.0, (9, 1))  # Health changed
+
+
+if __name__ == "__main__":
+    test_interpolates_in_the_past_despite_clock_offset()
+    test_out_of_order_and_teleports()
+    test_send_rate_follows_speed()
+    print("✅ All interpolation tests passed!")
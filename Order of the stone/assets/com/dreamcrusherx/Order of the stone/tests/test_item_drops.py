@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Dropped item tracker test script
+Checks stack merging, sleeping/waking and the per-chunk cap
+"""
+
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from system.item_drops import DroppedItemTracker
+
+
+def make_item(item_type, x, y=10.0, count=1):
+    return {"type": item_type, "count": count, "x": x, "y": y,
+            "vel_x": 0, "vel_y": 0, "on_ground": True, "lifetime": 0}
+
+
+def test_nearby_stacks_merge():
+    """Dropping the same item next to an existing stack adds to its count"""
+    tracker = DroppedItemTracker()
+    items = []
+    tracker.add(items, make_item("stone", 5.0))
+    tracker.add(items, make_item("stone", 5.5, count=3))
+    tracker.add(items, make_item("dirt", 5.5))
+    tracker.add(items, make_item("stone", 20.0))
+    assert len(items) == 3
+    assert items[0]["count"] == 4
+
+
+def test_resting_item_sleeps_and_wakes():
+    """Settled items sleep, keep ageing, and wake when a nearby block changes"""
+    tracker = DroppedItemTracker(sleep_after=3)
+    items = []
+    item = tracker.add(items, make_item("coal", 3.0))
+    for _ in range(3):
+        tracker.tick()
+        tracker.note_resting(items, item)
+    assert item["sleeping"]
+
+    for _ in range(100):
+        tracker.tick()
+    assert tracker.effective_lifetime(item) == 100
+
+    tracker.wake_around(40, 10)  # Far away, stays asleep
+    assert item["sleeping"]
+    tracker.wake_around(3, 11)   # Block under the item changed
+    assert not item["sleeping"]
+    assert item["lifetime"] == 100
+
+
+def test_settling_item_merges_into_sleeping_stack():
+    """An item that slides next to a sleeping stack merges on settling"""
+    tracker = DroppedItemTracker(sleep_after=1)
+    items = []
+    resting = tracker.add(items, make_item("iron", 0.0))
+    tracker.note_resting(items, resting)
+    moving = tracker.add(items, make_item("iron", 4.0, count=2))
+    moving["x"] = 1.0
+    tracker.moved(moving)
+    assert tracker.note_resting(items, moving)
+    assert items == [resting]
+    assert resting["count"] == 3
+
+
+def test_chunk_cap_despawns_oldest():
+    """Over-full chunks drop their oldest items first"""
+    tracker = DroppedItemTracker(max_per_chunk=4, merge_radius=0)
+    items = []
+    for i in range(6):
+        item = make_item("item_%d" % i, i * 2.0)
+        item["lifetime"] = 100 - i
+        tracker.add(items, item)
+    assert len(items) == 4
+    assert [item["type"] for item in items] == ["item_2", "item_3", "item_4", "item_5"]
+    assert tracker.get_stats(items)["despawned_total"] == 2
+
+
+def test_standing_player_lets_items_sleep():
+    """Items next to a player standing still settle; walking into them wakes them"""
+    tracker = DroppedItemTracker(sleep_after=3)
+    items = []
+    item = tracker.add(items, make_item("stone", 5.0))
+    for _ in range(5):
+        tracker.tick()
+        tracker.wake_pushed(5.3, 10.0)
+        if not item.get("sleeping"):
+            tracker.note_resting(items, item)
+    assert item["sleeping"]
+    tracker.wake_pushed(5.4, 10.0)  # Player steps into the item
+    assert not item["sleeping"]
+
+
+if __name__ == "__main__":
+    test_nearby_stacks_merge()
+    test_resting_item_sleeps_and_wakes()
+    test_settling_item_merges_into_sleeping_stack()
+    test_chunk_cap_despawns_oldest()
+    test_standing_player_lets_items_sleep()
+    print("✅ All dropped item tests passed!")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Load test harness test script
+Checks the report maths and runs a tiny bot load test over loopback
+"""
+
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from multiplayer.load_test import percentile, summarize, build_flat_world, run_load_test, GROUND_Y
+
+
+def test_percentiles():
+    """Nearest-rank percentiles, reported in milliseconds"""
+    values = [i / 1000 for i in range(1, 101)]  # 1..100 ms
+    assert percentile(values, 50) == 0.05
+    assert percentile(values, 99) == 0.099
+    assert percentile([], 90) == 0.0
+    row = summarize(list(reversed(values)))
+    assert row == {"count": 100, "p50_ms": 50.0, "p90_ms": 90.0, "p99_ms": 99.0, "max_ms": 100.0}
+
+
+def test_flat_world():
+    """The test world is solid ground with the spawn point above it"""
+    world = build_flat_world(10)
+    assert world["blocks"][f"3,{GROUND_Y}"] == "grass"
+    assert len(world["blocks"]) == 10 * 10
+    assert world["player"]["y"] < GROUND_Y
+
+
+def test_small_load_run():
+    """A few bots join, exchange every message type and nobody is dropped"""
+    report = run_load_test(bots=3, duration=1.5, warmup=0.5, port=25580, world_width=200,
+                           block_rate=4.0, chat_rate=2.0)
+    assert report["joined"] == 3 and report["dropped_connections"] == []
+    assert report["server"]["connections"] == 3
+    for kind in ("join", "player_update", "chat"):
+        assert report["latency"][kind]["count"] > 0
+    assert report["bytes_per_sec"]["from_server"] > 0
+
+
+if __name__ == "__main__":
+    test_percentiles()
+    test_flat_world()
+    test_small_load_run()
+    print("✅ All load test harness tests passed!")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Mob spawning service test script
+Checks biome candidate lists, caps, cache invalidation and the frame budget
+"""
+
+import os
+import random
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from system.mob_spawning import (MobSpawner, SpawnRule, BIOME_DESERT, BIOME_GRASSLAND,
+                                 BIOME_GROUND, BIOME_CANOPY)
+
+
+def make_world():
+    """Flat world: sand for x < 0, grass for x >= 0, a tree at x=10, a pond at x=20"""
+    blocks = {}
+    for x in range(-100, 100):
+        blocks[(x, 100)] = "sand" if x < 0 else "grass"
+        for y in range(101, 105):
+            blocks[(x, y)] = "dirt"
+    for y in range(96, 100):
+        blocks[(10, y)] = "log"
+    blocks[(10, 95)] = "leaves"
+    blocks[(20, 101)] = "water"
+    return blocks
+
+
+def make_spawner(blocks, **options):
+    return MobSpawner(lambda x, y: blocks.get((x, y)), chunk_size=50, **options)
+
+
+def test_candidates_by_biome():
+    """Columns are sorted into desert, grassland, ground and canopy lists"""
+    spawner = make_spawner(make_world())
+    lists = spawner.get_chunk_candidates(0)
+    assert (5, 99, BIOME_GRASSLAND) in lists[BIOME_GRASSLAND]
+    assert (20, 99, BIOME_GROUND) in lists[BIOME_GROUND]      # Water under the grass
+    assert lists[BIOME_CANOPY] == [(10, 95, BIOME_CANOPY)]
+    assert all(x != 10 for x, _, _ in lists[BIOME_GRASSLAND])  # No spawning inside the trunk
+    assert spawner.biome_at(-5) == BIOME_DESERT
+
+
+def test_block_change_invalidates_chunk():
+    """Changing a block rebuilds only that chunk's candidates"""
+    blocks = make_world()
+    spawner = make_spawner(blocks)
+    spawner.get_chunk_candidates(0)
+    spawner.get_chunk_candidates(-1)
+    blocks[(5, 99)] = "stone"
+    spawner.notify_block_change(5, 99)
+    assert 0 not in spawner.candidates and -1 in spawner.candidates
+    assert all(x != 5 for x, _, _ in spawner.get_chunk_candidates(0)[BIOME_GRASSLAND])
+
+
+def test_caps_and_timed_rules():
+    """Timed rules stop at their global and per-chunk caps"""
+    spawner = make_spawner(make_world())
+    spawner.add_rule(SpawnRule("horse", lambda x, y, b: {"type": "horse", "x": x, "y": y},
+                               ("horse",), biomes=(BIOME_GRASSLAND,), max_global=5,
+                               max_per_chunk=2, interval=1, max_distance=200))
+    entities = []
+    for _ in range(20):
+        spawner.update(entities, 0.0)
+    assert len(entities) == 4  # Two grassland chunks, two horses each
+    assert all(spawner.chunk_of(e["x"]) in (0, 1) for e in entities)
+
+
+def test_wave_is_spread_over_frames():
+    """A big wave finishes over several frames instead of in one update"""
+    spawner = make_spawner(make_world(), budget_ms=0.0)
+    spawner.add_rule(SpawnRule("night_wave", lambda x, y, b: {"type": "monster", "x": x, "y": y},
+                               ("monster",), max_global=100, max_per_chunk=5, interval=0, spacing=15))
+    entities = []
+    spawner.queue_wave("night_wave", range(-2, 2), attempts_per_chunk=2)
+    frames = 0
+    while spawner.pending:
+        spawner.update(entities, 0.0)
+        frames += 1
+    assert frames == 8
+    assert len(entities) == 8
+    xs = sorted(e["x"] for e in entities)
+    assert all(b - a >= 15 for a, b in zip(xs, xs[1:]) if spawner.chunk_of(a) == spawner.chunk_of(b))
+
+
+def test_queued_waves_roll_the_chance():
+    """Wave attempts roll the rule's chance too, so a 70% rule spawns on about 70% of them"""
+    random.seed(1234)
+    spawner = make_spawner(make_world())
+    spawner.add_rule(SpawnRule("night_wave", lambda x, y, b: {"type": "monster", "x": x, "y": y},
+                               ("monster",), max_global=1000, max_per_chunk=1000, interval=0, chance=0.7))
+    entities = []
+    spawner.queue_wave("night_wave", range(-2, 2), attempts_per_chunk=25)
+    while spawner.pending:
+        spawner.update(entities, 0.0)
+    assert 40 <= len(entities) < 100  # 100 attempts
+
+
+if __name__ == "__main__":
+    test_candidates_by_biome()
+    test_block_change_invalidates_chunk()
+    test_caps_and_timed_rules()
+    test_wave_is_spread_over_frames()
+    test_queued_waves_roll_the_chance()
+    print("✅ All mob spawning tests passed!")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Network statistics test script
+Checks per-type traffic counters, ping/pong RTT and rates, and frame sizes from the decoder
+"""
+
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from multiplayer.net_stats import NetStats, format_rate, MAX_PENDING_PINGS
+from multiplayer.protocol import encode_message, FrameDecoder, HEADER
+
+
+def test_counters_by_type_and_rates():
+    """Messages and bytes are counted per type; rates come from the last window"""
+    stats = NetStats()
+    stats._rate_sample = (100.0, 0, 0, 0, 0)
+    stats.record_in("player_update", 30)
+    stats.record_in("player_update", 30)
+    stats.record_out("chat", 50)
+    stats.record_out(None, 10)
+    rates = stats.update_rates(102.0)
+    assert rates == {"bytes_in": 30.0, "bytes_out": 30.0, "messages_in": 1.0, "messages_out": 1.0}
+    assert stats.update_rates(102.5) == rates  # Not a full window yet
+
+    snapshot = stats.snapshot()
+    assert snapshot["messages_in"] == {"player_update": 2}
+    assert snapshot["bytes_out"] == {"chat": 50, "unknown": 10}
+    assert snapshot["total_bytes_in"] == 60 and snapshot["total_bytes_out"] == 60
+    assert format_rate(512) == "512 B/s" and format_rate(2048) == "2.0 KB/s"
+
+
+def test_ping_round_trips():
+    """Pongs give an RTT; unknown or long-lost pings are ignored"""
+    stats = NetStats()
+    first = stats.start_ping(10.0)
+    assert abs(stats.finish_ping(first, 10.004) - 0.004) < 1e-9
+    assert stats.finish_ping(first, 10.5) is None  # Already answered
+    second = stats.start_ping(20.0)
+    stats.finish_ping(second, 20.014)
+    assert abs(stats.rtt - (0.004 + 0.010 * 0.2)) < 1e-9  # Smoothed
+    assert stats.snapshot()["rtt_ms"] == 6.0
+
+    for i in range(MAX_PENDING_PINGS + 3):
+        stats.start_ping(30.0 + i)
+    assert len(stats.pending_pings) == MAX_PENDING_PINGS
+
+
+def test_decoder_reports_frame_sizes():
+    """Frame sizes line up with decoded messages, so bytes can be counted per type"""
+    messages = [{"type": "chat", "message": "hello"},
+                {"type": "player_update", "position": [1.0, 2.0], "health": 10, "facing_direction": 1}]
+    frames = [encode_message(m) for m in messages]
+    decoder = FrameDecoder()
+    assert decoder.feed(frames[0] + frames[1][:3]) == messages[:1]
+    assert decoder.sizes == [len(frames[0])]
+    assert decoder.feed(frames[1][3:]) == messages[1:]
+    assert decoder.sizes == [len(frames[1])]
+
+    decoder.feed(HEADER.pack(1, 1, 99) + b"x")  # Unknown type: counted as malformed, no size
+    assert decoder.malformed == 1 and decoder.sizes == []
+
+
+if __name__ == "__main__":
+    test_counters_by_type_and_rates()
+    test_ping_round_trips()
+    test_decoder_reports_frame_sizes()
+    print("✅ All network stats tests passed!")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Flow-field pathfinding test script
+Checks that mobs route around walls and that the field only rebuilds when needed
+"""
+
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+
+from system.pathfinding import FlowField
+
+
+def make_world(solid):
+    """Build a passability callback from a set of solid tiles"""
+    return lambda x, y: (x, y) not in solid
+
+
+def test_routes_around_wall():
+    """A mob behind a wall should be sent around it, not into it"""
+    # Vertical wall at x=5 from y=-3..3, player at (10, 0), mob at (0, 0)
+    wall = {(5, y) for y in range(-3, 4)}
+    field = FlowField(make_world(wall), radius=12)
+    field.update((10, 0))
+
+    x, y = 0, 0
+    for _ in range(60):
+        step = field.next_step(x, y)
+        if step is None:
+            break
+        assert step not in wall
+        x, y = step
+    assert (x, y) == (10, 0)
+
+
+def test_unreachable_returns_none():
+    """A fully enclosed mob gets no direction and falls back to old steering"""
+    box = {(dx, dy) for dx in range(-2, 3) for dy in range(-2, 3) if abs(dx) == 2 or abs(dy) == 2}
+    field = FlowField(make_world(box), radius=8)
+    field.update((6, 6))
+    assert field.next_step(0, 0) is None
+    assert field.distance_at(0, 0) is None
+
+
+def test_rebuilds_only_on_change():
+    """Standing still must not rebuild; moving a tile or changing a block must"""
+    field = FlowField(make_world(set()), radius=6, max_age=1000)
+    assert field.update((0.2, 0.2))
+    assert not field.update((0.7, 0.9))   # Same tile
+    assert field.update((1.1, 0.0))       # New tile
+    field.notify_block_change(100, 100)   # Outside the window
+    assert not field.update((1.1, 0.0))
+    field.notify_block_change(2, 2)       # Inside the window
+    assert field.update((1.1, 0.0))
+
+
+def test_multiple_targets():
+    """Mobs head for the nearest player when LAN players are in range"""
+    field = FlowField(make_world(set()), radius=10)
+    field.update((-4, 0), [(4, 0), (40, 0)])  # The far player is out of range
+    assert field.get_stats()["targets"] == 2
+    assert field.next_step(2, 0) == (3, 0)
+    assert field.next_step(-2, 0) == (-3, 0)
+
+
+def test_block_changes_are_repaired_in_place():
+    """Digging and building inside the window patch the field into exactly what a full rebuild gives"""
+    rng = random.Random(7)
+    solid = {(x, y) for x in range(-8, 9) for y in range(-8, 9) if rng.random() < 0.3} - {(0, 0)}
+    field = FlowField(make_world(solid), radius=8, max_age=1000)
+    field.update((0, 0))
+    for _ in range(40):
+        tile = (rng.randint(-8, 8), rng.randint(-8, 8))
+        solid.symmetric_difference_update({tile})
+        field.notify_block_change(*tile)
+        assert field.update((0, 0))
+        fresh = FlowField(make_world(solid), radius=8)
+        fresh.update((0, 0))
+        assert field.distance == fresh.distance and field.next_index == fresh.next_index
+    assert field.rebuilds == 1 and field.repairs == 40
+
+
+def test_moving_targets_are_followed_without_rebuilds():
+    """Players stepping a tile at a time are followed by patching the area around them, not rebuilding"""
+    rng = random.Random(3)
+    arena = {(x, y) for x in range(-9, 10) for y in range(-9, 10) if max(abs(x), abs(y)) == 9}
+    solid = arena | {(x, y) for x in range(-8, 9) for y in range(-8, 9) if rng.random() < 0.2}
+    field = FlowField(make_world(solid), radius=14, max_age=1000)
+    player, friend = (0, 0), (5, -5)
+    solid -= {player, friend}
+    field.update(player, [friend])
+    trail = {player, friend}
+    for _ in range(30):
+        for _ in range(10):  # Step to an open neighbouring tile
+            move = (player[0] + rng.randint(-1, 1), player[1] + rng.randint(-1, 1))
+            if move not in solid and max(abs(move[0]), abs(move[1])) <= 3:
+                player = move
+                break
+        trail.add(player)
+        field.update(player, [friend])
+        fresh = FlowField(make_world(solid), radius=14)
+        fresh.update(player, [friend])
+        for x in range(-8, 9):
+            for y in range(-8, 9):
+                exact = fresh.distance_at(x, y)
+                if exact is None:
+                    continue
+                assert field.distance_at(x, y) >= exact  # Never shorter than the real path
+                tile = (x, y)
+                for _ in range(200):  # Always downhill to a player or a tile one just left
+                    step = field.next_step(*tile)
+                    if step is None:
+                        break
+                    assert step not in solid
+                    tile = step
+                assert tile in trail
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):  # Mobs next to the player step onto it
+            if (player[0] + dx, player[1] + dy) not in solid:
+                assert field.next_step(player[0] + dx, player[1] + dy) == player
+    assert field.rebuilds == 1 and field.retargets > 0
+
+    field.update((8, 8), [friend])  # Too far from the window centre: re-centred with a rebuild
+    assert field.rebuilds == 2
+
+if __name__ == "__main__":
+    test_routes_around_wall()
+    test_unreachable_returns_none()
+    test_rebuilds_only_on_change()
+    test_multiple_targets()
+    test_block_changes_are_repaired_in_place()
+    test_moving_targets_are_followed_without_rebuilds()
+    print("✅ All pathfinding tests passed!")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Projectile system test script
+Checks pooled storage, swept tile collision and spatial-hash hit events
+"""
+
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from system.projectile_system import (ProjectileSystem, SpatialHash, raycast_tiles,
+                                      TEAM_HOSTILE, TEAM_FRIENDLY)
+
+
+def no_tiles(x, y):
+    return False
+
+
+def test_raycast_stops_at_first_wall():
+    """The DDA walk reports the first solid tile even for long, fast moves"""
+    wall = {(5, 0), (8, 0)}
+    hit = raycast_tiles(0.5, 0.5, 20.5, 0.5, lambda x, y: (x, y) in wall)
+    assert hit is not None
+    assert hit[:2] == (5, 0)
+    assert raycast_tiles(0.5, 0.5, 4.5, 0.5, lambda x, y: (x, y) in wall) is None
+
+
+def test_fast_projectile_does_not_tunnel():
+    """A projectile moving 3 tiles per frame still stops at a 1-tile wall"""
+    pool = ProjectileSystem()
+    pool.spawn("rock", 0, 0, 3.0, 0.0)
+    events = []
+    for _ in range(5):
+        events += pool.update(lambda x, y: x == 4 and y == 0, {})
+    assert [e["event"] for e in events] == ["tile"]
+    assert events[0]["x"] < 4
+    assert pool.active_count == 0
+
+
+def test_hit_event_uses_spatial_index():
+    """Hostile shots hit players, friendly shots hit mobs"""
+    pool = ProjectileSystem()
+    player = {"x": 5.0, "y": 0.0}
+    mob = {"x": -5.0, "y": 0.0}
+    players, mobs = SpatialHash(), SpatialHash()
+    players.insert(player, player["x"], player["y"])
+    mobs.insert(mob, mob["x"], mob["y"])
+
+    pool.spawn("rock", 0, 0, 0.5, 0, damage=2, team=TEAM_HOSTILE)
+    pool.spawn("sword", 0, 0, -0.5, 0, damage=3, team=TEAM_FRIENDLY)
+    hits = []
+    for _ in range(20):
+        hits += [e for e in pool.update(no_tiles, {TEAM_HOSTILE: players, TEAM_FRIENDLY: mobs})
+                 if e["event"] == "hit"]
+    assert {(e["kind"], id(e["target"])) for e in hits} == {("rock", id(player)), ("sword", id(mob))}
+
+
+def test_boomerang_returns_to_owner():
+    """Returning projectiles fly back and report 'returned' with their payload"""
+    pool = ProjectileSystem()
+    pool.spawn("sword", 0, 0, 0.3, 0, team=TEAM_FRIENDLY, tile_collision=False,
+               returns=True, max_distance=3, owner="player", payload={"slot": 2})
+    events = []
+    for _ in range(60):
+        events += pool.update(no_tiles, {}, {"player": (0.0, 0.0)})
+    assert events[-1]["event"] == "returned"
+    assert events[-1]["payload"] == {"slot": 2}
+
+
+def test_slots_are_reused():
+    """Freed slots go back into the pool instead of growing it"""
+    pool = ProjectileSystem(capacity=4)
+    for _ in range(3):
+        for _ in range(4):
+            pool.spawn("rock", 0, 0, 0, 0, lifetime=1)
+        pool.update(no_tiles, {})
+    assert pool.capacity == 4
+    assert pool.active_count == 0
+    assert pool.spawned_total == 12
+
+
+if __name__ == "__main__":
+    test_raycast_stops_at_first_wall()
+    test_fast_projectile_does_not_tunnel()
+    test_hit_event_uses_spatial_index()
+    test_boomerang_returns_to_owner()
+    test_slots_are_reused()
+    print("✅ All projectile system tests passed!")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+LAN wire protocol test script
+Checks framing, split reads, compact encodings and the JSON fallback
+"""
+
+import json
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from multiplayer.protocol import (encode_message, FrameDecoder, ProtocolError, pack_value,
+                                  unpack_value, HEADER)
+
+
+def test_round_trip_messages():
+    """Every message type comes back out as the same dict"""
+    messages = [
+        {"type": "player_update", "username": "Steve", "position": [12.5, 100.0],
+         "health": 10, "facing_direction": -1},
+        {"type": "player_update", "username": "Alex", "position": [-3.5, 90.0],
+         "health": 7, "facing_direction": 1, "t": 1760000000.125},
+        {"type": "block_change", "username": "Alex", "x": -40, "y": 117, "block_type": None},
+        {"type": "chat", "username": "Zoë", "message": "héllo 🌍"},
+        {"type": "welcome", "world_data": {"blocks": {"1,2": "stone"}, "seed": 12345678901},
+         "players": ["a", "b"], "ok": True, "ratio": 0.25},
+    ]
+    decoder = FrameDecoder()
+    stream = b"".join(encode_message(m) for m in messages)
+    assert decoder.feed(stream) == messages
+
+
+def test_split_reads_and_multibyte_chars():
+    """Frames split at any byte (even inside a UTF-8 character) still decode"""
+    message = {"type": "chat", "username": "Zoë", "message": "🧱" * 50}
+    stream = encode_message(message) * 3
+    decoder = FrameDecoder()
+    received = []
+    for i in range(len(stream)):
+        received += decoder.feed(stream[i:i + 1])
+    assert received == [message] * 3
+    assert not decoder.buffer
+
+
+def test_player_update_is_compact():
+    """Binary player updates are over three times smaller than the old JSON lines"""
+    message = {"type": "player_update", "position": [1234.56, 101.0], "health": 10,
+               "facing_direction": 1}
+    old_size = len(json.dumps(message).encode("utf-8")) + 1
+    assert len(encode_message(message)) * 3 < old_size
+
+
+def test_far_positions_and_long_names_survive():
+    """Positions far from spawn keep full precision; long UTF-8 names are never cut"""
+    messages = [
+        {"type": "player_update", "username": "Steve", "position": [250000.37, -1.1],
+         "health": 10, "facing_direction": 1},
+        {"type": "player_update", "username": "é" * 200, "position": [1.5, 2.5],
+         "health": 10, "facing_direction": 1},
+        {"type": "block_change", "username": "Zoë", "x": 1, "y": 2, "block_type": "🧱" * 70},
+    ]
+    decoder = FrameDecoder()
+    assert decoder.feed(b"".join(encode_message(m) for m in messages)) == messages
+    assert decoder.malformed == 0
+
+
+def test_json_fallback_and_errors():
+    """JSON frames decode alongside binary ones; bad frames are counted or rejected"""
+    decoder = FrameDecoder()
+    message = {"type": "time_sync", "game_time": 12.5, "is_day": False, "weather": "clear"}
+    assert decoder.feed(encode_message(message, use_json=True) + encode_message(message)) == [message, message]
+
+    assert decoder.feed(HEADER.pack(1, 1, 99) + b"x") == []
+    assert decoder.malformed == 1
+
+    try:
+        decoder.feed(HEADER.pack(0, 7, 1))
+    except ProtocolError:
+        pass
+    else:
+        raise AssertionError("Wrong protocol version should be rejected")
+
+
+def test_pack_value_integers():
+    """Integer widths are chosen by size and survive the round trip"""
+    for value in (0, 127, 128, -1, -33, -200, 40000, -70000, 2 ** 40, -2 ** 40):
+        assert unpack_value(pack_value(value)) == value
+    assert len(pack_value(5)) == 1
+
+
+if __name__ == "__main__":
+    test_round_trip_messages()
+    test_split_reads_and_multibyte_chars()
+    test_player_update_is_compact()
+    test_far_positions_and_long_names_survive()
+    test_json_fallback_and_errors()
+    test_pack_value_integers()
+    print("✅ All protocol tests passed!")
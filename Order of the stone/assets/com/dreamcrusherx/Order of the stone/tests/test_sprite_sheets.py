@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Sprite sheet cache test script
+Checks that sheets are built once, reused across launches and rebuilt only when a GIF really changes
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from system.sprite_sheets import SpriteSheetCache, find_animation_gifs, frame_rects
+
+
+def fake_build(built):
+    """Stand-in for the PIL converter - records the GIF and writes a dummy sheet"""
+    def build(gif_path, sheet_path):
+        built.append(os.path.basename(gif_path))
+        with open(sheet_path, "wb") as f:
+            f.write(b"sheet")
+        return {"frame_size": (32, 32), "durations": [125, 125, 250]}
+    return build
+
+
+def write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def test_sheets_are_built_once_and_reused():
+    """A second launch only stats the GIFs; touching a GIF without changing it doesn't rebuild"""
+    with tempfile.TemporaryDirectory() as folder:
+        assets, cache_dir = os.path.join(folder, "assets"), os.path.join(folder, "sheets")
+        write(os.path.join(assets, "player", "animations", "walking.gif"), b"GIF89a walk")
+        write(os.path.join(assets, "tiles", "carrot.gif"), b"GIF89a carrot")
+        write(os.path.join(assets, "tiles", "grass.png"), b"not a gif")
+        gifs = find_animation_gifs(assets)
+        assert [os.path.basename(path) for path in gifs] == ["walking.gif", "carrot.gif"]
+
+        built = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert SpriteSheetCache(cache_dir, fake_build(built)).prepare(gifs) == 2
+        relaunch = SpriteSheetCache(cache_dir, fake_build(built))
+        assert relaunch.prepare(gifs) == 0 and built == ["walking.gif", "carrot.gif"]
+        assert relaunch.durations(gifs[0]) == [125, 125, 250]
+
+        os.utime(gifs[1], (1, 1))  # Same bytes, new mtime
+        assert relaunch.prepare(gifs) == 0
+        assert relaunch.index[os.path.realpath(gifs[1])]["mtime"] == 1
+
+
+def test_changed_or_missing_sheets_are_rebuilt():
+    """New GIF contents, a deleted sheet or a new sheet version all rebuild; failures return None"""
+    with tempfile.TemporaryDirectory() as folder:
+        gif = os.path.join(folder, "mobs", "slime.gif")
+        write(gif, b"GIF89a one")
+        built = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            cache = SpriteSheetCache(os.path.join(folder, "sheets"), fake_build(built))
+            entry = cache.entry(gif)
+            write(gif, b"GIF89a two frames")
+            cache.entry(gif)
+            os.remove(cache.sheet_path(entry))
+            cache.entry(gif)
+            SpriteSheetCache(cache.cache_dir, fake_build(built), version=2).prepare([gif])
+        assert built == ["slime.gif"] * 4
+
+        def broken(gif_path, sheet_path):
+            raise RuntimeError("PIL is needed to convert GIFs")
+
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            assert SpriteSheetCache(os.path.join(folder, "other"), broken).entry(gif) is None
+        assert "Could not build" in output.getvalue()
+        assert frame_rects((16, 24), 3) == [(0, 0, 16, 24), (16, 0, 16, 24), (32, 0, 16, 24)]
+
+
+if __name__ == "__main__":
+    test_sheets_are_built_once_and_reused()
+    test_changed_or_missing_sheets_are_rebuilt()
+    print("✅ All sprite sheet tests passed!")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Structure registry test script
+Checks chunk-bucketed overlap checks, point lookups, minimap queries and save/load
+"""
+
+import json
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from system.structure_registry import StructureRegistry
+
+
+def test_overlap_checks_across_chunks():
+    """Boxes spanning chunk edges are found from either side; margins keep structures apart"""
+    registry = StructureRegistry(chunk_width=50)
+    fort = registry.add("fortress", 45, 100, 60, 114, subtype="guarded_fort")
+    assert sorted(registry.chunks) == [0, 1]
+    assert registry.overlaps(58, 110, 70, 112)
+    assert registry.overlaps(30, 90, 44, 99) is False
+    assert registry.overlaps(30, 90, 44, 99, margin=1)
+    assert registry.overlapping(0, 80, 200, 130, kinds=("village",)) == []
+    assert registry.overlapping(0, 80, 200, 130) == [fort]  # Listed once, though it's in two buckets
+
+    registry.remove(fort)
+    assert not registry.overlaps(0, 0, 200, 200) and registry.chunks == {}
+
+
+def test_point_lookups_for_discovery():
+    """Discovery asks which structure holds the player's block - floats and negative columns included"""
+    registry = StructureRegistry(chunk_width=50)
+    ruins = registry.add("lost_ruins", -12, 90, -2, 105, entrance=[-7, 105])
+    deep = registry.add("underground_fortress", -20, -1000000, 19, -51)
+    assert registry.at(-2.5, 104.9) is ruins
+    assert registry.at(-1.5, 100) is ruins and registry.at(-0.5, 100) is None  # Block -2 vs block -1
+    assert registry.at(0.0, -60.0) is deep and registry.at(0.0, -50.0) is None
+    assert registry.at(-5, 95, kind="fortress") is None
+    assert registry.in_columns(-30, -15) == [deep] and registry.in_columns(-30, -21) == []
+    assert ruins.data["entrance"] == [-7, 105]
+
+
+def test_nearest_and_save_round_trip():
+    """Minimap lists discovered fortresses nearest first; a JSON round trip keeps everything"""
+    registry = StructureRegistry()
+    far = registry.add("fortress", 400, 100, 415, 112, subtype="defended_keep", discovered=True)
+    near = registry.add("fortress", -80, 100, -66, 112, subtype="safe_outpost", discovered=True)
+    registry.add("fortress", 10, 100, 20, 112, subtype="guarded_fort")  # Not found yet
+    registry.add("village", 100, 95, 120, 110)
+    assert registry.nearest(0, kind="fortress", discovered=True) == [near, far]
+
+    restored = StructureRegistry()
+    restored.load(json.loads(json.dumps(registry.to_list())))
+    assert restored.to_list() == registry.to_list()
+    assert restored.at(405, 105).subtype == "defended_keep"
+    assert len(restored.of_kind("fortress", discovered=False)) == 1
+
+    restored.load([{"kind": "broken"}])  # Bad entries are skipped
+    assert len(restored) == 0
+
+
+def test_rebuilding_boxes_from_blocks():
+    """Saves made before the registry get boxes back from their red brick clusters"""
+    bricks = [(x, y) for x in range(10, 22) for y in (100, 112)] + [(x, y) for x in range(300, 310) for y in (90, 99)]
+    bricks.append((500, 100))  # A lone brick is not a structure
+    registry = StructureRegistry()
+    added = registry.add_block_clusters("fortress", bricks)
+    assert [(s.x0, s.y0, s.x1, s.y1) for s in added] == [(10, 100, 21, 112), (300, 90, 309, 99)]
+    assert registry.add_block_clusters("fortress", bricks) == []  # Already registered
+
+
+if __name__ == "__main__":
+    test_overlap_checks_across_chunks()
+    test_point_lookups_for_discovery()
+    test_nearest_and_save_round_trip()
+    test_rebuilding_boxes_from_blocks()
+    print("✅ All structure registry tests passed!")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Texture cache test script
+Checks lazy lookups, disk cache hits across launches, key changes and stale file cleanup
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from system.texture_cache import ProceduralTextures, code_hash, decode_pixels, encode_pixels
+
+calls = []
+
+
+def make_square(size, shade=100):
+    """Stand-in generator - a "surface" here is just (width, height, RGBA bytes)"""
+    calls.append((size, shade))
+    return size, size, bytes([shade, shade, shade, 255]) * (size * size)
+
+
+def make_other(size):
+    return size, size, bytes(size * size * 4)
+
+
+def provider(folder, version=1):
+    return ProceduralTextures(folder, {"grass": "loaded"}, version=version,
+                              to_pixels=lambda surface: surface, from_pixels=lambda *pixels: pixels)
+
+
+def test_lookups_draw_lazily():
+    """Nothing is drawn until a texture is looked up, and only once"""
+    calls.clear()
+    with tempfile.TemporaryDirectory() as folder:
+        textures = provider(folder)
+        textures.register("snow", make_square, 4, 200)
+        textures.register("water", make_square, 4)
+        assert calls == [] and "snow" in textures and "grass" in textures and "lava" not in textures
+        assert textures.get("lava") is None and textures.get("grass") == "loaded"
+        assert textures["snow"] == (4, 4, bytes([200, 200, 200, 255]) * 16)
+        assert textures.get("snow") is textures["snow"] and calls == [(4, 200)]
+        assert textures.pending() == ["water"] and textures.warm() == 1 and calls == [(4, 200), (4, 100)]
+
+        textures.register("ladder", make_square, 4)
+        textures["ladder"] = "from file"  # A file texture assigned later wins, as before
+        assert textures["ladder"] == "from file" and textures.pending() == []
+
+
+def test_later_launches_read_the_cache():
+    """A second launch reads every texture from disk; changed args or version redraw and replace the file"""
+    calls.clear()
+    with tempfile.TemporaryDirectory() as folder:
+        first = provider(folder)
+        first.register("snow", make_square, 4, 200)
+        drawn = first["snow"]
+
+        second = provider(folder)
+        second.register("snow", make_square, 4, 200)
+        assert second["snow"] == drawn and second.loaded == 1 and second.generated == 0 and len(calls) == 1
+
+        third = provider(folder, version=2)
+        third.register("snow", make_square, 4, 50)
+        third["snow"]
+        assert third.generated == 1 and len(os.listdir(folder)) == 1  # The old snow file was dropped
+
+
+def test_bad_cache_files_are_redrawn():
+    """Corrupt files are redrawn; different generators hash differently"""
+    with tempfile.TemporaryDirectory() as folder:
+        textures = provider(folder)
+        textures.register("water", make_square, 2)
+        textures["water"]
+        path = os.path.join(folder, os.listdir(folder)[0])
+        with open(path, "wb") as f:
+            f.write(b"junk")
+        again = provider(folder)
+        again.register("water", make_square, 2)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            assert again["water"][0] == 2
+        assert again.generated == 1 and "unreadable" in output.getvalue()
+
+    assert decode_pixels(encode_pixels(1, 2, bytes(range(8)))) == (1, 2, bytes(range(8)))
+    assert code_hash(make_square) != code_hash(make_other)
+
+
+if __name__ == "__main__":
+    test_lookups_draw_lazily()
+    test_later_launches_read_the_cache()
+    test_bad_cache_files_are_redrawn()
+    print("✅ All texture cache tests passed!")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+UDP state channel test script
+Checks datagram packing, wraparound-safe sequencing and drop-old filtering
+"""
+
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from multiplayer.protocol import encode_message, decode_frame
+from multiplayer.udp_channel import (pack_datagram, unpack_datagram, sequence_newer, SequenceFilter,
+                                     KIND_STATE, MAX_DATAGRAM_SIZE)
+
+
+def test_datagram_round_trip():
+    """A position update fits one small datagram and decodes on its own"""
+    message = {"type": "player_update", "username": "Steve", "position": [12.5, 100.0],
+               "health": 10, "facing_direction": -1, "t": 1760000000.5}
+    datagram = pack_datagram(KIND_STATE, 0xDEADBEEF, 7, encode_message(message))
+    assert len(datagram) < 64 < MAX_DATAGRAM_SIZE
+
+    kind, token, sequence, frame = unpack_datagram(datagram)
+    assert (kind, token, sequence) == (KIND_STATE, 0xDEADBEEF, 7)
+    assert decode_frame(frame) == message
+
+
+def test_foreign_and_broken_datagrams_are_ignored():
+    """Stray packets on the port don't decode into messages"""
+    assert unpack_datagram(b"DISCOVER_SERVER") is None
+    assert unpack_datagram(b"\x4f\x03") is None
+    frame = encode_message({"type": "chat", "message": "hi"})
+    assert decode_frame(frame[:-1]) is None
+    assert decode_frame(frame + b"x") is None
+
+
+def test_sequence_filter_drops_old_updates():
+    """Only the newest update per player gets through, across the 32-bit wrap"""
+    assert sequence_newer(1, 0xFFFFFFFF) and not sequence_newer(0xFFFFFFFF, 1)
+
+    sequences = SequenceFilter()
+    assert sequences.accept("Alex", 0xFFFFFFFE)
+    assert sequences.accept("Alex", 2)              # Wrapped around
+    assert not sequences.accept("Alex", 0xFFFFFFFF)  # Late arrival from before the wrap
+    assert not sequences.accept("Alex", 2)           # Duplicate
+    assert sequences.accept("Steve", 1)              # Players are filtered separately
+    assert sequences.dropped == 2
+
+    sequences.forget("Alex")
+    assert sequences.accept("Alex", 1)
+
+
+if __name__ == "__main__":
+    test_datagram_round_trip()
+    test_foreign_and_broken_datagrams_are_ignored()
+    test_sequence_filter_drops_old_updates()
+    print("✅ All UDP channel tests passed!")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+World checks test script
+Checks the generation invariants, per-column enforcement and chunk checksums
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from world_generation.world_checks import (block_problem, chunk_checksums, enforce_generated, mismatched_chunks,
+                                           repair_chunks, terrain_problem, world_problems)
+from world_generation.world_gen import generate_world
+
+
+def test_generated_worlds_keep_the_invariants():
+    """Fresh worlds have grass only on top, dirt just under it and no buried trees"""
+    for seed in (29, 1234, "My World"):
+        with contextlib.redirect_stdout(io.StringIO()):
+            world = generate_world(seed=seed, world_width=200)
+        assert world_problems(world["blocks"]) == [], seed
+
+
+def test_rules_and_enforcement():
+    """Broken blocks are reported and dropped from a generated column with one summary line"""
+    assert block_problem(3, 4, "stone") is None
+    assert block_problem(3, 4, None) and block_problem(3, 4, "") and block_problem(4, 20000, "stone")
+    assert block_problem(250000, 4, "stone") is None  # Far out in the infinite world is fine
+    assert block_problem(3.5, 4, "stone")
+    assert terrain_problem(0, 100, "grass", 100) is None
+    assert terrain_problem(0, 101, "dirt", 100) is None and terrain_problem(0, 103, "dirt", 100)
+    assert terrain_problem(0, 120, "grass", 100) and terrain_problem(0, 100, "log", 100)
+    assert terrain_problem(0, 97, "leaves", 100) is None
+
+    column = [(5, 100, "grass"), (5, 101, "dirt"), (5, 130, "grass"), (5, 104, "log"), (5, 96, "leaves")]
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        kept = enforce_generated(column, lambda x: 100, "column 5")
+    assert kept == [(5, 100, "grass"), (5, 101, "dirt"), (5, 96, "leaves")]
+    assert output.getvalue().count("\n") == 1 and "dropped 2 blocks" in output.getvalue()
+
+
+def test_checksums_find_damaged_chunks():
+    """Saved checksums survive a JSON round trip; edits and bad entries show up in their own chunk"""
+    blocks = {f"{x},{y}": "stone" for x in range(-60, 60) for y in range(120, 125)}
+    saved = json.loads(json.dumps(chunk_checksums(blocks)))
+    reloaded = json.loads(json.dumps(blocks))
+    assert mismatched_chunks(reloaded, saved) == []
+
+    reloaded["70,120"] = None        # Chunk 1 gets a broken block
+    reloaded["-55,121"] = "dirt"     # Chunk -2 was edited
+    assert mismatched_chunks(reloaded, saved) == ["-2", "1"]
+    assert repair_chunks(reloaded, ["-2", "1"]) == 1
+    assert "70,120" not in reloaded and reloaded["-55,121"] == "dirt"
+
+
+def test_saves_refresh_the_checksums():
+    """Editing a world and saving it (as the dedicated server does) leaves no chunk looking damaged"""
+    from system.world_system import WorldSystem
+    with tempfile.TemporaryDirectory() as folder, contextlib.redirect_stdout(io.StringIO()):
+        worlds = WorldSystem(save_dir=folder)
+        assert worlds.create_world("Edited")
+        blocks = worlds.current_world_data["blocks"]
+        key = next(key for key, block in blocks.items() if block == "grass")
+        blocks.pop(key)
+        blocks["3,90"] = "oak_planks"
+        assert worlds.save_world() and worlds.load_world("Edited")
+        saved = worlds.current_world_data
+        assert mismatched_chunks(saved["blocks"], saved["chunk_checksums"]) == []
+
+
+if __name__ == "__main__":
+    test_generated_worlds_keep_the_invariants()
+    test_rules_and_enforcement()
+    test_checksums_find_damaged_chunks()
+    test_saves_refresh_the_checksums()
+    print("✅ All world check tests passed!")
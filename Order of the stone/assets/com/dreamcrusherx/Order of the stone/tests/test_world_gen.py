@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+World generation test script
+Checks that seeds keep making the same worlds and that progress follows the terrain ranges
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from world_generation.world_gen import WorldGenerator
+
+
+# sha256 of the saved world from the original single-loop generator (seed 29 has an ocean)
+ORIGINAL_WORLDS = {
+    (1234, 200): "43c100fc8ca7a8ac31f9ec381d329f4c579cbdf92e96f7617382ea1041b34682",
+    (29, 400): "ab295745b9ca9b23208bfc72d0d3f868d99ccfd99ab929107e9d3ff68da2729a",
+}
+
+
+def build(seed, width, **options):
+    """Generate quietly; returns the world as saved and the generator"""
+    generator = WorldGenerator(seed)
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        world = generator.generate_world(width, **options)
+    return json.dumps(world), generator, output.getvalue()
+
+
+def test_worlds_match_the_original_generator():
+    """Seeds keep making the same worlds"""
+    for (seed, width), digest in ORIGINAL_WORLDS.items():
+        saved, _, _ = build(seed, width)
+        assert hashlib.sha256(saved.encode()).hexdigest() == digest, (seed, width)
+
+
+def test_progress_counts_terrain_ranges():
+    """Progress goes up one terrain range at a time and ends at the total"""
+    calls = []
+    build(7, 230, on_progress=lambda done, total: calls.append((done, total)))
+    assert calls == [(done, 6) for done in range(1, 6)] + [(6, 6)]  # 5 ranges (50, 50, 50, 50, 30) + finishing
+
+
+def test_terrain_layers():
+    """Every column is grass over two dirt over stone, on bedrock, with ores only in stone depths"""
+    saved, generator, _ = build(1234, 200)
+    blocks = json.loads(saved)["blocks"]
+    for x in range(-100, 100, 7):
+        column = {int(key.split(",")[1]): block for key, block in blocks.items() if key.split(",")[0] == str(x)}
+        if "water" in column.values() or "sand" in column.values():
+            continue
+        top = min(y for y, block in column.items() if block in ("grass", "red_brick", "door"))
+        assert column[top + 1] == column[top + 2] == "dirt"
+        assert column[315] == "bedrock"
+        for y in range(top + 3, 315):
+            assert column[y] == "stone" or (120 <= y < 250 and column[y] in ("coal", "iron", "gold", "diamond"))
+
+
+if __name__ == "__main__":
+    test_worlds_match_the_original_generator()
+    test_progress_counts_terrain_ranges()
+    test_terrain_layers()
+    print("✅ All world generation tests passed!")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+World streaming test script
+Checks chunk encoding, nearest-first ordering, the flow-control window and patching queued chunks
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from multiplayer.lan_client import LANClient
+from multiplayer.protocol import encode_message, FrameDecoder
+from multiplayer.world_stream import ChunkIndex, ChunkStream, decode_chunk_blocks
+
+
+def make_blocks():
+    blocks = {}
+    for x in range(-120, 120):
+        for y in range(100, 130):
+            blocks[f"{x},{y}"] = "stone" if y > 105 else "dirt"
+        blocks[f"{x},99"] = "grass"
+    return blocks
+
+
+def test_chunk_round_trip():
+    """Chunks decode back to exactly the blocks they were built from"""
+    blocks = make_blocks()
+    index = ChunkIndex(blocks, chunk_size=50)
+    rebuilt = {}
+    for cx in index.chunk_ids():
+        message = {"type": "world_chunk", "cx": cx, "index": 1, "total": 1, "data": index.encode(cx)}
+        decoded = FrameDecoder().feed(encode_message(message))[0]
+        rebuilt.update(decode_chunk_blocks(decoded["data"], cx * 50))
+    assert rebuilt == blocks
+    assert index.chunk_ids() == [-3, -2, -1, 0, 1, 2]
+
+
+def test_block_change_updates_cached_chunk():
+    """A block change invalidates the cached encoding of its chunk only"""
+    index = ChunkIndex(make_blocks(), chunk_size=50)
+    before = index.encode(0)
+    other = index.encode(1)
+    index.set_block(10, 99, None)
+    index.set_block(12, 90, "wood")
+    decoded = decode_chunk_blocks(index.encode(0), 0)
+    assert index.encode(0) != before and index.encode(1) is other
+    assert "10,99" not in decoded and decoded["12,90"] == "wood"
+
+
+def test_stream_nearest_first_with_window():
+    """Chunks go out nearest the player first, a window at a time"""
+    stream = ChunkStream(range(-10, 11), center_chunk=3, window=3)
+    first = stream.next_chunks()
+    assert first[0] == 3 and set(first) <= {2, 3, 4}
+    assert stream.next_chunks() == []  # Window full until acknowledged
+    stream.ack(2)
+    assert len(stream.next_chunks()) == 2
+
+    stream.reprioritize(-8)  # Player moved
+    stream.ack(3)
+    assert stream.next_chunks()[0] == -8
+
+    while not stream.done:
+        stream.ack(3)
+        stream.next_chunks()
+    assert stream.sent == stream.total == 21
+
+
+def test_block_change_patches_queued_chunks():
+    """A block change applied right away is written into older chunks still waiting to be applied"""
+    index = ChunkIndex(make_blocks(), chunk_size=50)
+    with contextlib.redirect_stdout(io.StringIO()):
+        client = LANClient("tester")
+    client.chunk_size = 50
+    applied = []
+    client.on_block_change = lambda username, x, y, block_type: applied.append((x, y, block_type))
+    for cx in (-1, 0):
+        client._process_server_message({"type": "world_chunk", "cx": cx, "index": 1, "total": 2,
+                                         "data": index.encode(cx)})
+    client._process_server_message({"type": "block_change", "username": "alex", "x": 10, "y": 99,
+                                    "block_type": "air"})
+    client._process_server_message({"type": "block_change", "username": "alex", "x": -5, "y": 90,
+                                    "block_type": "wood"})
+
+    world = {}
+    for cx, blocks, _ in client.pop_world_chunks(max_chunks=4):
+        for key, block_type in blocks.items():
+            if block_type is None:
+                world.pop(key, None)
+            else:
+                world[key] = block_type
+    assert applied == [(10, 99, "air"), (-5, 90, "wood")]
+    assert "10,99" not in world and world["-5,90"] == "wood" and world["11,99"] == "grass"
+
+
+def test_own_block_change_patches_queued_chunks():
+    """The joining player's own edits are written into chunks still waiting to be applied"""
+    index = ChunkIndex(make_blocks(), chunk_size=50)
+    with contextlib.redirect_stdout(io.StringIO()):
+        client = LANClient("tester")
+    client.chunk_size = 50
+    client.connected = True
+    client._process_server_message({"type": "world_chunk", "cx": 0, "index": 1, "total": 1,
+                                     "data": index.encode(0)})
+    client.send_block_change(10, 99, "air")
+    client.send_block_change(12, 90, "wood")
+    (_, blocks, _), = client.pop_world_chunks(max_chunks=4)
+    assert blocks["10,99"] is None and blocks["12,90"] == "wood"
+
+
+def test_large_chunk_counts_round_trip():
+    """Chunk index and total are not capped at 65535"""
+    message = {"type": "world_chunk", "cx": -4, "index": 70000, "total": 80000, "data": b"x"}
+    decoded = FrameDecoder().feed(encode_message(message))[0]
+    assert (decoded["cx"], decoded["index"], decoded["total"]) == (-4, 70000, 80000)
+
+
+if __name__ == "__main__":
+    test_chunk_round_trip()
+    test_block_change_updates_cached_chunk()
+    test_stream_nearest_first_with_window()
+    test_block_change_patches_queued_chunks()
+    test_own_block_change_patches_queued_chunks()
+    test_large_chunk_counts_round_trip()
+    print("✅ All world streaming tests passed!")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+World template cache test script
+Checks template round trips, cache hits by seed/version/width, LRU eviction and world creation
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+
+# Add the game directory to the path so we can import the game modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from system.world_templates import WorldTemplateCache, decode_template, encode_template, template_key
+from world_generation.world_gen import GENERATOR_VERSION, generate_world
+
+
+def quiet_generate(seed, width=200):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return generate_world(seed=seed, world_width=width)
+
+
+def test_templates_round_trip_worlds():
+    """A decoded template is the generated world - blocks, player, spawn and seed"""
+    for seed in ("comp-1", 29):
+        world = quiet_generate(seed)
+        assert decode_template(encode_template(world)) == world
+    assert template_key(1234, 200, 1) != template_key("1234", 200, 1)  # Different worlds
+    assert template_key("a", 200, 1) != template_key("a", 200, 2) != template_key("a", 400, 2)
+
+
+def test_cache_hits_and_lru_eviction():
+    """Known seeds come back from disk; the least recently used template goes first"""
+    generated = []
+
+    def generate(seed):
+        generated.append(seed)
+        return {"blocks": {f"{x},120": "grass" for x in range(-60, 60)}, "seed": seed}
+
+    with tempfile.TemporaryDirectory() as folder:
+        cache = WorldTemplateCache(folder, version=1, max_templates=2)
+        with contextlib.redirect_stdout(io.StringIO()):
+            first = cache.get_or_generate("a", 120, lambda: generate("a"))
+            again = cache.get_or_generate("a", 120, lambda: generate("a"))
+            assert again == first and again is not first and generated == ["a"]
+            assert cache.pregenerate(["a", "b"], 120, generate) == 1
+            cache.get("a", 120)                          # "b" is now the oldest
+            cache.get_or_generate("c", 120, lambda: generate("c"))
+        assert sorted(entry["seed"] for entry in cache.index.values()) == ["a", "c"]
+        assert len([name for name in os.listdir(folder) if name.endswith(".owt")]) == 2
+
+        reopened = WorldTemplateCache(folder, version=1)
+        assert reopened.get("c", 120)["seed"] == "c"
+        assert WorldTemplateCache(folder, version=2).get("c", 120) is None  # Generator changed
+
+
+def test_created_worlds_use_templates():
+    """Creating a second world from the same seed copies the template"""
+    from system.world_system import WorldSystem
+    with tempfile.TemporaryDirectory() as folder, contextlib.redirect_stdout(io.StringIO()):
+        worlds = WorldSystem(save_dir=folder)
+        assert worlds.create_world("First", seed="shared")
+        first_blocks = worlds.current_world_data["blocks"]
+        assert worlds.create_world("Second", seed="shared")
+        assert worlds.templates.hits == 1
+        assert worlds.current_world_data["blocks"] == first_blocks
+        assert worlds.current_world_data["name"] == "Second"
+        assert next(iter(worlds.templates.index.values()))["version"] == GENERATOR_VERSION
+
+
+if __name__ == "__main__":
+    test_templates_round_trip_worlds()
+    test_cache_hits_and_lru_eviction()
+    test_created_worlds_use_templates()
+    print("✅ All world template tests passed!")
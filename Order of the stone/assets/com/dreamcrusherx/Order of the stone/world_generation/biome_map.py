@@ -0,0 +1,144 @@
+"""
+Deterministic biome map for the infinite world
+Seeded, smoothed value noise sampled once per chunk and cached:
+biome, temperature and tree density for every column, the same for the same seed
+"""
+
+import math
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Tuple
+
+CHUNK_WIDTH = 50           # Columns per cached chunk (same chunks as terrain and fortresses)
+MAX_CACHED_CHUNKS = 512    # Least recently used chunks beyond this are dropped (recomputed on demand)
+
+DESERT_MIN_DISTANCE = 200  # Deserts only appear this far from spawn (x=0)
+CARROT_CHUNK_CHANCE = 0.10  # Share of chunks that are carrot patches
+
+# Noise layers: (salt, cell width in columns) for the broad shape and the finer detail
+TEMPERATURE_LAYERS = ((1, 160), (2, 40))
+FOREST_LAYERS = ((3, 60), (4, 20))
+FIELD_LAYERS = ((5, 50), (6, 15))
+CARROT_SALT = 7
+DETAIL_WEIGHT = 0.35       # Finer layer's share of a noise value
+
+# Thresholds picked so the biome mix matches the old sine-wave biomes (~35% desert beyond spawn)
+DESERT_TEMPERATURE = 0.6
+FOREST_THRESHOLD = 0.6
+FIELD_THRESHOLD = 0.45
+
+# Chance per column of a tree (before the spacing and village checks)
+TREE_DENSITY = {
+    "forest": 0.3,      # Forests: High tree density
+    "field": 0.02,      # Fields: Very few trees
+    "mixed": 0.08,      # Mixed: Moderate tree density
+    "desert": 0.0016,   # Deserts: 2% of the mixed chance
+}
+
+_MASK = (1 << 64) - 1
+
+
+@dataclass(frozen=True)
+class BiomeInfo:
+    """What one column of the world is like"""
+    biome: str            # "desert", "forest", "field" or "mixed"
+    temperature: float    # 0.0 (cool) .. 1.0 (hot)
+    tree_density: float   # Chance of a tree in this column
+
+
+def _seed_number(seed) -> int:
+    """Stable 64-bit number for any seed (ints, digit strings and names alike)"""
+    text = str(seed)
+    return (zlib.crc32(text.encode("utf-8")) << 32) | zlib.crc32(text[::-1].encode("utf-8"))
+
+
+def _lattice(seed_number: int, salt: int, cell: int) -> float:
+    """Hashed lattice value in [0, 1) for one noise cell (splitmix64 finaliser)"""
+    h = (seed_number + salt * 0x9E3779B97F4A7C15 + cell * 0xD1B54A32D192ED03) & _MASK
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & _MASK
+    return ((h ^ (h >> 31)) >> 11) / float(1 << 53)
+
+
+def value_noise(seed_number: int, salt: int, x: float, cell_width: int) -> float:
+    """Smoothed value noise in [0, 1]: lattice values eased between cell edges"""
+    position = x / cell_width
+    cell = math.floor(position)
+    t = position - cell
+    t = t * t * (3 - 2 * t)  # Smoothstep - no visible corners at cell edges
+    left = _lattice(seed_number, salt, cell)
+    return left + (_lattice(seed_number, salt, cell + 1) - left) * t
+
+
+class BiomeMap:
+    """Biome noise for one world seed, computed per chunk and cached.
+
+    Every lookup after a chunk's first is a dict hit, and the same seed always
+    gives the same map - on any machine, on the worker thread or the main thread.
+    """
+
+    def __init__(self, seed, chunk_width: int = CHUNK_WIDTH, max_chunks: int = MAX_CACHED_CHUNKS):
+        self.seed = seed
+        self.seed_number = _seed_number(seed)
+        self.chunk_width = chunk_width
+        self.max_chunks = max_chunks
+        self.lock = threading.Lock()  # The chunk pre-generator reads from its own thread
+        self.chunks: "OrderedDict[int, Tuple[BiomeInfo, ...]]" = OrderedDict()
+        self.chunks_built = 0
+
+    def _layered(self, layers, x: int) -> float:
+        (broad_salt, broad_width), (detail_salt, detail_width) = layers
+        broad = value_noise(self.seed_number, broad_salt, x, broad_width)
+        detail = value_noise(self.seed_number, detail_salt, x, detail_width)
+        return broad * (1 - DETAIL_WEIGHT) + detail * DETAIL_WEIGHT
+
+    def classify(self, x: int) -> BiomeInfo:
+        """Work out one column from the noise (uncached)"""
+        temperature = self._layered(TEMPERATURE_LAYERS, x)
+        if abs(x) > DESERT_MIN_DISTANCE and temperature > DESERT_TEMPERATURE:
+            biome = "desert"
+        elif self._layered(FOREST_LAYERS, x) > FOREST_THRESHOLD:
+            biome = "forest"
+        elif self._layered(FIELD_LAYERS, x) > FIELD_THRESHOLD:
+            biome = "field"
+        else:
+            biome = "mixed"  # Mixed biome - sparse trees
+        return BiomeInfo(biome, round(temperature, 3), TREE_DENSITY[biome])
+
+    def _chunk(self, chunk_id: int) -> Tuple[BiomeInfo, ...]:
+        with self.lock:
+            columns = self.chunks.get(chunk_id)
+            if columns is not None:
+                self.chunks.move_to_end(chunk_id)
+                return columns
+        base_x = chunk_id * self.chunk_width
+        columns = tuple(self.classify(x) for x in range(base_x, base_x + self.chunk_width))
+        with self.lock:
+            self.chunks[chunk_id] = columns
+            self.chunks_built += 1
+            while len(self.chunks) > self.max_chunks:
+                self.chunks.popitem(last=False)
+        return columns
+
+    def info(self, x: int) -> BiomeInfo:
+        """Biome, temperature and tree density of column x"""
+        x = math.floor(x)
+        chunk_id = x // self.chunk_width
+        return self._chunk(chunk_id)[x - chunk_id * self.chunk_width]
+
+    def biome(self, x: int) -> str:
+        return self.info(x).biome
+
+    def tree_density(self, x: int) -> float:
+        return self.info(x).tree_density
+
+    def has_carrots(self, x: int) -> bool:
+        """True if column x is in a carrot patch (a whole chunk, decided by the seed)"""
+        chunk_id = math.floor(x) // self.chunk_width
+        return _lattice(self.seed_number, CARROT_SALT, chunk_id) < CARROT_CHUNK_CHANCE
+
+    def columns(self, start_x: int, end_x: int) -> List[BiomeInfo]:
+        """Column infos for start_x..end_x-1 (minimaps, previews)"""
+        return [self.info(x) for x in range(start_x, end_x)]
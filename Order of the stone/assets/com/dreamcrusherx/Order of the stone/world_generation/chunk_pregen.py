@@ -0,0 +1,268 @@
+"""
+Background chunk pre-generation for the infinite world
+Terrain for the chunks ahead of the player is planned on a worker thread;
+the main thread installs finished chunks a few columns per frame, within a time budget
+"""
+
+import math
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from world_generation.biome_map import BiomeInfo, BiomeMap
+from world_generation.world_checks import enforce_generated
+
+CHUNK_WIDTH = 50          # Columns per chunk (same chunks as fortresses and mob spawning)
+LOOKAHEAD_CHUNKS = 2      # Chunks kept ready either side of the player's chunk
+INSTALL_BUDGET_MS = 2.0   # Main-thread time per frame for installing planned columns
+
+BASE_HEIGHT = 115         # Base surface level of explored terrain
+BEDROCK_Y = 327           # 200 blocks below surface
+
+# (x, y, block) - a block a column plan wants placed (only where the world is still empty)
+PlannedBlock = Tuple[int, int, str]
+Lookup = Callable[[int, int], Optional[str]]
+
+
+def surface_height(x: int) -> int:
+    """Grass level of an explored column - natural hills from three waves"""
+    primary_wave = 8 * math.sin(x * 0.05)    # Large hills/valleys
+    secondary_wave = 3 * math.sin(x * 0.15)  # Medium variations
+    tertiary_wave = 2 * math.sin(x * 0.3)    # Small details
+    return max(100, min(125, BASE_HEIGHT + int(primary_wave + secondary_wave + tertiary_wave)))
+
+
+def column_rng(seed, x: int) -> random.Random:
+    """The RNG for column x of a world - same seed, same column, same terrain (whichever way it's generated)"""
+    return random.Random(f"terrain-{seed}-{x}")
+
+
+def tree_allowed(x: int, surface_y: int, tree_density: float, lookup: Lookup, rng) -> bool:
+    """Tree roll at the column's tree density, but never next to another tree or on village structures"""
+    for check_x in range(x - 5, x + 6):
+        for check_y in range(surface_y - 4, surface_y):
+            if lookup(check_x, check_y) in ("log", "leaves"):
+                return False
+    for check_x in range(x - 2, x + 3):
+        for check_y in range(surface_y - 5, surface_y + 1):
+            if lookup(check_x, check_y) in ("oak_planks", "bed", "chest", "door"):
+                return False  # This is a village area - no trees!
+
+    return rng.random() < tree_density
+
+
+def surface_item_allowed(x: int, ground_y: int, lookup: Lookup) -> bool:
+    """True if a surface item (carrot/chest) fits at (x, ground_y-1) clear of trunks and canopies"""
+    if lookup(x, ground_y) != "grass" or lookup(x, ground_y - 1) is not None:
+        return False
+    if lookup(x, ground_y - 2) == "log":
+        return False
+    return all(lookup(x, ground_y + dy) != "leaves" for dy in (-2, -3, -4))
+
+
+def plan_terrain_column(x: int, biome: BiomeInfo, rng, lookup: Lookup,
+                        planned: Optional[Dict[Tuple[int, int], str]] = None) -> List[PlannedBlock]:
+    """Everything explored column x gets: layers, biome surface, a tree, ores and carrots.
+
+    ``lookup`` reads the world; ``planned`` holds blocks already planned nearby (a chunk's
+    earlier columns) and is updated. Only spots that are still empty are planned.
+    """
+    planned = {} if planned is None else planned
+    mine: Dict[Tuple[int, int], str] = {}
+
+    def get(bx, by):
+        return planned.get((bx, by)) or lookup(bx, by)
+
+    def put(bx, by, block, replace=False):
+        if replace or get(bx, by) is None:
+            planned[(bx, by)] = mine[(bx, by)] = block
+
+    surface_y = surface_height(x)
+
+    # Layers from the bottom up: bedrock, 200 blocks of stone, 2 dirt, grass
+    put(x, BEDROCK_Y, "bedrock")
+    for y in range(surface_y + 3, BEDROCK_Y):
+        put(x, y, "stone")
+    for y in range(surface_y + 1, surface_y + 3):
+        put(x, y, "dirt")
+    put(x, surface_y, "grass")
+
+    def grow_tree(leaves):
+        put(x, surface_y - 1, "log")
+        put(x, surface_y - 2, "log")
+        for lx, ly in leaves:
+            put(x + lx, surface_y + ly, "leaves")
+
+    # Trees only ever grow ABOVE the surface
+    if biome.biome == "desert":
+        if get(x, surface_y) == "grass":
+            put(x, surface_y, "sand", replace=True)
+        # Deserts have very few trees (and smaller ones)
+        if tree_allowed(x, surface_y, biome.tree_density, get, rng) and get(x, surface_y - 1) is None:
+            grow_tree(((-1, -3), (0, -3), (1, -3), (-1, -2), (1, -2)))
+    elif tree_allowed(x, surface_y, biome.tree_density, get, rng):
+        if get(x, surface_y - 1) is None:
+            grow_tree(((-1, -3), (0, -3), (1, -3), (-1, -2), (1, -2), (0, -4)))
+
+    # Up to 3 ores per column, rarer ones deeper
+    ore_chance = rng.random()
+    min_ore_y = surface_y + 5
+    max_ore_y = BEDROCK_Y - 1
+    for _ in range(3):
+        if ore_chance < 0.8 and min_ore_y <= max_ore_y:
+            ore_y = rng.randint(min_ore_y, max_ore_y)
+            depth_percentage = (ore_y - surface_y) / (BEDROCK_Y - surface_y)
+            ore_roll = rng.random()
+            if ore_roll < 0.6:
+                ore_type = "coal"
+            elif ore_roll < 0.85:
+                ore_type = "iron"
+            elif ore_roll < 0.97 and depth_percentage > 0.5:
+                ore_type = "gold"
+            elif depth_percentage > 0.8:
+                ore_type = "diamond"
+            else:
+                ore_type = "coal"
+            # Ores replace this column's own stone, never blocks that were already there
+            put(x, ore_y, ore_type, replace=mine.get((x, ore_y)) == "stone")
+        ore_chance = rng.random() * 0.4  # 40% chance for second ore, 16% for third
+
+    # Carrots - 15% chance
+    if surface_item_allowed(x, surface_y, get) and rng.random() < 0.15:
+        put(x, surface_y - 1, "carrot")
+
+    # Grass only on the surface, dirt just under it, trees above it - checked per column as it's planned
+    return enforce_generated([(bx, by, block) for (bx, by), block in mine.items()], surface_height, f"column {x}")
+
+
+def plan_chunk(chunk_id: int, biomes: BiomeMap, lookup: Lookup,
+               chunk_width: int = CHUNK_WIDTH) -> List[Tuple[int, List[PlannedBlock]]]:
+    """Column plans for a whole chunk from the world's biome map and seed (same seed, same terrain)"""
+    planned: Dict[Tuple[int, int], str] = {}
+    base_x = chunk_id * chunk_width
+    return [(x, plan_terrain_column(x, biomes.info(x), column_rng(biomes.seed, x), lookup, planned))
+            for x in range(base_x, base_x + chunk_width)]
+
+
+class ChunkPregenerator:
+    """Plans chunks near the player on a background thread and hands them back in slices.
+
+    :meth:`request_around` (main thread, every frame) queues chunks within the
+    lookahead that aren't generated yet, nearest first. The worker plans them
+    with ``plan`` (which must only read the world). :meth:`install` then places
+    finished columns until the frame budget runs out, so exploring never stalls a frame.
+    """
+
+    def __init__(self, plan: Callable[[int], List[Tuple[int, List[PlannedBlock]]]],
+                 chunk_width: int = CHUNK_WIDTH, lookahead: int = LOOKAHEAD_CHUNKS,
+                 budget_ms: float = INSTALL_BUDGET_MS):
+        self.plan = plan
+        self.chunk_width = chunk_width
+        self.lookahead = lookahead
+        self.budget = budget_ms / 1000.0
+        self.condition = threading.Condition()
+        self.queued: List[int] = []
+        self.known: Set[int] = set()          # Chunks queued, being planned, ready or installed
+        self.ready: Deque[Tuple[int, Deque[Tuple[int, List[PlannedBlock]]]]] = deque()
+        self.center = 0
+        self.generation = 0                   # Bumped by reset() so stale plans are dropped
+        self.thread: Optional[threading.Thread] = None
+        self.running = False
+        self.chunks_planned = 0
+        self.columns_installed = 0
+
+    def chunk_of(self, x: float) -> int:
+        return math.floor(x / self.chunk_width)
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="ChunkPregen", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.thread:
+            self.thread.join(timeout=1.0)
+        self.thread = None
+
+    def reset(self):
+        """Forget everything (a different world was loaded)"""
+        with self.condition:
+            self.queued.clear()
+            self.known.clear()
+            self.ready.clear()
+            self.generation += 1
+
+    def request_around(self, x: float, is_generated: Callable[[int], bool]):
+        """Queue the chunks within the lookahead of x that still need terrain"""
+        center = self.chunk_of(x)
+        with self.condition:
+            self.center = center
+            added = False
+            for offset in sorted(range(-self.lookahead, self.lookahead + 1), key=abs):
+                chunk_id = center + offset
+                if chunk_id in self.known:
+                    continue
+                self.known.add(chunk_id)
+                if not is_generated(chunk_id):
+                    self.queued.append(chunk_id)
+                    added = True
+            if added:
+                self.condition.notify()
+        if not self.running:
+            self.start()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while self.running and not self.queued:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                # Nearest to the player first - they may have turned around
+                chunk_id = min(self.queued, key=lambda c: abs(c - self.center))
+                self.queued.remove(chunk_id)
+                generation = self.generation
+            try:
+                columns = self.plan(chunk_id)
+            except Exception as e:
+                print(f"⚠️ Chunk pre-generation failed for chunk {chunk_id}: {e}")
+                with self.condition:
+                    self.known.discard(chunk_id)
+                continue
+            with self.condition:
+                if generation == self.generation:
+                    self.ready.append((chunk_id, deque(columns)))
+                    self.chunks_planned += 1
+
+    def install(self, install_column: Callable[[int, List[PlannedBlock]], None],
+                on_chunk_installed: Optional[Callable[[int], None]] = None) -> int:
+        """Install planned columns until this frame's budget is spent; returns columns installed"""
+        deadline = time.perf_counter() + self.budget
+        installed = 0
+        while time.perf_counter() < deadline:
+            with self.condition:
+                if not self.ready:
+                    break
+                chunk_id, columns = self.ready[0]
+                x, blocks = columns.popleft()
+                finished = not columns
+                if finished:
+                    self.ready.popleft()
+            install_column(x, blocks)
+            installed += 1
+            if finished and on_chunk_installed:
+                on_chunk_installed(chunk_id)
+        self.columns_installed += installed
+        return installed
+
+    def pending(self) -> int:
+        """Chunks queued or planned but not fully installed"""
+        with self.condition:
+            return len(self.queued) + len(self.ready)
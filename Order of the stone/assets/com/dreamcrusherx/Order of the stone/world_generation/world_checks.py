@@ -0,0 +1,137 @@
+"""
+World invariants and chunk checksums
+Rules generated terrain must keep (checked as each chunk is generated instead of whole-world passes),
+and a cheap per-chunk checksum saved with the world so corruption is spotted on load
+"""
+
+import zlib
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+CHUNK_WIDTH = 50
+MAX_ABS_Y = 1000           # Heights beyond this are corrupt (the world is infinite in x, so x has no limit)
+DIRT_DEPTH = 2             # Dirt only in the two blocks under the surface
+
+# Natural ground - the topmost of these in a column is its surface
+GROUND_BLOCKS = {"grass", "dirt", "stone", "sand", "bedrock", "coal", "iron", "gold", "diamond"}
+TREE_BLOCKS = {"log", "leaves"}
+
+# (x, y, block) as generators plan them
+Block = Tuple[int, int, str]
+
+
+def block_problem(x, y, block) -> Optional[str]:
+    """Why a block can't be stored (bad coordinates, None or empty block), or None if it's fine"""
+    if not isinstance(x, int) or not isinstance(y, int):
+        return f"non-integer coordinates ({x!r}, {y!r})"
+    if abs(y) > MAX_ABS_Y:
+        return f"coordinates out of range ({x}, {y})"
+    if not isinstance(block, str) or not block:
+        return f"invalid block {block!r} at ({x}, {y})"
+    return None
+
+
+def terrain_problem(x: int, y: int, block: str, surface_y: Optional[int]) -> Optional[str]:
+    """Why a generated block breaks the surface rules, or None.
+
+    Grass only on the surface, dirt only just under it, trees only above it.
+    """
+    if surface_y is None:
+        return None
+    if block == "grass" and y != surface_y:
+        return f"underground grass at ({x}, {y}), surface is {surface_y}"
+    if block == "dirt" and not surface_y < y <= surface_y + DIRT_DEPTH:
+        return f"dirt outside the surface layer at ({x}, {y}), surface is {surface_y}"
+    if block in TREE_BLOCKS and y >= surface_y:
+        return f"{block} underground at ({x}, {y}), surface is {surface_y}"
+    return None
+
+
+def column_surfaces(blocks: Iterable[Block]) -> Dict[int, int]:
+    """Surface (topmost natural ground) of each column in a set of blocks"""
+    surfaces: Dict[int, int] = {}
+    for x, y, block in blocks:
+        if block in GROUND_BLOCKS and (x not in surfaces or y < surfaces[x]):
+            surfaces[x] = y
+    return surfaces
+
+
+def enforce_generated(blocks: List[Block], surface_of: Callable[[int], Optional[int]],
+                      label: str = "chunk") -> List[Block]:
+    """The blocks that keep the invariants; anything else is dropped with one summary line"""
+    kept, problems = [], []
+    for x, y, block in blocks:
+        problem = block_problem(x, y, block) or terrain_problem(x, y, block, surface_of(x))
+        if problem:
+            problems.append(problem)
+        else:
+            kept.append((x, y, block))
+    if problems:
+        print(f"⚠️ Generation check dropped {len(problems)} blocks in {label} (first: {problems[0]})")
+    return kept
+
+
+def world_problems(blocks: Dict[str, str], limit: int = 20) -> List[str]:
+    """Invariant violations in a generated world dict (tests and debugging - this is a full pass)"""
+    parsed = []
+    problems = []
+    for key, block in blocks.items():
+        try:
+            x, y = map(int, key.split(","))
+        except (ValueError, AttributeError):
+            problems.append(f"invalid key {key!r}")
+            continue
+        parsed.append((x, y, block))
+    surfaces = column_surfaces(parsed)
+    for x, y, block in parsed:
+        problem = block_problem(x, y, block) or terrain_problem(x, y, block, surfaces.get(x))
+        if problem:
+            problems.append(problem)
+            if len(problems) >= limit:
+                break
+    return problems
+
+
+def chunk_checksums(blocks: Dict[str, str], chunk_width: int = CHUNK_WIDTH) -> Dict[str, int]:
+    """CRC32 of each chunk's "x,y" and block entries, in the order they're stored (JSON keeps it)"""
+    chunk_of_column: Dict[str, str] = {}   # A few hundred columns, so parse each x once
+    entries: Dict[str, List[str]] = {}
+    for key, block in blocks.items():
+        column = key.partition(",")[0] if isinstance(key, str) else None
+        chunk_id = chunk_of_column.get(column)
+        if chunk_id is None:
+            try:
+                chunk_id = str(int(column) // chunk_width)
+            except (TypeError, ValueError):
+                chunk_id = "None"  # Unparseable keys land in their own bucket
+            chunk_of_column[column] = chunk_id
+        bucket = entries.get(chunk_id)
+        if bucket is None:
+            bucket = entries[chunk_id] = []
+        bucket.append(str(key))
+        bucket.append(str(block))
+    return {chunk_id: zlib.crc32("\n".join(bucket).encode("utf-8")) for chunk_id, bucket in entries.items()}
+
+
+def mismatched_chunks(blocks: Dict[str, str], saved: Dict[str, int],
+                      chunk_width: int = CHUNK_WIDTH) -> List[str]:
+    """Chunks whose blocks no longer match the checksums saved with them"""
+    current = chunk_checksums(blocks, chunk_width)
+    return sorted(chunk_id for chunk_id in set(current) | set(saved)
+                  if current.get(chunk_id) != saved.get(chunk_id))
+
+
+def repair_chunks(blocks: Dict[str, str], chunk_ids: Iterable[str], chunk_width: int = CHUNK_WIDTH) -> int:
+    """Drop unreadable entries (bad keys, None or empty blocks) from the given chunks; returns how many"""
+    chunk_ids = set(chunk_ids)
+    removed = 0
+    for key in list(blocks):
+        try:
+            x, y = map(int, key.split(","))
+            chunk_id = str(x // chunk_width)
+        except (ValueError, AttributeError):
+            x = y = None
+            chunk_id = "None"
+        if chunk_id in chunk_ids and block_problem(x, y, blocks[key]):
+            del blocks[key]
+            removed += 1
+    return removed
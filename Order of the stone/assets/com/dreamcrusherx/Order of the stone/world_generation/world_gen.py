@@ -5,7 +5,12 @@ Clean, reliable, Minecraft-style world generation
 
 import random
 import math
-from typing import Dict, Tuple, List
+from typing import Callable, Dict, Tuple, List, Optional
+
+GENERATOR_VERSION = 1  # Bump whenever a seed would generate a different world (invalidates world templates)
+
+BEDROCK_Y = 315        # Fixed bedrock level for land columns
+RANGE_WIDTH = 50       # Columns per terrain progress step (one world chunk)
 
 class WorldGenerator:
     def __init__(self, seed: int = None):
@@ -30,8 +35,12 @@ class WorldGenerator:
         print(f"🌍 NEW World Generator - Seed: {seed}")
         print(f"   Terrain: amp={self.terrain_amplitude:.1f}, base={self.base_height}, offsets=({self.offset1:.0f},{self.offset2:.0f},{self.offset3:.0f})")
     
-    def generate_world(self, world_width: int = 400, world_height: int = 200) -> Dict:
-        """Generate a complete Minecraft-style world"""
+    def generate_world(self, world_width: int = 400, world_height: int = 200,
+                       on_progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+        """Generate a complete Minecraft-style world
+        
+        on_progress: called with (steps done, total steps) as terrain ranges finish
+        """
         print("🚀 Generating brand new world...")
         
         world_data = {
@@ -58,7 +67,7 @@ class WorldGenerator:
         
         # Step 1: Generate basic terrain
         print("⛰️  Generating terrain...")
-        self._generate_terrain(blocks, world_width)
+        self._generate_terrain(blocks, world_width, on_progress)
         
         # Step 2: Add oceans FIRST (before spawn) - rare, on edges
         if self.rng.random() < 0.15:  # 15% chance for ocean
@@ -95,36 +104,53 @@ class WorldGenerator:
         # Note: Animals (cows, slimes) will be spawned by the main game
         # because they need texture references not available here
         
+        if on_progress:
+            steps = len(self._column_ranges(world_width)) + 1
+            on_progress(steps, steps)
+        
         print(f"✅ World complete! {len(blocks)} blocks generated")
         return world_data
     
-    def _generate_terrain(self, blocks: Dict[str, str], world_width: int):
+    def _surface_height(self, x: int) -> int:
+        """Grass level of column x"""
+        # Create varied terrain using RANDOMIZED sine waves with offsets
+        height_var = int(
+            self.terrain_amplitude * math.sin((x + self.offset1) * self.terrain_freq1) +
+            (self.terrain_amplitude * 0.5) * math.sin((x + self.offset2) * self.terrain_freq2) +
+            (self.terrain_amplitude * 0.3) * math.sin((x + self.offset3) * self.terrain_freq3)
+        )
+        surface_y = self.base_height + height_var
+        return max(self.base_height - 15, min(self.base_height + 15, surface_y))
+    
+    def _column_ranges(self, world_width: int) -> List[Tuple[int, int]]:
+        """The world's columns split into RANGE_WIDTH progress steps"""
+        x_start, x_end = -world_width//2, world_width//2
+        return [(x, min(x + RANGE_WIDTH, x_end)) for x in range(x_start, x_end, RANGE_WIDTH)]
+    
+    def _generate_terrain(self, blocks: Dict[str, str], world_width: int,
+                          on_progress: Optional[Callable[[int, int], None]] = None):
         """Generate basic terrain with variety - RANDOMIZED per world!"""
-        
-        for x in range(-world_width//2, world_width//2):
-            # Create varied terrain using RANDOMIZED sine waves with offsets
-            height_var = int(
-                self.terrain_amplitude * math.sin((x + self.offset1) * self.terrain_freq1) +
-                (self.terrain_amplitude * 0.5) * math.sin((x + self.offset2) * self.terrain_freq2) +
-                (self.terrain_amplitude * 0.3) * math.sin((x + self.offset3) * self.terrain_freq3)
-            )
-            surface_y = self.base_height + height_var
-            surface_y = max(self.base_height - 15, min(self.base_height + 15, surface_y))
+        ranges = self._column_ranges(world_width)
+        for done, (x_start, x_end) in enumerate(ranges, 1):
+            self._terrain_range(blocks, x_start, x_end)
+            if on_progress:
+                on_progress(done, len(ranges) + 1)
+    
+    def _terrain_range(self, blocks: Dict[str, str], x_start: int, x_end: int):
+        """Terrain for columns [x_start, x_end)"""
+        for x in range(x_start, x_end):
+            surface_y = self._surface_height(x)
             
             # Bedrock at bottom (fixed depth for all columns)
-            bedrock_y = 315  # Fixed bedrock level for entire world
-            blocks[f"{x},{bedrock_y}"] = "bedrock"
+            blocks[f"{x},{BEDROCK_Y}"] = "bedrock"
             
             # Stone layer - fill from bedrock UP to near surface (no gaps!)
-            # Go from bedrock (315) up to surface+3
-            for y in range(surface_y + 3, bedrock_y):
+            for y in range(surface_y + 3, BEDROCK_Y):
                 blocks[f"{x},{y}"] = "stone"
             
-            # Dirt layer (2 blocks below grass)
+            # Dirt layer (2 blocks below grass), then the grass surface
             blocks[f"{x},{surface_y + 1}"] = "dirt"
             blocks[f"{x},{surface_y + 2}"] = "dirt"
-            
-            # Grass surface
             blocks[f"{x},{surface_y}"] = "grass"
     
     def _add_ocean(self, blocks: Dict[str, str], world_width: int, side: str):
@@ -365,16 +391,20 @@ class WorldGenerator:
         print(f"   🏰 Generated {fortress_count} fortresses")
 
 
-def generate_world(seed: str = None, world_width: int = 400) -> Dict:
+def generate_world(seed: str = None, world_width: int = 400,
+                   on_progress: Optional[Callable[[int, int], None]] = None) -> Dict:
     """
     Generate a new world
     
     Args:
         seed: Optional seed for reproducible generation
         world_width: Width of the world in blocks
+        on_progress: Called with (steps done, total steps) while generating
         
     Returns:
         World data dictionary
     """
     generator = WorldGenerator(seed)
-    return generator.generate_world(world_width)
+    world = generator.generate_world(world_width, on_progress=on_progress)
+    world["seed"] = generator.seed  # Biomes and explored terrain follow it (see biome_map)
+    return world